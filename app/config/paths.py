@@ -42,6 +42,15 @@ PARTICIPANT_PATH: Path = DOCUMENTS_DIR / os.getenv(
     "PARTICIPANT_PATH", "Расписка участника.pdf"
 )  # Расписка участника
 
+# Контентно-адресуемое хранилище файлов пользователей
+BLOBS_DIR: Path = BASE_DIR / "storage" / "blobs"
+
+# Дисковый кэш изображений с кодами участников
+CODE_IMAGES_DIR: Path = BASE_DIR / "storage" / "codes"
+
+# Хранилище сессий FSM по умолчанию
+FSM_STORAGE_PATH: Path = BASE_DIR / "storage" / "fsm.sqlite3"
+
 # Файлы логирования
 LOG_FILE: Path = BASE_DIR / "logs" / "app.log"          # Основной лог
 LOG_ERROR_FILE: Path = BASE_DIR / "logs" / "error.log"  # Лог ошибок
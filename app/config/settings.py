@@ -18,6 +18,90 @@ BOT_TOKEN: str = os.getenv("BOT_TOKEN", "")
 # URL для подключения к базе данных
 DB_URL: str = os.getenv("DB_URL", "")
 
+# Время, в течение которого сборщик не удаляет содержимое файлов без
+# ссылок (секунды): ссылка на только что записанное содержимое может
+# ещё не попасть в базу
+BLOB_GC_GRACE: float = float(os.getenv("BLOB_GC_GRACE", "3600"))
+
+# Период фоновой записи изменений пользователей в БД (секунды)
+WRITE_BEHIND_INTERVAL: float = float(
+    os.getenv("WRITE_BEHIND_INTERVAL", "2")
+)
+
+# Количество изменённых пользователей для досрочной записи в БД
+WRITE_BEHIND_BATCH: int = int(os.getenv("WRITE_BEHIND_BATCH", "100"))
+
+# Хранилище FSM: "memory" (без сохранения между перезапусками),
+# "sqlite" или "redis"
+FSM_STORAGE: str = os.getenv("FSM_STORAGE", "memory")
+
+# Адрес хранилища FSM (путь к файлу SQLite или redis://host:port/db)
+FSM_STORAGE_URL: str = os.getenv("FSM_STORAGE_URL", "")
+
+# Время жизни неактивной сессии FSM (секунды)
+FSM_TTL: int = int(os.getenv("FSM_TTL", str(7 * 24 * 3600)))
+
+# Период фоновой записи сессий FSM в хранилище (секунды)
+FSM_FLUSH_INTERVAL: float = float(os.getenv("FSM_FLUSH_INTERVAL", "1"))
+
+# Максимум одновременных соединений общей HTTP-сессии ботов
+BOT_SESSION_LIMIT: int = int(os.getenv("BOT_SESSION_LIMIT", "100"))
+
+# Режим получения обновлений по умолчанию: "polling" или "webhook"
+BOT_MODE: str = os.getenv("BOT_MODE", "polling")
+
+# Публичный HTTPS-адрес, на который Telegram отправляет вебхуки
+WEBHOOK_BASE_URL: str = os.getenv("WEBHOOK_BASE_URL", "")
+
+# Префикс пути вебхуков (к нему добавляется ключ бота)
+WEBHOOK_PATH: str = os.getenv("WEBHOOK_PATH", "/webhook")
+
+# Адрес и порт, на которых слушает сервер вебхуков
+WEBHOOK_HOST: str = os.getenv("WEBHOOK_HOST", "0.0.0.0")
+WEBHOOK_PORT: int = int(os.getenv("WEBHOOK_PORT", "8080"))
+
+# Секрет для подписи токенов проверки вебхуков (пусто — случайный)
+WEBHOOK_SECRET: str = os.getenv("WEBHOOK_SECRET", "")
+
+# Размер очереди входящих обновлений и число обработчиков
+WEBHOOK_QUEUE_SIZE: int = int(os.getenv("WEBHOOK_QUEUE_SIZE", "1000"))
+WEBHOOK_WORKERS: int = int(os.getenv("WEBHOOK_WORKERS", "8"))
+
+# Период проверки изменений файлов локализации (секунды, 0 — не следить)
+LOCALE_RELOAD_INTERVAL: float = float(
+    os.getenv("LOCALE_RELOAD_INTERVAL", "2")
+)
+
+# Минимальное количество цифр в коде участника и множитель
+# перемешивания (взаимно прост с 10). После начала регистрации не
+# меняются: выданные коды вычисляются из них
+CODE_DIGITS: int = int(os.getenv("CODE_DIGITS", "3"))
+CODE_SEED: int = int(os.getenv("CODE_SEED", "701"))
+
+# Потоки рендеринга изображений с кодом и размер их кэша
+IMAGE_WORKERS: int = int(os.getenv("IMAGE_WORKERS", "2"))
+IMAGE_CACHE_SIZE: int = int(os.getenv("IMAGE_CACHE_SIZE", "128"))
+
+# Количество изображений для следующих участников, рендерящихся
+# заранее при запуске (0 — не прогревать)
+IMAGE_PREWARM: int = int(os.getenv("IMAGE_PREWARM", "0"))
+
+# Рендеринг изображений всех кодов на диск при запуске и число
+# процессов для него (0 — по числу ядер)
+IMAGE_PREBUILD: bool = os.getenv("IMAGE_PREBUILD", "0") == "1"
+IMAGE_PREBUILD_WORKERS: int = int(os.getenv("IMAGE_PREBUILD_WORKERS", "0"))
+
+# Фоновая загрузка словаря морфологии и склонение названий шагов при
+# запуске (иначе словарь загружается при первом склонении)
+MORPH_WARMUP: bool = os.getenv("MORPH_WARMUP", "1") == "1"
+
+# Сбор метрик задержек обработки апдейтов
+METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "1") == "1"
+
+# Адрес и порт эндпоинта метрик Prometheus (порт 0 — не запускать)
+METRICS_HOST: str = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT: int = int(os.getenv("METRICS_PORT", "0"))
+
 # Токен для оплаты
 PROVIDER_TOKEN: str = os.getenv("PROVIDER_TOKEN", "")
 
@@ -29,6 +113,44 @@ MAIN_ADMINS: list[int] = [
     int(x) for x in os.getenv("MAIN_ADMINS", "").split(",") if x
 ]
 
+# Кэш ролей администраторов: время жизни роли и отсутствия роли
+# (секунды) и максимальное количество записей
+ADMIN_CACHE_TTL: float = float(os.getenv("ADMIN_CACHE_TTL", "300"))
+ADMIN_NEGATIVE_TTL: float = float(os.getenv("ADMIN_NEGATIVE_TTL", "60"))
+ADMIN_CACHE_SIZE: int = int(os.getenv("ADMIN_CACHE_SIZE", "10000"))
+
+# Период проверки версии флагов бота в базе (секунды): за это время
+# изменения из другого процесса доходят до текущего (0 — не проверять)
+FLAG_POLL_INTERVAL: float = float(os.getenv("FLAG_POLL_INTERVAL", "5"))
+
+# Рассылки: скорость отправки одного бота (сообщений в секунду) и
+# размер всплеска, нижняя граница скорости после ответов RetryAfter,
+# интервал между сообщениями в один чат (секунды), число одновременных
+# запросов, размер страницы получателей, число повторов сообщения и
+# период обновления прогресса (секунды)
+BROADCAST_RATE: float = float(os.getenv("BROADCAST_RATE", "25"))
+BROADCAST_BURST: int = int(os.getenv("BROADCAST_BURST", "10"))
+BROADCAST_MIN_RATE: float = float(os.getenv("BROADCAST_MIN_RATE", "1"))
+BROADCAST_CHAT_INTERVAL: float = float(
+    os.getenv("BROADCAST_CHAT_INTERVAL", "1")
+)
+BROADCAST_CONCURRENCY: int = int(os.getenv("BROADCAST_CONCURRENCY", "10"))
+BROADCAST_BATCH: int = int(os.getenv("BROADCAST_BATCH", "100"))
+BROADCAST_RETRIES: int = int(os.getenv("BROADCAST_RETRIES", "5"))
+BROADCAST_REPORT_INTERVAL: float = float(
+    os.getenv("BROADCAST_REPORT_INTERVAL", "3")
+)
+
+# Поиск участников: ключи данных (названия шагов анкеты через
+# запятую), по которым строится индекс, и количество результатов на
+# странице
+SEARCH_KEYS: list[str] = [
+    x.strip()
+    for x in os.getenv("SEARCH_KEYS", "ФИО,Группа,ВУЗ").split(",")
+    if x.strip()
+]
+SEARCH_PAGE_SIZE: int = int(os.getenv("SEARCH_PAGE_SIZE", "8"))
+
 # Символ для отображения/разделения (по необходимости)
 SYMB: str = os.getenv("SYMB", "")
 
@@ -36,6 +158,23 @@ SYMB: str = os.getenv("SYMB", "")
 GSHEET_NAME: str = os.getenv("GSHEET_NAME", "")  # Имя таблицы
 GSHEET_PAGE: str = os.getenv("GSHEET_PAGE", "")  # Имя листа таблицы
 
+# Экспорт в Google Sheets: квота запросов записи (в секунду) и размер
+# всплеска, размер очереди и пакета, время накопления пакета (секунды)
+# и число повторов запроса при ошибке
+GSHEET_RATE: float = float(os.getenv("GSHEET_RATE", "1"))
+GSHEET_BURST: int = int(os.getenv("GSHEET_BURST", "5"))
+GSHEET_QUEUE_SIZE: int = int(os.getenv("GSHEET_QUEUE_SIZE", "1000"))
+GSHEET_BATCH_SIZE: int = int(os.getenv("GSHEET_BATCH_SIZE", "500"))
+GSHEET_FLUSH_INTERVAL: float = float(
+    os.getenv("GSHEET_FLUSH_INTERVAL", "2")
+)
+GSHEET_RETRIES: int = int(os.getenv("GSHEET_RETRIES", "5"))
+
+# Задержка инкрементальной синхронизации таблицы после регистрации
+# (секунды): изменения успевают попасть в базу, а частые регистрации
+# объединяются в одну синхронизацию
+GSHEET_SYNC_DELAY: float = float(os.getenv("GSHEET_SYNC_DELAY", "10"))
+
 # Основные команды бота
 COMMAND_MAIN: set[str] = {"start", "test", "admin"}
 
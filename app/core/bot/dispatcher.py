@@ -5,10 +5,17 @@
 
 from aiogram import Dispatcher, Router
 from aiogram.dispatcher.event.telegram import TelegramEventObserver
-from aiogram.fsm.storage.memory import MemoryStorage, SimpleEventIsolation
+from aiogram.fsm.storage.base import BaseStorage
+from aiogram.fsm.storage.memory import SimpleEventIsolation
 
 from app.core.bot import routers
 from app.core.bot.middleware import MwBase, mw
+from app.core.bot.services.metrics import UpdateMetricsMiddleware, get_metrics
+from app.core.bot.services.storage import get_fsm_storage
+
+# Диспетчер создаётся один раз: роутеры и middleware нельзя
+# подключать повторно при перезапуске ботов
+_dispatcher: Dispatcher | None = None
 
 
 async def setup_dispatcher() -> Dispatcher:
@@ -16,21 +23,30 @@ async def setup_dispatcher() -> Dispatcher:
     Асинхронная инициализация диспетчера и подключение роутеров с
     соответствующими middleware.
 
-    Создает диспетчер с изоляцией событий в памяти, настраивает
-    middleware для роутеров и подключает все роутеры к диспетчеру.
+    Создает диспетчер с хранилищем FSM из настроек и изоляцией
+    событий в памяти, настраивает middleware для роутеров и подключает
+    все роутеры к диспетчеру. Повторные вызовы возвращают тот же
+    диспетчер, общий для всех ботов.
 
     Returns
     -------
     Dispatcher
         Экземпляр диспетчера с подключенными роутерами и middleware.
     """
-    # Создаем диспетчер с изоляцией событий в памяти
-    storage: MemoryStorage = MemoryStorage()
+    global _dispatcher
+    if _dispatcher is not None:
+        return _dispatcher
+
+    # Создаем диспетчер с общим хранилищем FSM и изоляцией событий
+    storage: BaseStorage = get_fsm_storage()
     dp: Dispatcher = Dispatcher(
         storage=storage,
         events_isolation=SimpleEventIsolation()
     )
 
+    # Замер полного времени обработки каждого апдейта
+    dp.update.outer_middleware(UpdateMetricsMiddleware(get_metrics()))
+
     # Создание роутеров
     user_callback: Router = routers.get_router_user_callback()
     user_command: Router = routers.get_router_user_command()
@@ -59,13 +75,21 @@ async def setup_dispatcher() -> Dispatcher:
     for target, middleware in middleware_map:
         target.middleware(middleware)
 
-    # Подключаем все роутеры к диспетчеру
+    # Подключаем все роутеры к диспетчеру. Доступ к админским роутерам
+    # проверяется по ролям из таблицы admin. Админские команды идут
+    # раньше пользовательского обработчика любых сообщений, а общий
+    # обработчик админских callback — последним, чтобы не перехватывать
+    # пользовательские callback администраторов
     dp.include_routers(
         intercept_handler,
+        routers.admin_command,
+        routers.admin_message,
         user_callback,
         user_command,
         user_payment,
         user_message,
+        routers.admin_callback,
     )
 
+    _dispatcher = dp
     return dp
@@ -0,0 +1,10 @@
+"""
+Пакет для обработки данных администратора в базовом middleware Aiogram.
+Содержит функцию загрузки локализации админ-панели до вызова handler.
+"""
+
+from .process import admin_before
+
+__all__: list[str] = [
+    "admin_before",
+]
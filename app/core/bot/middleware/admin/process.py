@@ -0,0 +1,35 @@
+"""
+Обработка данных администратора для базового middleware Aiogram.
+"""
+
+from typing import Any
+
+from aiogram.fsm.context import FSMContext
+
+from app.core.bot.services.localization import (Localization,
+                                                 load_localization)
+
+
+async def admin_before(
+    data: dict[str, Any],
+) -> None:
+    """
+    Логика до вызова handler для role=admin.
+
+    Загружает локализацию админ-панели в FSM, если её там нет
+    или она устарела после правки файлов.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+        Словарь данных события.
+    """
+    state: FSMContext | None = data.get("state")
+    if state is None:
+        raise ValueError("FSMContext не найден в data")
+
+    fsm_data: dict[str, Any] = await state.get_data()
+    lang: str = fsm_data.get("lang") or "ru"
+    loc: Localization = await load_localization(lang=lang, role="admin")
+    if fsm_data.get("loc_admin") is not loc:
+        await state.update_data(loc_admin=loc)
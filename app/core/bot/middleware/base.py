@@ -2,16 +2,19 @@
 Базовый middleware для обработки событий Aiogram.
 """
 
-from datetime import datetime
+from time import perf_counter_ns
 from typing import Any, Awaitable, Callable, Literal
 
 from aiogram import BaseMiddleware
 
 from app.core.bot.middleware.user import clear_fsm_user
 from app.core.bot.services.logger import log_error
+from app.core.bot.services.metrics import (START_KEY, MetricsRegistry,
+                                           get_metrics)
 from app.core.database import User
 
 from . import utils
+from .admin.process import admin_before
 from .user.process import user_before
 
 
@@ -79,21 +82,33 @@ class MwBase(BaseMiddleware):
         data = data or {}
         data.update(self.extra_data)
 
+        metrics: MetricsRegistry = get_metrics()
+        handler_name: str = utils.get_handler_name(data)
+
+        # Время от начала обработки апдейта до middleware: выбор
+        # роутера и проверка фильтров
+        start: int | None = data.get(START_KEY)
+        if start is not None:
+            metrics.record_ns(
+                "filters",
+                perf_counter_ns() - start,
+                (("handler", handler_name),),
+            )
+
         user: User | None = None
         db: dict[str, str] | None = None
         msg_id: int = 0
 
         if self.role == "user":
-            time1: datetime = datetime.now()
-            user, db, msg_id = await user_before(data, event)
-            time2: datetime = datetime.now()
-            print(f"user_before time: {(time2 - time1).total_seconds()} sec")
+            with metrics.span("user_before"):
+                user, db, msg_id = await user_before(data, event)
         else:
-            # Логика для админов будет добавлена позже
-            pass
+            with metrics.span("admin_before"):
+                await admin_before(data)
 
         try:
-            result: Any = await handler(event, data)
+            with metrics.span("handler", handler=handler_name):
+                result: Any = await handler(event, data)
             await utils.remove_event(event, self.delete_event)
 
         except Exception as error:
@@ -103,18 +118,21 @@ class MwBase(BaseMiddleware):
         if self.role == "user":
             chat_id: Any = utils.get_message(event).chat.id
             if chat_id is not None:
-                await utils.remove_old_msg(event, chat_id, msg_id)
-
-            await utils.update_db(
-                tg_id=event.from_user.id,
-                bot_id=event.bot.id,
-                user=user,
-                data=db,
-            )
-            if user and int(user.state[-1]) >= 100:
+                with metrics.span("remove_old_msg"):
+                    await utils.remove_old_msg(event, chat_id, msg_id)
+
+            # Терминальные состояния записываются в БД сразу,
+            # так как FSM пользователя после них очищается
+            terminal: bool = bool(user) and int(user.state[-1]) >= 100
+            with metrics.span("update_db"):
+                await utils.update_db(
+                    tg_id=event.from_user.id,
+                    bot_id=event.bot.id,
+                    user=user,
+                    data=db,
+                    flush=terminal,
+                )
+            if terminal:
                 await clear_fsm_user(data)
-        else:
-            # Логика для админов будет добавлена позже
-            pass
 
         return result
@@ -8,6 +8,7 @@ from typing import Any, cast
 from aiogram.fsm.context import FSMContext
 
 from app.core.bot.services.localization import Localization, load_localization
+from app.core.bot.services.persistence import get_write_behind
 from app.core.database import DataManager, User, UserManager, async_session
 
 
@@ -18,7 +19,9 @@ async def get_user_fsm(
     """
     Обновляет FSM данные: user_db, data_db и локализацию.
 
-    Если их нет в FSM, создаёт/загружает все данные сразу.
+    Если их нет в FSM, создаёт/загружает все данные сразу. Если
+    локализации в FSM нет (сессия восстановлена из хранилища) или она
+    устарела после правки файлов, подставляет только её.
     Язык определяется из user_db (или по умолчанию "ru").
     """
     state: FSMContext | None = data.get("state")
@@ -37,8 +40,19 @@ async def get_user_fsm(
     data_db: dict[str, Any] | None = fsm_data.get(data_key)
     loc: Localization | None = fsm_data.get(loc_key)
 
+    # Локализация не сохраняется в хранилище FSM и подменяется
+    # реестром после правки файлов, поэтому сверяем её с текущей
+    # версией (повторная загрузка берётся из кэша реестра)
+    if user_db is not None and data_db is not None:
+        lang: str = user_db.lang
+        current: Localization = await load_localization(
+            lang=lang, role="user"
+        )
+        if loc is not current:
+            await state.update_data(**{loc_key: current, "lang": lang})
+
     # Если чего-то не хватает, загружаем всё вместе
-    if not (user_db and data_db and loc):
+    else:
         if not event:
             # Без event нельзя создать user_db и data_db
             return user_db, data_db
@@ -46,16 +60,25 @@ async def get_user_fsm(
         bot_id: int = event.bot.id
         tg_id: int = event.from_user.id
 
+        # Незаписанные изменения должны попасть в БД до повторной загрузки
+        write_behind = get_write_behind()
+        if write_behind.has_pending(tg_id, bot_id):
+            await write_behind.flush((tg_id, bot_id))
+
         async with async_session() as session:
             user_manager = UserManager(session)
             data_manager = DataManager(session)
 
             # Загружаем или создаём пользователя
             user_db = await user_manager.get_or_create(tg_id=tg_id, bot_id=bot_id)
-            # Загружаем данные пользователя
-            data_db = await data_manager.dict_all(tg_id=tg_id, bot_id=bot_id)
+            # Загружаем данные пользователя по уже известному ID
+            data_db = await data_manager.dict_all(
+                tg_id=tg_id,
+                bot_id=bot_id,
+                user=user_db,
+            )
             # Загружаем локализацию
-            lang: str = user_db.lang if user_db else "ru"
+            lang = user_db.lang if user_db else "ru"
             loc = await load_localization(lang=lang, role="user")
 
             # Обновляем FSM сразу всеми данными
@@ -6,7 +6,8 @@ from typing import Any
 
 from aiogram.types import Message
 
-from app.core.database import DataManager, User, UserManager, async_session
+from app.core.bot.services.persistence import get_write_behind
+from app.core.database import User
 
 
 async def check_type(
@@ -37,6 +38,27 @@ async def check_type(
     return True
 
 
+def get_handler_name(
+    data: dict[str, Any]
+) -> str:
+    """
+    Возвращает имя функции-обработчика события для меток метрик.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+        Словарь данных события.
+
+    Returns
+    -------
+    str
+        Имя обработчика или "unknown".
+    """
+    handler: Any = data.get("handler")
+    callback: Any = getattr(handler, "callback", None)
+    return getattr(callback, "__name__", "unknown")
+
+
 def get_message(
     event: Any
 ) -> Message:
@@ -97,26 +119,34 @@ async def update_db(
     bot_id: int,
     user: User | None,
     data: dict[str, str] | None,
+    flush: bool = False,
 ) -> None:
     """
-    Обновляет User и Data в БД при необходимости.
+    Помечает User и Data для отложенной записи в БД.
+
+    Изменения попадают в буфер write-behind и записываются пакетно.
+    При flush=True изменения пользователя записываются немедленно.
 
     Parameters
     ----------
+    tg_id : int
+        Идентификатор пользователя.
+    bot_id : int
+        Идентификатор бота.
     user : User | None
         Экземпляр пользователя.
     data : dict[str, str] | None
         Данные пользователя.
-    tg_id : int
-        Идентификатор пользователя.
+    flush : bool
+        Записать изменения пользователя сразу (терминальные состояния).
     """
     if user and data is not None:
-        async with async_session() as session:
-            await UserManager(session).update_user(
-                user=user
-            )
-            await DataManager(session).update_all(
-                tg_id=tg_id,
-                bot_id=bot_id,
-                new_data=data
-            )
+        write_behind = get_write_behind()
+        write_behind.mark_dirty(
+            tg_id=tg_id,
+            bot_id=bot_id,
+            user=user,
+            data=data,
+        )
+        if flush:
+            await write_behind.flush((tg_id, bot_id))
@@ -1,15 +1,42 @@
+from html import escape
 from typing import Any, Callable
 
 from aiogram import F, Router
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 
 import app.core.bot.services.keyboards as kb
+from app.config import SEARCH_PAGE_SIZE
+from app.core.bot.routers.admin.views import search_results, user_card
 from app.core.bot.routers.filters import AdminFilter, ChatTypeFilter
+from app.core.bot.services.broadcast import get_broadcast_engine
+from app.core.bot.services.flags import FlagService, get_flag_service
+from app.core.bot.services.google_sheets import SyncDiff, get_sheet_sync
+from app.core.bot.services.localization import (LocNode, Localization,
+                                                 load_localization)
 from app.core.bot.services.logger import log
+from app.core.bot.services.metrics import get_metrics, render_summary
+from app.core.bot.services.roles import ROLE_MAIN
+from app.core.bot.services.search import SearchPage, search_users
+from app.core.bot.services.stats import (METRIC_CANCELLED, METRIC_CONFIRMED,
+                                         METRIC_DAY, METRIC_HOUR,
+                                         METRIC_OPTION, METRIC_PENDING,
+                                         METRIC_REGISTERED)
+from app.core.database import (Admin, AdminManager, Broadcast,
+                               BroadcastManager, StatManager, User,
+                               UserManager, async_session)
 
 router: Router = Router()
 
+# Максимальная длина текста рассылки в предпросмотре
+PREVIEW_LIMIT: int = 3000
+
+# Количество дней, пиковых часов и вариантов ответа в статистике
+STATS_DAYS: int = 7
+STATS_HOURS: int = 3
+STATS_OPTIONS: int = 10
+
 
 def admin_callback(
     *filters: Any
@@ -55,6 +82,763 @@ async def delete_panel(
     await log(callback)
 
 
+@admin_callback(F.data == "metrics")
+async def metrics(
+    callback: CallbackQuery,
+    state: FSMContext
+) -> None:
+    """
+    Показывает сводку задержек обработки апдейтов.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+    """
+    if not isinstance(callback.message, Message):
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    screen: Any = loc.default.admin.metrics
+    keyboard: kb.InlineKeyboardMarkup = await kb.keyboard_dynamic(
+        screen.keyboard
+    )
+
+    try:
+        await callback.message.edit_text(
+            screen.text + render_summary(get_metrics()),
+            reply_markup=keyboard
+        )
+    except TelegramBadRequest:
+        # Метрики не изменились с прошлого обновления
+        await callback.answer()
+
+    await log(callback)
+
+
+@admin_callback(F.data == "input_code")
+async def input_code(
+    callback: CallbackQuery,
+    state: FSMContext
+) -> None:
+    """
+    Включает режим ввода кода участника.
+
+    Следующие сообщения администратора ищут участника по коду,
+    пока он не перейдёт на другой экран панели.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+    """
+    if not isinstance(callback.message, Message):
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    screen: Any = loc.default.admin.input_code
+    keyboard: kb.InlineKeyboardMarkup = await kb.keyboard_dynamic(
+        screen.keyboard
+    )
+
+    await state.update_data(admin_input="code")
+    await callback.message.edit_text(
+        screen.text,
+        reply_markup=keyboard
+    )
+
+    await log(callback)
+
+
+@admin_callback(F.data == "find_user")
+async def find_user(
+    callback: CallbackQuery,
+    state: FSMContext
+) -> None:
+    """
+    Включает режим поиска участников.
+
+    Следующие сообщения администратора считаются поисковыми
+    запросами, пока он не перейдёт на другой экран панели.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+    """
+    if not isinstance(callback.message, Message):
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    screen: Any = loc.default.admin.find_user
+    keyboard: kb.InlineKeyboardMarkup = await kb.keyboard_dynamic(
+        screen.keyboard
+    )
+
+    await state.update_data(admin_input="find_user")
+    await callback.message.edit_text(
+        screen.text,
+        reply_markup=keyboard
+    )
+
+    await log(callback)
+
+
+@admin_callback(F.data.startswith("find_page_"))
+async def find_page(
+    callback: CallbackQuery,
+    state: FSMContext
+) -> None:
+    """
+    Показывает другую страницу результатов последнего поиска.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+    """
+    if not isinstance(callback.message, Message) or not callback.bot:
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    number: str = (callback.data or "").removeprefix("find_page_")
+    if not loc or not number.isdigit():
+        return
+
+    screen: Any = loc.default.admin.find_user
+    query: str | None = data.get("find_query")
+    if not query:
+        await callback.answer(screen.expired, show_alert=True)
+        return
+
+    page: SearchPage = await search_users(
+        bot_id=callback.bot.id,
+        query=query,
+        page=int(number),
+        page_size=SEARCH_PAGE_SIZE,
+    )
+    text: str
+    keyboard: kb.InlineKeyboardMarkup
+    text, keyboard = await search_results(screen, page)
+    try:
+        await callback.message.edit_text(
+            text,
+            reply_markup=keyboard
+        )
+    except TelegramBadRequest:
+        # Нажата кнопка текущей страницы
+        await callback.answer()
+
+    await log(callback)
+
+
+@admin_callback(F.data.startswith("find_open_"))
+async def find_open(
+    callback: CallbackQuery,
+    state: FSMContext
+) -> None:
+    """
+    Отправляет карточку участника из результатов поиска.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+    """
+    if not isinstance(callback.message, Message) or not callback.bot:
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    number: str = (callback.data or "").removeprefix("find_open_")
+    if not loc or not number.isdigit():
+        return
+
+    screen: Any = loc.default.admin.find_user
+    user: User | None
+    card: str = ""
+    async with async_session() as session:
+        user = await UserManager(session).get_by_id(
+            user_id=int(number),
+            bot_id=callback.bot.id,
+        )
+        if user is not None:
+            card = await user_card(
+                session, user, loc.default.admin.input_code.names
+            )
+
+    if user is None:
+        await callback.answer(screen.missing, show_alert=True)
+        return
+
+    part1: str
+    part2: str
+    part3: str
+    part1, part2, part3 = screen.card
+    await callback.message.answer(
+        f"{part1}{user.code or "—"}{part2}{card}{part3}"
+    )
+    await callback.answer()
+
+    await log(callback)
+
+
+@admin_callback(F.data == "table_sync")
+async def table_sync(
+    callback: CallbackQuery,
+    state: FSMContext
+) -> None:
+    """
+    Выгружает в таблицу изменения, накопившиеся с прошлой
+    синхронизации, и показывает количество строк.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+    """
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    diff: SyncDiff = await get_sheet_sync().sync()
+
+    part1: str
+    part2: str
+    part1, part2 = loc.default.admin.table.sync
+    await callback.answer(
+        f"{part1}{len(diff.changes)}{part2}{len(diff.cleared)}",
+        show_alert=True
+    )
+
+    await log(callback)
+
+
+@admin_callback(F.data == "stats_main")
+async def stats_main(
+    callback: CallbackQuery,
+    state: FSMContext
+) -> None:
+    """
+    Показывает общую статистику регистраций.
+
+    Значения читаются из счётчиков, которые изменяются при
+    регистрации и её отмене, поэтому экран не обходит таблицы
+    пользователей и ответов.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+    """
+    if not isinstance(callback.message, Message) or not callback.bot:
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    screen: Any = loc.default.admin.stats_main
+    totals: tuple[str, ...] = (
+        METRIC_REGISTERED, METRIC_CONFIRMED, METRIC_PENDING, METRIC_CANCELLED
+    )
+    async with async_session() as session:
+        stats: dict[str, dict[str, int]] = await StatManager(session).get(
+            callback.bot.id, [*totals, METRIC_DAY, METRIC_HOUR]
+        )
+
+    lines: list[str] = [
+        f"🔸 {screen.names.get(metric)}: {stats[metric].get('', 0)}"
+        for metric in totals
+    ]
+    # Ключи дней в формате ГГГГ-ММ-ДД сортируются как даты
+    days: list[str] = [
+        f"🔸 {day[8:10]}.{day[5:7]}.{day[:4]}: {value}"
+        for day, value in sorted(stats[METRIC_DAY].items(), reverse=True)
+        if value > 0
+    ][:STATS_DAYS]
+    hours: list[str] = [
+        f"🔸 {hour}:00–{(int(hour) + 1) % 24:02d}:00: {value}"
+        for hour, value in sorted(
+            stats[METRIC_HOUR].items(), key=lambda item: -item[1]
+        )
+        if value > 0
+    ][:STATS_HOURS]
+
+    keyboard: kb.InlineKeyboardMarkup = await kb.keyboard_dynamic(
+        screen.keyboard
+    )
+    try:
+        await callback.message.edit_text(
+            f"{screen.text}{"\n".join(lines)}"
+            f"{screen.days}{"\n".join(days) or screen.empty}"
+            f"{screen.hours}{"\n".join(hours) or screen.empty}",
+            reply_markup=keyboard
+        )
+    except TelegramBadRequest:
+        # Статистика не изменилась с прошлого обновления
+        await callback.answer()
+
+    await log(callback)
+
+
+@admin_callback(F.data == "stats_zone")
+async def stats_zone(
+    callback: CallbackQuery,
+    state: FSMContext
+) -> None:
+    """
+    Показывает распределение ответов на шаги выбора.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+    """
+    if not isinstance(callback.message, Message) or not callback.bot:
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    screen: Any = loc.default.admin.stats_zone
+    async with async_session() as session:
+        stats: dict[str, dict[str, int]] = await StatManager(
+            session
+        ).prefixed(callback.bot.id, METRIC_OPTION)
+
+    # Названия шагов берутся из локализации пользователей
+    loc_user: Localization = await load_localization(
+        data.get("lang") or "ru", "user"
+    )
+    blocks: list[str] = []
+    for step_id, step in loc_user.steps_index.items():
+        counts: dict[str, int] = stats.get(f"{METRIC_OPTION}{step_id}", {})
+        options: list[tuple[str, int]] = sorted(
+            ((key, value) for key, value in counts.items() if value > 0),
+            key=lambda item: -item[1],
+        )
+        if not options:
+            continue
+        lines: list[str] = [
+            f"🔸 {escape(key)}: {value}"
+            for key, value in options[:STATS_OPTIONS]
+        ]
+        other: int = sum(value for _, value in options[STATS_OPTIONS:])
+        if other:
+            lines.append(f"🔸 {screen.other}: {other}")
+        blocks.append(f"<b>{escape(step.text)}</b>\n{"\n".join(lines)}")
+
+    keyboard: kb.InlineKeyboardMarkup = await kb.keyboard_dynamic(
+        screen.keyboard
+    )
+    text: str = (
+        f"{screen.text}\n\n{"\n\n".join(blocks)}" if blocks
+        else f"{screen.text}{screen.empty}"
+    )
+    try:
+        await callback.message.edit_text(
+            text,
+            reply_markup=keyboard
+        )
+    except TelegramBadRequest:
+        # Статистика не изменилась с прошлого обновления
+        await callback.answer()
+
+    await log(callback)
+
+
+@admin_callback(F.data == "bot_settings")
+async def bot_settings(
+    callback: CallbackQuery,
+    state: FSMContext
+) -> None:
+    """
+    Показывает блокировки бота с кнопками переключения.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+    """
+    if not isinstance(callback.message, Message):
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    await _show_flags(callback.message, loc.default.admin.bot_settings)
+    await log(callback)
+
+
+@admin_callback(F.data.startswith("flag_"))
+async def flag_toggle(
+    callback: CallbackQuery,
+    state: FSMContext,
+    role: str
+) -> None:
+    """
+    Переключает блокировку бота.
+
+    Флаг сохраняется в базе и сразу применяется в памяти; другие
+    процессы подхватывают его при проверке версии флагов.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+        role (str): роль администратора из фильтра
+    """
+    if not isinstance(callback.message, Message):
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    screen: Any = loc.default.admin.bot_settings
+    name: str = (callback.data or "").removeprefix("flag_")
+    if name not in screen.flags:
+        return
+    if role != ROLE_MAIN:
+        await callback.answer(screen.forbidden, show_alert=True)
+        return
+
+    flags: FlagService = get_flag_service()
+    await flags.set(name, not flags.get(name))
+
+    await _show_flags(callback.message, screen)
+    await log(callback)
+
+
+async def _show_flags(
+    message: Message,
+    screen: Any,
+) -> None:
+    """
+    Отрисовывает экран блокировок с текущими значениями флагов.
+
+    Args:
+        message (Message): сообщение панели
+        screen (Any): узел локализации экрана
+    """
+    flags: FlagService = get_flag_service()
+    rows: list[list[list[str]]] = [
+        [[
+            f"{screen.on if flags.get(name) else screen.off}"
+            f"{screen.flags.get(name)}",
+            f"flag_{name}",
+        ]]
+        for name in screen.flags
+    ]
+    keyboard: kb.InlineKeyboardMarkup = await kb.keyboard_dynamic(
+        [*rows, *screen.keyboard]
+    )
+    await message.edit_text(
+        screen.text,
+        reply_markup=keyboard
+    )
+
+
+@admin_callback(F.data == "admin_list")
+async def admin_list(
+    callback: CallbackQuery,
+    state: FSMContext
+) -> None:
+    """
+    Показывает администраторов бота из базы данных.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+    """
+    if not isinstance(callback.message, Message) or not callback.bot:
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    # Возврат с экрана добавления или удаления выключает режим ввода
+    if data.get("admin_input"):
+        await state.update_data(admin_input=None)
+
+    screen: Any = loc.default.admin.admin_list
+    async with async_session() as session:
+        admins: list[Admin] = await AdminManager(session).all(
+            bot_id=callback.bot.id
+        )
+
+    lines: list[str] = [
+        f"🔸 <code>{admin.tg_id}</code>"
+        f"{f' {escape(admin.name)}' if admin.name else ''} — "
+        f"{screen.roles.get(admin.role, admin.role)}"
+        for admin in admins
+    ]
+    keyboard: kb.InlineKeyboardMarkup = await kb.keyboard_dynamic(
+        screen.keyboard
+    )
+    await callback.message.edit_text(
+        f"{screen.text}{"\n".join(lines) or screen.empty}{screen.hint}",
+        reply_markup=keyboard
+    )
+
+    await log(callback)
+
+
+@admin_callback(F.data.in_({"admin_add", "admin_remove"}))
+async def admin_edit(
+    callback: CallbackQuery,
+    state: FSMContext,
+    role: str
+) -> None:
+    """
+    Включает режим добавления или удаления администратора.
+
+    Список администраторов изменяют только главные администраторы.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+        role (str): роль администратора из фильтра
+    """
+    if not isinstance(callback.message, Message):
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    screen: Any = loc.default.admin.admin_list
+    if role != ROLE_MAIN:
+        await callback.answer(screen.forbidden, show_alert=True)
+        return
+
+    mode: str = callback.data or ""
+    keyboard: kb.InlineKeyboardMarkup = await kb.keyboard_dynamic(
+        screen.input.keyboard
+    )
+    await state.update_data(admin_input=mode)
+    await callback.message.edit_text(
+        screen.add if mode == "admin_add" else screen.remove,
+        reply_markup=keyboard
+    )
+
+    await log(callback)
+
+
+@admin_callback(F.data == "broadcast")
+async def broadcast(
+    callback: CallbackQuery,
+    state: FSMContext
+) -> None:
+    """
+    Показывает текст рассылки и кнопки её запуска.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+    """
+    if not isinstance(callback.message, Message) or not callback.bot:
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    # Возврат с экрана ввода текста выключает режим ввода
+    if data.get("admin_input"):
+        await state.update_data(admin_input=None)
+
+    screen: Any = loc.default.admin.broadcast
+    draft: tuple[str, str] | None = await _draft(
+        callback.from_user.id, callback.bot.id
+    )
+    preview: str = screen.empty
+    if draft is not None:
+        preview = escape(draft[0][:PREVIEW_LIMIT])
+        if len(draft[0]) > PREVIEW_LIMIT:
+            preview += "…"
+
+    keyboard: kb.InlineKeyboardMarkup = await kb.keyboard_dynamic(
+        screen.keyboard
+    )
+    await callback.message.edit_text(
+        f"{screen.text}{preview}{screen.hint}",
+        reply_markup=keyboard
+    )
+
+    await log(callback)
+
+
+@admin_callback(F.data == "broadcast_edit")
+async def broadcast_edit(
+    callback: CallbackQuery,
+    state: FSMContext,
+    role: str
+) -> None:
+    """
+    Включает режим ввода текста рассылки.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+        role (str): роль администратора из фильтра
+    """
+    if not isinstance(callback.message, Message):
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    screen: Any = loc.default.admin.broadcast
+    if role != ROLE_MAIN:
+        await callback.answer(screen.forbidden, show_alert=True)
+        return
+
+    keyboard: kb.InlineKeyboardMarkup = await kb.keyboard_dynamic(
+        screen.input.keyboard
+    )
+    await state.update_data(admin_input="broadcast")
+    await callback.message.edit_text(
+        screen.input.text,
+        reply_markup=keyboard
+    )
+
+    await log(callback)
+
+
+@admin_callback(F.data == "broadcast_start")
+async def broadcast_start(
+    callback: CallbackQuery,
+    state: FSMContext,
+    role: str
+) -> None:
+    """
+    Запускает рассылку текста по всем пользователям бота.
+
+    Сообщение панели становится отчётом о прогрессе: движок
+    рассылок обновляет в нём счётчики, скорость и оставшееся время.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+        role (str): роль администратора из фильтра
+    """
+    if not isinstance(callback.message, Message) or not callback.bot:
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    screen: Any = loc.default.admin.broadcast
+    if role != ROLE_MAIN:
+        await callback.answer(screen.forbidden, show_alert=True)
+        return
+
+    draft: tuple[str, str] | None = await _draft(
+        callback.from_user.id, callback.bot.id
+    )
+    if draft is None:
+        await callback.answer(screen.no_text, show_alert=True)
+        return
+
+    job: Broadcast | None = await get_broadcast_engine().start(
+        bot=callback.bot,
+        admin_tg_id=callback.from_user.id,
+        text=draft[0],
+        entities=draft[1],
+        lang=data.get("lang") or "ru",
+        progress_msg_id=callback.message.message_id,
+    )
+    if job is None:
+        await callback.answer(screen.running, show_alert=True)
+        return
+    await callback.answer()
+
+    await log(callback)
+
+
+@admin_callback(F.data == "broadcast_stop")
+async def broadcast_stop(
+    callback: CallbackQuery,
+    state: FSMContext,
+    role: str
+) -> None:
+    """
+    Останавливает рассылку бота.
+
+    Args:
+        callback (CallbackQuery): объект коллбека
+        state (FSMContext): контекст FSM для хранения данных
+        role (str): роль администратора из фильтра
+    """
+    if not callback.bot:
+        return
+
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc:
+        return
+
+    if role != ROLE_MAIN:
+        await callback.answer(
+            loc.default.admin.broadcast.forbidden, show_alert=True
+        )
+        return
+
+    async with async_session() as session:
+        jobs: list[Broadcast] = await BroadcastManager(session).active(
+            callback.bot.id
+        )
+    for job in jobs:
+        await get_broadcast_engine().cancel(callback.bot, job.id)
+    await callback.answer()
+
+    await log(callback)
+
+
+async def _draft(
+    tg_id: int,
+    bot_id: int,
+) -> tuple[str, str] | None:
+    """
+    Возвращает сохранённый текст рассылки администратора.
+
+    Args:
+        tg_id (int): Telegram ID администратора.
+        bot_id (int): ID бота.
+
+    Returns:
+        tuple[str, str] | None: Текст и разметка в JSON или None,
+            если текст не задан.
+    """
+    async with async_session() as session:
+        draft: Broadcast | None = await BroadcastManager(session).draft(
+            bot_id, tg_id
+        )
+    if draft is None:
+        return None
+    return draft.text, draft.entities
+
+
 # Обработчик основного меню админа
 @admin_callback()
 async def main(
@@ -78,24 +862,23 @@ async def main(
     if not loc:
         return
 
+    # Уход с экрана ввода выключает режим ввода
+    if data.get("admin_input"):
+        await state.update_data(admin_input=None)
+
     key_path: str = callback.data or ''
     if not key_path.startswith("admin"):
         key_path = f"admin.{key_path}"
 
-    # Двигаемся по вложенной структуре локализации
-    keys: list[str] = key_path.split('.')
-    current: Any = loc.default
-
-    try:
-        for k in keys:
-            current = getattr(current, k)
-    except AttributeError:
+    # Ищем меню в таблице путей локализации
+    current: Any = loc.lookup(f"default.{key_path}")
+    if not isinstance(current, LocNode) or "text" not in current:
         # Если ключа нет — выходим
         return
 
     # Получаем текст и клавиатуру
     text: str = current.text
-    keyboard_data: list = getattr(current, 'keyboard', [])
+    keyboard_data: Any = current.get('keyboard', ())
     keyboard: kb.InlineKeyboardMarkup = await kb.keyboard_dynamic(
         keyboard_data
     )
@@ -62,6 +62,10 @@ async def start(
     if not loc:
         return
 
+    # Новая панель открывается без режима ввода
+    if data.get("admin_input"):
+        await state.update_data(admin_input=None)
+
     # Получаем текст и данные клавиатуры из локализации
     text: str = loc.default.admin.text
     keyboard_data: list = loc.default.admin.keyboard
@@ -1,17 +1,28 @@
+import json
+from html import escape
 from typing import Any, Callable
 
-from aiogram import Router
+from aiogram import F, Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import InlineKeyboardMarkup, Message
 
-from app.config import COMMAND_MAIN
-from app.core.bot.routers.filters import AdminFilter, ChatTypeFilter
+from app.config import COMMAND_MAIN, SEARCH_PAGE_SIZE
+from app.core.bot.routers.admin.views import search_results, user_card
+from app.core.bot.routers.filters import (AdminFilter, AdminInputFilter,
+                                          ChatTypeFilter)
 from app.core.bot.services.keyboards import keyboard_dynamic
 from app.core.bot.services.logger import log
+from app.core.bot.services.roles import ROLE_MAIN, get_role_resolver
+from app.core.bot.services.search import SearchPage, search_users
+from app.core.database import (AdminManager, BroadcastManager, User,
+                               UserManager, async_session)
 
 router: Router = Router()
 
+# Максимальная длина поискового запроса
+QUERY_LIMIT: int = 100
+
 
 def admin_message(
     *filters: Any
@@ -38,3 +49,250 @@ def admin_message(
         )(func)
 
     return decorator
+
+
+@admin_message(AdminInputFilter("code"), F.text)
+async def input_code(
+    message: Message,
+    state: FSMContext
+) -> None:
+    """
+    Ищет участника по коду и отправляет его карточку.
+
+    Поиск идёт по уникальному индексу кода, поэтому карточка
+    появляется сразу при любом числе участников.
+
+    Args:
+        message (Message): Объект входящего сообщения Telegram.
+        state (FSMContext): Контекст FSM для хранения данных.
+    """
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc or not message.bot or not message.text:
+        return
+
+    screen: Any = loc.default.admin.input_code
+    keyboard: InlineKeyboardMarkup = await keyboard_dynamic(screen.keyboard)
+
+    text: str = message.text.strip()
+    user: User | None = None
+    card: str = ""
+    if text.isdigit():
+        async with async_session() as session:
+            user = await UserManager(session).get_by_code(
+                code=int(text),
+                bot_id=message.bot.id,
+            )
+            if user is not None:
+                card = await user_card(session, user, screen.names)
+
+    part1: str
+    part2: str
+    part3: str
+    if user is None:
+        part1, part2 = screen.not_found
+        answer: str = f"{part1}{escape(text)}{part2}"
+    else:
+        part1, part2, part3 = screen.found
+        answer = f"{part1}{user.code}{part2}{card}{part3}"
+
+    await message.answer(
+        text=answer,
+        reply_markup=keyboard
+    )
+
+    await log(message)
+
+
+@admin_message(AdminInputFilter("find_user"), F.text)
+async def find_user(
+    message: Message,
+    state: FSMContext
+) -> None:
+    """
+    Ищет участников по ФИО, группе или ВУЗу и отправляет первую
+    страницу результатов.
+
+    Слова запроса ищутся как начала слов в ответах участников,
+    поэтому достаточно первых букв фамилии или имени.
+
+    Args:
+        message (Message): Объект входящего сообщения Telegram.
+        state (FSMContext): Контекст FSM для хранения данных.
+    """
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc or not message.bot or not message.text:
+        return
+
+    query: str = message.text.strip()[:QUERY_LIMIT]
+    # Запрос нужен кнопкам переключения страниц
+    await state.update_data(find_query=query)
+
+    page: SearchPage = await search_users(
+        bot_id=message.bot.id,
+        query=query,
+        page=0,
+        page_size=SEARCH_PAGE_SIZE,
+    )
+    text: str
+    keyboard: InlineKeyboardMarkup
+    text, keyboard = await search_results(loc.default.admin.find_user, page)
+    await message.answer(
+        text=text,
+        reply_markup=keyboard
+    )
+
+    await log(message)
+
+
+@admin_message(AdminInputFilter("admin_add"), F.text)
+async def admin_add(
+    message: Message,
+    state: FSMContext,
+    role: str
+) -> None:
+    """
+    Добавляет модератора по Telegram ID.
+
+    Args:
+        message (Message): Объект входящего сообщения Telegram.
+        state (FSMContext): Контекст FSM для хранения данных.
+        role (str): Роль администратора из фильтра.
+    """
+    await _edit_admins(message, state, role, add=True)
+
+
+@admin_message(AdminInputFilter("admin_remove"), F.text)
+async def admin_remove(
+    message: Message,
+    state: FSMContext,
+    role: str
+) -> None:
+    """
+    Удаляет администратора по Telegram ID.
+
+    Args:
+        message (Message): Объект входящего сообщения Telegram.
+        state (FSMContext): Контекст FSM для хранения данных.
+        role (str): Роль администратора из фильтра.
+    """
+    await _edit_admins(message, state, role, add=False)
+
+
+@admin_message(AdminInputFilter("broadcast"), F.text)
+async def broadcast_text(
+    message: Message,
+    state: FSMContext,
+    role: str
+) -> None:
+    """
+    Сохраняет текст рассылки вместе с его форматированием.
+
+    Args:
+        message (Message): Объект входящего сообщения Telegram.
+        state (FSMContext): Контекст FSM для хранения данных.
+        role (str): Роль администратора из фильтра.
+    """
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc or not message.bot or not message.text or not message.from_user:
+        return
+
+    screen: Any = loc.default.admin.broadcast
+    keyboard: InlineKeyboardMarkup = await keyboard_dynamic(
+        screen.input.keyboard
+    )
+    if role != ROLE_MAIN:
+        await message.answer(text=screen.forbidden, reply_markup=keyboard)
+        return
+
+    tg_id: int = message.from_user.id
+    bot_id: int = message.bot.id
+    entities: str = json.dumps(
+        [
+            entity.model_dump(mode="json", exclude_none=True)
+            for entity in message.entities or []
+        ],
+        ensure_ascii=False,
+    )
+    # Черновик хранится отдельно от таблицы admin: у главных
+    # администраторов из настроек может не быть записи в ней
+    async with async_session() as session:
+        await BroadcastManager(session).save_draft(
+            bot_id=bot_id,
+            admin_tg_id=tg_id,
+            text=message.text,
+            entities=entities,
+        )
+
+    await message.answer(
+        text=screen.saved,
+        reply_markup=keyboard
+    )
+
+    await log(message)
+
+
+async def _edit_admins(
+    message: Message,
+    state: FSMContext,
+    role: str,
+    add: bool,
+) -> None:
+    """
+    Добавляет или удаляет администратора и сбрасывает кэш его роли.
+
+    Args:
+        message (Message): Сообщение с Telegram ID.
+        state (FSMContext): Контекст FSM для хранения данных.
+        role (str): Роль отправителя.
+        add (bool): Добавить (True) или удалить (False).
+    """
+    data: dict = await state.get_data()
+    loc: Any | None = data.get("loc_admin")
+    if not loc or not message.bot or not message.text:
+        return
+
+    screen: Any = loc.default.admin.admin_list
+    keyboard: InlineKeyboardMarkup = await keyboard_dynamic(
+        screen.input.keyboard
+    )
+    # Роль могли отозвать после открытия экрана
+    if role != ROLE_MAIN:
+        await message.answer(text=screen.forbidden, reply_markup=keyboard)
+        return
+
+    text: str = message.text.strip()
+    if not text.isdigit():
+        await message.answer(text=screen.invalid, reply_markup=keyboard)
+        return
+
+    tg_id: int = int(text)
+    bot_id: int = message.bot.id
+    template: Any
+    async with async_session() as session:
+        manager = AdminManager(session)
+        if add:
+            if await manager.get(tg_id=tg_id, bot_id=bot_id) is not None:
+                template = screen.exists
+            else:
+                await manager.create(tg_id=tg_id, bot_id=bot_id)
+                template = screen.added
+        elif await manager.delete(tg_id=tg_id, bot_id=bot_id):
+            template = screen.removed
+        else:
+            template = screen.not_found
+
+    # Новая роль действует сразу, без ожидания истечения кэша
+    get_role_resolver().invalidate(tg_id, bot_id)
+
+    part1: str
+    part2: str
+    part1, part2 = template
+    await message.answer(
+        text=f"{part1}{tg_id}{part2}",
+        reply_markup=keyboard
+    )
+
+    await log(message)
@@ -0,0 +1,110 @@
+from html import escape
+from typing import Any
+
+from aiogram.types import InlineKeyboardMarkup
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bot.services.keyboards import keyboard_dynamic
+from app.core.bot.services.search import SearchPage
+from app.core.database import DataManager, User
+
+# Максимальная длина подписи кнопки участника в результатах поиска
+BUTTON_LIMIT: int = 60
+
+
+async def user_card(
+    session: AsyncSession,
+    user: User,
+    names: Any
+) -> str:
+    """
+    Собирает строки карточки участника: Telegram ID, дату
+    регистрации и ответы.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Сессия для чтения данных участника.
+    user : User
+        Участник.
+    names : Any
+        Названия полей карточки из локализации.
+
+    Returns
+    -------
+    str
+        Строки карточки для HTML-разметки.
+    """
+    fields: dict[str, Any] = await DataManager(session).dict_all(
+        tg_id=user.tg_id,
+        bot_id=user.bot_id,
+        user=user.id,
+    )
+    registration: str = (
+        user.date_registration.strftime("%d.%m.%Y %H:%M")
+        if user.date_registration else "—"
+    )
+    lines: list[str] = [
+        f"🔸 {names.id}: <code>{user.tg_id}</code>",
+        f"🔸 {names.registration}: {registration}",
+        *(
+            f"🔸 {escape(key)}: {escape(str(value))}"
+            for key, value in fields.items()
+        ),
+    ]
+    return "\n".join(lines)
+
+
+async def search_results(
+    screen: Any,
+    page: SearchPage
+) -> tuple[str, InlineKeyboardMarkup]:
+    """
+    Собирает текст и клавиатуру страницы результатов поиска.
+
+    Каждый найденный участник — отдельная кнопка, открывающая его
+    карточку, под ними — переключение страниц.
+
+    Parameters
+    ----------
+    screen : Any
+        Экран поиска из локализации.
+    page : SearchPage
+        Страница результатов.
+
+    Returns
+    -------
+    tuple[str, InlineKeyboardMarkup]
+        Текст сообщения и клавиатура.
+    """
+    part1: str
+    part2: str
+    part3: str
+    if not page.total:
+        part1, part2 = screen.empty
+        text: str = f"{part1}{escape(page.query)}{part2}"
+        return text, await keyboard_dynamic(screen.keyboard)
+
+    part1, part2, part3 = screen.results
+    text = f"{part1}{escape(page.query)}{part2}{page.total}{part3}"
+
+    rows: list[list[list[str]]] = []
+    for user_id, code, title in page.hits:
+        label: str = f"{code} · {title}" if code is not None else title
+        if len(label) > BUTTON_LIMIT:
+            label = label[:BUTTON_LIMIT - 1] + "…"
+        rows.append([[label, f"find_open_{user_id}"]])
+
+    if page.pages > 1:
+        previous: str
+        following: str
+        previous, following = screen.nav
+        nav: list[list[str]] = []
+        if page.page > 0:
+            nav.append([previous, f"find_page_{page.page - 1}"])
+        nav.append([f"{page.page + 1}/{page.pages}", f"find_page_{page.page}"])
+        if page.page + 1 < page.pages:
+            nav.append([following, f"find_page_{page.page + 1}"])
+        rows.append(nav)
+
+    return text, await keyboard_dynamic([*rows, *screen.keyboard])
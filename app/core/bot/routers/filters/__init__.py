@@ -7,6 +7,7 @@
 
 # Импорт фильтров
 from .admin import AdminFilter
+from .admin_input import AdminInputFilter
 from .chat_type import ChatTypeFilter
 from .intercept import InterceptFilter
 from .user import CallbackNextFilter
@@ -14,6 +15,7 @@ from .user import CallbackNextFilter
 # Экспортируемые объекты модуля
 __all__: list[str] = [
     "AdminFilter",
+    "AdminInputFilter",
     "ChatTypeFilter",
     "InterceptFilter",
     "CallbackNextFilter",
@@ -2,42 +2,36 @@
 Фильтр для проверки прав администратора с произвольными ролями.
 """
 
+from collections.abc import Iterable
 from typing import Any
 
 from aiogram.filters import BaseFilter
 from aiogram.types import CallbackQuery, Message
 
-from app.config import MAIN_ADMINS
-
-# Временный список администраторов для демонстрации
-ADMINS: list[int] = [111111111, 1645736584]
-
-# Словарь ролей с их пользователями
-ROLES: dict[str, list[int]] = {
-    "main": MAIN_ADMINS,
-    "moderator": ADMINS,
-}
+from app.core.bot.services.roles import get_role_resolver
 
 
 class AdminFilter(BaseFilter):
     """Фильтр для проверки, является ли пользователь администратором.
 
-    Возвращает словарь с ролью, если пользователь найден,
-    иначе возвращает False.
+    Роль определяется по настройкам и таблице администраторов с
+    кэшированием в памяти, без запросов к Telegram API. Возвращает
+    словарь с ролью, если пользователь найден, иначе возвращает False.
     """
 
     def __init__(
         self,
-        roles: dict[str, list[int]] | None = None,
+        roles: Iterable[str] | None = None,
     ) -> None:
         """Инициализация фильтра.
 
         Args:
-            roles (dict[str, list[int]] | None): Словарь ролей
-                с пользователями. Если None, используется
-                глобальный словарь ROLES.
+            roles (Iterable[str] | None): Допустимые роли. Если None,
+                подходит любая роль администратора.
         """
-        self.roles: dict[str, list[int]] = roles or ROLES
+        self.roles: frozenset[str] | None = (
+            frozenset(roles) if roles is not None else None
+        )
 
     async def __call__(
         self,
@@ -53,36 +47,14 @@ class AdminFilter(BaseFilter):
                 пользователь найден, иначе False.
         """
         from_user: Any | None = getattr(event, "from_user", None)
-        if not from_user:
-            return False
-
-        tg_id: int = from_user.id
-        chat_id: int | None = None
         bot: Any | None = getattr(event, "bot", None)
-
-        # Определяем chat_id в зависимости от типа события
-        if isinstance(event, Message):
-            chat_id = event.chat.id
-        elif isinstance(event, CallbackQuery):
-            if not event.message:
-                return False
-            chat_id = event.message.chat.id
-        else:
+        if not from_user or not bot:
             return False
 
-        # Проверяем локальные роли
-        for role, tg_ids in self.roles.items():
-            if tg_id in tg_ids:
-                return {"role": role}
-
-        # Проверка через Telegram API
-        if bot and chat_id is not None:
-            try:
-                member: Any = await bot.get_chat_member(chat_id, tg_id)
-                if member.status in {"administrator", "creator"}:
-                    return {"role": "moderator"}
-            except Exception:
-                # Игнорируем ошибки, например, если бот не администратор
-                pass
-
-        return False
+        role: str | None = await get_role_resolver().resolve(
+            tg_id=from_user.id,
+            bot_id=bot.id,
+        )
+        if role is None or (self.roles is not None and role not in self.roles):
+            return False
+        return {"role": role}
@@ -0,0 +1,46 @@
+"""
+Фильтр сообщений администратора, ожидающих ввода в админ-панели.
+"""
+
+from typing import Any
+
+from aiogram.filters import BaseFilter
+from aiogram.fsm.context import FSMContext
+from aiogram.types import Message
+
+
+class AdminInputFilter(BaseFilter):
+    """Фильтр, пропускающий сообщения в заданном режиме ввода.
+
+    Режим ввода хранится в данных FSM под ключом ``admin_input`` и
+    устанавливается экраном админ-панели (например, "Ввод кода").
+    Остальные сообщения администратора идут в обычный сценарий.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+    ) -> None:
+        """Инициализация фильтра.
+
+        Args:
+            mode (str): Режим ввода, например "code".
+        """
+        self.mode: str = mode
+
+    async def __call__(
+        self,
+        message: Message,
+        state: FSMContext,
+    ) -> bool:
+        """Проверяет режим ввода администратора.
+
+        Args:
+            message (Message): Сообщение от Telegram.
+            state (FSMContext): Контекст FSM администратора.
+
+        Returns:
+            bool: True, если администратор в режиме ввода mode.
+        """
+        data: dict[str, Any] = await state.get_data()
+        return data.get("admin_input") == self.mode
@@ -2,35 +2,27 @@
 Фильтр для проверки активных блокировок бота.
 """
 
+from typing import Any
+
 from aiogram.filters import BaseFilter
 from aiogram.types import CallbackQuery, Message
 
-# Глобальные флаги состояния бота
-FLAG_BOT: bool = False
-FLAG_REG: bool = False
+from app.core.bot.services.flags import (FLAG_BOT, FLAG_REG, FlagService,
+                                         get_flag_service)
+from app.core.bot.services.roles import get_role_resolver
 
 
 class InterceptFilter(BaseFilter):
     """Фильтр для проверки активных блокировок бота.
 
+    Флаги читаются из памяти сервиса флагов на каждом событии, поэтому
+    техобслуживание и закрытие регистрации включаются из админ-панели
+    без перезапуска. Администраторов блокировка не касается.
+
     Возвращает словарь с активными флагами, если есть блокировка,
     иначе возвращает False.
     """
 
-    def __init__(
-        self,
-        flag_bot: bool = FLAG_BOT,
-        flag_reg: bool = FLAG_REG,
-    ) -> None:
-        """Инициализация фильтра.
-
-        Args:
-            flag_bot (bool): Флаг техобслуживания.
-            flag_reg (bool): Флаг закрытой регистрации.
-        """
-        self.flag_bot: bool = flag_bot
-        self.flag_reg: bool = flag_reg
-
     async def __call__(
         self,
         event: Message | CallbackQuery,
@@ -44,9 +36,22 @@ class InterceptFilter(BaseFilter):
             dict[str, bool] | bool: Словарь с активными флагами,
                 если есть блокировка, иначе False.
         """
-        if self.flag_bot or self.flag_reg:
-            return {
-                "flag_bot": self.flag_bot,
-                "flag_reg": self.flag_reg,
-            }
-        return False
+        flags: FlagService = get_flag_service()
+        flag_bot: bool = flags.get(FLAG_BOT)
+        flag_reg: bool = flags.get(FLAG_REG)
+        if not flag_bot and not flag_reg:
+            return False
+
+        # Администраторы должны иметь возможность снять блокировку
+        from_user: Any | None = getattr(event, "from_user", None)
+        bot: Any | None = getattr(event, "bot", None)
+        if from_user and bot and await get_role_resolver().resolve(
+            tg_id=from_user.id,
+            bot_id=bot.id,
+        ):
+            return False
+
+        return {
+            "flag_bot": flag_bot,
+            "flag_reg": flag_reg,
+        }
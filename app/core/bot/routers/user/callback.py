@@ -15,6 +15,8 @@ from app.core.bot.routers.filters import CallbackNextFilter, ChatTypeFilter
 from app.core.bot.services.keyboards import kb_cancel_confirm
 from app.core.bot.services.logger import log
 from app.core.bot.services.multi import multi
+from app.core.bot.services.persistence import get_write_behind
+from app.core.bot.services.stats import cancellation_deltas
 
 
 def get_router_user_callback() -> Router:
@@ -203,6 +205,15 @@ def get_router_user_callback() -> Router:
         )
         user_db: Any = user_data.get("user_db")
         data_db: Any = user_data.get("data_db")
+
+        # Отмена вычитается из счётчиков до очистки ответов; запись
+        # идёт вместе с изменением пользователя
+        if user_db.date_registration is not None and callback.bot:
+            get_write_behind().record(
+                tg_id=callback.from_user.id,
+                bot_id=callback.bot.id,
+                deltas=cancellation_deltas(user_db, data_db, loc),
+            )
         data_db.clear()
 
         if not isinstance(callback.message, types.Message):
@@ -67,7 +67,7 @@ def get_router_user_message() -> Router:
             return
 
         # Проверяем, что шаг пользователя ожидает ввод текста
-        state_obj: Any | None = getattr(loc.steps, user_state, None)
+        state_obj: Any | None = loc.step(user_state)
         if not state_obj or state_obj.type != "input":
             return
 
@@ -1,28 +1,65 @@
 """
 Модуль для запуска и остановки Telegram-ботов и проверки их состояния.
 
-Содержит функции для управления жизненным циклом ботов через PollingManager,
-включая регистрацию команд и настройку диспетчера.
+Содержит функции для управления жизненным циклом ботов через PollingManager
+или WebhookManager, включая регистрацию команд и настройку диспетчера.
+Общие службы процесса (экспорт в таблицу, буфер записи, хранилище FSM,
+сервер метрик и другие) запускаются первым вызовом run_bot и
+останавливаются, когда завершается последний из одновременных вызовов.
 """
 
 import asyncio
+from asyncio import Task
 
 from aiogram import Bot, Dispatcher
 from aiogram.types.user import User
 from loguru import logger
 
+from app.config import (BOT_MODE, GSHEET_SYNC_DELAY, IMAGE_PREBUILD,
+                        IMAGE_PREBUILD_WORKERS, IMAGE_PREWARM, METRICS_PORT,
+                        MORPH_WARMUP)
+from app.core.database import FileManager, async_session
+
 from .commands import register_bot_commands
 from .dispatcher import setup_dispatcher
+from .services.broadcast import get_broadcast_engine
+from .services.flags import get_flag_service
+from .services.generator import (assign_missing_codes, get_code_renderer,
+                                 prewarm_next_codes)
+from .services.generator.prebuild import prebuild_code_images
+from .services.google_sheets import get_sheet_exporter, get_sheet_sync
+from .services.localization import (get_localization_registry,
+                                    load_localization)
+from .services.metrics import get_metrics_server
+from .services.multi.graph import prewarm_step_titles
+from .services.persistence import get_write_behind
 from .services.polling import PollingManager, get_polling_manager
+from .services.session import close_bot_session
+from .services.storage import get_fsm_storage
+from .services.webhook import WebhookManager, get_webhook_manager
+
+# Количество выполняющихся вызовов run_bot и блокировка запуска и
+# остановки общих служб
+_active_runs: int = 0
+_services_lock: asyncio.Lock = asyncio.Lock()
+
+# Фоновый прогрев изображений кодов и склонений названий шагов и
+# сборка содержимого удалённых файлов
+_warmup_tasks: list[Task[int]] = []
 
 
 async def run_bot(
     api_tokens: str | list[str],
+    mode: str | dict[str, str] = BOT_MODE,
 ) -> bool:
     """Запускает одного или нескольких Telegram-ботов.
 
     Args:
         api_tokens (str | list[str]): API-токен бота или список токенов.
+        mode (str | dict[str, str]): Режим получения обновлений
+            ("polling" или "webhook") для всех ботов или словарь
+            токен → режим. Токены, которых нет в словаре, работают
+            через polling.
 
     Returns:
         bool: True, если хотя бы один бот успешно запущен, иначе False.
@@ -30,8 +67,28 @@ async def run_bot(
     if isinstance(api_tokens, str):
         api_tokens = [api_tokens]
 
-    dispatcher: Dispatcher = await setup_dispatcher()
     polling_manager: PollingManager = get_polling_manager()
+    webhook_manager: WebhookManager = get_webhook_manager()
+
+    async def on_startup(bot: Bot) -> None:
+        """Регистрирует команды бота, логирует его запуск и продолжает
+        незавершённые рассылки.
+
+        Args:
+            bot (Bot): Экземпляр бота из менеджера polling/webhook.
+        """
+        await register_bot_commands(bot)
+        bot_info: User = await bot.me()
+        logger.debug(f"Бот @{bot_info.username} запущен")
+        await get_broadcast_engine().resume(bot)
+
+    async def on_shutdown(bot: Bot) -> None:
+        """Обрабатывает остановку бота.
+
+        Рассылки бота прерываются и продолжатся при следующем запуске.
+        """
+        await get_broadcast_engine().stop(bot.id)
+        logger.debug(f"Бот остановлен")
 
     async def start_single_bot(token: str) -> bool:
         """Запускает одного бота по API-токену.
@@ -42,46 +99,161 @@ async def run_bot(
         Returns:
             bool: True, если бот успешно запущен, иначе False.
         """
-        if polling_manager.is_bot_running(token):
+        if is_bot_running(token):
             logger.warning("Бот запущен, повторный запуск отклонен")
             return False
 
-        try:
-            async with Bot(token) as bot:
-                await register_bot_commands(bot)
-
-                async def on_startup() -> None:
-                    """Обрабатывает запуск бота."""
-                    bot_info: User = await bot.get_me()
-                    logger.debug(f"Бот @{bot_info.username} запущен")
-
-                async def on_shutdown() -> None:
-                    """Обрабатывает остановку бота."""
-                    logger.debug(f"Бот остановлен")
+        bot_mode: str = (
+            mode.get(token, "polling") if isinstance(mode, dict) else mode
+        )
 
-                polling_manager.start_bot_polling(
+        try:
+            task: Task[None]
+            if bot_mode == "webhook":
+                task = webhook_manager.start_bot_webhook(
+                    dp=dispatcher,
+                    api_token=token,
+                    on_bot_startup=on_startup,
+                    on_bot_shutdown=on_shutdown,
+                )
+            else:
+                task = polling_manager.start_bot_polling(
                     dp=dispatcher,
                     api_token=token,
                     on_bot_startup=on_startup,
                     on_bot_shutdown=on_shutdown,
                 )
 
-                # Ждем, пока бот не будет остановлен
-                while polling_manager.is_bot_running(token):
-                    await asyncio.sleep(1)
-
+            # Ждем завершения задачи бота без периодического опроса.
+            # Остановка через stop_bot не считается ошибкой, а отмена
+            # самого run_bot останавливает бота.
+            try:
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
             return True
 
         except Exception as error:
             logger.exception(f"Ошибка при запуске бота {token}: {error}")
             return False
 
-    results: list[bool] = await asyncio.gather(
-        *(start_single_bot(t) for t in api_tokens)
-    )
+    await _acquire_services()
+    try:
+        dispatcher: Dispatcher = await setup_dispatcher()
+        results: list[bool] = await asyncio.gather(
+            *(start_single_bot(t) for t in api_tokens)
+        )
+    finally:
+        await _release_services()
     return any(results)
 
 
+async def _acquire_services() -> None:
+    """Запускает общие службы при первом вызове run_bot.
+
+    Если запуск прерван ошибкой, уже запущенные службы
+    останавливаются, а счётчик вызовов не меняется.
+    """
+    global _active_runs
+    async with _services_lock:
+        if not _active_runs:
+            try:
+                await _start_services()
+            except BaseException:
+                await _stop_services()
+                raise
+        _active_runs += 1
+
+
+async def _release_services() -> None:
+    """Останавливает общие службы после последнего вызова run_bot."""
+    global _active_runs
+    async with _services_lock:
+        _active_runs -= 1
+        if not _active_runs:
+            await _stop_services()
+
+
+async def _start_services() -> None:
+    """Загружает локализации и флаги, запускает сервер метрик, экспорт
+    в таблицу и фоновый прогрев."""
+    # Ошибки в файлах локализации обнаруживаются до запуска ботов
+    await get_localization_registry().preload()
+    await assign_missing_codes()
+
+    # Флаги блокировок читаются из памяти; изменения из других
+    # процессов подхватываются фоновой проверкой версии
+    await get_flag_service().load()
+    get_flag_service().start()
+
+    if METRICS_PORT:
+        await get_metrics_server().start()
+
+    # Отправка операций экспорта, оставшихся с прошлого запуска, и
+    # выгрузка изменений, не попавших в таблицу до остановки
+    get_sheet_exporter().start()
+    get_sheet_sync().schedule(GSHEET_SYNC_DELAY)
+
+    # Изображения кодов рендерятся в фоне: все коды на диск и
+    # ближайшие — в память
+    if IMAGE_PREBUILD:
+        _warmup_tasks.append(asyncio.create_task(
+            prebuild_code_images(IMAGE_PREBUILD_WORKERS)
+        ))
+    if IMAGE_PREWARM > 0:
+        _warmup_tasks.append(asyncio.create_task(
+            prewarm_next_codes(IMAGE_PREWARM)
+        ))
+    # Словарь морфологии и склонения названий шагов загружаются в фоне
+    # (морфология только для русского языка); без прогрева — при
+    # первом склонении
+    if MORPH_WARMUP:
+        _warmup_tasks.append(asyncio.create_task(
+            prewarm_step_titles(await load_localization("ru", "user"))
+        ))
+    # Содержимое файлов, на которое не осталось ссылок, удаляется
+    # из хранилища в фоне
+    _warmup_tasks.append(asyncio.create_task(_collect_file_blobs()))
+
+
+async def _collect_file_blobs() -> int:
+    """Удаляет содержимое файлов без ссылок из хранилища.
+
+    Returns:
+        int: Количество удалённых файлов содержимого.
+    """
+    async with async_session() as session:
+        return await FileManager(session).collect_garbage()
+
+
+async def _stop_services() -> None:
+    """Останавливает общие службы процесса.
+
+    Фоновый прогрев отменяется до закрытия служб, которые он
+    использует; отложенные изменения гарантированно записываются.
+    """
+    for warmup_task in _warmup_tasks:
+        warmup_task.cancel()
+    for result in await asyncio.gather(
+        *_warmup_tasks, return_exceptions=True
+    ):
+        if isinstance(result, Exception):
+            logger.error(f"Ошибка фонового прогрева: {result}")
+    _warmup_tasks.clear()
+
+    await get_broadcast_engine().close()
+    await get_flag_service().close()
+    await get_sheet_sync().close()
+    await get_write_behind().close()
+    await get_sheet_exporter().close()
+    await get_fsm_storage().close()
+    await close_bot_session()
+    await get_localization_registry().close()
+    await get_metrics_server().stop()
+    get_code_renderer().close()
+
+
 def stop_bot(
     api_tokens: str | list[str],
 ) -> bool:
@@ -97,18 +269,39 @@ def stop_bot(
         api_tokens = [api_tokens]
 
     polling_manager: PollingManager = get_polling_manager()
+    webhook_manager: WebhookManager = get_webhook_manager()
     stopped_any: bool = False
 
     for token in api_tokens:
         try:
-            if not polling_manager.is_bot_running(token):
+            if webhook_manager.is_bot_running(token):
+                webhook_manager.stop_bot_webhook(token)
+            elif polling_manager.is_bot_running(token):
+                polling_manager.stop_bot_polling(token)
+            else:
                 logger.warning(f"Бот не запущен, остановка отклонена")
                 continue
 
-            polling_manager.stop_bot_polling(token)
             stopped_any = True
 
         except Exception as error:
             logger.exception(f"Ошибка при остановке бота {token}: {error}")
 
     return stopped_any
+
+
+def is_bot_running(
+    api_token: str,
+) -> bool:
+    """Проверяет, запущен ли бот в любом из режимов.
+
+    Args:
+        api_token (str): API-токен бота.
+
+    Returns:
+        bool: True, если бот запущен, иначе False.
+    """
+    return (
+        get_polling_manager().is_bot_running(api_token)
+        or get_webhook_manager().is_bot_running(api_token)
+    )
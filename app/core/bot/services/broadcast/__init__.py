@@ -0,0 +1,17 @@
+"""
+Пакет рассылок.
+
+Содержит движок массовых рассылок с возобновлением после перезапуска,
+ограничитель частоты отправки и глобальный экземпляр движка.
+"""
+
+from .engine import BroadcastEngine, BroadcastProgress
+from .instance import get_broadcast_engine
+from .pacer import BroadcastPacer
+
+__all__: list[str] = [
+    "BroadcastEngine",
+    "BroadcastPacer",
+    "BroadcastProgress",
+    "get_broadcast_engine",
+]
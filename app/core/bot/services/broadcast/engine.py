@@ -0,0 +1,585 @@
+"""
+Модуль движка рассылок.
+
+Содержит класс BroadcastEngine: получатели читаются из таблицы user
+страницами по курсору ID (WHERE id > курсор ORDER BY id LIMIT n),
+поэтому рассылка по любому числу пользователей не держит их всех в
+памяти. Сообщения страницы отправляются параллельно через
+BroadcastPacer бота, после каждой страницы курсор и счётчики
+сохраняются в таблице broadcast. После падения или перезапуска
+незавершённые рассылки продолжаются с сохранённого курсора: сообщения
+последней незавершённой страницы могут прийти повторно, но ни один
+получатель не пропускается. Прогресс со скоростью и оценкой
+оставшегося времени обновляется в сообщении администратора.
+"""
+
+import asyncio
+import json
+import time
+from asyncio import Task
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from aiogram import Bot
+from aiogram.exceptions import (TelegramBadRequest, TelegramForbiddenError,
+                                TelegramNetworkError, TelegramRetryAfter,
+                                TelegramServerError)
+from aiogram.types import InlineKeyboardMarkup, MessageEntity
+from loguru import logger
+
+from app.core.bot.services.keyboards import keyboard_dynamic
+from app.core.bot.services.localization import (Localization,
+                                                load_localization)
+from app.core.bot.services.metrics import MetricsRegistry
+from app.core.database import Broadcast, BroadcastManager, async_session
+from app.core.database.models.broadcast import (STATUS_CANCELLED,
+                                                STATUS_DONE, STATUS_RUNNING)
+
+from .pacer import BroadcastPacer
+
+
+@dataclass(slots=True)
+class BroadcastProgress:
+    """Прогресс выполняемой рассылки.
+
+    Атрибуты:
+        total (int): Количество получателей при создании рассылки.
+        sent (int): Доставлено сообщений.
+        failed (int): Не доставлено сообщений.
+        started (float): Момент запуска в этом процессе.
+        initial (int): Обработано получателей до запуска в этом
+            процессе (после возобновления).
+    """
+    total: int
+    sent: int
+    failed: int
+    started: float
+    initial: int
+
+    @property
+    def processed(self) -> int:
+        """Обработано получателей."""
+        return self.sent + self.failed
+
+    def speed(
+        self,
+        now: float,
+    ) -> float:
+        """
+        Средняя скорость с момента запуска.
+
+        Args:
+            now (float): Текущее время.
+
+        Returns:
+            float: Сообщений в секунду.
+        """
+        elapsed: float = now - self.started
+        if elapsed <= 0:
+            return 0.0
+        return (self.processed - self.initial) / elapsed
+
+    def eta(
+        self,
+        now: float,
+    ) -> float | None:
+        """
+        Оценка оставшегося времени по средней скорости.
+
+        Args:
+            now (float): Текущее время.
+
+        Returns:
+            float | None: Секунды до завершения или None, пока
+                скорость неизвестна.
+        """
+        speed: float = self.speed(now)
+        if speed <= 0:
+            return None
+        return max(0, self.total - self.processed) / speed
+
+
+class BroadcastEngine:
+    """Выполнение рассылок с ограничением частоты и возобновлением."""
+
+    def __init__(
+        self,
+        metrics: MetricsRegistry,
+        rate: float,
+        burst: float,
+        min_rate: float,
+        chat_interval: float,
+        concurrency: int,
+        batch_size: int,
+        retries: int,
+        report_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Инициализация движка.
+
+        Args:
+            metrics (MetricsRegistry): Реестр счётчиков отправки.
+            rate (float): Максимальная скорость отправки одного бота
+                (сообщений в секунду).
+            burst (float): Размер всплеска.
+            min_rate (float): Нижняя граница скорости после ответов
+                RetryAfter.
+            chat_interval (float): Минимальный интервал между
+                сообщениями в один чат в секундах.
+            concurrency (int): Количество одновременных запросов.
+            batch_size (int): Размер страницы получателей.
+            retries (int): Количество повторов сообщения при
+                RetryAfter и сетевых ошибках.
+            report_interval (float): Период обновления прогресса
+                в секундах.
+            clock (Callable[[], float]): Источник монотонного времени.
+        """
+        self.metrics: MetricsRegistry = metrics
+        self.rate: float = rate
+        self.burst: float = burst
+        self.min_rate: float = min_rate
+        self.chat_interval: float = chat_interval
+        self.concurrency: int = concurrency
+        self.batch_size: int = batch_size
+        self.retries: int = retries
+        self.report_interval: float = report_interval
+        self.clock: Callable[[], float] = clock
+
+        # Квота Telegram действует на токен, поэтому темп — на бота
+        self._pacers: dict[int, BroadcastPacer] = {}
+        self._tasks: dict[int, Task[None]] = {}
+        self._progress: dict[int, BroadcastProgress] = {}
+
+    async def start(
+        self,
+        bot: Bot,
+        admin_tg_id: int,
+        text: str,
+        entities: str,
+        lang: str,
+        progress_msg_id: int | None = None,
+    ) -> Broadcast | None:
+        """
+        Создаёт рассылку по всем пользователям бота и запускает её.
+
+        Args:
+            bot (Bot): Бот, от имени которого идёт рассылка.
+            admin_tg_id (int): Telegram ID администратора.
+            text (str): Текст сообщения.
+            entities (str): Разметка текста в JSON.
+            lang (str): Язык администратора.
+            progress_msg_id (int | None): ID сообщения администратора
+                для отчёта о прогрессе.
+
+        Returns:
+            Broadcast | None: Созданная рассылка или None, если у бота
+                уже идёт рассылка.
+        """
+        async with async_session() as session:
+            manager = BroadcastManager(session)
+            if await manager.active(bot.id):
+                return None
+            job: Broadcast = await manager.create(
+                bot_id=bot.id,
+                admin_tg_id=admin_tg_id,
+                text=text,
+                entities=entities,
+                lang=lang,
+                progress_msg_id=progress_msg_id,
+            )
+        logger.info(f"Рассылка #{job.id}: {job.total} получателей")
+        self._spawn(bot, job)
+        return job
+
+    async def resume(
+        self,
+        bot: Bot,
+    ) -> int:
+        """
+        Продолжает незавершённые рассылки бота с сохранённого курсора.
+
+        Args:
+            bot (Bot): Запущенный бот.
+
+        Returns:
+            int: Количество возобновлённых рассылок.
+        """
+        async with async_session() as session:
+            jobs: list[Broadcast] = await BroadcastManager(
+                session
+            ).active(bot.id)
+
+        resumed: int = 0
+        for job in jobs:
+            if job.id in self._tasks:
+                continue
+            logger.info(
+                f"Рассылка #{job.id} возобновлена: обработано "
+                f"{job.sent + job.failed} из {job.total}"
+            )
+            self._spawn(bot, job)
+            resumed += 1
+        return resumed
+
+    async def cancel(
+        self,
+        bot: Bot,
+        job_id: int,
+    ) -> bool:
+        """
+        Останавливает рассылку без возможности возобновления.
+
+        Args:
+            bot (Bot): Бот рассылки.
+            job_id (int): ID рассылки.
+
+        Returns:
+            bool: True, если рассылка выполнялась и остановлена.
+        """
+        progress: BroadcastProgress | None = self._progress.get(job_id)
+        task: Task[None] | None = self._tasks.get(job_id)
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        async with async_session() as session:
+            manager = BroadcastManager(session)
+            if not await manager.set_status(job_id, STATUS_CANCELLED):
+                return False
+            job: Broadcast | None = await manager.get(job_id)
+            if job is not None and progress is not None:
+                # Счётчики включают сообщения незавершённой страницы
+                await manager.save_progress(
+                    job_id, job.last_user_id, progress.sent, progress.failed,
+                )
+
+        if job is not None:
+            if progress is None:
+                progress = _stored_progress(job, self.clock())
+            logger.info(f"Рассылка #{job_id} остановлена")
+            await self._report(bot, job, progress)
+        return True
+
+    def progress(
+        self,
+        job_id: int,
+    ) -> BroadcastProgress | None:
+        """
+        Возвращает прогресс рассылки, выполняемой в этом процессе.
+
+        Args:
+            job_id (int): ID рассылки.
+
+        Returns:
+            BroadcastProgress | None: Прогресс или None.
+        """
+        return self._progress.get(job_id)
+
+    async def stop(
+        self,
+        bot_id: int,
+    ) -> None:
+        """
+        Прерывает рассылки бота при его остановке.
+
+        Статус рассылок не меняется: при следующем запуске бота они
+        продолжатся с сохранённого курсора.
+
+        Args:
+            bot_id (int): ID бота.
+        """
+        tasks: list[Task[None]] = [
+            task for job_id, task in self._tasks.items()
+            if task.get_name() == _task_name(bot_id, job_id)
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Прерывает все рассылки процесса."""
+        tasks: list[Task[None]] = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _spawn(
+        self,
+        bot: Bot,
+        job: Broadcast,
+    ) -> None:
+        """Запускает рассылку в фоновой задаче."""
+        self._tasks[job.id] = asyncio.create_task(
+            self._run(bot, job),
+            name=_task_name(bot.id, job.id),
+        )
+
+    def _pacer(
+        self,
+        bot_id: int,
+    ) -> BroadcastPacer:
+        """Возвращает ограничитель частоты бота."""
+        pacer: BroadcastPacer | None = self._pacers.get(bot_id)
+        if pacer is None:
+            pacer = BroadcastPacer(
+                rate=self.rate,
+                burst=self.burst,
+                min_rate=self.min_rate,
+                chat_interval=self.chat_interval,
+                clock=self.clock,
+            )
+            self._pacers[bot_id] = pacer
+        return pacer
+
+    async def _run(
+        self,
+        bot: Bot,
+        job: Broadcast,
+    ) -> None:
+        """
+        Отправляет рассылку страницами получателей, сохраняя курсор
+        после каждой страницы.
+
+        Args:
+            bot (Bot): Бот рассылки.
+            job (Broadcast): Рассылка.
+        """
+        pacer: BroadcastPacer = self._pacer(bot.id)
+        entities: list[MessageEntity] | None = _load_entities(job.entities)
+        progress: BroadcastProgress = _stored_progress(job, self.clock())
+        self._progress[job.id] = progress
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.concurrency)
+        cursor: int = job.last_user_id
+        reported: float = self.clock()
+
+        try:
+            await self._report(bot, job, progress)
+            while True:
+                async with async_session() as session:
+                    manager = BroadcastManager(session)
+                    # Рассылку могли остановить из другого процесса
+                    current: Broadcast | None = await manager.get(job.id)
+                    if current is None or current.status != STATUS_RUNNING:
+                        return
+                    batch: list[tuple[int, int]] = await manager.recipients(
+                        bot_id=job.bot_id,
+                        after_id=cursor,
+                        limit=self.batch_size,
+                    )
+                if not batch:
+                    break
+
+                await asyncio.gather(*(
+                    self._deliver(
+                        bot, pacer, semaphore, progress,
+                        tg_id, job.text, entities,
+                    )
+                    for _, tg_id in batch
+                ))
+                cursor = batch[-1][0]
+                async with async_session() as session:
+                    await BroadcastManager(session).save_progress(
+                        job.id, cursor, progress.sent, progress.failed,
+                    )
+                pacer.prune()
+
+                if self.clock() - reported >= self.report_interval:
+                    await self._report(bot, job, progress)
+                    reported = self.clock()
+
+            async with async_session() as session:
+                finished: bool = await BroadcastManager(
+                    session
+                ).set_status(job.id, STATUS_DONE)
+            if finished:
+                job.status = STATUS_DONE
+                logger.info(
+                    f"Рассылка #{job.id} завершена: доставлено "
+                    f"{progress.sent}, не доставлено {progress.failed}"
+                )
+                await self._report(bot, job, progress)
+        except Exception as e:
+            # Статус не меняется: рассылка продолжится после перезапуска
+            logger.exception(f"Ошибка рассылки #{job.id}: {e}")
+        finally:
+            self._progress.pop(job.id, None)
+            self._tasks.pop(job.id, None)
+
+    async def _deliver(
+        self,
+        bot: Bot,
+        pacer: BroadcastPacer,
+        semaphore: asyncio.Semaphore,
+        progress: BroadcastProgress,
+        chat_id: int,
+        text: str,
+        entities: list[MessageEntity] | None,
+    ) -> None:
+        """Отправляет сообщение одному получателю и учитывает результат."""
+        async with semaphore:
+            sent: bool = await self._send(bot, pacer, chat_id, text, entities)
+        if sent:
+            progress.sent += 1
+        else:
+            progress.failed += 1
+        self.metrics.inc(
+            "broadcast_messages",
+            result="sent" if sent else "failed",
+        )
+
+    async def _send(
+        self,
+        bot: Bot,
+        pacer: BroadcastPacer,
+        chat_id: int,
+        text: str,
+        entities: list[MessageEntity] | None,
+    ) -> bool:
+        """
+        Отправляет сообщение с повторами при превышении квоты и
+        сетевых ошибках.
+
+        Returns:
+            bool: True, если сообщение доставлено.
+        """
+        for attempt in range(self.retries + 1):
+            await pacer.acquire(chat_id)
+            try:
+                # Разметка передаётся сущностями, поэтому parse_mode
+                # бота по умолчанию отключается
+                await bot.send_message(
+                    chat_id=chat_id,
+                    text=text,
+                    entities=entities,
+                    parse_mode=None,
+                )
+            except TelegramRetryAfter as e:
+                pacer.retry_after(chat_id, e.retry_after)
+                self.metrics.inc("broadcast_retry_after")
+                logger.warning(
+                    f"Рассылка: превышена квота, пауза {e.retry_after} с, "
+                    f"скорость {pacer.rate:.1f} сообщ./с"
+                )
+            except (TelegramForbiddenError, TelegramBadRequest):
+                # Бот заблокирован или чат недоступен: повтор не поможет
+                return False
+            except (TelegramNetworkError, TelegramServerError) as e:
+                logger.warning(f"Рассылка: ошибка отправки в {chat_id}: {e}")
+                await asyncio.sleep(min(60.0, 2.0 ** attempt))
+            except Exception as e:
+                logger.error(f"Рассылка: ошибка отправки в {chat_id}: {e}")
+                return False
+            else:
+                pacer.success()
+                return True
+        return False
+
+    async def _report(
+        self,
+        bot: Bot,
+        job: Broadcast,
+        progress: BroadcastProgress,
+    ) -> None:
+        """
+        Обновляет сообщение администратора с прогрессом рассылки.
+
+        Ошибки отчёта не прерывают рассылку.
+
+        Args:
+            bot (Bot): Бот рассылки.
+            job (Broadcast): Рассылка.
+            progress (BroadcastProgress): Текущий прогресс.
+        """
+        if job.progress_msg_id is None:
+            return
+        try:
+            loc: Localization = await load_localization(job.lang, "admin")
+            screen: Any = loc.default.admin.broadcast.progress
+            now: float = self.clock()
+            eta: float | None = progress.eta(now)
+
+            part1: str
+            part2: str
+            part1, part2 = screen.title
+            lines: list[str] = [
+                f"{part1}{job.id}{part2}"
+                f"{screen.status.get(job.status, job.status)}",
+                "",
+                f"🔸 {screen.sent}: {progress.sent} / "
+                f"{max(progress.total, progress.processed)}",
+                f"🔸 {screen.failed}: {progress.failed}",
+            ]
+            if job.status == STATUS_RUNNING:
+                remaining: str = (
+                    str(timedelta(seconds=round(eta)))
+                    if eta is not None else "—"
+                )
+                lines.extend([
+                    f"🔸 {screen.speed}: {progress.speed(now):.1f}",
+                    f"🔸 {screen.eta}: {remaining}",
+                ])
+            keyboard: InlineKeyboardMarkup = await keyboard_dynamic(
+                screen.keyboard if job.status == STATUS_RUNNING
+                else screen.finished.keyboard
+            )
+
+            await self._pacer(bot.id).acquire(job.admin_tg_id)
+            await bot.edit_message_text(
+                text="\n".join(lines),
+                chat_id=job.admin_tg_id,
+                message_id=job.progress_msg_id,
+                reply_markup=keyboard,
+            )
+        except TelegramRetryAfter as e:
+            self._pacer(bot.id).retry_after(job.admin_tg_id, e.retry_after)
+        except TelegramBadRequest:
+            # Прогресс не изменился или сообщение удалено
+            pass
+        except Exception as e:
+            logger.warning(f"Ошибка отчёта рассылки #{job.id}: {e}")
+
+
+def _stored_progress(
+    job: Broadcast,
+    now: float,
+) -> BroadcastProgress:
+    """Прогресс рассылки по сохранённым счётчикам."""
+    return BroadcastProgress(
+        total=job.total,
+        sent=job.sent,
+        failed=job.failed,
+        started=now,
+        initial=job.sent + job.failed,
+    )
+
+
+def _load_entities(
+    raw: str,
+) -> list[MessageEntity] | None:
+    """
+    Восстанавливает разметку текста из JSON.
+
+    Args:
+        raw (str): Список сущностей в JSON или "None".
+
+    Returns:
+        list[MessageEntity] | None: Сущности или None без разметки.
+    """
+    try:
+        items: Any = json.loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(items, list) or not items:
+        return None
+    return [MessageEntity.model_validate(item) for item in items]
+
+
+def _task_name(
+    bot_id: int,
+    job_id: int,
+) -> str:
+    """Имя фоновой задачи рассылки."""
+    return f"broadcast:{bot_id}:{job_id}"
@@ -0,0 +1,37 @@
+"""
+Модуль содержит глобальный экземпляр движка рассылок.
+"""
+
+from typing import Final
+
+from app.config import (BROADCAST_BATCH, BROADCAST_BURST,
+                        BROADCAST_CHAT_INTERVAL, BROADCAST_CONCURRENCY,
+                        BROADCAST_MIN_RATE, BROADCAST_RATE,
+                        BROADCAST_REPORT_INTERVAL, BROADCAST_RETRIES)
+from app.core.bot.services.metrics import get_metrics
+
+from .engine import BroadcastEngine
+
+_engine: Final[BroadcastEngine] = BroadcastEngine(
+    metrics=get_metrics(),
+    rate=BROADCAST_RATE,
+    burst=BROADCAST_BURST,
+    min_rate=BROADCAST_MIN_RATE,
+    chat_interval=BROADCAST_CHAT_INTERVAL,
+    concurrency=BROADCAST_CONCURRENCY,
+    batch_size=BROADCAST_BATCH,
+    retries=BROADCAST_RETRIES,
+    report_interval=BROADCAST_REPORT_INTERVAL,
+)
+
+
+def get_broadcast_engine() -> BroadcastEngine:
+    """
+    Возвращает глобальный экземпляр движка рассылок.
+
+    Returns
+    -------
+    BroadcastEngine
+        Движок рассылок.
+    """
+    return _engine
@@ -0,0 +1,109 @@
+"""
+Модуль темпа рассылки.
+
+Содержит класс BroadcastPacer: общий token bucket ограничивает
+частоту отправки одного бота (Telegram допускает около 30 сообщений
+в секунду), а время следующей отправки в каждый чат — частоту
+сообщений в один чат. Ответ RetryAfter опустошает корзину на
+указанное сервером время и вдвое снижает скорость; каждые rate
+успешных отправок подряд скорость растёт на одно сообщение в секунду
+до исходной (AIMD), поэтому рассылка сама находит допустимый темп.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+from app.core.bot.utils.ratelimit import TokenBucket
+
+
+class BroadcastPacer:
+    """Ограничитель частоты отправки сообщений одного бота."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        min_rate: float,
+        chat_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Инициализация ограничителя.
+
+        Args:
+            rate (float): Максимальная скорость (сообщений в секунду).
+            burst (float): Размер всплеска.
+            min_rate (float): Нижняя граница скорости после
+                снижений.
+            chat_interval (float): Минимальный интервал между
+                сообщениями в один чат в секундах.
+            clock (Callable[[], float]): Источник монотонного времени.
+        """
+        self.max_rate: float = rate
+        self.min_rate: float = min(min_rate, rate)
+        self.chat_interval: float = chat_interval
+        self.clock: Callable[[], float] = clock
+        self.bucket: TokenBucket = TokenBucket(rate, burst, clock)
+
+        # Время, раньше которого в чат нельзя отправлять
+        self._chats: dict[int, float] = {}
+        self._streak: int = 0
+
+    @property
+    def rate(self) -> float:
+        """
+        Текущая скорость отправки.
+
+        Returns:
+            float: Сообщений в секунду.
+        """
+        return self.bucket.rate
+
+    async def acquire(
+        self,
+        chat_id: int,
+    ) -> None:
+        """
+        Дожидается разрешения на отправку сообщения в чат.
+
+        Args:
+            chat_id (int): ID чата получателя.
+        """
+        delay: float = self._chats.get(chat_id, 0.0) - self.clock()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self.bucket.acquire()
+        self._chats[chat_id] = self.clock() + self.chat_interval
+
+    def success(self) -> None:
+        """Учитывает успешную отправку и постепенно повышает скорость."""
+        self._streak += 1
+        if self._streak >= self.bucket.rate and self.rate < self.max_rate:
+            self._streak = 0
+            self.bucket.set_rate(min(self.max_rate, self.rate + 1))
+
+    def retry_after(
+        self,
+        chat_id: int,
+        seconds: float,
+    ) -> None:
+        """
+        Учитывает превышение квоты: пауза и снижение скорости.
+
+        Args:
+            chat_id (int): ID чата, отправка в который отклонена.
+            seconds (float): Время ожидания из ответа сервера.
+        """
+        self._streak = 0
+        self.bucket.set_rate(max(self.min_rate, self.rate / 2))
+        self.bucket.penalize(seconds)
+        self._chats[chat_id] = self.clock() + max(seconds, self.chat_interval)
+
+    def prune(self) -> None:
+        """Удаляет чаты, интервал которых уже истёк."""
+        now: float = self.clock()
+        self._chats = {
+            chat_id: until for chat_id, until in self._chats.items()
+            if until > now
+        }
@@ -0,0 +1,17 @@
+"""
+Пакет флагов бота.
+
+Содержит сервис флагов в памяти с синхронизацией через таблицу flag
+и его глобальный экземпляр.
+"""
+
+from .instance import get_flag_service
+from .service import FLAG_BOT, FLAG_REG, FlagListener, FlagService
+
+__all__: list[str] = [
+    "FLAG_BOT",
+    "FLAG_REG",
+    "FlagListener",
+    "FlagService",
+    "get_flag_service",
+]
@@ -0,0 +1,23 @@
+"""
+Модуль содержит глобальный экземпляр сервиса флагов.
+"""
+
+from typing import Final
+
+from app.config import FLAG_POLL_INTERVAL
+
+from .service import FlagService
+
+_flags: Final[FlagService] = FlagService(interval=FLAG_POLL_INTERVAL)
+
+
+def get_flag_service() -> FlagService:
+    """
+    Возвращает глобальный экземпляр сервиса флагов.
+
+    Returns
+    -------
+    FlagService
+        Сервис флагов бота.
+    """
+    return _flags
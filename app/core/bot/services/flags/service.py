@@ -0,0 +1,180 @@
+"""
+Модуль сервиса флагов бота.
+
+Содержит класс FlagService: все флаги загружаются из таблицы flag
+один раз и отдаются из памяти, поэтому проверка флагов на каждом
+апдейте не обращается к базе. Изменения через админ-панель сразу
+применяются в процессе и рассылаются подписчикам. Другие процессы с
+той же базой раз в interval секунд сравнивают версию набора флагов
+(номер последнего изменения) со своей и при расхождении
+перечитывают флаги, так что все процессы сходятся не дольше чем за
+interval секунд.
+"""
+
+import asyncio
+from asyncio import Task
+from collections.abc import Callable
+
+from loguru import logger
+
+from app.core.database import Flag, FlagManager, async_session
+
+# Флаг технических работ: бот отвечает только администраторам
+FLAG_BOT: str = "bot"
+
+# Флаг закрытой регистрации
+FLAG_REG: str = "reg"
+
+# Подписчик изменений: получает имя флага и новое значение
+FlagListener = Callable[[str, bool], None]
+
+
+class FlagService:
+    """Флаги бота в памяти с синхронизацией через таблицу flag."""
+
+    def __init__(
+        self,
+        interval: float,
+    ) -> None:
+        """
+        Инициализация сервиса.
+
+        Args:
+            interval (float): Период проверки версии флагов в
+                секундах. 0 отключает проверку.
+        """
+        self.interval: float = interval
+        self.version: int = 0
+
+        self._values: dict[str, bool] = {}
+        self._listeners: list[FlagListener] = []
+        self._task: Task[None] | None = None
+
+    def get(
+        self,
+        name: str,
+        default: bool = False,
+    ) -> bool:
+        """
+        Возвращает значение флага из памяти.
+
+        Args:
+            name (str): Имя флага.
+            default (bool): Значение, если флаг не задан.
+
+        Returns:
+            bool: Значение флага.
+        """
+        return self._values.get(name, default)
+
+    def snapshot(self) -> dict[str, bool]:
+        """
+        Возвращает копию всех флагов.
+
+        Returns:
+            dict[str, bool]: Значения флагов по именам.
+        """
+        return dict(self._values)
+
+    async def load(self) -> int:
+        """
+        Перечитывает все флаги из базы и оповещает подписчиков об
+        изменившихся.
+
+        Returns:
+            int: Количество изменившихся флагов.
+        """
+        async with async_session() as session:
+            manager = FlagManager(session)
+            flags: list[Flag] = list(await manager.list_all())
+            version: int = await manager.version()
+
+        values: dict[str, bool] = {flag.name: flag.value for flag in flags}
+        changed: list[str] = [
+            name for name in values.keys() | self._values.keys()
+            if values.get(name, False) != self._values.get(name, False)
+        ]
+        self._values = values
+        self.version = version
+        for name in changed:
+            self._notify(name, values.get(name, False))
+        return len(changed)
+
+    async def set(
+        self,
+        name: str,
+        value: bool,
+    ) -> None:
+        """
+        Сохраняет значение флага и сразу применяет его в процессе.
+
+        Args:
+            name (str): Имя флага.
+            value (bool): Новое значение.
+        """
+        async with async_session() as session:
+            version: int = await FlagManager(session).set(name, value)
+
+        previous: bool = self._values.get(name, False)
+        self._values[name] = value
+        # Версия не поднимается выше чужих изменений, которые процесс
+        # ещё не прочитал: их подхватит следующая проверка
+        if version == self.version + 1:
+            self.version = version
+        if previous != value:
+            self._notify(name, value)
+        logger.info(f"Флаг {name} = {value} (версия {version})")
+
+    def subscribe(
+        self,
+        listener: FlagListener,
+    ) -> Callable[[], None]:
+        """
+        Подписывает функцию на изменения флагов.
+
+        Args:
+            listener (FlagListener): Функция (имя, значение).
+
+        Returns:
+            Callable[[], None]: Функция отписки.
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def start(self) -> None:
+        """Запускает фоновую проверку версии флагов."""
+        if self.interval <= 0:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch())
+
+    async def close(self) -> None:
+        """Останавливает фоновую проверку версии флагов."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _watch(self) -> None:
+        """Перечитывает флаги, когда версия в базе меняется."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                async with async_session() as session:
+                    version: int = await FlagManager(session).version()
+                if version != self.version:
+                    await self.load()
+            except Exception as e:
+                logger.error(f"Ошибка проверки флагов: {e}")
+
+    def _notify(
+        self,
+        name: str,
+        value: bool,
+    ) -> None:
+        """Передаёт изменение флага подписчикам."""
+        for listener in list(self._listeners):
+            try:
+                listener(name, value)
+            except Exception as e:
+                logger.error(f"Ошибка подписчика флага {name}: {e}")
@@ -6,7 +6,17 @@
 """
 
 from .generator_image import generate_image
+from .generator_code import CodeSpace
+from .instance import (assign_missing_codes, get_code_renderer,
+                       get_code_space, prewarm_next_codes)
+from .renderer import CodeImageRenderer
 
 __all__: list[str] = [
+    "CodeImageRenderer",
+    "CodeSpace",
+    "assign_missing_codes",
     "generate_image",
+    "get_code_renderer",
+    "get_code_space",
+    "prewarm_next_codes",
 ]
@@ -1,38 +1,200 @@
 """
 Модуль для генерации уникальных числовых кодов участников мероприятий.
 
-Содержит функцию для генерации числовых кодов на основе ID пользователя
-и фиксированного числа для детерминированного перемешивания.
+Содержит класс CodeSpace — биекцию между ID пользователей и кодами.
+Первые 10 ** base_digits пользователей получают коды прежней схемы
+(ID * seed по модулю), поэтому уже выданные коды не меняются. Дальше
+пространство растёт по разрядам: пользователи с ID из
+(10 ** (d - 1), 10 ** d] получают d-значные коды без ведущих нулей,
+перемешанные шифром Фейстеля с обходом цикла. Диапазоны разрядов не
+пересекаются, поэтому коды не повторяются, а по коду за O(1)
+восстанавливается ID пользователя.
 """
 
-def generate_code(
-    user_id: int,
-    num_digits: int,
-    seed: int = 701
-) -> int | None:
-    """
-    Генерирует уникальный числовой код участника мероприятия.
-
-    Функция создаёт код заданной длины, используя фиксированное число
-    для детерминированного перемешивания ID пользователя.
-
-    Аргументы:
-        user_id (int): ID участника, может быть любым положительным числом.
-        num_digits (int): Количество цифр в создаваемом коде.
-        seed (int, optional): Фиксированное число для детерминированного
-            перемешивания. По умолчанию 701.
-
-    Возвращает:
-        int: Числовой код участника в диапазоне от 0 до 10**num_digits - 1.
-    """
-    if user_id < 1:
-        return
-
-    # Вычисляем максимальное число для заданного количества цифр
-    max_number: int = 10 ** num_digits
-
-    # Перемешиваем ID детерминированно и ограничиваем по диапазону
-    code_number: int = (user_id * seed) % max_number
-
-    # Возвращаем код как число
-    return code_number
+import hashlib
+import math
+
+# Количество раундов шифра Фейстеля
+FEISTEL_ROUNDS: int = 4
+
+
+class CodeSpace:
+    """Биективное отображение ID пользователей в коды участников."""
+
+    def __init__(
+        self,
+        base_digits: int,
+        seed: int = 701,
+    ) -> None:
+        """
+        Инициализация пространства кодов.
+
+        Args:
+            base_digits (int): Минимальное количество цифр в коде.
+            seed (int): Множитель кодов первого диапазона и ключ
+                перемешивания остальных. Должен быть взаимно прост
+                с 10.
+
+        Raises:
+            ValueError: Некорректные параметры пространства кодов.
+        """
+        if base_digits < 1:
+            raise ValueError("Количество цифр кода должно быть больше 0")
+        if math.gcd(seed, 10) != 1:
+            raise ValueError("Множитель кода должен быть взаимно прост с 10")
+
+        self.base_digits: int = base_digits
+        self.seed: int = seed
+        self.base_size: int = 10 ** base_digits
+
+        self._seed_inverse: int = pow(seed, -1, self.base_size)
+        self._key: bytes = seed.to_bytes(8, "big", signed=True)
+
+    def encode(
+        self,
+        user_id: int,
+    ) -> int:
+        """
+        Возвращает код участника по ID пользователя.
+
+        Args:
+            user_id (int): ID пользователя (начиная с 1).
+
+        Returns:
+            int: Код участника.
+
+        Raises:
+            ValueError: ID меньше 1.
+        """
+        if user_id < 1:
+            raise ValueError(f"Некорректный ID пользователя: {user_id}")
+
+        if user_id <= self.base_size:
+            return (user_id * self.seed) % self.base_size
+
+        digits: int = len(str(user_id - 1))
+        low: int = 10 ** (digits - 1)
+        index: int = user_id - low - 1
+        return low + self._permute(index, 9 * low, digits, inverse=False)
+
+    def decode(
+        self,
+        code: int,
+    ) -> int | None:
+        """
+        Восстанавливает ID пользователя по коду участника.
+
+        Args:
+            code (int): Код участника.
+
+        Returns:
+            int | None: ID пользователя или None для отрицательного
+                кода.
+        """
+        if code < 0:
+            return None
+
+        if code < self.base_size:
+            user_id: int = (code * self._seed_inverse) % self.base_size
+            return user_id or self.base_size
+
+        digits: int = len(str(code))
+        low: int = 10 ** (digits - 1)
+        index: int = self._permute(code - low, 9 * low, digits, inverse=True)
+        return index + low + 1
+
+    def digits(
+        self,
+        user_id: int,
+    ) -> int:
+        """
+        Возвращает количество цифр в кодах диапазона пользователя.
+
+        Args:
+            user_id (int): ID пользователя.
+
+        Returns:
+            int: Количество цифр.
+        """
+        if user_id <= self.base_size:
+            return self.base_digits
+        return len(str(user_id - 1))
+
+    def _permute(
+        self,
+        value: int,
+        size: int,
+        digits: int,
+        inverse: bool,
+    ) -> int:
+        """
+        Перестановка чисел [0, size) шифром Фейстеля с обходом цикла.
+
+        Сбалансированная сеть Фейстеля переставляет числа из
+        [0, 4 ** half); результат вне [0, size) шифруется повторно,
+        пока не попадёт в диапазон (в среднем меньше четырёх раз).
+
+        Args:
+            value (int): Число из [0, size).
+            size (int): Размер диапазона.
+            digits (int): Количество цифр диапазона (часть ключа).
+            inverse (bool): Выполнить обратную перестановку.
+
+        Returns:
+            int: Переставленное число из [0, size).
+        """
+        half: int = max(1, ((size - 1).bit_length() + 1) // 2)
+        while True:
+            value = self._feistel(value, half, digits, inverse)
+            if value < size:
+                return value
+
+    def _feistel(
+        self,
+        value: int,
+        half: int,
+        digits: int,
+        inverse: bool,
+    ) -> int:
+        """
+        Один проход сети Фейстеля над числом из 2 * half бит.
+
+        Args:
+            value (int): Число из [0, 4 ** half).
+            half (int): Разрядность половины в битах.
+            digits (int): Количество цифр диапазона (часть ключа).
+            inverse (bool): Выполнить обратное преобразование.
+
+        Returns:
+            int: Преобразованное число.
+        """
+        mask: int = (1 << half) - 1
+        left: int = value >> half
+        right: int = value & mask
+        rounds: range = range(FEISTEL_ROUNDS)
+
+        if not inverse:
+            for round_ in rounds:
+                left, right = (
+                    right, left ^ (self._round(right, round_, digits) & mask)
+                )
+        else:
+            for round_ in reversed(rounds):
+                left, right = (
+                    right ^ (self._round(left, round_, digits) & mask), left
+                )
+        return (left << half) | right
+
+    def _round(
+        self,
+        value: int,
+        round_: int,
+        digits: int,
+    ) -> int:
+        """Раундовая функция: ключевой хэш половины числа."""
+        digest: bytes = hashlib.blake2b(
+            value.to_bytes(8, "big") + bytes((round_, digits)),
+            key=self._key,
+            digest_size=8,
+        ).digest()
+        return int.from_bytes(digest, "big")
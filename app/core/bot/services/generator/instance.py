@@ -0,0 +1,104 @@
+"""
+Модуль содержит глобальные экземпляры пространства кодов участников
+и рендерера изображений с кодом.
+"""
+
+from typing import Final
+
+from loguru import logger
+from sqlalchemy import func, select
+
+from app.config import (BACKGROUND_PATH, CODE_DIGITS, CODE_IMAGES_DIR,
+                        CODE_SEED, FONT_PATH, IMAGE_CACHE_SIZE,
+                        IMAGE_WORKERS)
+from app.core.database import User, UserManager, async_session
+
+from .generator_code import CodeSpace
+from .renderer import CodeImageRenderer
+
+_code_space: Final[CodeSpace] = CodeSpace(
+    base_digits=CODE_DIGITS,
+    seed=CODE_SEED,
+)
+
+_renderer: Final[CodeImageRenderer] = CodeImageRenderer(
+    background_path=BACKGROUND_PATH,
+    font_path=FONT_PATH,
+    workers=IMAGE_WORKERS,
+    cache_size=IMAGE_CACHE_SIZE,
+    cache_dir=CODE_IMAGES_DIR,
+)
+
+
+def get_code_space() -> CodeSpace:
+    """
+    Возвращает глобальный экземпляр пространства кодов участников.
+
+    Returns
+    -------
+    CodeSpace
+        Пространство кодов.
+    """
+    return _code_space
+
+
+def get_code_renderer() -> CodeImageRenderer:
+    """
+    Возвращает глобальный экземпляр рендерера изображений с кодом.
+
+    Returns
+    -------
+    CodeImageRenderer
+        Рендерер изображений.
+    """
+    return _renderer
+
+
+async def prewarm_next_codes(
+    count: int,
+) -> int:
+    """
+    Рендерит изображения для кодов следующих участников.
+
+    Код вычисляется по ID пользователя, поэтому коды ближайших
+    регистраций известны заранее.
+
+    Parameters
+    ----------
+    count : int
+        Количество следующих ID пользователей.
+
+    Returns
+    -------
+    int
+        Количество изображений в кэше после прогрева.
+    """
+    async with async_session() as session:
+        last_id: int = await session.scalar(select(func.max(User.id))) or 0
+
+    codes: dict[str, None] = dict.fromkeys(
+        str(_code_space.encode(user_id))
+        for user_id in range(last_id + 1, last_id + 1 + count)
+    )
+    cached: int = await _renderer.prewarm(codes)
+    logger.debug(f"Изображений с кодом в кэше: {cached}")
+    return cached
+
+
+async def assign_missing_codes() -> int:
+    """
+    Сохраняет коды участников, зарегистрированных до появления
+    колонки кода.
+
+    Returns
+    -------
+    int
+        Количество заполненных кодов.
+    """
+    async with async_session() as session:
+        assigned: int = await UserManager(session).assign_codes(
+            _code_space.encode
+        )
+    if assigned:
+        logger.info(f"Заполнены коды участников: {assigned}")
+    return assigned
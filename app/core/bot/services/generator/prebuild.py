@@ -0,0 +1,166 @@
+"""
+Модуль предварительного рендеринга изображений всех кодов.
+
+Коды первых 10 ** CODE_DIGITS участников известны заранее — это все
+числа меньше 10 ** CODE_DIGITS. Изображения рендерятся
+параллельно в пуле процессов в дисковый кэш рендерера. Кэш лежит в
+директории версии ассетов: после замены фона или шрифта он собирается
+заново, а директории прежних версий удаляются.
+
+Запуск вручную (например, при деплое):
+    python main.py prebuild
+"""
+
+import asyncio
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from loguru import logger
+
+from .instance import get_code_renderer, get_code_space
+from .renderer import CodeImageRenderer
+
+# Файл-отметка полностью собранной версии кэша
+COMPLETE_MARKER: str = ".complete"
+
+# Количество кодов в одной задаче процесса
+CHUNK_SIZE: int = 50
+
+# Рендерер процесса пула (создаётся инициализатором)
+_worker_renderer: CodeImageRenderer | None = None
+
+
+def all_codes() -> list[str]:
+    """
+    Возвращает тексты кодов базового диапазона.
+
+    Returns:
+        list[str]: Коды в том виде, в котором они печатаются.
+    """
+    return [str(code) for code in range(get_code_space().base_size)]
+
+
+async def prebuild_code_images(
+    workers: int = 0,
+    renderer: CodeImageRenderer | None = None,
+) -> int:
+    """
+    Рендерит на диск изображения всех кодов, которых ещё нет в кэше.
+
+    Args:
+        workers (int): Количество процессов (0 — по числу ядер).
+        renderer (CodeImageRenderer | None): Рендерер с дисковым
+            кэшем (по умолчанию глобальный).
+
+    Returns:
+        int: Количество отрендеренных изображений.
+    """
+    renderer = renderer or get_code_renderer()
+    version_dir: Path | None = renderer.version_dir
+    if renderer.cache_dir is None or version_dir is None:
+        return 0
+    if (version_dir / COMPLETE_MARKER).exists():
+        return 0
+
+    _drop_stale_versions(renderer.cache_dir, keep=version_dir)
+    version_dir.mkdir(parents=True, exist_ok=True)
+
+    texts: list[str] = [
+        text for text in all_codes()
+        if not (version_dir / f"{text}.png").exists()
+    ]
+    chunks: list[list[str]] = [
+        texts[i:i + CHUNK_SIZE] for i in range(0, len(texts), CHUNK_SIZE)
+    ]
+
+    # spawn: дочерние процессы не наследуют потоки и блокировки
+    # работающего бота
+    pool: ProcessPoolExecutor = ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(
+            renderer.background_path,
+            renderer.font_path,
+            renderer.cache_dir,
+        ),
+    )
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    try:
+        counts: list[int] = await asyncio.gather(*(
+            loop.run_in_executor(pool, _render_chunk, chunk)
+            for chunk in chunks
+        ))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    (version_dir / COMPLETE_MARKER).touch()
+    rendered: int = sum(counts)
+    logger.info(
+        f"Изображения кодов собраны: {rendered} новых, "
+        f"версия ассетов {renderer.version}"
+    )
+    return rendered
+
+
+def _drop_stale_versions(
+    cache_dir: Path,
+    keep: Path,
+) -> None:
+    """
+    Удаляет директории кэша прежних версий ассетов.
+
+    Args:
+        cache_dir (Path): Корневая директория кэша.
+        keep (Path): Директория текущей версии.
+    """
+    if not cache_dir.is_dir():
+        return
+    for path in cache_dir.iterdir():
+        if path.is_dir() and path != keep:
+            shutil.rmtree(path, ignore_errors=True)
+            logger.debug(f"Удалён кэш изображений версии {path.name}")
+
+
+def _init_worker(
+    background_path: Path,
+    font_path: Path,
+    cache_dir: Path,
+) -> None:
+    """Создаёт рендерер в процессе пула."""
+    global _worker_renderer
+    _worker_renderer = CodeImageRenderer(
+        background_path=background_path,
+        font_path=font_path,
+        workers=1,
+        cache_size=0,
+        cache_dir=cache_dir,
+    )
+
+
+def _render_chunk(
+    texts: list[str],
+) -> int:
+    """
+    Рендерит группу кодов в процессе пула.
+
+    Args:
+        texts (list[str]): Тексты кодов.
+
+    Returns:
+        int: Количество отрендеренных изображений.
+    """
+    if _worker_renderer is None:
+        raise RuntimeError("Рендерер процесса не инициализирован")
+
+    version_dir: Path | None = _worker_renderer.version_dir
+    rendered: int = 0
+    for text in texts:
+        if version_dir and (version_dir / f"{text}.png").exists():
+            continue
+        _worker_renderer.load_or_render(text)
+        rendered += 1
+    return rendered
@@ -0,0 +1,281 @@
+"""
+Модуль рендеринга изображений с кодом участника.
+
+Содержит класс CodeImageRenderer: фон декодируется и шрифт
+загружается один раз, рендеринг выполняется в пуле потоков (Pillow
+освобождает GIL при рисовании и сжатии), а готовые PNG кэшируются по
+тексту. Кодов не больше тысячи, поэтому кэш можно заранее прогреть.
+Если задана директория кэша, готовые изображения хранятся на диске в
+поддиректории версии ассетов и переживают перезапуск.
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+# Уровень сжатия PNG: в 2,5 раза быстрее уровня по умолчанию
+# при увеличении размера файла примерно на 10%
+PNG_COMPRESS_LEVEL: int = 3
+
+# Цвет текста (белый)
+FONT_COLOR: tuple[int, int, int] = (255, 255, 255)
+
+
+class CodeImageRenderer:
+    """Рендерер изображений с кодом поверх фона с кэшем результатов."""
+
+    def __init__(
+        self,
+        background_path: Path,
+        font_path: Path,
+        workers: int,
+        cache_size: int,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """
+        Инициализация рендерера.
+
+        Args:
+            background_path (Path): Путь к фоновому изображению.
+            font_path (Path): Путь к файлу шрифта.
+            workers (int): Количество потоков рендеринга.
+            cache_size (int): Максимальное количество изображений
+                в кэше.
+            cache_dir (Path | None): Корневая директория дискового
+                кэша изображений (None — без дискового кэша).
+        """
+        self.background_path: Path = background_path
+        self.font_path: Path = font_path
+        self.cache_size: int = cache_size
+        self.cache_dir: Path | None = cache_dir
+        self.workers: int = workers
+
+        # Пул создаётся при первом рендеринге и заново после close,
+        # поэтому рендерер переживает перезапуск ботов
+        self._executor: ThreadPoolExecutor | None = None
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[bytes]] = {}
+
+        self._background: Image.Image | None = None
+        self._font_size: int = 0
+        self._assets_lock: threading.Lock = threading.Lock()
+        # FreeType-шрифт не потокобезопасен: у каждого потока свой
+        self._local: threading.local = threading.local()
+        self._version: str | None = None
+
+    @property
+    def version(self) -> str:
+        """
+        Версия ассетов: хэш фона и шрифта.
+
+        Меняется при замене файлов, поэтому входит в ключи
+        загруженных в Telegram изображений.
+
+        Returns:
+            str: Первые 12 символов SHA-256 содержимого ассетов.
+        """
+        if self._version is None:
+            digest = hashlib.sha256()
+            for path in (self.background_path, self.font_path):
+                digest.update(path.read_bytes())
+            self._version = digest.hexdigest()[:12]
+        return self._version
+
+    def render_sync(
+        self,
+        text: str,
+    ) -> bytes:
+        """
+        Рендерит изображение с текстом без использования кэша.
+
+        Args:
+            text (str): Текст, который будет добавлен на изображение.
+
+        Returns:
+            bytes: Содержимое PNG-файла.
+        """
+        background: Image.Image = self._load_background()
+        font: ImageFont.FreeTypeFont = self._thread_font()
+
+        image: Image.Image = background.copy()
+        draw: ImageDraw.ImageDraw = ImageDraw.Draw(image)
+
+        # Вычисляем координаты для центрирования текста
+        bbox: tuple[float, float, float, float] = draw.textbbox(
+            (0, 0),
+            text,
+            font=font
+        )
+        text_width: float = bbox[2] - bbox[0]
+        text_height: float = bbox[3] - bbox[1]
+        text_x: float = (image.width - text_width) / 2
+        text_y: float = (image.height - text_height) * 0.4
+
+        draw.text(
+            (text_x, text_y),
+            text,
+            font=font,
+            fill=FONT_COLOR
+        )
+
+        buffer = BytesIO()
+        image.save(buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+        return buffer.getvalue()
+
+    @property
+    def version_dir(self) -> Path | None:
+        """
+        Директория дискового кэша текущей версии ассетов.
+
+        Returns:
+            Path | None: Путь к директории или None без дискового кэша.
+        """
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / self.version
+
+    def load_or_render(
+        self,
+        text: str,
+    ) -> bytes:
+        """
+        Читает изображение из дискового кэша, при промахе рендеря и
+        сохраняя его.
+
+        Args:
+            text (str): Текст, который будет добавлен на изображение.
+
+        Returns:
+            bytes: Содержимое PNG-файла.
+        """
+        version_dir: Path | None = self.version_dir
+        if version_dir is None:
+            return self.render_sync(text)
+
+        path: Path = version_dir / f"{text}.png"
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            pass
+
+        content: bytes = self.render_sync(text)
+        version_dir.mkdir(parents=True, exist_ok=True)
+        # Запись через временный файл: параллельные процессы и
+        # читатели не увидят недописанное изображение
+        tmp_path: Path = path.with_name(f".{text}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+        return content
+
+    async def render(
+        self,
+        text: str,
+    ) -> bytes:
+        """
+        Возвращает изображение с текстом, при промахе кэша читая его
+        с диска или рендеря в пуле потоков.
+
+        Одновременные запросы одного текста ждут один рендеринг.
+
+        Args:
+            text (str): Текст, который будет добавлен на изображение.
+
+        Returns:
+            bytes: Содержимое PNG-файла.
+        """
+        content: bytes | None = self._cache.get(text)
+        if content is not None:
+            self._cache.move_to_end(text)
+            return content
+
+        pending: asyncio.Future[bytes] | None = self._pending.get(text)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future[bytes] = loop.run_in_executor(
+            self._get_executor(), self.load_or_render, text
+        )
+        self._pending[text] = future
+        try:
+            content = await asyncio.shield(future)
+        finally:
+            self._pending.pop(text, None)
+
+        self._cache[text] = content
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return content
+
+    async def prewarm(
+        self,
+        texts: Iterable[str],
+    ) -> int:
+        """
+        Заранее рендерит изображения и кладёт их в кэш.
+
+        Args:
+            texts (Iterable[str]): Тексты изображений.
+
+        Returns:
+            int: Количество изображений в кэше после прогрева.
+        """
+        await asyncio.gather(*(
+            self.render(text) for text in list(texts)[:self.cache_size]
+        ))
+        return len(self._cache)
+
+    def close(self) -> None:
+        """
+        Останавливает пул потоков рендеринга.
+
+        Следующий рендеринг создаст новый пул.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Возвращает пул потоков рендеринга, создавая его при
+        необходимости.
+
+        Returns:
+            ThreadPoolExecutor: Пул потоков рендеринга.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="image-render",
+            )
+        return self._executor
+
+    def _load_background(self) -> Image.Image:
+        """Декодирует фон один раз на процесс."""
+        if self._background is None:
+            with self._assets_lock:
+                if self._background is None:
+                    image: Image.Image = Image.open(self.background_path)
+                    image.load()
+                    # Размер шрифта относительно высоты изображения
+                    self._font_size = int(image.height * 0.4)
+                    self._background = image
+        return self._background
+
+    def _thread_font(self) -> ImageFont.FreeTypeFont:
+        """Загружает шрифт один раз на поток."""
+        font: ImageFont.FreeTypeFont | None = getattr(
+            self._local, "font", None
+        )
+        if font is None:
+            font = ImageFont.truetype(self.font_path, size=self._font_size)
+            self._local.font = font
+        return font
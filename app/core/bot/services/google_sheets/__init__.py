@@ -0,0 +1,22 @@
+"""
+Пакет работы с Google Sheets.
+
+Содержит блокирующий клиент таблицы, фоновый экспорт операций
+через очередь и outbox и инкрементальную синхронизацию регистраций
+по снимку строк.
+"""
+
+from .exporter import SheetExporter, SheetOperation
+from .google_sheets import GoogleSheetsService
+from .instance import get_sheet_exporter, get_sheet_sync
+from .sync import SheetSync, SyncDiff
+
+__all__: list[str] = [
+    "GoogleSheetsService",
+    "SheetExporter",
+    "SheetOperation",
+    "SheetSync",
+    "SyncDiff",
+    "get_sheet_exporter",
+    "get_sheet_sync",
+]
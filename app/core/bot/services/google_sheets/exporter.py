@@ -0,0 +1,617 @@
+"""
+Модуль конвейера экспорта в Google Sheets.
+
+Содержит класс SheetExporter: обработчики ставят операции в
+ограниченную очередь и не ждут HTTP-запросов. Фоновая задача собирает
+операции в пакеты, сохраняет их в таблицу outbox и отправляет
+добавления строк одним append_rows, а изменения ячеек и диапазонов —
+одним batch_update. Запросы ограничены token bucket по квоте API и
+повторяются с экспоненциальной задержкой; неотправленные операции
+остаются в outbox и отправляются после перезапуска. Операции, которые
+должны сохраниться вместе с другими изменениями, записываются в outbox
+транзакцией вызывающего кода в обход очереди.
+"""
+
+import asyncio
+import json
+import random
+from asyncio import Task
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from gspread.exceptions import APIError
+from gspread.utils import rowcol_to_a1
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bot.utils.ratelimit import TokenBucket
+from app.core.database import OutboxManager, SheetOutbox, async_session
+
+# Типы операций экспорта
+APPEND: str = "append"
+UPDATE: str = "update"
+RANGE: str = "range"
+
+# Коды ответа API, после которых запрос стоит повторить
+RETRY_STATUSES: frozenset[int] = frozenset({408, 429, 500, 502, 503, 504})
+
+
+@dataclass(slots=True)
+class SheetOperation:
+    """Операция экспорта в таблицу.
+
+    Атрибуты:
+        kind (str): Тип операции: APPEND, UPDATE или RANGE.
+        values (list[Any]): Значения строки (APPEND), одно значение
+            ячейки (UPDATE) или строки диапазона (RANGE).
+        row (int): Номер строки ячейки или верхней строки
+            диапазона (с 1).
+        col (int): Номер колонки ячейки или левой колонки
+            диапазона (с 1).
+        outbox_id (int | None): ID записи в outbox после сохранения.
+    """
+    kind: str
+    values: list[Any] = field(default_factory=list)
+    row: int = 0
+    col: int = 0
+    outbox_id: int | None = None
+
+    def payload(self) -> str:
+        """
+        Сериализует данные операции для outbox.
+
+        Returns:
+            str: JSON с данными операции.
+        """
+        return json.dumps(
+            {"values": self.values, "row": self.row, "col": self.col},
+            ensure_ascii=False,
+            default=str,
+        )
+
+    @classmethod
+    def from_outbox(
+        cls,
+        record: SheetOutbox,
+    ) -> "SheetOperation":
+        """
+        Восстанавливает операцию из записи outbox.
+
+        Args:
+            record (SheetOutbox): Запись outbox.
+
+        Returns:
+            SheetOperation: Операция экспорта.
+        """
+        data: dict[str, Any] = json.loads(record.payload)
+        return cls(
+            kind=record.kind,
+            values=data["values"],
+            row=data["row"],
+            col=data["col"],
+            outbox_id=record.id,
+        )
+
+
+class SheetExporter:
+    """Фоновый экспорт операций в Google Sheets через outbox."""
+
+    def __init__(
+        self,
+        worksheet: Callable[[], Any],
+        bucket: TokenBucket,
+        queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+        retries: int,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        max_attempts: int = 20,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Инициализация экспорта.
+
+        Args:
+            worksheet (Callable[[], Any]): Блокирующая функция,
+                возвращающая лист gspread (или совместимый объект с
+                методами append_rows и batch_update) либо None.
+                Вызывается в отдельном потоке.
+            bucket (TokenBucket): Ограничитель частоты запросов.
+            queue_size (int): Ёмкость очереди операций.
+            batch_size (int): Максимальное количество операций
+                в пакете.
+            flush_interval (float): Время накопления пакета в секундах.
+            retries (int): Количество повторов запроса при ошибке.
+            backoff (float): Начальная задержка повтора в секундах.
+            max_backoff (float): Максимальная задержка повтора.
+            max_attempts (int): Количество неудачных отправок, после
+                которого операция удаляется из outbox.
+            enabled (bool): Экспорт настроен; иначе операции
+                отбрасываются.
+        """
+        self.worksheet: Callable[[], Any] = worksheet
+        self.bucket: TokenBucket = bucket
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.retries: int = retries
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.max_attempts: int = max_attempts
+        self.enabled: bool = enabled
+
+        self._queue: asyncio.Queue[SheetOperation] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        # Операции, взятые из очереди, но ещё не сохранённые в outbox
+        self._buffer: list[SheetOperation] = []
+        self._lock: asyncio.Lock = asyncio.Lock()
+        # Сигнал о новых операциях в outbox, записанных в обход очереди
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._task: Task[None] | None = None
+        self._closing: bool = False
+        self._wks: Any = None
+
+    @property
+    def pending_count(self) -> int:
+        """
+        Количество операций, ещё не сохранённых в outbox.
+
+        Returns:
+            int: Размер очереди и текущего пакета.
+        """
+        return self._queue.qsize() + len(self._buffer)
+
+    async def append_row(
+        self,
+        values: Sequence[Any],
+    ) -> None:
+        """
+        Ставит в очередь добавление строки.
+
+        Ждёт только при переполненной очереди.
+
+        Args:
+            values (Sequence[Any]): Значения строки.
+        """
+        await self._put(SheetOperation(kind=APPEND, values=list(values)))
+
+    async def update_cell(
+        self,
+        row: int,
+        col: int,
+        value: Any,
+    ) -> None:
+        """
+        Ставит в очередь изменение ячейки.
+
+        Несколько изменений одной ячейки в пакете объединяются,
+        записывается последнее значение.
+
+        Args:
+            row (int): Номер строки (с 1).
+            col (int): Номер колонки (с 1).
+            value (Any): Новое значение ячейки.
+        """
+        await self._put(
+            SheetOperation(kind=UPDATE, values=[value], row=row, col=col)
+        )
+
+    async def update_range(
+        self,
+        row: int,
+        col: int,
+        values: Sequence[Sequence[Any]],
+    ) -> None:
+        """
+        Ставит в очередь запись прямоугольного диапазона.
+
+        Args:
+            row (int): Номер верхней строки (с 1).
+            col (int): Номер левой колонки (с 1).
+            values (Sequence[Sequence[Any]]): Строки диапазона.
+        """
+        await self._put(SheetOperation(
+            kind=RANGE,
+            values=[list(line) for line in values],
+            row=row,
+            col=col,
+        ))
+
+    async def stage(
+        self,
+        session: AsyncSession,
+        operations: Sequence[SheetOperation],
+    ) -> None:
+        """
+        Записывает операции в outbox транзакцией вызывающего кода.
+
+        Операции не проходят через очередь и сохраняются только вместе
+        с остальными изменениями сессии. После фиксации транзакции
+        нужно вызвать notify, чтобы фоновая задача их отправила.
+
+        Args:
+            session (AsyncSession): Сессия открытой транзакции.
+            operations (Sequence[SheetOperation]): Операции экспорта.
+        """
+        if not self.enabled or not operations:
+            return
+        await OutboxManager(session).add(
+            [(operation.kind, operation.payload())
+             for operation in operations],
+            commit=False,
+        )
+
+    def notify(self) -> None:
+        """Будит фоновую задачу после записи операций через stage."""
+        if not self.enabled:
+            return
+        self._wakeup.set()
+        self.start()
+
+    def start(self) -> None:
+        """Запускает фоновую задачу, отправляющую outbox."""
+        if not self.enabled or self._closing:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self) -> bool:
+        """
+        Сохраняет накопленные операции в outbox и отправляет его.
+
+        Returns:
+            bool: True, если outbox полностью отправлен.
+        """
+        async with self._lock:
+            while not self._queue.empty():
+                self._buffer.append(self._queue.get_nowait())
+            await self._persist_buffer()
+            return await self._deliver_pending()
+
+    async def close(self) -> None:
+        """
+        Останавливает фоновую задачу и отправляет оставшиеся операции.
+
+        Неотправленные операции остаются в outbox до следующего
+        запуска.
+        """
+        self._closing = True
+        if self._task and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        if self.enabled:
+            await self.flush()
+        self._closing = False
+
+    async def _put(
+        self,
+        operation: SheetOperation,
+    ) -> None:
+        """
+        Ставит операцию в очередь и запускает фоновую задачу.
+
+        Args:
+            operation (SheetOperation): Операция экспорта.
+        """
+        if not self.enabled:
+            return
+        await self._queue.put(operation)
+        self.start()
+
+    async def _run(self) -> None:
+        """Фоновый цикл: пакет из очереди → outbox → таблица."""
+        # Сначала — операции, не отправленные до перезапуска
+        delivered: bool = await self._flush_safe()
+        while True:
+            # Пока таблица недоступна, outbox повторяется по таймеру
+            await self._collect(None if delivered else self.max_backoff)
+            delivered = await self._flush_safe()
+
+    async def _collect(
+        self,
+        wait: float | None,
+    ) -> None:
+        """
+        Переносит операции из очереди в пакет.
+
+        Ждёт первую операцию, затем добирает пакет в течение
+        flush_interval или до batch_size операций. Сигнал notify
+        прерывает ожидание, чтобы outbox был отправлен сразу.
+
+        Args:
+            wait (float | None): Максимальное ожидание первой операции
+                в секундах (None — без ограничения).
+        """
+        getter: Task[SheetOperation] = asyncio.ensure_future(
+            self._queue.get()
+        )
+        waiter: Task[bool] = asyncio.ensure_future(self._wakeup.wait())
+        try:
+            await asyncio.wait(
+                (getter, waiter),
+                timeout=wait,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            waiter.cancel()
+            if getter.done():
+                self._buffer.append(getter.result())
+            else:
+                # Отменённый get не забирает операцию из очереди
+                getter.cancel()
+        self._wakeup.clear()
+        if not getter.done() or getter.cancelled():
+            return
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        deadline: float = loop.time() + self.flush_interval
+        while len(self._buffer) < self.batch_size:
+            timeout: float = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                self._buffer.append(
+                    await asyncio.wait_for(self._queue.get(), timeout)
+                )
+            except TimeoutError:
+                break
+
+    async def _flush_safe(self) -> bool:
+        """
+        Отправляет пакет, не прерываясь отменой фоновой задачи.
+
+        Returns:
+            bool: True, если outbox полностью отправлен.
+        """
+        try:
+            return await asyncio.shield(self._flush_locked())
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            logger.exception(f"Ошибка экспорта в таблицу: {error}")
+            return False
+
+    async def _flush_locked(self) -> bool:
+        """
+        Сохраняет пакет в outbox и отправляет его под блокировкой.
+
+        Returns:
+            bool: True, если outbox полностью отправлен.
+        """
+        async with self._lock:
+            await self._persist_buffer()
+            return await self._deliver_pending()
+
+    async def _persist_buffer(self) -> None:
+        """Сохраняет операции пакета в outbox одной транзакцией."""
+        if not self._buffer:
+            return
+        async with async_session() as session:
+            await OutboxManager(session).add(
+                [(operation.kind, operation.payload())
+                 for operation in self._buffer]
+            )
+        self._buffer.clear()
+
+    async def _deliver_pending(self) -> bool:
+        """
+        Отправляет операции из outbox пакетами по batch_size.
+
+        Returns:
+            bool: True, если outbox отправлен полностью, False при
+                ошибке (операции остаются в outbox).
+        """
+        while True:
+            async with async_session() as session:
+                manager = OutboxManager(session)
+                records: list[SheetOutbox] = await manager.pending(
+                    self.batch_size
+                )
+                # Полный пакет значит, что в outbox могут остаться
+                # операции, даже если часть пакета удалена как устаревшая
+                fetched: int = len(records)
+                stale: list[SheetOutbox] = [
+                    record for record in records
+                    if record.attempts >= self.max_attempts
+                ]
+                if stale:
+                    for record in stale:
+                        logger.error(
+                            f"Операция экспорта удалена после "
+                            f"{record.attempts} попыток: {record.payload}"
+                        )
+                    await manager.delete([record.id for record in stale])
+                    records = [r for r in records if r not in stale]
+
+            operations: list[SheetOperation] = [
+                SheetOperation.from_outbox(record) for record in records
+            ]
+            for kinds in ((APPEND,), (UPDATE, RANGE)):
+                group: list[SheetOperation] = [
+                    operation for operation in operations
+                    if operation.kind in kinds
+                ]
+                if group and not await self._deliver(group):
+                    return False
+
+            if fetched < self.batch_size:
+                return True
+
+    async def _deliver(
+        self,
+        operations: list[SheetOperation],
+    ) -> bool:
+        """
+        Отправляет добавления строк или изменения одним запросом.
+
+        Добавления и изменения отправляются и подтверждаются
+        раздельно, чтобы повтор изменений не дублировал строки. Если
+        таблица отклонила данные пакета, он делится пополам, пока не
+        останутся отдельные некорректные операции: они удаляются из
+        outbox, остальные отправляются.
+
+        Args:
+            operations (list[SheetOperation]): Добавления строк или
+                изменения ячеек и диапазонов.
+
+        Returns:
+            bool: True, если все операции отправлены или отброшены.
+        """
+        if not operations:
+            return True
+        ids: list[int] = [
+            operation.outbox_id for operation in operations
+            if operation.outbox_id is not None
+        ]
+        try:
+            if operations[0].kind == APPEND:
+                await self._call(
+                    "append_rows",
+                    [operation.values for operation in operations],
+                    value_input_option="USER_ENTERED",
+                )
+            else:
+                # Последняя запись с тем же началом диапазона побеждает
+                ranges: dict[tuple[int, int], list[list[Any]]] = {}
+                for operation in operations:
+                    key: tuple[int, int] = (operation.row, operation.col)
+                    ranges.pop(key, None)
+                    ranges[key] = (
+                        operation.values if operation.kind == RANGE
+                        else [operation.values]
+                    )
+                await self._call(
+                    "batch_update",
+                    [
+                        {"range": rowcol_to_a1(row, col), "values": values}
+                        for (row, col), values in ranges.items()
+                    ],
+                    value_input_option="USER_ENTERED",
+                )
+        except Exception as error:
+            if _is_rejected(error):
+                if len(operations) > 1:
+                    # Добавления второй половины ждут первую, чтобы
+                    # строки не поменялись местами
+                    middle: int = len(operations) // 2
+                    return (
+                        await self._deliver(operations[:middle])
+                        and await self._deliver(operations[middle:])
+                    )
+                logger.error(
+                    f"Операция экспорта отклонена таблицей и удалена: "
+                    f"{error}; {operations[0].payload()}"
+                )
+                async with async_session() as session:
+                    await OutboxManager(session).delete(ids)
+                return True
+
+            logger.error(
+                f"Экспорт {len(operations)} операций не выполнен: {error}"
+            )
+            async with async_session() as session:
+                await OutboxManager(session).mark_failed(ids)
+            return False
+
+        async with async_session() as session:
+            await OutboxManager(session).delete(ids)
+        return True
+
+    async def _call(
+        self,
+        method: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Вызывает метод листа в потоке с учётом квоты и повторами.
+
+        Args:
+            method (str): Имя метода листа.
+            *args (Any): Позиционные аргументы метода.
+            **kwargs (Any): Именованные аргументы метода.
+
+        Returns:
+            Any: Результат метода.
+
+        Raises:
+            Exception: Ошибка, которую не исправили повторы.
+        """
+        attempt: int = 0
+        while True:
+            await self.bucket.acquire()
+            try:
+                wks: Any = await self._get_worksheet()
+                return await asyncio.to_thread(
+                    getattr(wks, method), *args, **kwargs
+                )
+            except Exception as error:
+                if attempt >= self.retries or not _is_retryable(error):
+                    raise
+                delay: float = min(
+                    self.max_backoff, self.backoff * 2 ** attempt
+                )
+                # Разброс задержки, чтобы повторы не шли синхронно
+                delay *= 0.5 + random.random() / 2
+                if isinstance(error, APIError) and error.code == 429:
+                    self.bucket.penalize(delay)
+                logger.warning(
+                    f"Ошибка запроса к таблице ({error}), "
+                    f"повтор через {delay:.1f} с"
+                )
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _get_worksheet(self) -> Any:
+        """
+        Возвращает лист, при необходимости подключаясь к таблице.
+
+        Returns:
+            Any: Лист таблицы.
+
+        Raises:
+            ConnectionError: Не удалось подключиться к таблице.
+        """
+        if self._wks is None:
+            self._wks = await asyncio.to_thread(self.worksheet)
+            if self._wks is None:
+                raise ConnectionError("Таблица недоступна")
+        return self._wks
+
+
+def _is_retryable(
+    error: Exception,
+) -> bool:
+    """
+    Проверяет, стоит ли повторить запрос после ошибки.
+
+    Args:
+        error (Exception): Ошибка запроса.
+
+    Returns:
+        bool: True для превышения квоты, ошибок сервера и сети.
+    """
+    if isinstance(error, APIError):
+        return error.code in RETRY_STATUSES
+    return isinstance(error, (ConnectionError, TimeoutError, OSError))
+
+
+def _is_rejected(
+    error: Exception,
+) -> bool:
+    """
+    Проверяет, отклонила ли таблица сами данные запроса.
+
+    Такой запрос не выполнится ни при каком числе повторов, а ошибки
+    доступа и конфигурации (401, 403, 404) касаются всех операций.
+
+    Args:
+        error (Exception): Ошибка запроса.
+
+    Returns:
+        bool: True для ответа 400 Bad Request.
+    """
+    return isinstance(error, APIError) and error.code == 400
@@ -10,14 +10,14 @@ class GoogleSheetsService:
     Сервис для работы с Google Sheets.
 
     Поддерживает подключение к Google Sheets, работу с worksheet,
-    обновление ячеек и добавление строк.
+    обновление ячеек и добавление строк. Все методы блокирующие:
+    из обработчиков используйте SheetExporter.
     """
 
     def __init__(self) -> None:
-        """Инициализация сервиса и подключение к таблице."""
+        """Инициализация сервиса без подключения к таблице."""
         self.gc: gspread.Client | None = None
         self.wks: gspread.Worksheet | None = None
-        self._connect()
 
     def _connect(self) -> None:
         """
@@ -44,10 +44,13 @@ class GoogleSheetsService:
 
     def get_worksheet(self) -> gspread.Worksheet | None:
         """
-        Возвращает объект worksheet.
+        Возвращает объект worksheet, при первом вызове подключаясь
+        к таблице.
 
         :return: gspread.Worksheet или None, если не удалось подключиться.
         """
+        if self.wks is None:
+            self._connect()
         return self.wks
 
     def update_cell(
@@ -63,8 +66,9 @@ class GoogleSheetsService:
         :param col: номер колонки (начинается с 1)
         :param value: новое значение ячейки
         """
-        if self.wks:
-            self.wks.update_cell(row, col, value)
+        wks: gspread.Worksheet | None = self.get_worksheet()
+        if wks:
+            wks.update_cell(row, col, value)
 
     def append_row(
         self,
@@ -75,5 +79,6 @@ class GoogleSheetsService:
 
         :param values: список значений для добавления
         """
-        if self.wks:
-            self.wks.append_row(values)
+        wks: gspread.Worksheet | None = self.get_worksheet()
+        if wks:
+            wks.append_row(values)
@@ -0,0 +1,50 @@
+"""
+Модуль содержит глобальные экземпляры экспорта и синхронизации
+с Google Sheets.
+"""
+
+from typing import Final
+
+from app.config import (GSHEET_BATCH_SIZE, GSHEET_BURST, GSHEET_CREDS,
+                        GSHEET_FLUSH_INTERVAL, GSHEET_NAME, GSHEET_QUEUE_SIZE,
+                        GSHEET_RATE, GSHEET_RETRIES)
+from app.core.bot.utils.ratelimit import TokenBucket
+
+from .exporter import SheetExporter
+from .google_sheets import GoogleSheetsService
+from .sync import SheetSync
+
+_exporter: Final[SheetExporter] = SheetExporter(
+    worksheet=GoogleSheetsService().get_worksheet,
+    bucket=TokenBucket(rate=GSHEET_RATE, capacity=GSHEET_BURST),
+    queue_size=GSHEET_QUEUE_SIZE,
+    batch_size=GSHEET_BATCH_SIZE,
+    flush_interval=GSHEET_FLUSH_INTERVAL,
+    retries=GSHEET_RETRIES,
+    enabled=bool(GSHEET_NAME) and GSHEET_CREDS.exists(),
+)
+_sync: Final[SheetSync] = SheetSync(_exporter)
+
+
+def get_sheet_exporter() -> SheetExporter:
+    """
+    Возвращает глобальный экземпляр экспорта в Google Sheets.
+
+    Returns
+    -------
+    SheetExporter
+        Экспорт в таблицу.
+    """
+    return _exporter
+
+
+def get_sheet_sync() -> SheetSync:
+    """
+    Возвращает глобальный экземпляр синхронизации с Google Sheets.
+
+    Returns
+    -------
+    SheetSync
+        Синхронизация таблицы.
+    """
+    return _sync
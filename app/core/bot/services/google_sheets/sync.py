@@ -0,0 +1,341 @@
+"""
+Модуль инкрементальной синхронизации регистраций с Google Sheets.
+
+Содержит класс SheetSync: в базе хранится снимок выгруженных строк
+(номер строки и хэш значений на пользователя). Синхронизация берёт
+только пользователей, изменённых после последней выгрузки, сравнивает
+хэши со снимком и отправляет изменившиеся строки диапазонами через
+SheetExporter: соседние строки объединяются в один диапазон, а все
+диапазоны пакета уходят одним batch_update. Диапазоны записываются в
+outbox той же транзакцией, что и новый снимок, поэтому строки не
+теряются при остановке процесса до отправки. Таблица при этом не
+читается. Колонки ответов и их значения берутся из типизированной
+таблицы профилей. В режиме dry-run изменения только вычисляются и
+логируются.
+"""
+
+import asyncio
+import hashlib
+import json
+from asyncio import Task
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from loguru import logger
+
+from app.core.bot.services.profile import (ProfileField, format_value,
+                                           get_profile_service)
+from app.core.database import (ProfileManager, SheetRow, SheetRowManager,
+                               User, async_session)
+
+from .exporter import RANGE, SheetExporter, SheetOperation
+
+# Колонки перед ответами на шаги регистрации
+BASE_COLUMNS: tuple[str, ...] = ("Код", "Telegram ID", "Регистрация")
+
+# Строка заголовка и ID пользователя, под которым он хранится в снимке
+HEADER_ROW: int = 1
+HEADER_USER_ID: int = 0
+
+# Максимальное количество строк в одном диапазоне
+MAX_RANGE_ROWS: int = 500
+
+
+@dataclass(slots=True)
+class RowChange:
+    """Строка таблицы, которую нужно записать.
+
+    Атрибуты:
+        row (int): Номер строки (с 1).
+        user_id (int): ID пользователя (0 — заголовок).
+        values (list[Any]): Значения строки.
+    """
+    row: int
+    user_id: int
+    values: list[Any]
+
+
+@dataclass(slots=True)
+class SyncDiff:
+    """Результат сравнения базы со снимком таблицы.
+
+    Атрибуты:
+        header (list[str]): Текущий заголовок таблицы.
+        header_changed (bool): Заголовок изменился, и все строки
+            переписываются заново.
+        changes (list[RowChange]): Новые и изменившиеся строки.
+        cleared (list[int]): Строки удалённых пользователей.
+        removed (list[int]): ID пользователей, удаляемых из снимка.
+        unchanged (list[int]): ID проверенных пользователей, строки
+            которых не изменились.
+    """
+    header: list[str]
+    header_changed: bool = False
+    changes: list[RowChange] = field(default_factory=list)
+    cleared: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+    unchanged: list[int] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        """Таблица уже совпадает с базой."""
+        return not self.changes and not self.cleared
+
+    def ranges(self) -> list[tuple[int, list[list[Any]]]]:
+        """
+        Объединяет записываемые строки в диапазоны подряд идущих строк.
+
+        Очищаемые строки записываются пустыми значениями.
+
+        Returns:
+            list[tuple[int, list[list[Any]]]]: Номер верхней строки и
+                строки диапазона.
+        """
+        width: int = len(self.header)
+        rows: dict[int, list[Any]] = {
+            row: [""] * width for row in self.cleared
+        }
+        for change in self.changes:
+            rows[change.row] = change.values
+
+        ranges: list[tuple[int, list[list[Any]]]] = []
+        for row in sorted(rows):
+            if ranges:
+                start, values = ranges[-1]
+                if (
+                    start + len(values) == row
+                    and len(values) < MAX_RANGE_ROWS
+                ):
+                    values.append(rows[row])
+                    continue
+            ranges.append((row, [rows[row]]))
+        return ranges
+
+
+class SheetSync:
+    """Инкрементальная выгрузка регистраций в таблицу по снимку строк."""
+
+    def __init__(
+        self,
+        exporter: SheetExporter,
+    ) -> None:
+        """
+        Инициализация синхронизации.
+
+        Args:
+            exporter (SheetExporter): Экспорт, через который
+                отправляются диапазоны.
+        """
+        self.exporter: SheetExporter = exporter
+
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._task: Task[None] | None = None
+
+    async def diff(self) -> SyncDiff:
+        """
+        Сравнивает базу со снимком, не изменяя таблицу.
+
+        Returns:
+            SyncDiff: Строки, которые нужно записать или очистить.
+        """
+        profiles = get_profile_service()
+        await profiles.prepare()
+        fields: tuple[ProfileField, ...] = profiles.fields
+        header: list[str] = [
+            *BASE_COLUMNS, *(field.title for field in fields)
+        ]
+
+        async with async_session() as session:
+            manager = SheetRowManager(session)
+            snapshot: dict[int, SheetRow] = await manager.all()
+            stamps: dict[int, datetime | None] = await manager.stamps()
+
+            diff = SyncDiff(header=header)
+            header_row: SheetRow | None = snapshot.pop(HEADER_USER_ID, None)
+            diff.header_changed = (
+                header_row is None or header_row.digest != _digest(header)
+            )
+            if diff.header_changed:
+                diff.changes.append(
+                    RowChange(HEADER_ROW, HEADER_USER_ID, list(header))
+                )
+
+            # Без изменения заголовка проверяются только пользователи,
+            # изменённые после последней выгрузки их строки
+            candidates: list[int] = [
+                user_id for user_id, updated_at in stamps.items()
+                if diff.header_changed
+                or user_id not in snapshot
+                or updated_at is None
+                or updated_at > snapshot[user_id].synced_at
+            ]
+            users: list[tuple[User, dict[str, Any]]] = await ProfileManager(
+                session, profiles.columns
+            ).users(candidates)
+
+        next_row: int = max(
+            (row.row for row in snapshot.values()), default=HEADER_ROW
+        ) + 1
+        for user, profile in users:
+            values: list[Any] = _row_values(user, profile, fields)
+
+            known: SheetRow | None = snapshot.get(user.id)
+            if known is None:
+                diff.changes.append(RowChange(next_row, user.id, values))
+                next_row += 1
+            elif diff.header_changed or known.digest != _digest(values):
+                diff.changes.append(RowChange(known.row, user.id, values))
+            else:
+                diff.unchanged.append(user.id)
+
+        for user_id, row in snapshot.items():
+            if user_id not in stamps:
+                diff.cleared.append(row.row)
+                diff.removed.append(user_id)
+        return diff
+
+    async def sync(
+        self,
+        dry_run: bool = False,
+    ) -> SyncDiff:
+        """
+        Выгружает изменения в таблицу и обновляет снимок.
+
+        Args:
+            dry_run (bool): Только вычислить и залогировать изменения.
+
+        Returns:
+            SyncDiff: Выполненные (или запланированные) изменения.
+        """
+        async with self._lock:
+            # Время снимка берётся до чтения базы: изменения, записанные
+            # во время сравнения, попадут в следующую синхронизацию
+            now: datetime = datetime.now(timezone.utc).replace(tzinfo=None)
+            diff: SyncDiff = await self.diff()
+            ranges: list[tuple[int, list[list[Any]]]] = diff.ranges()
+
+            logger.info(
+                f"Синхронизация таблицы{' (dry-run)' if dry_run else ''}: "
+                f"строк {len(diff.changes)}, очищено {len(diff.cleared)}, "
+                f"без изменений {len(diff.unchanged)}, "
+                f"диапазонов {len(ranges)}"
+            )
+            if dry_run:
+                for row, values in ranges:
+                    logger.info(
+                        f"Строки {row}–{row + len(values) - 1}: "
+                        f"{json.dumps(values, ensure_ascii=False, default=str)}"
+                    )
+                return diff
+
+            # Без настроенной таблицы снимок не обновляется, чтобы
+            # строки выгрузились после её подключения
+            if not self.exporter.enabled:
+                return diff
+
+            operations: list[SheetOperation] = [
+                SheetOperation(kind=RANGE, values=values, row=row, col=1)
+                for row, values in ranges
+            ]
+            snapshot: list[SheetRow] = [
+                SheetRow(
+                    user_id=change.user_id,
+                    row=change.row,
+                    digest=_digest(change.values),
+                    synced_at=now,
+                )
+                for change in diff.changes
+            ]
+            async with async_session() as session:
+                manager = SheetRowManager(session)
+                known: dict[int, SheetRow] = await manager.all()
+                # Неизменившиеся строки отмечаются проверенными, чтобы
+                # не сравнивать их повторно
+                snapshot.extend(
+                    SheetRow(
+                        user_id=user_id,
+                        row=known[user_id].row,
+                        digest=known[user_id].digest,
+                        synced_at=now,
+                    )
+                    for user_id in diff.unchanged if user_id in known
+                )
+                # Снимок фиксируется вместе с операциями outbox
+                await self.exporter.stage(session, operations)
+                await manager.replace(snapshot, removed=diff.removed)
+            self.exporter.notify()
+            return diff
+
+    def schedule(
+        self,
+        delay: float,
+    ) -> None:
+        """
+        Запускает синхронизацию в фоне через delay секунд.
+
+        Вызовы до начала синхронизации объединяются в одну.
+
+        Args:
+            delay (float): Задержка перед синхронизацией в секундах.
+        """
+        if not self.exporter.enabled:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._delayed(delay))
+
+    async def close(self) -> None:
+        """Отменяет запланированную синхронизацию."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _delayed(
+        self,
+        delay: float,
+    ) -> None:
+        """Ждёт delay секунд и выполняет синхронизацию."""
+        await asyncio.sleep(delay)
+        try:
+            await self.sync()
+        except Exception as e:
+            logger.error(f"Ошибка синхронизации таблицы: {e}")
+
+
+def _row_values(
+    user: User,
+    profile: dict[str, Any],
+    fields: Sequence[ProfileField],
+) -> list[Any]:
+    """
+    Формирует значения строки пользователя.
+
+    Args:
+        user (User): Пользователь.
+        profile (dict[str, Any]): Значения колонок профиля.
+        fields (Sequence[ProfileField]): Колонки профиля.
+
+    Returns:
+        list[Any]: Значения строки.
+    """
+    registration: str = (
+        user.date_registration.strftime("%Y-%m-%d %H:%M:%S")
+        if user.date_registration else ""
+    )
+    return [
+        user.code if user.code is not None else "",
+        user.tg_id,
+        registration,
+        *(format_value(profile.get(field.column)) for field in fields),
+    ]
+
+
+def _digest(
+    values: Sequence[Any],
+) -> str:
+    """Хэш значений строки для сравнения со снимком."""
+    return hashlib.sha1(
+        json.dumps(values, ensure_ascii=False, default=str).encode()
+    ).hexdigest()
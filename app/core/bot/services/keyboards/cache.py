@@ -0,0 +1,113 @@
+"""
+Модуль кэша инлайн-клавиатур.
+
+Клавиатуры пользовательских шагов полностью определяются
+локализацией и аргументами функции-построителя, поэтому собранные
+объекты InlineKeyboardMarkup (неизменяемые модели aiogram)
+переиспользуются между пользователями. Кэш сбрасывается при
+загрузке или подмене локализации в реестре.
+"""
+
+import functools
+from collections.abc import Hashable
+from typing import Any, Callable
+
+from aiogram import types
+
+from app.core.bot.services.localization import get_localization_registry
+
+# Построитель клавиатуры
+Builder = Callable[..., types.InlineKeyboardMarkup]
+
+
+class KeyboardCache:
+    """Кэш собранных клавиатур, привязанный к версии локализации."""
+
+    def __init__(
+        self,
+        version: Callable[[], int],
+        maxsize: int = 4096,
+    ) -> None:
+        """
+        Инициализация кэша.
+
+        Args:
+            version (Callable[[], int]): Функция, возвращающая текущую
+                версию локализации.
+            maxsize (int): Максимальное количество клавиатур в кэше.
+        """
+        self.version: Callable[[], int] = version
+        self.maxsize: int = maxsize
+
+        self._version: int | None = None
+        self._entries: dict[Hashable, types.InlineKeyboardMarkup] = {}
+
+    def get(
+        self,
+        build: Builder,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> types.InlineKeyboardMarkup:
+        """
+        Возвращает клавиатуру из кэша, при промахе собирая её.
+
+        Узлы локализации хэшируются по идентичности, поэтому в ключ
+        входит сам объект с текстами кнопок; после подмены
+        локализации весь кэш сбрасывается.
+
+        Args:
+            build (Builder): Функция-построитель клавиатуры.
+            args (tuple[Any, ...]): Позиционные аргументы.
+            kwargs (dict[str, Any]): Именованные аргументы.
+
+        Returns:
+            types.InlineKeyboardMarkup: Клавиатура.
+        """
+        version: int = self.version()
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+        key: Hashable = (build, args, tuple(sorted(kwargs.items())))
+        try:
+            markup: types.InlineKeyboardMarkup | None = (
+                self._entries.get(key)
+            )
+        except TypeError:
+            # Нехэшируемые аргументы: собираем без кэша
+            return build(*args, **kwargs)
+
+        if markup is None:
+            markup = build(*args, **kwargs)
+            if len(self._entries) >= self.maxsize:
+                self._entries.clear()
+            self._entries[key] = markup
+        return markup
+
+    def clear(self) -> None:
+        """Очищает кэш."""
+        self._entries.clear()
+
+
+_cache: KeyboardCache = KeyboardCache(
+    version=lambda: get_localization_registry().version,
+)
+
+
+def cached_keyboard(
+    build: Builder,
+) -> Builder:
+    """
+    Декоратор кэширования клавиатуры по аргументам построителя.
+
+    Args:
+        build (Builder): Функция-построитель клавиатуры.
+
+    Returns:
+        Builder: Функция, возвращающая клавиатуру из кэша.
+    """
+    @functools.wraps(build)
+    def wrapper(*args: Any, **kwargs: Any) -> types.InlineKeyboardMarkup:
+        return _cache.get(build, args, kwargs)
+
+    return wrapper
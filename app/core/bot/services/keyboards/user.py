@@ -2,18 +2,23 @@
 Модуль для формирования инлайн-клавиатур Telegram-бота.
 
 Содержит функции для генерации клавиатур с кнопками "Далее", "Назад"
-и выбора из списка опций различной длины.
+и выбора из списка опций различной длины. Собранные клавиатуры
+кэшируются до смены версии локализации.
 """
 
+from collections.abc import Sequence
 from typing import Any
 
 from aiogram import types
 
 from app.config import SYMB
+from app.core.bot.services.localization import Option
 
+from .cache import cached_keyboard
 from .make import build_keyboard
 
 
+@cached_keyboard
 def kb_dynamic(
     buttons: Any,
     state: str,
@@ -41,6 +46,7 @@ def kb_dynamic(
     return build_keyboard(rows)
 
 
+@cached_keyboard
 def kb_start(
     buttons: Any
 ) -> types.InlineKeyboardMarkup:
@@ -57,6 +63,7 @@ def kb_start(
     return build_keyboard(rows)
 
 
+@cached_keyboard
 def kb_submit(
     payment: bool,
     buttons: Any
@@ -78,9 +85,10 @@ def kb_submit(
     return build_keyboard(rows)
 
 
+@cached_keyboard
 def kb_select(
     name: str,
-    options: list[dict[str, Any]],
+    options: Sequence[Option],
     buttons: Any
 ) -> types.InlineKeyboardMarkup:
     """
@@ -88,8 +96,7 @@ def kb_select(
 
     Args:
         name (str): Имя группы опций.
-        options (list[dict[str, Any]]): Список словарей с полями "text",
-            "next" и опциональным "save".
+        options (Sequence[Option]): Варианты ответа шага выбора.
         buttons (Any): Объект с локализованными текстами кнопок.
 
     Returns:
@@ -103,16 +110,16 @@ def kb_select(
     max_length_per_row: int = 25
 
     for option in options:
-        text: str = option["text"]
-        next_step: str = option["next"]
-        save: bool = option.get("save") is True
+        text: str = option.text
         callback_data: str = (
-            f"user{SYMB}{next_step}{SYMB}{text}{SYMB}{name}" if save
-            else f"user{SYMB}{next_step}"
+            f"user{SYMB}{option.next}{SYMB}{text}{SYMB}{name}"
+            if option.save
+            else f"user{SYMB}{option.next}"
         )
 
-        # Если callback слишком длинный, возвращаем пустую клавиатуру
-        if len(callback_data) > 64:
+        # Размер callback проверяется при загрузке локализации; здесь
+        # остаётся защита для данных в обход неё (лимит — в байтах)
+        if len(callback_data.encode()) > 64:
             return build_keyboard([[]])
 
         # Перенос ряда, если кнопка не помещается
@@ -133,6 +140,7 @@ def kb_select(
     return build_keyboard(rows)
 
 
+@cached_keyboard
 def kb_delete(
     buttons: Any
 ) -> types.InlineKeyboardMarkup:
@@ -149,6 +157,7 @@ def kb_delete(
     return build_keyboard(rows)
 
 
+@cached_keyboard
 def kb_cancel_confirm(
     buttons: Any
 ) -> types.InlineKeyboardMarkup:
@@ -168,6 +177,7 @@ def kb_cancel_confirm(
     return build_keyboard(rows)
 
 
+@cached_keyboard
 def kb_success(
     payment: bool,
     buttons: Any
@@ -198,6 +208,7 @@ def kb_success(
     return build_keyboard(rows)
 
 
+@cached_keyboard
 def kb_payment(
     buttons: Any
 ) -> types.InlineKeyboardMarkup:
@@ -1,13 +1,28 @@
 """
 Пакет для работы с локализацией приложения.
 
-Содержит модели, функции загрузки и обновления данных локализации.
+Содержит неизменяемые модели, компилятор и функции загрузки файлов
+локализации, а также реестр локализаций с отслеживанием изменений
+файлов.
 """
 
-from .loader import load_localization
-from .model import Localization
+from .compiler import compile_localization
+from .instance import get_localization_registry, load_localization
+from .loader import read_localization
+from .model import (InputSpec, LocalizationError, LocNode, Localization,
+                    Option, Step)
+from .registry import LocalizationRegistry
 
 __all__: list[str] = [
+    "InputSpec",
+    "LocNode",
     "Localization",
+    "LocalizationError",
+    "LocalizationRegistry",
+    "Option",
+    "Step",
+    "compile_localization",
+    "get_localization_registry",
     "load_localization",
+    "read_localization",
 ]
@@ -0,0 +1,536 @@
+"""
+Модуль компиляции файлов локализации.
+
+Преобразует JSON-данные локализации в неизменяемые структуры
+(LocNode, Step, Localization), строит индекс шагов и плоскую
+таблицу путей и проверяет структуру при загрузке, чтобы ошибки в
+файлах обнаруживались сразу, а не как AttributeError при обработке
+апдейта.
+"""
+
+import re
+from collections.abc import Mapping
+from typing import Any
+
+from loguru import logger
+
+from app.config import SYMB
+
+from .model import (InputSpec, LocalizationError, LocNode, Localization,
+                    Option, Step)
+
+# Типы шагов регистрации, для которых есть обработчики
+STEP_TYPES: frozenset[str] = frozenset({"input", "select", "text"})
+
+# Первый шаг анкеты (на него ведёт кнопка согласия)
+FIRST_STEP: str = "2"
+
+# Служебные шаги после анкеты: проверка данных, оплата, завершение
+EXIT_STEPS: frozenset[str] = frozenset({"98", "99", "100"})
+
+# Идентификаторы служебных шагов, которые нельзя занимать в анкете
+RESERVED_STEPS: frozenset[str] = EXIT_STEPS | {"1"}
+
+# Ограничение Telegram на размер callback_data (байты UTF-8)
+CALLBACK_DATA_LIMIT: int = 64
+
+# Ключи, без которых обработчики роли не работают:
+# путь → ожидаемое количество частей шаблона (0 — не шаблон)
+REQUIRED_PATHS: dict[str, dict[str, int]] = {
+    "user": {
+        "messages.help": 0,
+        "messages.cancel": 0,
+        "messages.callback_calcel": 0,
+        "messages.template.start": 2,
+        "messages.template.input.empty": 3,
+        "messages.template.input.filled": 3,
+        "messages.template.input.error": 2,
+        "messages.template.select": 2,
+        "messages.template.submit": 2,
+        "messages.template.final.parts": 3,
+        "messages.template.final.confirm": 0,
+        "messages.template.final.names.address": 0,
+        "messages.template.final.names.date": 0,
+        "messages.template.payment": 2,
+        "messages.template.id": 2,
+        "buttons.yes": 0,
+        "buttons.no": 0,
+        "buttons.next": 0,
+        "buttons.back": 0,
+        "buttons.consent": 0,
+        "buttons.delete": 0,
+        "buttons.cancel_reg": 0,
+        "buttons.payment": 0,
+        "event.name": 0,
+        "event.address": 0,
+        "event.date": 0,
+        "event.time": 0,
+        "event.timezone": 0,
+        "event.payment.status": 0,
+        "event.payment.price": 0,
+        "event.payment.currency": 0,
+        "steps": 0,
+        # Названия месяцев в родительном падеже: ключи 1–12
+        **{f"months.{month}": 0 for month in range(1, 13)},
+    },
+    "admin": {
+        "default.admin.text": 0,
+        "default.admin.keyboard": 0,
+        "default.admin.input_code.text": 0,
+        "default.admin.input_code.found": 3,
+        "default.admin.input_code.not_found": 2,
+        "default.admin.input_code.names.id": 0,
+        "default.admin.input_code.names.registration": 0,
+        "default.admin.find_user.text": 0,
+        "default.admin.find_user.keyboard": 0,
+        "default.admin.find_user.results": 3,
+        "default.admin.find_user.empty": 2,
+        "default.admin.find_user.nav": 2,
+        "default.admin.find_user.card": 3,
+        "default.admin.find_user.expired": 0,
+        "default.admin.find_user.missing": 0,
+        "default.admin.table.sync": 2,
+        "default.admin.stats_main.text": 0,
+        "default.admin.stats_main.names.registered": 0,
+        "default.admin.stats_main.names.confirmed": 0,
+        "default.admin.stats_main.names.pending": 0,
+        "default.admin.stats_main.names.cancelled": 0,
+        "default.admin.stats_main.days": 0,
+        "default.admin.stats_main.hours": 0,
+        "default.admin.stats_main.empty": 0,
+        "default.admin.stats_main.keyboard": 0,
+        "default.admin.stats_zone.text": 0,
+        "default.admin.stats_zone.empty": 0,
+        "default.admin.stats_zone.other": 0,
+        "default.admin.stats_zone.keyboard": 0,
+        "default.admin.bot_settings.flags.bot": 0,
+        "default.admin.bot_settings.flags.reg": 0,
+        "default.admin.bot_settings.on": 0,
+        "default.admin.bot_settings.off": 0,
+        "default.admin.bot_settings.forbidden": 0,
+        "default.admin.admin_list.text": 0,
+        "default.admin.admin_list.empty": 0,
+        "default.admin.admin_list.hint": 0,
+        "default.admin.admin_list.roles.main": 0,
+        "default.admin.admin_list.roles.moderator": 0,
+        "default.admin.admin_list.forbidden": 0,
+        "default.admin.admin_list.add": 0,
+        "default.admin.admin_list.remove": 0,
+        "default.admin.admin_list.added": 2,
+        "default.admin.admin_list.removed": 2,
+        "default.admin.admin_list.exists": 2,
+        "default.admin.admin_list.not_found": 2,
+        "default.admin.admin_list.invalid": 0,
+        "default.admin.broadcast.text": 0,
+        "default.admin.broadcast.empty": 0,
+        "default.admin.broadcast.hint": 0,
+        "default.admin.broadcast.keyboard": 0,
+        "default.admin.broadcast.input.text": 0,
+        "default.admin.broadcast.input.keyboard": 0,
+        "default.admin.broadcast.saved": 0,
+        "default.admin.broadcast.no_text": 0,
+        "default.admin.broadcast.running": 0,
+        "default.admin.broadcast.forbidden": 0,
+        "default.admin.broadcast.progress.title": 2,
+        "default.admin.broadcast.progress.status.running": 0,
+        "default.admin.broadcast.progress.status.done": 0,
+        "default.admin.broadcast.progress.status.cancelled": 0,
+        "default.admin.broadcast.progress.sent": 0,
+        "default.admin.broadcast.progress.failed": 0,
+        "default.admin.broadcast.progress.speed": 0,
+        "default.admin.broadcast.progress.eta": 0,
+        "default.admin.broadcast.progress.keyboard": 0,
+        "default.admin.broadcast.progress.finished.keyboard": 0,
+    },
+}
+
+
+def compile_localization(
+    data: Mapping[str, Any],
+    role: str,
+) -> Localization:
+    """
+    Компилирует данные локализации в неизменяемый объект.
+
+    Args:
+        data (Mapping[str, Any]): Объединённые JSON-данные локализации.
+        role (str): Роль: "user" или "admin".
+
+    Returns:
+        Localization: Скомпилированная локализация.
+
+    Raises:
+        LocalizationError: Структура данных некорректна.
+    """
+    paths: dict[str, Any] = {}
+    items: dict[str, Any] = {}
+    steps_index: dict[str, Step] = {}
+
+    for key, value in data.items():
+        if key == "steps":
+            steps_index = _compile_steps(value)
+            items[key] = LocNode(steps_index)
+            paths[key] = items[key]
+            for step_id, step in steps_index.items():
+                paths[f"steps.{step_id}"] = step
+        else:
+            items[key] = _compile_value(value, key, paths)
+
+    for path, parts in REQUIRED_PATHS.get(role, {}).items():
+        if path not in paths:
+            raise LocalizationError(path, "обязательный ключ отсутствует")
+        if parts and not (
+            isinstance(paths[path], tuple) and len(paths[path]) == parts
+        ):
+            raise LocalizationError(
+                path, f"ожидается список из {parts} строк"
+            )
+
+    if role == "admin":
+        _check_menus(paths)
+
+    return Localization(items, steps_index=steps_index, paths=paths)
+
+
+def _compile_value(
+    value: Any,
+    path: str,
+    paths: dict[str, Any],
+) -> Any:
+    """
+    Рекурсивно компилирует значение и заполняет таблицу путей.
+
+    Args:
+        value (Any): JSON-значение.
+        path (str): Путь к значению через точку.
+        paths (dict[str, Any]): Таблица путей для заполнения.
+
+    Returns:
+        Any: LocNode для словарей, кортеж для списков, иначе значение.
+    """
+    compiled: Any
+    if isinstance(value, dict):
+        compiled = LocNode({
+            key: _compile_value(item, f"{path}.{key}", paths)
+            for key, item in value.items()
+        })
+    elif isinstance(value, list):
+        compiled = tuple(
+            _compile_value(item, f"{path}.{index}", {})
+            for index, item in enumerate(value)
+        )
+    else:
+        compiled = value
+    paths[path] = compiled
+    return compiled
+
+
+def _compile_steps(
+    data: Any,
+) -> dict[str, Step]:
+    """
+    Компилирует шаги регистрации.
+
+    Args:
+        data (Any): Значение ключа "steps".
+
+    Returns:
+        dict[str, Step]: Шаги по идентификатору.
+
+    Raises:
+        LocalizationError: Шаг описан некорректно.
+    """
+    if not isinstance(data, dict):
+        raise LocalizationError("steps", "ожидается объект")
+
+    steps: dict[str, Step] = {}
+    for key, raw in data.items():
+        path: str = f"steps.{key}"
+        if not isinstance(raw, dict):
+            raise LocalizationError(path, "ожидается объект")
+
+        step_id: str = _require(raw, "id", str, path)
+        if step_id != key:
+            raise LocalizationError(
+                path, f"id {step_id!r} не совпадает с ключом"
+            )
+        step_type: str = _require(raw, "type", str, path)
+        if step_type not in STEP_TYPES:
+            raise LocalizationError(
+                path, f"неизвестный тип шага {step_type!r}"
+            )
+
+        options: tuple[Option, ...] = ()
+        spec: InputSpec | None = None
+        next_step: str | None = None
+        if step_type == "select":
+            options = _compile_options(raw.get("options"), path)
+        else:
+            next_step = _require(raw, "next", str, path)
+        if step_type == "input":
+            spec = _compile_input(raw.get("data"), f"{path}.data")
+
+        steps[key] = Step(
+            id=step_id,
+            type=step_type,
+            text=_require(raw, "text", str, path),
+            next=next_step,
+            data=spec,
+            options=options,
+            link_preview=bool(raw.get("link_preview", False)),
+        )
+
+    if steps:
+        _check_graph(steps)
+    return steps
+
+
+def option_callback(
+    step: Step,
+    option: Option,
+) -> str:
+    """
+    Возвращает callback_data кнопки варианта ответа.
+
+    Args:
+        step (Step): Шаг выбора.
+        option (Option): Вариант ответа.
+
+    Returns:
+        str: Данные коллбека кнопки.
+    """
+    if option.save:
+        return f"user{SYMB}{option.next}{SYMB}{option.text}{SYMB}{step.text}"
+    return f"user{SYMB}{option.next}"
+
+
+def step_targets(
+    step: Step,
+) -> tuple[str, ...]:
+    """
+    Возвращает шаги, на которые можно перейти из шага.
+
+    Args:
+        step (Step): Шаг регистрации.
+
+    Returns:
+        tuple[str, ...]: Идентификаторы следующих шагов.
+    """
+    if step.next is not None:
+        return (step.next,)
+    return tuple(option.next for option in step.options)
+
+
+def _check_graph(
+    steps: Mapping[str, Step],
+) -> None:
+    """
+    Проверяет граф переходов между шагами.
+
+    Каждый переход должен вести на существующий или служебный шаг,
+    из каждого шага должен быть путь к служебным шагам, а данные
+    кнопок выбора — укладываться в ограничение Telegram.
+
+    Args:
+        steps (Mapping[str, Step]): Шаги по идентификатору.
+
+    Raises:
+        LocalizationError: Граф шагов некорректен.
+    """
+    if FIRST_STEP not in steps:
+        raise LocalizationError(
+            f"steps.{FIRST_STEP}", "первый шаг анкеты отсутствует"
+        )
+
+    for step_id, step in steps.items():
+        if step_id in RESERVED_STEPS:
+            raise LocalizationError(
+                f"steps.{step_id}", "идентификатор занят служебным шагом"
+            )
+        for target in step_targets(step):
+            if target not in steps and target not in EXIT_STEPS:
+                raise LocalizationError(
+                    f"steps.{step_id}",
+                    f"переход на несуществующий шаг {target!r}",
+                )
+        for index, option in enumerate(step.options):
+            size: int = len(option_callback(step, option).encode())
+            if size > CALLBACK_DATA_LIMIT:
+                raise LocalizationError(
+                    f"steps.{step_id}.options.{index}",
+                    f"callback_data {size} байт, максимум "
+                    f"{CALLBACK_DATA_LIMIT}",
+                )
+
+    # Шаги, из которых достижимы служебные: обратный обход от выходов
+    finishing: set[str] = set()
+    changed: bool = True
+    while changed:
+        changed = False
+        for step_id, step in steps.items():
+            if step_id not in finishing and any(
+                target in EXIT_STEPS or target in finishing
+                for target in step_targets(step)
+            ):
+                finishing.add(step_id)
+                changed = True
+    stuck: list[str] = [
+        step_id for step_id in steps if step_id not in finishing
+    ]
+    if stuck:
+        raise LocalizationError(
+            "steps", f"из шагов {stuck} нельзя дойти до завершения анкеты"
+        )
+
+    # Недостижимые шаги не ломают анкету, но скорее всего это ошибка
+    reached: set[str] = set()
+    queue: list[str] = [FIRST_STEP]
+    while queue:
+        step_id = queue.pop()
+        if step_id in reached or step_id not in steps:
+            continue
+        reached.add(step_id)
+        queue.extend(step_targets(steps[step_id]))
+    unreachable: list[str] = [
+        step_id for step_id in steps if step_id not in reached
+    ]
+    if unreachable:
+        logger.warning(f"Шаги анкеты недостижимы: {unreachable}")
+
+
+def _compile_input(
+    raw: Any,
+    path: str,
+) -> InputSpec:
+    """
+    Компилирует параметры шага ввода.
+
+    Args:
+        raw (Any): Значение ключа "data" шага.
+        path (str): Путь к значению.
+
+    Returns:
+        InputSpec: Параметры ввода со скомпилированным выражением.
+
+    Raises:
+        LocalizationError: Параметры описаны некорректно.
+    """
+    if not isinstance(raw, dict):
+        raise LocalizationError(path, "ожидается объект")
+
+    pattern: str = _require(raw, "pattern", str, path)
+    try:
+        regex: re.Pattern[str] = re.compile(pattern)
+    except re.error as error:
+        raise LocalizationError(
+            f"{path}.pattern", f"некорректное выражение: {error}"
+        ) from None
+
+    min_age: Any = raw.get("min_age")
+    if min_age is not None and not isinstance(min_age, int):
+        raise LocalizationError(f"{path}.min_age", "ожидается число")
+
+    return InputSpec(
+        required=_require(raw, "required", bool, path),
+        type=_require(raw, "type", str, path),
+        pattern=pattern,
+        format=_require(raw, "format", str, path),
+        min_age=min_age,
+        regex=regex,
+    )
+
+
+def _compile_options(
+    raw: Any,
+    path: str,
+) -> tuple[Option, ...]:
+    """
+    Компилирует варианты ответа шага выбора.
+
+    Args:
+        raw (Any): Значение ключа "options" шага.
+        path (str): Путь к шагу.
+
+    Returns:
+        tuple[Option, ...]: Варианты ответа.
+
+    Raises:
+        LocalizationError: Варианты описаны некорректно.
+    """
+    if not isinstance(raw, list) or not raw:
+        raise LocalizationError(
+            f"{path}.options", "ожидается непустой список"
+        )
+
+    options: list[Option] = []
+    for index, item in enumerate(raw):
+        item_path: str = f"{path}.options.{index}"
+        if not isinstance(item, dict):
+            raise LocalizationError(item_path, "ожидается объект")
+        options.append(Option(
+            text=_require(item, "text", str, item_path),
+            next=_require(item, "next", str, item_path),
+            save=item.get("save") is True,
+        ))
+    return tuple(options)
+
+
+def _check_menus(
+    paths: Mapping[str, Any],
+) -> None:
+    """
+    Проверяет клавиатуры меню админ-панели.
+
+    Каждая кнопка — список из текста и данных (типа кнопки) и,
+    для ссылок, адреса.
+
+    Args:
+        paths (Mapping[str, Any]): Таблица путей локализации.
+
+    Raises:
+        LocalizationError: Клавиатура описана некорректно.
+    """
+    for path, value in paths.items():
+        if not path.startswith("default.") or not path.endswith(".keyboard"):
+            continue
+        if not isinstance(value, tuple):
+            raise LocalizationError(path, "ожидается список рядов")
+        for row in value:
+            if not isinstance(row, tuple) or not all(
+                isinstance(button, tuple)
+                and len(button) >= 2
+                and all(isinstance(part, str) for part in button)
+                for button in row
+            ):
+                raise LocalizationError(
+                    path, "кнопка — список из текста и данных"
+                )
+
+
+def _require(
+    raw: Mapping[str, Any],
+    key: str,
+    kind: type,
+    path: str,
+) -> Any:
+    """
+    Возвращает обязательное значение заданного типа.
+
+    Args:
+        raw (Mapping[str, Any]): Объект JSON.
+        key (str): Ключ значения.
+        kind (type): Ожидаемый тип.
+        path (str): Путь к объекту.
+
+    Returns:
+        Any: Значение ключа.
+
+    Raises:
+        LocalizationError: Ключа нет или тип не совпадает.
+    """
+    value: Any = raw.get(key)
+    if not isinstance(value, kind):
+        raise LocalizationError(
+            f"{path}.{key}", f"ожидается {kind.__name__}"
+        )
+    return value
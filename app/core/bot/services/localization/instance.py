@@ -0,0 +1,53 @@
+"""
+Модуль содержит глобальный экземпляр реестра локализаций.
+"""
+
+from typing import Final, Literal
+
+from app.config import LOCALE_RELOAD_INTERVAL, LOCALIZATIONS_DIR
+
+from .model import Localization
+from .registry import LocalizationRegistry
+
+# Один реестр на процесс: локализации общие для всех ботов
+_registry: Final[LocalizationRegistry] = LocalizationRegistry(
+    base_dir=LOCALIZATIONS_DIR,
+    interval=LOCALE_RELOAD_INTERVAL,
+)
+
+
+def get_localization_registry() -> LocalizationRegistry:
+    """
+    Возвращает глобальный экземпляр реестра локализаций.
+
+    Returns
+    -------
+    LocalizationRegistry
+        Реестр локализаций.
+    """
+    return _registry
+
+
+async def load_localization(
+    lang: str,
+    role: Literal["user", "admin"],
+) -> Localization:
+    """
+    Возвращает локализацию для указанной роли и языка.
+
+    Файлы разбираются один раз; повторные вызовы возвращают тот же
+    объект, пока файлы локализации не изменятся.
+
+    Parameters
+    ----------
+    lang : str
+        Код языка локализации (например, "ru", "en").
+    role : Literal["user", "admin"]
+        Роль пользователя или администратора.
+
+    Returns
+    -------
+    Localization
+        Общий объект локализации.
+    """
+    return await _registry.get(lang, role)
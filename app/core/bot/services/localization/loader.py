@@ -1,20 +1,44 @@
 """
-Модуль для асинхронной загрузки файлов локализации и объединения их
+Модуль для асинхронного чтения файлов локализации и объединения их
 в единый объект локализации для пользователя или администратора.
 """
 
 import asyncio
 import json
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any
 
 import aiofiles
-from loguru import logger
 
 from app.config import LOCALIZATIONS_DIR
+from app.core.bot.services.localization.compiler import compile_localization
 from app.core.bot.services.localization.model import Localization
 
 
+def localization_files(
+    lang: str,
+    role: str,
+    base_dir: Path = LOCALIZATIONS_DIR,
+) -> tuple[Path, ...]:
+    """Возвращает файлы, из которых собирается локализация.
+
+    Для пользователей это основной файл и файл локализации по
+    умолчанию, для администраторов — только основной файл.
+
+    Args:
+        lang (str): Код языка локализации (например, "ru", "en").
+        role (str): Роль: "user" или "admin".
+        base_dir (Path): Директория локализаций.
+
+    Returns:
+        tuple[Path, ...]: Пути к файлам в порядке объединения.
+    """
+    primary_file: Path = base_dir / role / f"{lang}.json"
+    if role == "user":
+        return primary_file, base_dir / "default" / f"{lang}.json"
+    return (primary_file,)
+
+
 async def _read_json(
     file_path: Path
 ) -> dict[str, Any]:
@@ -25,49 +49,50 @@ async def _read_json(
 
     Returns:
         dict[str, Any]: Содержимое JSON-файла в виде словаря.
-        При ошибке или отсутствии файла возвращается пустой словарь.
-    """
-    if not file_path.exists():
-        logger.error(f"File not found: {file_path.resolve()}")
-        return {}
 
-    try:
-        async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-            return json.loads(await f.read())
-    except Exception as exc:
-        logger.error(f"Error loading {file_path}: {exc}")
-        return {}
+    Raises:
+        OSError: Файл не найден или не читается.
+        ValueError: Файл не является корректным JSON-объектом.
+    """
+    async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
+        data: Any = json.loads(await f.read())
+    if not isinstance(data, dict):
+        raise ValueError(f"{file_path}: ожидается JSON-объект")
+    return data
 
 
-async def load_localization(
+async def read_localization(
     lang: str,
-    role: Literal["user", "admin"],
+    role: str,
+    base_dir: Path = LOCALIZATIONS_DIR,
 ) -> Localization:
-    """Загружает локализацию для указанной роли и языка.
+    """Читает и компилирует локализацию для указанной роли и языка.
 
-    Для пользователей объединяет основной файл и файл локализации
-    по умолчанию. Для администраторов загружает только основной файл.
+    Каждый вызов заново читает файлы с диска, поэтому обработчики
+    получают локализацию через кэширующий реестр
+    (``load_localization``).
 
     Args:
         lang (str): Код языка локализации (например, "ru", "en").
-        role (Literal["user", "admin"]): Роль пользователя или администратора.
+        role (str): Роль: "user" или "admin".
+        base_dir (Path): Директория локализаций.
 
     Returns:
         Localization: Объект локализации с объединёнными данными.
+
+    Raises:
+        OSError: Файл локализации не найден или не читается.
+        ValueError: Файл локализации содержит некорректный JSON или
+            некорректную структуру (LocalizationError).
     """
-    role_dir: Path = LOCALIZATIONS_DIR / role
-    primary_file: Path = role_dir / f"{lang}.json"
+    parts: list[dict[str, Any]] = await asyncio.gather(*(
+        _read_json(file_path)
+        for file_path in localization_files(lang, role, base_dir)
+    ))
 
-    if role == "user":
-        default_file: Path = LOCALIZATIONS_DIR / "default" / f"{lang}.json"
-        default_data: dict[str, Any]
-        primary_data, default_data = await asyncio.gather(
-            _read_json(primary_file),
-            _read_json(default_file),
-        )
-        # Объединяем данные дефолтной локализации с основной
-        primary_data.update(default_data)
-    else:
-        primary_data: dict[str, Any] = await _read_json(primary_file)
-
-    return Localization(primary_data)
+    # Объединяем данные дефолтной локализации с основной
+    primary_data: dict[str, Any] = parts[0]
+    for part in parts[1:]:
+        primary_data.update(part)
+
+    return compile_localization(primary_data, role)
@@ -1,52 +1,250 @@
 """
 Модуль для работы с локализацией.
 
-Содержит класс Localization для хранения и доступа к переведённым
-строкам с поддержкой вложенных словарей.
+Содержит неизменяемые структуры, в которые компилируются файлы
+локализации: узлы с доступом к ключам через атрибуты, шаги
+регистрации и корневой объект Localization с индексом шагов и
+плоской таблицей путей.
 """
 
-from typing import Any
+import re
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, NoReturn
 
 
-class Localization:
+class LocalizationError(ValueError):
+    """Ошибка структуры файла локализации."""
+
+    def __init__(
+        self,
+        path: str,
+        message: str,
+    ) -> None:
+        """
+        Инициализирует ошибку с указанием пути к ключу.
+
+        Args:
+            path (str): Путь к ключу через точку.
+            message (str): Описание ошибки.
+        """
+        super().__init__(f"{path or '<root>'}: {message}")
+        self.path: str = path
+
+
+class LocNode:
     """
-    Класс для хранения и доступа к данным локализации.
+    Неизменяемый узел локализации.
 
-    Позволяет обращаться к переведённым строкам через атрибуты.
-    Автоматически создаёт вложенные объекты для словарей.
+    Позволяет обращаться к ключам словаря через атрибуты. Вложенные
+    словари представлены узлами LocNode, списки — кортежами.
     """
 
-    default: 'Localization'
+    __slots__ = ("_items",)
+
+    _items: Mapping[str, Any]
 
     def __init__(
         self,
-        localization_data: dict[str, Any]
+        items: Mapping[str, Any],
     ) -> None:
         """
-        Инициализирует объект локализации на основе словаря.
+        Инициализирует узел из уже скомпилированных значений.
 
         Args:
-            localization_data (dict[str, Any]): Данные локализации в виде
-                словаря.
+            items (Mapping[str, Any]): Значения узла.
         """
-        self._parse_data(localization_data)
+        object.__setattr__(self, "_items", MappingProxyType(dict(items)))
+
+    def __getattr__(
+        self,
+        name: str,
+    ) -> Any:
+        # Служебные имена не ищутся среди ключей: иначе copy и pickle
+        # зациклятся на ещё не заполненном _items
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._items[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(
+        self,
+        name: str,
+        value: Any,
+    ) -> NoReturn:
+        raise AttributeError("Локализация неизменяема")
+
+    def __delattr__(
+        self,
+        name: str,
+    ) -> NoReturn:
+        raise AttributeError("Локализация неизменяема")
+
+    def __contains__(
+        self,
+        key: object,
+    ) -> bool:
+        return key in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __copy__(self) -> "LocNode":
+        return self
+
+    def __deepcopy__(
+        self,
+        memo: dict[int, Any],
+    ) -> "LocNode":
+        return self
+
+    def get(
+        self,
+        key: str,
+        default: Any = None,
+    ) -> Any:
+        """
+        Возвращает значение ключа или значение по умолчанию.
+
+        Args:
+            key (str): Ключ узла.
+            default (Any): Значение при отсутствии ключа.
+
+        Returns:
+            Any: Значение ключа.
+        """
+        return self._items.get(key, default)
+
+
+@dataclass(frozen=True, slots=True)
+class Option:
+    """Вариант ответа шага выбора.
 
-    def _parse_data(
+    Атрибуты:
+        text (str): Текст кнопки.
+        next (str): Идентификатор следующего шага.
+        save (bool): Сохранять ли выбранный вариант в данные.
+    """
+    text: str
+    next: str
+    save: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class InputSpec:
+    """Параметры шага ввода.
+
+    Атрибуты:
+        required (bool): Обязателен ли ввод для перехода дальше.
+        type (str): Тип значения для проверки.
+        pattern (str): Регулярное выражение для проверки ввода.
+        format (str): Пример формата для подсказки.
+        min_age (int | None): Минимальный возраст для дат.
+        regex (re.Pattern[str]): Скомпилированное выражение pattern.
+    """
+    required: bool
+    type: str
+    pattern: str
+    format: str
+    min_age: int | None
+    regex: re.Pattern[str]
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    """Шаг регистрации.
+
+    Атрибуты:
+        id (str): Идентификатор шага.
+        type (str): Тип шага: "input", "select" или "text".
+        text (str): Текст (название) шага.
+        next (str | None): Следующий шаг (для шагов выбора — None,
+            переход задают варианты ответа).
+        data (InputSpec | None): Параметры ввода для шагов "input".
+        options (tuple[Option, ...]): Варианты ответа для "select".
+        link_preview (bool): Показывать ли предпросмотр ссылок.
+    """
+    id: str
+    type: str
+    text: str
+    next: str | None = None
+    data: InputSpec | None = None
+    options: tuple[Option, ...] = ()
+    link_preview: bool = False
+
+
+class Localization(LocNode):
+    """
+    Скомпилированная локализация.
+
+    Помимо доступа к ключам через атрибуты содержит индекс шагов
+    регистрации и плоскую таблицу значений по путям через точку,
+    построенные при загрузке.
+    """
+
+    __slots__ = ("steps_index", "paths")
+
+    steps_index: Mapping[str, Step]
+    paths: Mapping[str, Any]
+
+    default: LocNode
+
+    def __init__(
         self,
-        data: dict[str, Any]
+        items: Mapping[str, Any],
+        steps_index: Mapping[str, Step] | None = None,
+        paths: Mapping[str, Any] | None = None,
     ) -> None:
         """
-        Рекурсивно создаёт атрибуты для ключей словаря локализации.
+        Инициализирует корневой объект локализации.
+
+        Args:
+            items (Mapping[str, Any]): Скомпилированные значения.
+            steps_index (Mapping[str, Step] | None): Шаги по
+                идентификатору.
+            paths (Mapping[str, Any] | None): Значения по путям через
+                точку.
+        """
+        super().__init__(items)
+        object.__setattr__(
+            self, "steps_index", MappingProxyType(dict(steps_index or {}))
+        )
+        object.__setattr__(
+            self, "paths", MappingProxyType(dict(paths or {}))
+        )
+
+    def step(
+        self,
+        step_id: str,
+    ) -> Step | None:
+        """
+        Возвращает шаг регистрации по идентификатору.
 
-        Если значение является словарём, создаётся вложенный объект
-        Localization. Иначе значение сохраняется как обычный атрибут.
+        Args:
+            step_id (str): Идентификатор шага.
+
+        Returns:
+            Step | None: Шаг или None, если его нет.
+        """
+        return self.steps_index.get(step_id)
+
+    def lookup(
+        self,
+        path: str,
+    ) -> Any:
+        """
+        Возвращает значение по пути через точку.
 
         Args:
-            data (dict[str, Any]): Словарь с локализационными данными.
-        """
-        for key, value in data.items():
-            # Если значение — словарь, создаём вложенный объект
-            if isinstance(value, dict):
-                setattr(self, key, Localization(value))
-            else:
-                setattr(self, key, value)
+            path (str): Путь к ключу, например "default.admin.table".
+
+        Returns:
+            Any: Узел или значение; None, если пути нет.
+        """
+        return self.paths.get(path)
@@ -0,0 +1,213 @@
+"""
+Модуль реестра локализаций.
+
+Содержит класс LocalizationRegistry: каждая пара (язык, роль)
+разбирается один раз на процесс, и все пользователи получают один и
+тот же объект локализации. Фоновая задача следит за временем
+изменения файлов и при правке подменяет объект новой версией, так
+что тексты можно менять без перезапуска бота.
+"""
+
+import asyncio
+from asyncio import Task
+from pathlib import Path
+from typing import cast
+
+from loguru import logger
+
+from .loader import localization_files, read_localization
+from .model import Localization
+
+# Ключ локализации: (язык, роль)
+LocaleKey = tuple[str, str]
+
+# Отпечаток файлов локализации: время изменения каждого файла
+# (None — файла нет)
+Stamp = tuple[int | None, ...]
+
+
+class LocalizationRegistry:
+    """Кэш разобранных локализаций с отслеживанием изменений файлов."""
+
+    def __init__(
+        self,
+        base_dir: Path,
+        interval: float,
+    ) -> None:
+        """
+        Инициализация реестра.
+
+        Args:
+            base_dir (Path): Директория файлов локализации.
+            interval (float): Период проверки изменений файлов в
+                секундах. 0 отключает отслеживание.
+        """
+        self.base_dir: Path = base_dir
+        self.interval: float = interval
+        # Увеличивается при каждой загрузке или подмене локализации
+        self.version: int = 0
+
+        self._cache: dict[LocaleKey, Localization] = {}
+        self._stamps: dict[LocaleKey, Stamp] = {}
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._task: Task[None] | None = None
+        self._closing: bool = False
+
+    async def get(
+        self,
+        lang: str,
+        role: str,
+    ) -> Localization:
+        """
+        Возвращает локализацию, при первом обращении разбирая файлы.
+
+        Возвращаемый объект общий для всех пользователей и не должен
+        изменяться.
+
+        Args:
+            lang (str): Код языка локализации.
+            role (str): Роль: "user" или "admin".
+
+        Returns:
+            Localization: Объект локализации.
+
+        Raises:
+            OSError: Файл локализации не найден или не читается.
+            ValueError: Файл локализации некорректен.
+        """
+        key: LocaleKey = (lang, role)
+        loc: Localization | None = self._cache.get(key)
+        if loc is None:
+            async with self._lock:
+                loc = self._cache.get(key)
+                if loc is None:
+                    # Без keep_previous ошибка пробрасывается
+                    loc = cast(
+                        Localization,
+                        await self._load(key, keep_previous=False),
+                    )
+            self._ensure_watcher()
+        return loc
+
+    async def preload(self) -> int:
+        """
+        Загружает все локализации из директории.
+
+        Вызывается при запуске, чтобы ошибки в файлах обнаруживались
+        до приёма апдейтов.
+
+        Returns:
+            int: Количество загруженных локализаций.
+
+        Raises:
+            OSError: Файл локализации не читается.
+            ValueError: Файл локализации некорректен.
+        """
+        count: int = 0
+        for role in ("user", "admin"):
+            for file_path in sorted((self.base_dir / role).glob("*.json")):
+                await self.get(file_path.stem, role)
+                count += 1
+        return count
+
+    async def reload(self) -> int:
+        """
+        Перечитывает локализации, файлы которых изменились.
+
+        Если новая версия не разбирается, остаётся прежняя.
+
+        Returns:
+            int: Количество подменённых локализаций.
+        """
+        reloaded: int = 0
+        async with self._lock:
+            for key in list(self._cache):
+                if self._stamp(key) == self._stamps.get(key):
+                    continue
+                if await self._load(key, keep_previous=True):
+                    reloaded += 1
+                    logger.info(f"Локализация {key[1]}/{key[0]} обновлена")
+        return reloaded
+
+    async def close(self) -> None:
+        """Останавливает отслеживание изменений файлов."""
+        self._closing = True
+        if self._task and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._closing = False
+
+    async def _load(
+        self,
+        key: LocaleKey,
+        keep_previous: bool,
+    ) -> Localization | None:
+        """
+        Разбирает локализацию и атомарно кладёт её в кэш.
+
+        Args:
+            key (LocaleKey): Ключ локализации.
+            keep_previous (bool): При ошибке оставить прежнюю версию
+                вместо того, чтобы пробросить исключение.
+
+        Returns:
+            Localization | None: Новая локализация или None, если
+                при ошибке осталась прежняя версия.
+        """
+        # Отпечаток снимается до чтения: правка во время разбора
+        # будет замечена при следующей проверке
+        stamp: Stamp = self._stamp(key)
+        try:
+            loc: Localization = await read_localization(
+                *key, base_dir=self.base_dir
+            )
+        except Exception as error:
+            logger.error(f"Ошибка загрузки локализации {key}: {error}")
+            if not keep_previous:
+                raise
+            # Повторная попытка — после следующей правки файла
+            self._stamps[key] = stamp
+            return None
+
+        self._stamps[key] = stamp
+        self._cache[key] = loc
+        self.version += 1
+        return loc
+
+    def _stamp(
+        self,
+        key: LocaleKey,
+    ) -> Stamp:
+        """
+        Снимает отпечаток файлов локализации.
+
+        Args:
+            key (LocaleKey): Ключ локализации.
+
+        Returns:
+            Stamp: Время изменения файлов в наносекундах.
+        """
+        stamp: list[int | None] = []
+        for file_path in localization_files(*key, base_dir=self.base_dir):
+            try:
+                stamp.append(file_path.stat().st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _ensure_watcher(self) -> None:
+        """Запускает отслеживание изменений, если оно не запущено."""
+        if self._closing or self.interval <= 0:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Фоновый цикл проверки изменений файлов."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.reload()
+            except Exception as error:
+                logger.exception(f"Ошибка обновления локализаций: {error}")
@@ -0,0 +1,13 @@
+"""
+Пакет повторного использования загруженных в Telegram медиафайлов.
+
+Содержит хранилище file_id и его глобальный экземпляр.
+"""
+
+from .instance import get_media_store
+from .store import MediaStore
+
+__all__: list[str] = [
+    "MediaStore",
+    "get_media_store",
+]
@@ -0,0 +1,21 @@
+"""
+Модуль содержит глобальный экземпляр хранилища file_id медиафайлов.
+"""
+
+from typing import Final
+
+from .store import MediaStore
+
+_media_store: Final[MediaStore] = MediaStore()
+
+
+def get_media_store() -> MediaStore:
+    """
+    Возвращает глобальный экземпляр хранилища file_id.
+
+    Returns
+    -------
+    MediaStore
+        Хранилище file_id медиафайлов.
+    """
+    return _media_store
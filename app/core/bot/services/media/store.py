@@ -0,0 +1,95 @@
+"""
+Модуль хранилища file_id загруженных медиафайлов.
+
+Содержит класс MediaStore: после первой отправки файла Telegram
+возвращает file_id, и повторные отправки того же файла тем же ботом
+используют его вместо загрузки байтов. Идентификаторы кэшируются в
+памяти и сохраняются в таблицу media.
+"""
+
+from app.core.database import MediaManager, async_session
+
+# Ключ file_id: (ID бота, ключ медиа) — file_id действителен только
+# для бота, который загрузил файл
+MediaKey = tuple[int, str]
+
+
+class MediaStore:
+    """Кэш file_id медиафайлов с сохранением в базе данных."""
+
+    def __init__(self) -> None:
+        """Инициализация хранилища."""
+        self._file_ids: dict[MediaKey, str] = {}
+        # Ключи, для которых в базе точно нет file_id
+        self._missing: set[MediaKey] = set()
+
+    async def get(
+        self,
+        bot_id: int,
+        key: str,
+    ) -> str | None:
+        """
+        Возвращает file_id медиафайла.
+
+        Args:
+            bot_id (int): ID бота.
+            key (str): Ключ медиафайла.
+
+        Returns:
+            str | None: file_id или None, если файл ещё не загружался.
+        """
+        media_key: MediaKey = (bot_id, key)
+        file_id: str | None = self._file_ids.get(media_key)
+        if file_id is not None or media_key in self._missing:
+            return file_id
+
+        async with async_session() as session:
+            file_id = await MediaManager(session).get_file_id(bot_id, key)
+
+        if file_id is None:
+            self._missing.add(media_key)
+        else:
+            self._file_ids[media_key] = file_id
+        return file_id
+
+    async def set(
+        self,
+        bot_id: int,
+        key: str,
+        file_id: str,
+    ) -> None:
+        """
+        Сохраняет file_id загруженного медиафайла.
+
+        Args:
+            bot_id (int): ID бота.
+            key (str): Ключ медиафайла.
+            file_id (str): Идентификатор файла в Telegram.
+        """
+        media_key: MediaKey = (bot_id, key)
+        if self._file_ids.get(media_key) == file_id:
+            return
+        self._file_ids[media_key] = file_id
+        self._missing.discard(media_key)
+
+        async with async_session() as session:
+            await MediaManager(session).set_file_id(bot_id, key, file_id)
+
+    async def forget(
+        self,
+        bot_id: int,
+        key: str,
+    ) -> None:
+        """
+        Удаляет file_id, который Telegram больше не принимает.
+
+        Args:
+            bot_id (int): ID бота.
+            key (str): Ключ медиафайла.
+        """
+        media_key: MediaKey = (bot_id, key)
+        self._file_ids.pop(media_key, None)
+        self._missing.add(media_key)
+
+        async with async_session() as session:
+            await MediaManager(session).delete(bot_id, key)
@@ -0,0 +1,33 @@
+"""
+Пакет метрик задержек обработки апдейтов.
+
+Содержит:
+- MetricsRegistry — реестр гистограмм задержек и счётчиков.
+- Histogram — лог-линейная гистограмма в стиле HDR.
+- UpdateMetricsMiddleware, RequestMetricsMiddleware — middleware
+  для замера апдейтов и вызовов Telegram Bot API.
+- render_prometheus, render_summary — экспорт метрик.
+- get_metrics, get_metrics_server — глобальные экземпляры.
+"""
+
+from .export import render_prometheus, render_summary
+from .histogram import Histogram
+from .instance import get_metrics, get_metrics_server
+from .middleware import (START_KEY, RequestMetricsMiddleware,
+                         UpdateMetricsMiddleware)
+from .registry import MetricsRegistry, Span
+from .server import MetricsServer
+
+__all__: list[str] = [
+    "START_KEY",
+    "Histogram",
+    "MetricsRegistry",
+    "MetricsServer",
+    "RequestMetricsMiddleware",
+    "Span",
+    "UpdateMetricsMiddleware",
+    "get_metrics",
+    "get_metrics_server",
+    "render_prometheus",
+    "render_summary",
+]
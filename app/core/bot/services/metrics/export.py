@@ -0,0 +1,144 @@
+"""
+Модуль экспорта метрик.
+
+Содержит функции форматирования реестра в текстовый формат
+Prometheus и в краткую сводку для админ-панели.
+"""
+
+import html
+from collections.abc import Mapping
+
+from .histogram import Histogram
+from .registry import Labels, MetricKey, MetricsRegistry
+
+# Префикс имён метрик в формате Prometheus
+PREFIX: str = "bot"
+
+# Квантили, выводимые для каждой гистограммы
+QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99)
+
+
+def render_prometheus(
+    registry: MetricsRegistry,
+) -> str:
+    """
+    Форматирует метрики в текстовый формат Prometheus.
+
+    Гистограммы выводятся как summary (квантили, _sum и _count),
+    счётчики — как counter.
+
+    Args:
+        registry (MetricsRegistry): Реестр метрик.
+
+    Returns:
+        str: Текст в формате Prometheus exposition.
+    """
+    lines: list[str] = []
+
+    for name, keys in _group(registry.histograms).items():
+        metric: str = f"{PREFIX}_{name}_seconds"
+        lines.append(f"# TYPE {metric} summary")
+        for key in keys:
+            histogram: Histogram = registry.histograms[key]
+            labels: Labels = key[1]
+            for q in QUANTILES:
+                lines.append(
+                    f"{metric}{_format(labels + (('quantile', str(q)),))} "
+                    f"{histogram.quantile(q) / 1e6}"
+                )
+            lines.append(
+                f"{metric}_sum{_format(labels)} {histogram.total / 1e6}"
+            )
+            lines.append(
+                f"{metric}_count{_format(labels)} {histogram.count}"
+            )
+
+    for name, keys in _group(registry.counters).items():
+        metric = f"{PREFIX}_{name}_total"
+        lines.append(f"# TYPE {metric} counter")
+        for key in keys:
+            lines.append(
+                f"{metric}{_format(key[1])} {registry.counters[key]}"
+            )
+
+    return "\n".join(lines) + "\n"
+
+
+def render_summary(
+    registry: MetricsRegistry,
+    limit: int = 20,
+) -> str:
+    """
+    Форматирует краткую сводку задержек для админ-панели.
+
+    Замеры отсортированы по суммарному времени: сверху те участки,
+    на которые уходит больше всего времени.
+
+    Args:
+        registry (MetricsRegistry): Реестр метрик.
+        limit (int): Максимальное количество строк.
+
+    Returns:
+        str: Сводка в HTML-разметке Telegram.
+    """
+    keys: list[MetricKey] = sorted(
+        registry.histograms,
+        key=lambda key: registry.histograms[key].total,
+        reverse=True,
+    )[:limit]
+    if not keys:
+        return "<i>Нет данных</i>"
+
+    rows: list[str] = []
+    for key in keys:
+        histogram: Histogram = registry.histograms[key]
+        label: str = ",".join(value for _, value in key[1])
+        title: str = f"{key[0]}[{label}]" if label else key[0]
+        rows.append(
+            f"<code>{html.escape(title)}</code>\n"
+            f"n={histogram.count} "
+            f"p50={_ms(histogram.quantile(0.5))} "
+            f"p99={_ms(histogram.quantile(0.99))} "
+            f"max={_ms(histogram.max)}"
+        )
+    return "\n".join(rows)
+
+
+def _group(
+    metrics: Mapping[MetricKey, object],
+) -> dict[str, list[MetricKey]]:
+    """Группирует ключи метрик по имени."""
+    groups: dict[str, list[MetricKey]] = {}
+    for key in sorted(metrics):
+        groups.setdefault(key[0], []).append(key)
+    return groups
+
+
+def _format(
+    labels: Labels,
+) -> str:
+    """Форматирует метки в синтаксисе Prometheus."""
+    if not labels:
+        return ""
+    pairs: str = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+def _escape(
+    value: str,
+) -> str:
+    """Экранирует значение метки."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def _ms(
+    value_us: int,
+) -> str:
+    """Форматирует микросекунды в миллисекунды."""
+    return f"{value_us / 1000:.1f}ms"
@@ -0,0 +1,111 @@
+"""
+Модуль лог-линейной гистограммы задержек в стиле HDR Histogram.
+
+Значения до 2**precision хранятся точно, большие значения попадают
+в корзины, ширина которых растёт вместе с порядком величины, поэтому
+относительная погрешность квантилей не превышает 2**(1 - precision)
+при постоянной стоимости записи.
+"""
+
+
+class Histogram:
+    """Лог-линейная гистограмма целых значений (микросекунды)."""
+
+    __slots__ = (
+        "precision",
+        "_sub",
+        "_half",
+        "counts",
+        "count",
+        "total",
+        "max",
+    )
+
+    def __init__(
+        self,
+        precision: int = 5,
+    ) -> None:
+        """
+        Инициализация гистограммы.
+
+        Args:
+            precision (int): Число значащих бит корзины. При 5 битах
+                погрешность квантилей не превышает ~6%.
+        """
+        self.precision: int = precision
+        self._sub: int = 1 << precision
+        self._half: int = 1 << (precision - 1)
+
+        self.counts: dict[int, int] = {}
+        self.count: int = 0
+        self.total: int = 0
+        self.max: int = 0
+
+    def record(
+        self,
+        value: int,
+    ) -> None:
+        """
+        Записывает значение в гистограмму.
+
+        Args:
+            value (int): Неотрицательное значение.
+        """
+        if value < 0:
+            value = 0
+        index: int = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(
+        self,
+        q: float,
+    ) -> int:
+        """
+        Возвращает оценку квантиля сверху.
+
+        Args:
+            q (float): Квантиль от 0 до 1.
+
+        Returns:
+            int: Верхняя граница корзины квантиля (не больше максимума).
+        """
+        if not self.count:
+            return 0
+
+        rank: float = q * self.count
+        seen: int = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._upper(index), self.max)
+        return self.max
+
+    def _index(
+        self,
+        value: int,
+    ) -> int:
+        """Возвращает номер корзины для значения."""
+        if value < self._sub:
+            return value
+        shift: int = value.bit_length() - self.precision
+        return (
+            self._sub
+            + (shift - 1) * self._half
+            + ((value >> shift) - self._half)
+        )
+
+    def _upper(
+        self,
+        index: int,
+    ) -> int:
+        """Возвращает верхнюю границу корзины."""
+        if index < self._sub:
+            return index
+        offset: int = index - self._sub
+        shift: int = offset // self._half + 1
+        mantissa: int = offset % self._half + self._half
+        return ((mantissa + 1) << shift) - 1
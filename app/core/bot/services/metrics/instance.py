@@ -0,0 +1,43 @@
+"""
+Модуль содержит глобальные экземпляры реестра и сервера метрик.
+"""
+
+from typing import Final
+
+from app.config import METRICS_ENABLED, METRICS_HOST, METRICS_PORT
+
+from .registry import MetricsRegistry
+from .server import MetricsServer
+
+# Один реестр на процесс: метрики всех ботов агрегируются вместе
+_metrics: Final[MetricsRegistry] = MetricsRegistry(enabled=METRICS_ENABLED)
+
+_metrics_server: Final[MetricsServer] = MetricsServer(
+    registry=_metrics,
+    host=METRICS_HOST,
+    port=METRICS_PORT,
+)
+
+
+def get_metrics() -> MetricsRegistry:
+    """
+    Возвращает глобальный реестр метрик.
+
+    Returns
+    -------
+    MetricsRegistry
+        Реестр метрик, используемый приложением.
+    """
+    return _metrics
+
+
+def get_metrics_server() -> MetricsServer:
+    """
+    Возвращает глобальный сервер метрик.
+
+    Returns
+    -------
+    MetricsServer
+        HTTP-сервер эндпоинта /metrics.
+    """
+    return _metrics_server
@@ -0,0 +1,82 @@
+"""
+Модуль middleware для сбора метрик.
+
+Содержит:
+- UpdateMetricsMiddleware — внешний middleware диспетчера, измеряющий
+  полное время обработки апдейта и отмечающий его начало для замера
+  фильтров в MwBase;
+- RequestMetricsMiddleware — middleware HTTP-сессии, измеряющий
+  вызовы Telegram Bot API.
+"""
+
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware, NextRequestMiddlewareType)
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import Response, TelegramType
+from aiogram.types import TelegramObject, Update
+
+from .registry import MetricsRegistry
+
+# Ключ данных апдейта с моментом начала обработки (perf_counter_ns)
+START_KEY: str = "metrics_start"
+
+
+class UpdateMetricsMiddleware(BaseMiddleware):
+    """Замер полного времени обработки апдейта."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+    ) -> None:
+        """
+        Инициализация middleware.
+
+        Args:
+            registry (MetricsRegistry): Реестр метрик.
+        """
+        self.registry: MetricsRegistry = registry
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        data[START_KEY] = perf_counter_ns()
+        event_type: str = (
+            event.event_type if isinstance(event, Update) else "unknown"
+        )
+        with self.registry.span("update", type=event_type):
+            return await handler(event, data)
+
+
+class RequestMetricsMiddleware(BaseRequestMiddleware):
+    """Замер вызовов Telegram Bot API по методам."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+    ) -> None:
+        """
+        Инициализация middleware.
+
+        Args:
+            registry (MetricsRegistry): Реестр метрик.
+        """
+        self.registry: MetricsRegistry = registry
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        with self.registry.span(
+            "telegram_api",
+            method=method.__api_method__,
+        ):
+            return await make_request(bot, method)
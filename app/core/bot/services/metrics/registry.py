@@ -0,0 +1,232 @@
+"""
+Модуль реестра метрик бота.
+
+Содержит MetricsRegistry: замеры (spans) по монотонным часам
+агрегируются в гистограммы задержек и счётчики с метками. Запись
+замера — несколько операций со словарём, поэтому реестр можно
+держать включённым в продакшене.
+"""
+
+from __future__ import annotations
+
+import functools
+from time import perf_counter_ns
+from types import TracebackType
+from typing import Any, Awaitable, Callable, TypeVar
+
+from .histogram import Histogram
+
+# Метки метрики: отсортированные пары (имя, значение)
+Labels = tuple[tuple[str, str], ...]
+
+# Ключ метрики: (имя, метки)
+MetricKey = tuple[str, Labels]
+
+T = TypeVar("T")
+
+
+class Span:
+    """Замер длительности участка кода."""
+
+    __slots__ = ("registry", "name", "labels", "start")
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        labels: Labels,
+    ) -> None:
+        """
+        Инициализация замера.
+
+        Args:
+            registry (MetricsRegistry): Реестр для записи результата.
+            name (str): Имя замера.
+            labels (Labels): Метки замера.
+        """
+        self.registry: MetricsRegistry = registry
+        self.name: str = name
+        self.labels: Labels = labels
+        self.start: int = 0
+
+    def __enter__(self) -> Span:
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.registry.record_ns(
+            self.name,
+            perf_counter_ns() - self.start,
+            self.labels,
+        )
+        if exc_type is not None:
+            self.registry.inc_labels(f"{self.name}_errors", 1, self.labels)
+
+
+class MetricsRegistry:
+    """Реестр гистограмм задержек и счётчиков."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Инициализация реестра.
+
+        Args:
+            enabled (bool): Записывать ли метрики. Выключенный реестр
+                отдаёт замеры, которые ничего не сохраняют.
+        """
+        self.enabled: bool = enabled
+        self.histograms: dict[MetricKey, Histogram] = {}
+        self.counters: dict[MetricKey, int] = {}
+
+    def span(
+        self,
+        name: str,
+        **labels: str,
+    ) -> Span:
+        """
+        Создаёт замер для использования в ``with``.
+
+        Args:
+            name (str): Имя замера.
+            **labels (str): Метки замера.
+
+        Returns:
+            Span: Замер длительности.
+        """
+        return Span(self, name, _labels(labels))
+
+    def timed(
+        self,
+        name: str,
+        **labels: str,
+    ) -> Callable[
+        [Callable[..., Awaitable[T]]],
+        Callable[..., Awaitable[T]],
+    ]:
+        """
+        Декоратор замера длительности асинхронной функции.
+
+        Args:
+            name (str): Имя замера.
+            **labels (str): Метки замера.
+
+        Returns:
+            Callable: Декоратор асинхронной функции.
+        """
+        key_labels: Labels = _labels(labels)
+
+        def decorator(
+            func: Callable[..., Awaitable[T]],
+        ) -> Callable[..., Awaitable[T]]:
+            @functools.wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> T:
+                with Span(self, name, key_labels):
+                    return await func(*args, **kwargs)
+            return wrapper
+
+        return decorator
+
+    def observe(
+        self,
+        name: str,
+        seconds: float,
+        **labels: str,
+    ) -> None:
+        """
+        Записывает готовое значение длительности.
+
+        Args:
+            name (str): Имя замера.
+            seconds (float): Длительность в секундах.
+            **labels (str): Метки замера.
+        """
+        self.record_ns(name, int(seconds * 1e9), _labels(labels))
+
+    def inc(
+        self,
+        name: str,
+        value: int = 1,
+        **labels: str,
+    ) -> None:
+        """
+        Увеличивает счётчик.
+
+        Args:
+            name (str): Имя счётчика.
+            value (int): Величина увеличения.
+            **labels (str): Метки счётчика.
+        """
+        self.inc_labels(name, value, _labels(labels))
+
+    def record_ns(
+        self,
+        name: str,
+        duration_ns: int,
+        labels: Labels = (),
+    ) -> None:
+        """
+        Записывает длительность в наносекундах.
+
+        Гистограммы хранят микросекунды.
+
+        Args:
+            name (str): Имя замера.
+            duration_ns (int): Длительность в наносекундах.
+            labels (Labels): Метки замера.
+        """
+        if not self.enabled:
+            return
+        key: MetricKey = (name, labels)
+        histogram: Histogram | None = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.record(duration_ns // 1000)
+
+    def inc_labels(
+        self,
+        name: str,
+        value: int,
+        labels: Labels = (),
+    ) -> None:
+        """
+        Увеличивает счётчик с уже подготовленными метками.
+
+        Args:
+            name (str): Имя счётчика.
+            value (int): Величина увеличения.
+            labels (Labels): Метки счётчика.
+        """
+        if not self.enabled:
+            return
+        key: MetricKey = (name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def reset(self) -> None:
+        """Сбрасывает все накопленные метрики."""
+        self.histograms.clear()
+        self.counters.clear()
+
+
+def _labels(
+    labels: dict[str, str],
+) -> Labels:
+    """
+    Приводит метки к хэшируемому виду.
+
+    Args:
+        labels (dict[str, str]): Метки.
+
+    Returns:
+        Labels: Отсортированные пары (имя, значение).
+    """
+    if not labels:
+        return ()
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
@@ -0,0 +1,73 @@
+"""
+Модуль HTTP-эндпоинта метрик в формате Prometheus.
+"""
+
+from aiohttp import web
+from loguru import logger
+
+from .export import render_prometheus
+from .registry import MetricsRegistry
+
+# Тип содержимого текстового формата Prometheus
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """HTTP-сервер, отдающий метрики по пути /metrics."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        host: str,
+        port: int,
+    ) -> None:
+        """
+        Инициализация сервера.
+
+        Args:
+            registry (MetricsRegistry): Реестр метрик.
+            host (str): Адрес для прослушивания.
+            port (int): Порт для прослушивания.
+        """
+        self.registry: MetricsRegistry = registry
+        self.host: str = host
+        self.port: int = port
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> None:
+        """Запускает сервер, если он ещё не запущен."""
+        if self._runner is not None:
+            return
+
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle)
+
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, self.host, self.port).start()
+        self._runner = runner
+        logger.debug(f"Метрики доступны на {self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        """Останавливает сервер."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(
+        self,
+        request: web.Request,
+    ) -> web.Response:
+        """
+        Отдаёт метрики в текстовом формате Prometheus.
+
+        Args:
+            request (web.Request): Входящий запрос.
+
+        Returns:
+            web.Response: Текст метрик.
+        """
+        return web.Response(
+            text=render_prometheus(self.registry),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
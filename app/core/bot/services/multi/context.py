@@ -4,11 +4,14 @@
 """
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from aiogram import types
 from aiogram.fsm.context import FSMContext
 
+if TYPE_CHECKING:
+    from .graph import StepNode
+
 
 @dataclass(slots=True)
 class MultiContext:
@@ -23,6 +26,8 @@ class MultiContext:
         data (str | None): Дополнительные данные, переданные пользователем.
         event (types.CallbackQuery | types.Message | None):
             Событие Telegram, которое вызвало этот контекст.
+        node (StepNode | None): Скомпилированный узел шага с готовыми
+            текстами и клавиатурами.
     """
     state: FSMContext
     loc: Any
@@ -31,3 +36,4 @@ class MultiContext:
     tg_id: int = 0
     data: str | None = None
     event: types.CallbackQuery | types.Message | None = None
+    node: "StepNode | None" = None
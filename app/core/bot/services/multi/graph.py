@@ -0,0 +1,296 @@
+"""
+Модуль графа шагов регистрации.
+
+Содержит класс StepGraph: шаги локализации компилируются в таблицу
+узлов с уже выбранным обработчиком и заранее собранными текстами и
+клавиатурами, поэтому ``multi`` выбирает шаг одним обращением к
+словарю. Граф строится один раз на версию локализации; корректность
+переходов проверяется при загрузке локализации.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from aiogram.types import InlineKeyboardMarkup, LinkPreviewOptions
+
+from app.core.bot.services.keyboards import (kb_dynamic, kb_payment,
+                                             kb_select, kb_start)
+from app.core.bot.services.localization import (Localization, Step,
+                                                get_localization_registry)
+from app.core.bot.utils.morphology.casing import lower_words
+from app.core.bot.utils.morphology.inflection import (inflect_text,
+                                                      prewarm_inflections,
+                                                      warm_up_morph)
+
+from .context import MultiContext
+from .handlers.final import handler_final
+from .handlers.input import handler_input
+from .handlers.payment import handler_payment
+from .handlers.select import handler_select
+from .handlers.start import handler_start
+from .handlers.submit import handler_submit
+from .handlers.text import handler_text
+
+# Обработчик шага
+Handler = Callable[
+    [MultiContext],
+    Awaitable[tuple[str, InlineKeyboardMarkup, LinkPreviewOptions]],
+]
+
+# Таблица стандартных обработчиков.
+HANDLERS: dict[str, Handler] = {
+    "input": handler_input,
+    "select": handler_select,
+    "text": handler_text,
+}
+
+# Таблица обработчиков для специальных состояний.
+SPECIAL_HANDLERS: dict[str, Handler] = {
+    "1": handler_start,
+    "98": handler_submit,
+    "99": handler_payment,
+    "100": handler_final,
+}
+
+# Предпросмотр ссылок отключён для всех шагов, кроме текстовых
+NO_PREVIEW: LinkPreviewOptions = LinkPreviewOptions(is_disabled=True)
+
+
+@dataclass(frozen=True, slots=True)
+class StepNode:
+    """Скомпилированный шаг регистрации.
+
+    Атрибуты:
+        id (str): Идентификатор шага.
+        handler (Handler): Обработчик шага.
+        step (Step | None): Шаг локализации (None для служебных).
+        text (str): Готовый текст сообщения; для шагов ввода — текст
+            ошибки ввода.
+        prompt (str): Текст приглашения к вводу (шаги ввода).
+        keyboard (InlineKeyboardMarkup | None): Готовая клавиатура;
+            для шагов ввода — без кнопки "Далее".
+        keyboard_next (InlineKeyboardMarkup | None): Клавиатура шага
+            ввода с кнопкой "Далее".
+        preview (LinkPreviewOptions): Параметры предпросмотра ссылок.
+    """
+    id: str
+    handler: Handler
+    step: Step | None = None
+    text: str = ""
+    prompt: str = ""
+    keyboard: InlineKeyboardMarkup | None = None
+    keyboard_next: InlineKeyboardMarkup | None = None
+    preview: LinkPreviewOptions = NO_PREVIEW
+
+
+class StepGraph:
+    """Таблица скомпилированных шагов одной локализации."""
+
+    __slots__ = ("nodes", "start")
+
+    def __init__(
+        self,
+        nodes: dict[str, StepNode],
+    ) -> None:
+        """
+        Инициализация графа.
+
+        Args:
+            nodes (dict[str, StepNode]): Узлы по идентификатору шага.
+        """
+        self.nodes: dict[str, StepNode] = nodes
+        self.start: StepNode = nodes["1"]
+
+    def dispatch(
+        self,
+        value: str,
+    ) -> StepNode:
+        """
+        Возвращает узел шага.
+
+        Неизвестное состояние ведёт на стартовый шаг, чтобы
+        пользователь не завис.
+
+        Args:
+            value (str): Идентификатор шага.
+
+        Returns:
+            StepNode: Узел шага.
+        """
+        return self.nodes.get(value, self.start)
+
+
+async def compile_graph(
+    loc: Localization,
+) -> StepGraph:
+    """
+    Компилирует шаги локализации в граф.
+
+    Args:
+        loc (Localization): Локализация пользователя.
+
+    Returns:
+        StepGraph: Граф шагов.
+    """
+    buttons: Any = loc.buttons
+    template: Any = loc.messages.template
+    nodes: dict[str, StepNode] = {}
+
+    part1: str
+    part2: str
+
+    part1, part2 = template.start
+    nodes["1"] = StepNode(
+        id="1",
+        handler=handler_start,
+        text=f"{part1}{loc.event.name}{part2}",
+        keyboard=kb_start(buttons=buttons),
+    )
+
+    part1, part2 = template.payment
+    nodes["99"] = StepNode(
+        id="99",
+        handler=handler_payment,
+        text=f"{part1}{buttons.payment}{part2}",
+        keyboard=kb_payment(buttons=buttons),
+    )
+    for step_id in ("98", "100"):
+        nodes[step_id] = StepNode(
+            id=step_id, handler=SPECIAL_HANDLERS[step_id]
+        )
+
+    for step_id, step in loc.steps_index.items():
+        nodes[step_id] = await _compile_step(step, loc)
+
+    return StepGraph(nodes)
+
+
+async def _compile_step(
+    step: Step,
+    loc: Localization,
+) -> StepNode:
+    """
+    Собирает тексты и клавиатуры шага анкеты.
+
+    Args:
+        step (Step): Шаг локализации.
+        loc (Localization): Локализация пользователя.
+
+    Returns:
+        StepNode: Узел шага.
+    """
+    buttons: Any = loc.buttons
+    template: Any = loc.messages.template
+    part1: str
+    part2: str
+    part3: str
+
+    if step.type == "select":
+        part1, part2 = template.select
+        return StepNode(
+            id=step.id,
+            handler=handler_select,
+            step=step,
+            text=f"{part1}{step.text}{part2}",
+            keyboard=kb_select(
+                name=step.text,
+                options=step.options,
+                buttons=buttons,
+            ),
+        )
+
+    if step.type == "input" and step.data is not None:
+        part1, part2 = template.input.error
+        error_text: str = f"{part1}{step.data.format}{part2}"
+
+        part1, part2, part3 = template.input.empty
+        accusative: str = await inflect_text(
+            text=await lower_words(step.text, capitalize_first=False),
+            case="винительный",
+        )
+        return StepNode(
+            id=step.id,
+            handler=handler_input,
+            step=step,
+            text=error_text,
+            prompt=f"{part1}{accusative}{part2}{step.data.format}{part3}",
+            keyboard=kb_dynamic(
+                buttons=buttons,
+                state=step.next,
+                backstate=step.id,
+                show_next=False,
+            ),
+            keyboard_next=kb_dynamic(
+                buttons=buttons,
+                state=step.next,
+                backstate=step.id,
+                show_next=True,
+            ),
+        )
+
+    return StepNode(
+        id=step.id,
+        handler=HANDLERS.get(step.type, handler_text),
+        step=step,
+        text=step.text,
+        keyboard=kb_dynamic(
+            buttons=buttons,
+            state=step.next,
+            backstate=step.id,
+        ),
+        preview=LinkPreviewOptions(is_disabled=not step.link_preview),
+    )
+
+
+# Скомпилированные графы по локализации; сбрасываются при смене
+# версии реестра локализаций
+_graphs: dict[Localization, StepGraph] = {}
+_graphs_version: int | None = None
+
+
+async def get_step_graph(
+    loc: Localization,
+) -> StepGraph:
+    """
+    Возвращает граф шагов локализации, при первом обращении
+    компилируя его.
+
+    Args:
+        loc (Localization): Локализация пользователя.
+
+    Returns:
+        StepGraph: Граф шагов.
+    """
+    global _graphs_version
+    version: int = get_localization_registry().version
+    if version != _graphs_version:
+        _graphs.clear()
+        _graphs_version = version
+
+    graph: StepGraph | None = _graphs.get(loc)
+    if graph is None:
+        graph = _graphs[loc] = await compile_graph(loc)
+    return graph
+
+
+async def prewarm_step_titles(
+    loc: Localization,
+) -> int:
+    """
+    Склоняет названия шагов ввода и выбора во все падежи заранее.
+
+    Словарь морфологии загружается в пуле потоков.
+
+    Args:
+        loc (Localization): Локализация пользователя.
+
+    Returns:
+        int: Количество склонённых фраз в кэше.
+    """
+    await warm_up_morph()
+    titles: list[str] = [
+        await lower_words(step.text, capitalize_first=False)
+        for step in loc.steps_index.values()
+        if step.type in ("input", "select")
+    ]
+    return await prewarm_inflections(titles)
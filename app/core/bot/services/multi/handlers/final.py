@@ -3,19 +3,27 @@
 
 Выполняет загрузку данных пользователя, генерацию кода, создание
 итогового изображения и отправку финального сообщения с закреплением.
+Изображение кода загружается в Telegram один раз на бота: повторные
+отправки используют сохранённый file_id.
 """
 
 from datetime import datetime, timedelta, timezone
-from io import BytesIO
 from typing import Any
 
-from aiogram import types
+from aiogram import Bot, types
 from aiogram.enums import ChatAction
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import InlineKeyboardMarkup, LinkPreviewOptions
 
-from app.core.bot.services.generator import generate_image
-from app.core.bot.services.generator.generator_code import generate_code
+from app.config import GSHEET_SYNC_DELAY
+from app.core.bot.services.generator import (CodeImageRenderer,
+                                             get_code_renderer,
+                                             get_code_space)
+from app.core.bot.services.google_sheets import get_sheet_sync
 from app.core.bot.services.keyboards import kb_success
+from app.core.bot.services.media import MediaStore, get_media_store
+from app.core.bot.services.persistence import get_write_behind
+from app.core.bot.services.stats import registration_deltas
 from app.core.database.models import User
 
 from ..context import MultiContext
@@ -59,20 +67,9 @@ async def handler_final(
             inline_keyboard=[[]]
         ), LinkPreviewOptions()
 
-    # Генерация кода
-    code: int | None = generate_code(
-        user_id=user.id,
-        num_digits=3,
-    )
-
-    # Отображение действия загрузки
-    await message.bot.send_chat_action(
-        chat_id=ctx.tg_id,
-        action=ChatAction.UPLOAD_PHOTO,
-    )
-
-    # Генерация изображения
-    image_buffer: BytesIO = await generate_image(str(code))
+    # Выдача кода: сохраняется в пользователе для поиска по коду
+    code: int = get_code_space().encode(user.id)
+    user.code = code
 
     # Формирование подписи
     template: Any = loc.messages.template.final
@@ -90,7 +87,7 @@ async def handler_final(
 
     month_name: str = getattr(
         loc.months,
-        str(dt.month - 1),
+        str(dt.month),
     )
 
     date_str: str = (
@@ -113,13 +110,12 @@ async def handler_final(
     )
 
     # Отправка изображения
-    sent_message: types.Message = await message.answer_photo(
-        photo=types.BufferedInputFile(
-            image_buffer.read(),
-            filename="code.png",
-        ),
+    sent_message: types.Message = await _send_code_photo(
+        message=message,
+        bot=message.bot,
+        tg_id=ctx.tg_id,
+        code=str(code),
         caption=caption,
-        parse_mode="HTML",
         reply_markup=kb_success(
             payment=loc.event.payment.status,
             buttons=loc.buttons
@@ -151,8 +147,94 @@ async def handler_final(
             pass
 
     tz = timezone(timedelta(hours=loc.event.timezone))
+    first: bool = user_db.date_registration is None
     user_db.date_registration = datetime.now(tz=tz)
 
+    # Счётчики статистики записываются вместе с пользователем
+    if first:
+        get_write_behind().record(
+            tg_id=ctx.tg_id,
+            bot_id=message.bot.id,
+            deltas=registration_deltas(
+                user_db, user_data.get("data_db") or {}, loc
+            ),
+        )
+
+    # Выгрузка в таблицу после записи изменений в базу (в фоне,
+    # одной синхронизацией на несколько регистраций)
+    get_sheet_sync().schedule(GSHEET_SYNC_DELAY)
+
     return "", InlineKeyboardMarkup(
         inline_keyboard=[[]]
     ), LinkPreviewOptions()
+
+
+async def _send_code_photo(
+    message: types.Message,
+    bot: Bot,
+    tg_id: int,
+    code: str,
+    caption: str,
+    reply_markup: InlineKeyboardMarkup,
+) -> types.Message:
+    """
+    Отправляет изображение с кодом, по возможности по file_id.
+
+    Ключ file_id включает версию фона и шрифта, поэтому после замены
+    ассетов изображение загружается заново. Если Telegram отклоняет
+    сохранённый file_id, изображение отправляется файлом.
+
+    Parameters
+    ----------
+    message : types.Message
+        Сообщение, в чат которого отправляется изображение.
+    bot : Bot
+        Экземпляр бота.
+    tg_id : int
+        Telegram ID пользователя.
+    code : str
+        Код участника.
+    caption : str
+        Подпись к изображению.
+    reply_markup : InlineKeyboardMarkup
+        Клавиатура сообщения.
+
+    Returns
+    -------
+    types.Message
+        Отправленное сообщение.
+    """
+    renderer: CodeImageRenderer = get_code_renderer()
+    store: MediaStore = get_media_store()
+    key: str = f"code:{renderer.version}:{code}"
+
+    file_id: str | None = await store.get(bot.id, key)
+    if file_id is not None:
+        try:
+            return await message.answer_photo(
+                photo=file_id,
+                caption=caption,
+                parse_mode="HTML",
+                reply_markup=reply_markup,
+            )
+        except TelegramBadRequest:
+            await store.forget(bot.id, key)
+
+    # Отображение действия загрузки
+    await bot.send_chat_action(
+        chat_id=tg_id,
+        action=ChatAction.UPLOAD_PHOTO,
+    )
+
+    sent_message: types.Message = await message.answer_photo(
+        photo=types.BufferedInputFile(
+            await renderer.render(code),
+            filename="code.png",
+        ),
+        caption=caption,
+        parse_mode="HTML",
+        reply_markup=reply_markup,
+    )
+    if sent_message.photo:
+        await store.set(bot.id, key, sent_message.photo[-1].file_id)
+    return sent_message
@@ -12,9 +12,7 @@ from typing import Any, Callable
 
 from aiogram.types import InlineKeyboardMarkup, LinkPreviewOptions
 
-from app.core.bot.services.keyboards import kb_dynamic
-from app.core.bot.utils.morphology.casing import lower_words
-from app.core.bot.utils.morphology.inflection import inflect_text
+from app.core.database.models.profile import VALUE_PARSERS
 
 from ..context import MultiContext
 
@@ -39,16 +37,15 @@ async def handler_input(
     """
     loc: Any = ctx.loc
     loc_state: Any = ctx.loc_state
+    node: Any = ctx.node
     user_input: str | datetime | None = ctx.data
 
-    format_: str = loc_state.data.format
-    pattern: str = loc_state.data.pattern
+    regex: re.Pattern[str] = loc_state.data.regex
     base_text: str = loc_state.text
     value_type: str = loc_state.data.type
     template: Any = loc.messages.template.input
 
     error_occurred: bool = False
-    show_next: bool = loc_state.data.required
     part1: str
     part2: str
     part3: str
@@ -71,7 +68,7 @@ async def handler_input(
         #             f"{min_age}"
         #         )
         #         return None
-        if re.fullmatch(pattern, user_input):
+        if regex.fullmatch(user_input):
             if await type_check(
                 value=user_input,
                 value_type=value_type
@@ -85,60 +82,25 @@ async def handler_input(
         # Если пользователь ничего не ввёл, пробуем взять сохранённые данные
         user_input = data_db.get(base_text, None)
 
-    # Формируем текст сообщения в зависимости от результата проверки
+    # Тексты ошибки и приглашения к вводу, а также обе клавиатуры
+    # собраны при компиляции графа шагов
     if error_occurred:
-        part1, part2 = template.error
-        text_message: str = f"{part1}{format_}{part2}"
-        show_next = False
-
-    elif not user_input:
-        part1, part2, part3 = template.empty
-
-        processed_text: str = await inflect_text(
-            text=await lower_words(
-                base_text,
-                capitalize_first=False,
-            ),
-            case="винительный",
-        )
-
-        text_message = (
-            f"{part1}{processed_text}{part2}{format_}{part3}"
-        )
-        show_next = False
+        return node.text, node.keyboard, node.preview
 
-    else:
-        # Поле заполнено корректно
-        part1, part2, part3 = template.filled
-        text_message = (
-            f"{part1}{base_text}{part2}{user_input}{part3}"
-        )
-        show_next = True
-
-    keyboard: InlineKeyboardMarkup = kb_dynamic(
-        buttons=loc.buttons,
-        state=loc_state.next,
-        backstate=loc_state.id,
-        show_next=show_next,
-    )
-
-    opts: LinkPreviewOptions = LinkPreviewOptions(is_disabled=True)
+    if not user_input:
+        return node.prompt, node.keyboard, node.preview
 
-    return text_message, keyboard, opts
+    # Поле заполнено корректно
+    part1, part2, part3 = template.filled
+    text_message: str = f"{part1}{base_text}{part2}{user_input}{part3}"
+    return text_message, node.keyboard_next, node.preview
 
 
 async def type_check(
     value: str,
     value_type: str
 ) -> bool:
-    type_map: dict[str, Callable[[str], Any]] = {
-        "int": int,
-        "bool": lambda v: v.lower() == "true",
-        "date": lambda v: datetime.strptime(v, "%d.%m.%Y"),
-        "time": lambda v: datetime.strptime(v, "%d.%m.%Y %H:%M:%S"),
-        "str": str
-    }
-    caster: Callable[[str], Any] | None = type_map.get(
+    caster: Callable[[str], Any] | None = VALUE_PARSERS.get(
         value_type.lower()
     )
     if not caster:
@@ -10,8 +10,6 @@ from typing import Any
 
 from aiogram.types import InlineKeyboardMarkup, LinkPreviewOptions
 
-from app.core.bot.services.keyboards import kb_payment
-
 from ..context import MultiContext
 
 
@@ -41,19 +39,6 @@ async def handler_payment(
             f"Некорректный формат состояний пользователя: {states!r}"
         )
 
-    loc: Any = ctx.loc
-
-    part1: str
-    part2: str
-
-    part1, part2 = loc.messages.template.payment
-    text_message: str = f"{part1}{loc.buttons.payment}{part2}"
-
-    # Создаём финальную клавиатуру
-    keyboard: InlineKeyboardMarkup = kb_payment(
-        buttons=loc.buttons
-    )
-
-    opts: LinkPreviewOptions = LinkPreviewOptions(is_disabled=True)
-
-    return text_message, keyboard, opts
+    # Текст и клавиатура оплаты собраны при компиляции графа шагов
+    node: Any = ctx.node
+    return node.text, node.keyboard, node.preview
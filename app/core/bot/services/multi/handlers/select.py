@@ -9,8 +9,6 @@ from typing import Any
 
 from aiogram.types import InlineKeyboardMarkup, LinkPreviewOptions
 
-from app.core.bot.services.keyboards import kb_select
-
 from ..context import MultiContext
 
 
@@ -20,8 +18,8 @@ async def handler_select(
     """
     Обрабатывает состояние выбора и формирует сообщение и клавиатуру.
 
-    Создаёт текст сообщения на основе шаблона локализации и генерирует
-    клавиатуру выбора для пользователя.
+    Возвращает текст сообщения и клавиатуру выбора, заранее собранные
+    из шаблона локализации.
 
     Args:
         ctx (MultiContext): Контекст шага сценария, содержащий локализацию,
@@ -32,23 +30,6 @@ async def handler_select(
             Сформированное сообщение, клавиатура выбора и параметры
             предпросмотра ссылок.
     """
-    loc: Any = ctx.loc
-    loc_state: Any = ctx.loc_state
-    part1: str
-    part2: str
-
-    base_text: str = loc_state.text
-    part1, part2 = loc.messages.template.select
-
-    # Формируем сообщение на основе шаблона
-    text_message: str = f"{part1}{base_text}{part2}"
-
-    # Генерируем клавиатуру выбора
-    keyboard: InlineKeyboardMarkup = kb_select(
-        name=base_text,
-        options=loc_state.options,
-        buttons=loc.buttons,
-    )
-    opts: LinkPreviewOptions = LinkPreviewOptions(is_disabled=True)
-
-    return text_message, keyboard, opts
+    # Текст и клавиатура выбора собраны при компиляции графа шагов
+    node: Any = ctx.node
+    return node.text, node.keyboard, node.preview
@@ -11,8 +11,6 @@ from typing import Any
 
 from aiogram.types import InlineKeyboardMarkup, LinkPreviewOptions
 
-from app.core.bot.services.keyboards import kb_start
-
 from ..context import MultiContext
 
 
@@ -22,8 +20,8 @@ async def handler_start(
     """
     Обрабатывает стартовое состояние пользователя.
 
-    Формирует текст приветственного сообщения на основе данных локализации
-    и создает инлайн-клавиатуру для дальнейшего взаимодействия.
+    Возвращает текст приветственного сообщения и клавиатуру согласия,
+    заранее собранные из локализации.
 
     Parameters
     ----------
@@ -37,18 +35,7 @@ async def handler_start(
         Кортеж, содержащий текст сообщения, клавиатуру и параметры
         предпросмотра ссылок.
     """
-    loc: Any = ctx.loc
-    part1: str
-    part2: str
-
-    # Формируем текст сообщения на основе шаблона локализации
-    part1, part2 = loc.messages.template.start
-    text_message: str = f"{part1}{loc.event.name}{part2}"
-
-    # Создаем клавиатуру на основе локализованных кнопок
-    keyboard: InlineKeyboardMarkup = kb_start(buttons=loc.buttons)
-
-    # Отключение предпросмотра ссылок для чистоты интерфейса
-    preview_options = LinkPreviewOptions(is_disabled=True)
-
-    return text_message, keyboard, preview_options
+    # Текст и клавиатура стартового шага собраны при компиляции
+    # графа шагов (приветствие, согласие, ссылки без предпросмотра)
+    node: Any = ctx.node
+    return node.text, node.keyboard, node.preview
@@ -47,9 +47,7 @@ async def handler_submit(
     keep_keys: list[str] = [
         step_data.text
         for state in states
-        if (step_data := getattr(loc.steps, state, None)) is not None
-        and getattr(step_data, "type", None) not in ("start", "submit")
-        and getattr(step_data, "text", None) is not None
+        if (step_data := loc.step(state)) is not None
     ]
 
     # Загружаем данные пользователя, фильтруя только нужные поля
@@ -10,8 +10,6 @@ from typing import Any
 
 from aiogram.types import InlineKeyboardMarkup, LinkPreviewOptions
 
-from app.core.bot.services.keyboards import kb_dynamic
-
 from ..context import MultiContext
 
 
@@ -36,25 +34,7 @@ async def handler_text(
         Кортеж, содержащий текст сообщения, клавиатуру и параметры
         предпросмотра ссылок.
     """
-    loc: Any = ctx.loc
-    loc_state: Any = ctx.loc_state
-
-    # Ключ состояния используется для формирования кнопки "Назад"
-    state_key: Any = loc_state.id
-
-    # Текст сообщения полностью определяется локалью состояния
-    text_message: str = loc_state.text
-
-    # Формирование клавиатуры на основе следующего состояния
-    keyboard: InlineKeyboardMarkup = kb_dynamic(
-        buttons=loc.buttons,
-        state=loc_state.next,
-        backstate=state_key,
-    )
-
-    # Управление предпросмотром ссылок в сообщении
-    preview_options = LinkPreviewOptions(
-        is_disabled=not loc_state.link_preview
-    )
-
-    return text_message, keyboard, preview_options
+    # Текст, клавиатура ("Назад"/"Далее") и параметры предпросмотра
+    # определяются только локалью шага и собраны при компиляции графа
+    node: Any = ctx.node
+    return node.text, node.keyboard, node.preview
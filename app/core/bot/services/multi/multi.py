@@ -7,34 +7,16 @@
 которые требуется отправить пользователю в Telegram.
 """
 
-from typing import Any, Callable
+from typing import Any
 
 from aiogram import types
 from aiogram.fsm.context import FSMContext
 
-from .context import MultiContext
-from .handlers.final import handler_final
-from .handlers.input import handler_input
-from .handlers.payment import handler_payment
-from .handlers.select import handler_select
-from .handlers.start import handler_start
-from .handlers.submit import handler_submit
-from .handlers.text import handler_text
-
-# Таблица стандартных обработчиков.
-HANDLERS: dict[str, Callable[[MultiContext], Any]] = {
-    "input": handler_input,
-    "select": handler_select,
-    "text": handler_text,
-}
+from app.core.bot.services.localization import Localization
+from app.core.bot.services.metrics import get_metrics
 
-# Таблица обработчиков для специальных состояний.
-SPECIAL_HANDLERS: dict[str, Callable[[MultiContext], Any]] = {
-    "1": handler_start,
-    "98": handler_submit,
-    "99": handler_payment,
-    "100": handler_final,
-}
+from .context import MultiContext
+from .graph import StepGraph, StepNode, get_step_graph
 
 
 async def multi(
@@ -58,8 +40,8 @@ async def multi(
 
     Parameters
     ----------
-    loc : Any
-        Объект локализации текущего пользователя.
+    state : FSMContext
+        Контекст FSM пользователя с локализацией.
     value : str
         Текущее значение состояния.
     tg_id : int
@@ -77,34 +59,22 @@ async def multi(
         Текст сообщения, клавиатура и параметры предпросмотра ссылок.
     """
     user_data: dict[str, Any] = await state.get_data()
-    loc: Any = user_data.get("loc_user")
-    # Определяем обработчик для специальных состояний, если они есть.
-    handler: Callable[[MultiContext], Any] | None = (
-        SPECIAL_HANDLERS.get(value)
-    )
-
-    loc_state: Any | None = None
-
-    if handler is None:
-        # Если состояние не специальное, определяем его по локализации.
-        loc_state = getattr(loc.steps, value, None)
+    loc: Localization = user_data["loc_user"]
 
-        # Если состояние локализации не найдено, используем стартовый
-        # обработчик, чтобы избежать зависания пользователя.
-        handler = (
-            HANDLERS.get(loc_state.type, handler_start)
-            if loc_state
-            else handler_start
-        )
+    # Шаг выбирается по таблице скомпилированного графа; неизвестное
+    # состояние ведёт на стартовый шаг, чтобы пользователь не завис
+    graph: StepGraph = await get_step_graph(loc)
+    node: StepNode = graph.dispatch(value)
 
     context = MultiContext(
         state=state,
         loc=loc,
-        loc_state=loc_state,
+        loc_state=node.step,
         value=value,
         tg_id=tg_id,
         data=data,
         event=event,
+        node=node,
     )
 
     # Сохраняем выбранные пользователем данные заранее, так как они могут
@@ -117,4 +87,5 @@ async def multi(
         data_db: Any = user_data.get("data_db")
         data_db[key] = value_to_store
 
-    return await handler(context)
+    with get_metrics().span("multi", step=node.handler.__name__):
+        return await node.handler(context)
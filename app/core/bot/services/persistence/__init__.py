@@ -0,0 +1,17 @@
+"""
+Пакет отложенной записи (write-behind) данных пользователей.
+
+Содержит:
+- WriteBehindBuffer — буфер изменений User и Data с пакетной записью.
+- get_write_behind — функция для получения глобального экземпляра буфера.
+"""
+
+from .buffer import PendingWrite, WriteBehindBuffer, snapshot_user
+from .instance import get_write_behind
+
+__all__: list[str] = [
+    "PendingWrite",
+    "WriteBehindBuffer",
+    "get_write_behind",
+    "snapshot_user",
+]
@@ -0,0 +1,332 @@
+"""
+Модуль буфера отложенной записи (write-behind) для User и Data.
+
+Middleware помечает закэшированные в FSM объекты пользователя как
+изменённые, а буфер объединяет изменения по ключу (tg_id, bot_id) и
+записывает их в базу пакетными транзакциями по таймеру или при
+достижении порога размера. Приращения счётчиков статистики,
+записанные обработчиком вместе с изменением пользователя, а также
+поисковые документы и профили изменённых пользователей попадают в ту
+же транзакцию, что и сам пользователь.
+"""
+
+import asyncio
+from asyncio import Task
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import inspect, update
+
+from app.core.bot.services.profile import get_profile_service
+from app.core.bot.services.search import sync_documents
+from app.core.database import DataManager, StatManager, User, async_session
+from app.core.database.models.stat import StatKey
+
+# Ключ буфера: (tg_id, bot_id)
+BufferKey = tuple[int, int]
+
+
+@dataclass(slots=True)
+class PendingWrite:
+    """Отложенное изменение одного пользователя.
+
+    Атрибуты:
+        tg_id (int): Telegram ID пользователя.
+        bot_id (int): ID бота.
+        user (User): Объект пользователя из FSM.
+        data (dict[str, str]): Данные пользователя из FSM.
+    """
+    tg_id: int
+    bot_id: int
+    user: User
+    data: dict[str, str]
+
+
+def snapshot_user(
+    user: User,
+) -> dict[str, Any]:
+    """
+    Снимает значения всех колонок пользователя в словарь.
+
+    Ключи совпадают с именами атрибутов модели, поэтому результат
+    подходит для пакетного UPDATE по первичному ключу.
+
+    Args:
+        user (User): Объект пользователя.
+
+    Returns:
+        dict[str, Any]: Значения колонок пользователя.
+    """
+    return {
+        attr.key: getattr(user, attr.key)
+        for attr in inspect(User).column_attrs
+    }
+
+
+class WriteBehindBuffer:
+    """Буфер отложенной записи пользователей и их данных."""
+
+    def __init__(
+        self,
+        interval: float,
+        max_batch: int,
+    ) -> None:
+        """
+        Инициализация буфера.
+
+        Args:
+            interval (float): Период фоновой записи в секундах.
+            max_batch (int): Количество изменённых пользователей,
+                при котором запись выполняется досрочно.
+        """
+        self.interval: float = interval
+        self.max_batch: int = max_batch
+
+        self._pending: dict[BufferKey, PendingWrite] = {}
+        self._stats: dict[BufferKey, Counter[StatKey]] = {}
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._task: Task[None] | None = None
+        self._closing: bool = False
+
+    def pending_count(self) -> int:
+        """
+        Возвращает количество пользователей, ожидающих записи.
+
+        Returns:
+            int: Размер буфера.
+        """
+        return len(self._pending)
+
+    def has_pending(
+        self,
+        tg_id: int,
+        bot_id: int,
+    ) -> bool:
+        """
+        Проверяет, есть ли незаписанные изменения пользователя.
+
+        Args:
+            tg_id (int): Telegram ID пользователя.
+            bot_id (int): ID бота.
+
+        Returns:
+            bool: True, если изменения ещё не записаны в БД.
+        """
+        return (tg_id, bot_id) in self._pending
+
+    def mark_dirty(
+        self,
+        tg_id: int,
+        bot_id: int,
+        user: User,
+        data: dict[str, str],
+    ) -> None:
+        """
+        Помечает пользователя и его данные как изменённые.
+
+        Повторные изменения одного пользователя до записи объединяются:
+        в БД попадёт только последнее состояние.
+
+        Args:
+            tg_id (int): Telegram ID пользователя.
+            bot_id (int): ID бота.
+            user (User): Объект пользователя из FSM.
+            data (dict[str, str]): Данные пользователя из FSM.
+        """
+        self._pending[(tg_id, bot_id)] = PendingWrite(
+            tg_id=tg_id,
+            bot_id=bot_id,
+            user=user,
+            data=data,
+        )
+        self._ensure_worker()
+
+        # Досрочная запись при переполнении буфера
+        if len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+
+    def record(
+        self,
+        tg_id: int,
+        bot_id: int,
+        deltas: Mapping[StatKey, int],
+    ) -> None:
+        """
+        Добавляет приращения счётчиков статистики пользователя.
+
+        Приращения записываются той же транзакцией, что и следующее
+        изменение пользователя, поэтому счётчики не расходятся с
+        таблицей user.
+
+        Args:
+            tg_id (int): Telegram ID пользователя.
+            bot_id (int): ID бота.
+            deltas (Mapping[StatKey, int]): Приращения по ключам
+                счётчиков.
+        """
+        self._stats.setdefault((tg_id, bot_id), Counter()).update(deltas)
+
+    async def flush(
+        self,
+        key: BufferKey | None = None,
+    ) -> int:
+        """
+        Записывает накопленные изменения в базу данных.
+
+        Args:
+            key (BufferKey | None): Ключ (tg_id, bot_id) одного
+                пользователя. Если None, записывается весь буфер.
+
+        Returns:
+            int: Количество записанных пользователей.
+        """
+        async with self._lock:
+            batch: dict[BufferKey, PendingWrite]
+            if key is None:
+                batch, self._pending = self._pending, {}
+            else:
+                entry: PendingWrite | None = self._pending.pop(key, None)
+                batch = {key: entry} if entry else {}
+
+            if not batch:
+                return 0
+
+            stats: dict[BufferKey, Counter[StatKey]] = {
+                buffer_key: self._stats.pop(buffer_key)
+                for buffer_key in batch if buffer_key in self._stats
+            }
+            try:
+                await self._write(list(batch.values()), stats.values())
+            except Exception as error:
+                logger.exception(
+                    f"Ошибка пакетной записи пользователей: {error}"
+                )
+                # Возвращаем изменения в буфер, если их не успели обновить
+                for buffer_key, entry in batch.items():
+                    self._pending.setdefault(buffer_key, entry)
+                for buffer_key, deltas in stats.items():
+                    self._stats.setdefault(buffer_key, Counter()).update(
+                        deltas
+                    )
+                return 0
+
+            return len(batch)
+
+    async def close(self) -> None:
+        """
+        Останавливает фоновую запись и сбрасывает остаток буфера.
+
+        Вызывается при остановке ботов, чтобы гарантировать запись
+        всех изменений.
+        """
+        self._closing = True
+        self._wakeup.set()
+
+        if self._task and not self._task.done():
+            await self._task
+        self._task = None
+
+        await self.flush()
+        # Приращения без изменений пользователя записываются отдельно
+        if self._stats:
+            stats: dict[BufferKey, Counter[StatKey]] = self._stats
+            self._stats = {}
+            try:
+                await self._write([], stats.values())
+            except Exception as error:
+                logger.exception(f"Ошибка записи статистики: {error}")
+                # Приращения остаются в буфере до следующей записи
+                for buffer_key, deltas in stats.items():
+                    self._stats.setdefault(buffer_key, Counter()).update(
+                        deltas
+                    )
+        self._closing = False
+
+    def _ensure_worker(self) -> None:
+        """Запускает фоновую задачу записи, если она не запущена."""
+        if self._closing:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Фоновый цикл периодической записи буфера."""
+        while not self._closing:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=self.interval,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception as error:
+                logger.exception(f"Ошибка фоновой записи буфера: {error}")
+
+    @staticmethod
+    async def _write(
+        batch: list[PendingWrite],
+        stats: Iterable[Counter[StatKey]] = (),
+    ) -> None:
+        """
+        Записывает пакет изменений одной транзакцией.
+
+        Пользователи обновляются одним пакетным UPDATE по первичному
+        ключу, данные — через DataManager без промежуточных коммитов.
+        ID пользователей берутся из FSM, поэтому повторных SELECT по
+        таблице User не выполняется. Поисковые документы
+        перезаписываются только у пользователей, ответы которых
+        изменились, профили — у зарегистрированных пользователей.
+
+        Args:
+            batch (list[PendingWrite]): Изменения для записи.
+            stats (Iterable[Counter[StatKey]]): Приращения счётчиков
+                статистики пользователей пакета.
+        """
+        deltas: Counter[StatKey] = Counter()
+        for counter in stats:
+            deltas.update(counter)
+        profiles = get_profile_service()
+        # Схема профилей следует за изменениями шагов анкеты
+        await profiles.prepare()
+        async with async_session() as session:
+            data_manager = DataManager(session)
+            for entry in batch:
+                await data_manager.update_all(
+                    tg_id=entry.tg_id,
+                    bot_id=entry.bot_id,
+                    new_data=dict(entry.data),
+                    commit=False,
+                    user=entry.user.id,
+                )
+            await StatManager(session).add(deltas, commit=False)
+            await sync_documents(
+                session,
+                ((entry.user.id, entry.bot_id, entry.data) for entry in batch),
+            )
+            await profiles.sync(
+                session,
+                ((entry.user, entry.data) for entry in batch),
+            )
+            if batch:
+                # Время изменения ставится непосредственно перед
+                # фиксацией, чтобы выгрузка в таблицу, прочитавшая
+                # базу раньше, не пропустила пользователя
+                now: datetime = datetime.now(timezone.utc).replace(
+                    tzinfo=None
+                )
+                for entry in batch:
+                    entry.user.updated_at = now
+                rows: list[dict[str, Any]] = [
+                    snapshot_user(entry.user) for entry in batch
+                ]
+                await session.execute(update(User), rows)
+            await session.commit()
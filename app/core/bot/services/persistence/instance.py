@@ -0,0 +1,31 @@
+"""
+Модуль содержит глобальный экземпляр буфера отложенной записи.
+
+Предоставляет функцию доступа к единственному экземпляру
+WriteBehindBuffer, общему для всех middleware и ботов процесса.
+"""
+
+from typing import Final
+
+from app.config import WRITE_BEHIND_BATCH, WRITE_BEHIND_INTERVAL
+
+from .buffer import WriteBehindBuffer
+
+# Один буфер на процесс: изменения разных ботов объединяются
+# в общие пакетные транзакции.
+_write_behind: Final[WriteBehindBuffer] = WriteBehindBuffer(
+    interval=WRITE_BEHIND_INTERVAL,
+    max_batch=WRITE_BEHIND_BATCH,
+)
+
+
+def get_write_behind() -> WriteBehindBuffer:
+    """
+    Возвращает глобальный экземпляр WriteBehindBuffer.
+
+    Returns
+    -------
+    WriteBehindBuffer
+        Буфер отложенной записи, используемый приложением.
+    """
+    return _write_behind
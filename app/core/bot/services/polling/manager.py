@@ -10,13 +10,13 @@ from asyncio import Task
 from typing import Any, Awaitable, Callable
 
 from aiogram import Bot
-from aiogram.client.default import DefaultBotProperties
 from aiogram.dispatcher.dispatcher import DEFAULT_BACKOFF_CONFIG, Dispatcher
-from aiogram.enums import ParseMode
 from aiogram.types import User
 from aiogram.utils.backoff import BackoffConfig
 from loguru import logger
 
+from app.core.bot.services.session import create_bot
+
 
 class PollingManager:
     """Менеджер для запуска и контроля опроса Telegram-ботов."""
@@ -56,10 +56,10 @@ class PollingManager:
         handle_as_tasks: bool = True,
         backoff_config: BackoffConfig = DEFAULT_BACKOFF_CONFIG,
         allowed_updates: list[str] | None = None,
-        on_bot_startup: Callable[[], Awaitable[Any]] | None = None,
-        on_bot_shutdown: Callable[[], Awaitable[Any]] | None = None,
+        on_bot_startup: Callable[[Bot], Awaitable[Any]] | None = None,
+        on_bot_shutdown: Callable[[Bot], Awaitable[Any]] | None = None,
         **kwargs: Any,
-    ) -> None:
+    ) -> Task[None]:
         """
         Запускает опрос бота в отдельной асинхронной задаче.
 
@@ -77,15 +77,20 @@ class PollingManager:
             Конфигурация backoff.
         allowed_updates : list[str], optional
             Список разрешенных типов апдейтов.
-        on_bot_startup : Callable[[], Awaitable[Any]], optional
+        on_bot_startup : Callable[[Bot], Awaitable[Any]], optional
             Функция запуска бота.
-        on_bot_shutdown : Callable[[], Awaitable[Any]], optional
+        on_bot_shutdown : Callable[[Bot], Awaitable[Any]], optional
             Функция завершения работы бота.
         **kwargs : Any
             Дополнительные аргументы для dp._polling.
+
+        Returns
+        -------
+        Task[None]
+            Задача бота; завершается при остановке бота.
         """
         if self.is_bot_running(api_token):
-            return
+            return self.tasks[api_token]
 
         task: Task[None] = asyncio.create_task(
             self._run_polling(
@@ -101,6 +106,7 @@ class PollingManager:
             )
         )
         self.tasks[api_token] = task
+        return task
 
     async def _run_polling(
         self,
@@ -110,8 +116,8 @@ class PollingManager:
         handle_as_tasks: bool,
         backoff_config: BackoffConfig,
         allowed_updates: list[str] | None,
-        on_bot_startup: Callable[[], Awaitable[Any]] | None = None,
-        on_bot_shutdown: Callable[[], Awaitable[Any]] | None = None,
+        on_bot_startup: Callable[[Bot], Awaitable[Any]] | None = None,
+        on_bot_shutdown: Callable[[Bot], Awaitable[Any]] | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -131,50 +137,47 @@ class PollingManager:
             Настройка backoff.
         allowed_updates : list[str] | None
             Разрешенные апдейты.
-        on_bot_startup : Callable[[], Awaitable[Any]] | None
+        on_bot_startup : Callable[[Bot], Awaitable[Any]] | None
             Функция запуска.
-        on_bot_shutdown : Callable[[], Awaitable[Any]] | None
+        on_bot_shutdown : Callable[[Bot], Awaitable[Any]] | None
             Функция остановки.
         **kwargs : Any
             Дополнительные аргументы для dp._polling.
         """
-        async with Bot(
-            token=api_token,
-            default=DefaultBotProperties(
-                parse_mode=ParseMode.HTML
+        # Бот использует общую HTTP-сессию, поэтому не закрывается
+        # через async with
+        bot: Bot = create_bot(api_token)
+        try:
+            # Удаляем старые вебхуки и сбрасываем очередь обновлений
+            await bot.delete_webhook()
+            await bot.get_updates(offset=-1)
+
+            user: User = await bot.me()
+            self.api_to_bot_id[api_token] = user.id
+
+            if on_bot_startup:
+                await on_bot_startup(bot)
+
+            await dp._polling(
+                bot=bot,
+                handle_as_tasks=handle_as_tasks,
+                polling_timeout=polling_timeout,
+                backoff_config=backoff_config,
+                allowed_updates=allowed_updates,
+                **kwargs,
             )
-        ) as bot:
-            try:
-                # Удаляем старые вебхуки и сбрасываем очередь обновлений
-                await bot.delete_webhook()
-                await bot.get_updates(offset=-1)
-
-                user: User = await bot.me()
-                self.api_to_bot_id[api_token] = user.id
-
-                if on_bot_startup:
-                    await on_bot_startup()
-
-                await dp._polling(
-                    bot=bot,
-                    handle_as_tasks=handle_as_tasks,
-                    polling_timeout=polling_timeout,
-                    backoff_config=backoff_config,
-                    allowed_updates=allowed_updates,
-                    **kwargs,
-                )
-
-            except Exception as error:
-                logger.exception(
-                    "Unexpected error in polling task for token "
-                    f"{api_token}: {error}"
-                )
-
-            finally:
-                if on_bot_shutdown:
-                    await on_bot_shutdown()
-                self.tasks.pop(api_token, None)
-                self.api_to_bot_id.pop(api_token, None)
+
+        except Exception as error:
+            logger.exception(
+                "Unexpected error in polling task for token "
+                f"{api_token}: {error}"
+            )
+
+        finally:
+            if on_bot_shutdown:
+                await on_bot_shutdown(bot)
+            self.tasks.pop(api_token, None)
+            self.api_to_bot_id.pop(api_token, None)
 
     def stop_bot_polling(self, api_token: str) -> None:
         """
@@ -0,0 +1,22 @@
+"""
+Пакет профилей участников.
+
+Содержит построение схемы профиля по шагам анкеты, сервис, который
+поддерживает таблицу профилей в соответствии со схемой и данными, и
+его глобальный экземпляр.
+"""
+
+from .instance import PROFILE_LANG, get_profile_service
+from .schema import ProfileField, column_name, profile_fields
+from .service import ProfileService, format_value, parse_value
+
+__all__: list[str] = [
+    "PROFILE_LANG",
+    "ProfileField",
+    "ProfileService",
+    "column_name",
+    "format_value",
+    "get_profile_service",
+    "parse_value",
+    "profile_fields",
+]
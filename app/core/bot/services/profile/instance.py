@@ -0,0 +1,24 @@
+"""
+Модуль содержит глобальный экземпляр сервиса профилей участников.
+"""
+
+from typing import Final
+
+from .service import ProfileService
+
+# Язык локализации, названия шагов которой задают колонки профиля
+PROFILE_LANG: str = "ru"
+
+_profiles: Final[ProfileService] = ProfileService(lang=PROFILE_LANG)
+
+
+def get_profile_service() -> ProfileService:
+    """
+    Возвращает глобальный экземпляр сервиса профилей.
+
+    Returns
+    -------
+    ProfileService
+        Сервис профилей участников.
+    """
+    return _profiles
@@ -0,0 +1,142 @@
+"""
+Модуль схемы профиля участника.
+
+Содержит описание колонок профиля, построенное по шагам анкеты:
+шаги ввода и выбора с одинаковым названием (например, выбор ВУЗа и
+его ручной ввод) пишут в одну колонку, тип колонки берётся из типа
+значения шага, а имя — транслитерация названия шага.
+"""
+
+import re
+from collections.abc import Collection
+from dataclasses import dataclass
+
+from app.core.bot.services.localization import Localization
+from app.core.database.models.profile import (COLUMN_TYPES, FIXED_COLUMNS,
+                                              ProfileColumn)
+
+# Типы шагов, ответы на которые попадают в профиль
+PROFILE_STEPS: tuple[str, ...] = ("input", "select")
+
+# Тип значения шагов выбора и колонок с разнотипными шагами
+DEFAULT_TYPE: str = "str"
+
+# Максимальная длина имени колонки (ограничение PostgreSQL)
+NAME_LIMIT: int = 63
+
+# Транслитерация кириллицы для имён колонок
+TRANSLIT: dict[str, str] = {
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e",
+    "ё": "e", "ж": "zh", "з": "z", "и": "i", "й": "y", "к": "k",
+    "л": "l", "м": "m", "н": "n", "о": "o", "п": "p", "р": "r",
+    "с": "s", "т": "t", "у": "u", "ф": "f", "х": "kh", "ц": "ts",
+    "ч": "ch", "ш": "sh", "щ": "shch", "ъ": "", "ы": "y", "ь": "",
+    "э": "e", "ю": "yu", "я": "ya",
+}
+
+# Символы, недопустимые в имени колонки
+INVALID_CHARS: re.Pattern[str] = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileField:
+    """Колонка профиля.
+
+    Атрибуты:
+        column (str): Имя колонки.
+        title (str): Название шага (ключ данных) на языке схемы.
+        type (str): Тип значения шага.
+        steps (tuple[str, ...]): ID шагов, ответы на которые пишутся
+            в колонку.
+    """
+    column: str
+    title: str
+    type: str
+    steps: tuple[str, ...]
+
+
+def column_name(
+    title: str,
+    taken: Collection[str] = (),
+) -> str:
+    """
+    Строит имя колонки по названию шага.
+
+    Args:
+        title (str): Название шага.
+        taken (Collection[str]): Уже занятые имена.
+
+    Returns:
+        str: Имя из латинских букв, цифр и подчёркиваний, не
+            совпадающее со служебными и занятыми именами.
+    """
+    latin: str = "".join(
+        TRANSLIT.get(char, char) for char in title.casefold()
+    )
+    base: str = INVALID_CHARS.sub("_", latin).strip("_") or "field"
+    if base[0].isdigit():
+        base = f"f_{base}"
+    base = base[:NAME_LIMIT]
+
+    name: str = base
+    number: int = 2
+    while name in taken or name in FIXED_COLUMNS:
+        suffix: str = f"_{number}"
+        name = f"{base[:NAME_LIMIT - len(suffix)]}{suffix}"
+        number += 1
+    return name
+
+
+def profile_fields(
+    loc: Localization,
+) -> tuple[ProfileField, ...]:
+    """
+    Строит колонки профиля по шагам анкеты.
+
+    Args:
+        loc (Localization): Локализация пользователя на языке схемы.
+
+    Returns:
+        tuple[ProfileField, ...]: Колонки в порядке шагов.
+    """
+    steps: dict[str, list[str]] = {}
+    types: dict[str, set[str]] = {}
+    for step in loc.steps_index.values():
+        if step.type not in PROFILE_STEPS:
+            continue
+        value_type: str = (
+            step.data.type.lower() if step.data is not None else DEFAULT_TYPE
+        )
+        steps.setdefault(step.text, []).append(step.id)
+        types.setdefault(step.text, set()).add(
+            value_type if value_type in COLUMN_TYPES else DEFAULT_TYPE
+        )
+
+    fields: list[ProfileField] = []
+    taken: set[str] = set()
+    for title, ids in steps.items():
+        name: str = column_name(title, taken)
+        taken.add(name)
+        kinds: set[str] = types[title]
+        fields.append(ProfileField(
+            column=name,
+            title=title,
+            type=kinds.pop() if len(kinds) == 1 else DEFAULT_TYPE,
+            steps=tuple(ids),
+        ))
+    return tuple(fields)
+
+
+def profile_columns(
+    fields: tuple[ProfileField, ...],
+) -> tuple[ProfileColumn, ...]:
+    """
+    Переводит колонки профиля в описание колонок таблицы.
+
+    Args:
+        fields (tuple[ProfileField, ...]): Колонки профиля.
+
+    Returns:
+        tuple[ProfileColumn, ...]: Имена и типы колонок.
+    """
+    return tuple((field.column, field.type) for field in fields)
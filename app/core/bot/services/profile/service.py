@@ -0,0 +1,281 @@
+"""
+Модуль сервиса профилей участников.
+
+Содержит класс ProfileService: по шагам анкеты на языке схемы
+строится набор типизированных колонок, таблица профилей приводится к
+нему (новые шаги добавляют колонки, удалённые и сменившие тип шаги
+пересоздают таблицу) и заполняется по таблице data. Буфер отложенной
+записи обновляет профили в той же транзакции, что и ответы, поэтому
+статистика и выгрузка читают готовые типизированные строки вместо
+разворота пар ключ–значение. Схема проверяется при каждой записи и
+следует за изменениями файлов локализации без перезапуска.
+"""
+
+import asyncio
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, timezone
+from typing import Any
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bot.services.localization import Localization, load_localization
+from app.core.database import ProfileManager, User, async_session
+from app.core.database.models.profile import VALUE_PARSERS, ProfileColumn
+
+from .schema import ProfileField, profile_columns, profile_fields
+
+
+def parse_value(
+    value_type: str,
+    value: str,
+) -> Any:
+    """
+    Приводит ответ к типу колонки.
+
+    Args:
+        value_type (str): Тип значения шага.
+        value (str): Ответ в строковом виде.
+
+    Returns:
+        Any: Значение колонки или None, если ответ пуст или не
+            соответствует типу.
+    """
+    if not value:
+        return None
+    try:
+        return VALUE_PARSERS[value_type](value)
+    except (KeyError, ValueError):
+        return None
+
+
+def format_value(
+    value: Any,
+) -> str:
+    """
+    Возвращает значение колонки в формате ответа.
+
+    Args:
+        value (Any): Значение колонки.
+
+    Returns:
+        str: Значение в том виде, в котором его вводит пользователь
+            (пустая строка для None).
+    """
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%d.%m.%Y %H:%M:%S")
+    if isinstance(value, date):
+        return value.strftime("%d.%m.%Y")
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class ProfileService:
+    """Типизированные профили участников по шагам анкеты."""
+
+    def __init__(
+        self,
+        lang: str,
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Инициализация сервиса.
+
+        Args:
+            lang (str): Язык локализации, названия шагов которой
+                задают колонки.
+            batch_size (int): Размер страницы пользователей при
+                заполнении таблицы.
+        """
+        self.lang: str = lang
+        self.batch_size: int = batch_size
+        self.fields: tuple[ProfileField, ...] = ()
+
+        self._loc: Localization | None = None
+        # Колонки по названиям шагов на языке пользователя
+        self._titles: dict[str, dict[str, ProfileField]] = {}
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    @property
+    def columns(self) -> tuple[ProfileColumn, ...]:
+        """
+        Колонки ответов текущей схемы.
+
+        Returns:
+            tuple[ProfileColumn, ...]: Имена и типы колонок.
+        """
+        return profile_columns(self.fields)
+
+    async def prepare(
+        self,
+        force: bool = False,
+    ) -> str:
+        """
+        Приводит таблицу профилей к текущим шагам анкеты.
+
+        Если схема таблицы изменилась, профили заполняются заново по
+        таблице data.
+
+        Args:
+            force (bool): Пересоздать и заполнить таблицу, даже если
+                шаги не менялись.
+
+        Returns:
+            str: Изменение схемы (см. ProfileManager.migrate) или
+                пустая строка.
+        """
+        loc: Localization = await load_localization(self.lang, "user")
+        if loc is self._loc and not force:
+            return ""
+
+        async with self._lock:
+            if loc is self._loc and not force:
+                return ""
+
+            fields: tuple[ProfileField, ...] = profile_fields(loc)
+            async with async_session() as session:
+                change: str = await ProfileManager(
+                    session, profile_columns(fields)
+                ).migrate(force=force)
+            self.fields = fields
+            self._titles = {}
+            if change:
+                filled: int = await self._fill()
+                logger.info(
+                    f"Схема профилей: {change}, колонок {len(fields)}, "
+                    f"заполнено профилей {filled}"
+                )
+            self._loc = loc
+            return change
+
+    async def sync(
+        self,
+        session: AsyncSession,
+        entries: Iterable[tuple[User, Mapping[str, str]]],
+    ) -> None:
+        """
+        Обновляет профили пользователей без фиксации транзакции.
+
+        Зарегистрированным пользователям записывается профиль, у
+        остальных он удаляется.
+
+        Args:
+            session (AsyncSession): Сессия, транзакцию которой
+                фиксирует вызывающий код.
+            entries (Iterable[tuple[User, Mapping[str, str]]]):
+                Пользователи и их ответы.
+        """
+        rows: list[dict[str, Any]] = []
+        removed: list[int] = []
+        for user, answers in entries:
+            if user.date_registration is None:
+                removed.append(user.id)
+            else:
+                rows.append(await self.row(user, answers))
+
+        manager = ProfileManager(session, self.columns)
+        await manager.upsert(rows, commit=False)
+        await manager.remove(removed, commit=False)
+
+    async def row(
+        self,
+        user: User,
+        answers: Mapping[str, str],
+    ) -> dict[str, Any]:
+        """
+        Строит строку профиля пользователя.
+
+        Args:
+            user (User): Пользователь.
+            answers (Mapping[str, str]): Ответы по названиям шагов на
+                языке пользователя.
+
+        Returns:
+            dict[str, Any]: Значения всех колонок профиля.
+        """
+        titles: dict[str, ProfileField] = await self._fields_by_title(
+            user.lang
+        )
+        row: dict[str, Any] = {
+            "user_id": user.id,
+            "bot_id": user.bot_id,
+            "updated_at": datetime.now(timezone.utc).replace(tzinfo=None),
+            **{field.column: None for field in self.fields},
+        }
+        for title, value in answers.items():
+            field: ProfileField | None = titles.get(title)
+            if field is not None:
+                row[field.column] = parse_value(field.type, value)
+        return row
+
+    def answers(
+        self,
+        values: Mapping[str, Any],
+    ) -> dict[str, str]:
+        """
+        Возвращает ответы профиля по названиям шагов на языке схемы.
+
+        Args:
+            values (Mapping[str, Any]): Значения колонок профиля.
+
+        Returns:
+            dict[str, str]: Непустые ответы в формате ввода.
+        """
+        return {
+            field.title: format_value(values[field.column])
+            for field in self.fields
+            if values.get(field.column) is not None
+        }
+
+    async def _fill(self) -> int:
+        """Заполняет профили зарегистрированных пользователей по data."""
+        cursor: int = 0
+        filled: int = 0
+        while True:
+            async with async_session() as session:
+                manager = ProfileManager(session, self.columns)
+                page: list[tuple[User, dict[str, str]]] = (
+                    await manager.registered(
+                        after_id=cursor,
+                        limit=self.batch_size,
+                    )
+                )
+                if not page:
+                    break
+                await manager.upsert(
+                    [await self.row(user, answers) for user, answers in page]
+                )
+            cursor = page[-1][0].id
+            filled += len(page)
+        return filled
+
+    async def _fields_by_title(
+        self,
+        lang: str,
+    ) -> dict[str, ProfileField]:
+        """Сопоставляет названия шагов на языке lang с колонками."""
+        if lang in self._titles:
+            return self._titles[lang]
+
+        titles: dict[str, ProfileField] = {
+            field.title: field for field in self.fields
+        }
+        if lang != self.lang:
+            try:
+                loc: Localization = await load_localization(lang, "user")
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    f"Локализация {lang} для профилей не загружена: {e}"
+                )
+            else:
+                titles = {}
+                for field in self.fields:
+                    for step_id in field.steps:
+                        step: Any = loc.steps_index.get(step_id)
+                        if step is not None:
+                            titles[step.text] = field
+        self._titles[lang] = titles
+        return titles
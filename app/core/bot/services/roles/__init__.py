@@ -0,0 +1,16 @@
+"""
+Пакет ролей администраторов.
+
+Содержит кэширующее определение роли пользователя по настройкам и
+таблице admin и его глобальный экземпляр.
+"""
+
+from .instance import get_role_resolver
+from .resolver import ROLE_MAIN, ROLE_MODERATOR, RoleResolver
+
+__all__: list[str] = [
+    "ROLE_MAIN",
+    "ROLE_MODERATOR",
+    "RoleResolver",
+    "get_role_resolver",
+]
@@ -0,0 +1,31 @@
+"""
+Модуль содержит глобальный экземпляр определения ролей.
+"""
+
+from typing import Final
+
+from app.config import (ADMIN_CACHE_SIZE, ADMIN_CACHE_TTL,
+                        ADMIN_NEGATIVE_TTL, MAIN_ADMINS)
+from app.core.bot.services.metrics import get_metrics
+
+from .resolver import RoleResolver
+
+_resolver: Final[RoleResolver] = RoleResolver(
+    main_admins=MAIN_ADMINS,
+    metrics=get_metrics(),
+    ttl=ADMIN_CACHE_TTL,
+    negative_ttl=ADMIN_NEGATIVE_TTL,
+    max_size=ADMIN_CACHE_SIZE,
+)
+
+
+def get_role_resolver() -> RoleResolver:
+    """
+    Возвращает глобальный экземпляр определения ролей.
+
+    Returns
+    -------
+    RoleResolver
+        Определение ролей администраторов.
+    """
+    return _resolver
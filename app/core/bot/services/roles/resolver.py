@@ -0,0 +1,144 @@
+"""
+Модуль определения ролей администраторов.
+
+Содержит класс RoleResolver: главные администраторы задаются в
+настройках, остальные хранятся в таблице admin. Роль пользователя
+кэшируется в памяти на ttl секунд, а отсутствие роли — на
+negative_ttl секунд: фильтр администратора проверяет каждое сообщение
+в приватном чате, и обычные пользователи не должны обращаться к базе
+на каждом апдейте. Изменение списка администраторов через панель
+сбрасывает кэш пользователя.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+from app.core.bot.services.metrics import MetricsRegistry
+from app.core.database import Admin, AdminManager, async_session
+
+# Роли администраторов
+ROLE_MAIN: str = "main"
+ROLE_MODERATOR: str = "moderator"
+
+# Ключ кэша: (Telegram ID, ID бота)
+RoleKey = tuple[int, int]
+
+
+class RoleResolver:
+    """Кэширующее определение роли пользователя по таблице admin."""
+
+    def __init__(
+        self,
+        main_admins: Iterable[int],
+        metrics: MetricsRegistry,
+        ttl: float,
+        negative_ttl: float,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Инициализация определения ролей.
+
+        Args:
+            main_admins (Iterable[int]): Telegram ID главных
+                администраторов из настроек.
+            metrics (MetricsRegistry): Реестр счётчиков обращений.
+            ttl (float): Время жизни найденной роли в секундах.
+            negative_ttl (float): Время жизни отсутствия роли
+                в секундах.
+            max_size (int): Максимальное количество записей в кэше.
+            clock (Callable[[], float]): Источник монотонного времени.
+        """
+        self.main_admins: frozenset[int] = frozenset(main_admins)
+        self.metrics: MetricsRegistry = metrics
+        self.ttl: float = ttl
+        self.negative_ttl: float = negative_ttl
+        self.max_size: int = max_size
+        self.clock: Callable[[], float] = clock
+
+        # Роль (None — не администратор) и момент истечения записи
+        self._cache: OrderedDict[RoleKey, tuple[str | None, float]] = (
+            OrderedDict()
+        )
+
+    async def resolve(
+        self,
+        tg_id: int,
+        bot_id: int,
+    ) -> str | None:
+        """
+        Возвращает роль пользователя в боте.
+
+        Args:
+            tg_id (int): Telegram ID пользователя.
+            bot_id (int): ID бота.
+
+        Returns:
+            str | None: Роль или None, если пользователь не
+                администратор.
+        """
+        if tg_id in self.main_admins:
+            self._count(ROLE_MAIN, "config")
+            return ROLE_MAIN
+
+        key: RoleKey = (tg_id, bot_id)
+        now: float = self.clock()
+        cached: tuple[str | None, float] | None = self._cache.get(key)
+        if cached is not None and cached[1] > now:
+            self._cache.move_to_end(key)
+            self._count(cached[0], "cache")
+            return cached[0]
+
+        async with async_session() as session:
+            admin: Admin | None = await AdminManager(session).get(
+                tg_id=tg_id,
+                bot_id=bot_id,
+            )
+        role: str | None = admin.role if admin is not None else None
+        # Главные администраторы задаются только настройками: роль main
+        # в таблице не даёт полных прав
+        if role == ROLE_MAIN:
+            role = ROLE_MODERATOR
+
+        ttl: float = self.ttl if role is not None else self.negative_ttl
+        self._cache[key] = (role, now + ttl)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        self._count(role, "db")
+        return role
+
+    def invalidate(
+        self,
+        tg_id: int | None = None,
+        bot_id: int | None = None,
+    ) -> None:
+        """
+        Сбрасывает закэшированную роль.
+
+        Args:
+            tg_id (int | None): Telegram ID пользователя (None —
+                сбросить весь кэш).
+            bot_id (int | None): ID бота (None — во всех ботах).
+        """
+        if tg_id is None:
+            self._cache.clear()
+            return
+        for key in [
+            key for key in self._cache
+            if key[0] == tg_id and (bot_id is None or key[1] == bot_id)
+        ]:
+            del self._cache[key]
+
+    def _count(
+        self,
+        role: str | None,
+        source: str,
+    ) -> None:
+        """Увеличивает счётчик обращений по роли и источнику ответа."""
+        self.metrics.inc(
+            "admin_role_lookups",
+            role=role or "none",
+            source=source,
+        )
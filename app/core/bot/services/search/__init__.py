@@ -0,0 +1,22 @@
+"""
+Пакет поиска участников.
+
+Содержит нормализацию ответов и запросов, построение и обновление
+поисковых документов, постраничный поиск и перестроение индекса по
+существующим данным.
+"""
+
+from .index import sync_documents
+from .query import SearchPage, search_users
+from .rebuild import rebuild_search_index
+from .tokens import build_document, match_terms, normalize
+
+__all__: list[str] = [
+    "SearchPage",
+    "build_document",
+    "match_terms",
+    "normalize",
+    "rebuild_search_index",
+    "search_users",
+    "sync_documents",
+]
@@ -0,0 +1,67 @@
+"""
+Модуль обновления поисковых документов.
+
+Содержит функцию sync_documents: документы пользователей строятся по
+их данным и сравниваются с сохранёнными, поэтому в транзакцию
+попадают только изменившиеся документы, а документы пользователей
+без ответов удаляются.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import SEARCH_KEYS
+from app.core.database import SearchManager
+
+from .tokens import build_document
+
+# Данные пользователя для индекса: ID пользователя, ID бота и ответы
+IndexEntry = tuple[int, int, Mapping[str, str]]
+
+
+async def sync_documents(
+    session: AsyncSession,
+    entries: Iterable[IndexEntry],
+    keys: Sequence[str] = SEARCH_KEYS,
+) -> int:
+    """
+    Обновляет поисковые документы пользователей без фиксации
+    транзакции.
+
+    Args:
+        session (AsyncSession): Сессия, транзакцию которой фиксирует
+            вызывающий код.
+        entries (Iterable[IndexEntry]): Данные пользователей.
+        keys (Sequence[str]): Ключи данных, по которым ищут
+            участников.
+
+    Returns:
+        int: Количество изменённых и удалённых документов.
+    """
+    items: list[IndexEntry] = list(entries)
+    if not items:
+        return 0
+
+    manager = SearchManager(session)
+    stored: dict[int, tuple[str, str]] = await manager.documents(
+        user_id for user_id, _, _ in items
+    )
+    docs: list[dict[str, Any]] = []
+    removed: list[int] = []
+    for user_id, bot_id, data in items:
+        doc: tuple[str, str] | None = build_document(data, keys)
+        if doc is None:
+            if user_id in stored:
+                removed.append(user_id)
+        elif stored.get(user_id) != doc:
+            docs.append({
+                "user_id": user_id,
+                "bot_id": bot_id,
+                "title": doc[0],
+                "content": doc[1],
+            })
+    await manager.index(docs, commit=False)
+    await manager.remove(removed, commit=False)
+    return len(docs) + len(removed)
@@ -0,0 +1,89 @@
+"""
+Модуль поиска участников.
+
+Содержит функцию search_users, которая возвращает страницу
+ранжированных результатов поиска по документам участников бота.
+"""
+
+from dataclasses import dataclass, field
+
+from app.core.database import SearchManager, async_session
+from app.core.database.managers.search.crud import SearchHit
+
+from .tokens import match_terms
+
+
+@dataclass(slots=True)
+class SearchPage:
+    """Страница результатов поиска.
+
+    Атрибуты:
+        query (str): Запрос администратора.
+        page (int): Номер страницы (с нуля).
+        pages (int): Количество страниц.
+        total (int): Количество найденных участников.
+        hits (list[SearchHit]): Участники страницы: ID пользователя,
+            код и подпись.
+    """
+    query: str
+    page: int = 0
+    pages: int = 0
+    total: int = 0
+    hits: list[SearchHit] = field(default_factory=list)
+
+
+async def search_users(
+    bot_id: int,
+    query: str,
+    page: int,
+    page_size: int,
+) -> SearchPage:
+    """
+    Ищет участников бота по словам запроса.
+
+    Каждое слово запроса должно быть началом какого-либо слова в
+    документе участника. Номер страницы за пределами результатов
+    заменяется последней страницей.
+
+    Args:
+        bot_id (int): ID бота.
+        query (str): Запрос администратора.
+        page (int): Номер страницы (с нуля).
+        page_size (int): Количество участников на странице.
+
+    Returns:
+        SearchPage: Страница результатов.
+    """
+    terms: list[str] = match_terms(query)
+    if not terms:
+        return SearchPage(query=query)
+
+    page = max(page, 0)
+    async with async_session() as session:
+        manager = SearchManager(session)
+        total: int
+        hits: list[SearchHit]
+        total, hits = await manager.search(
+            bot_id=bot_id,
+            terms=terms,
+            limit=page_size,
+            offset=page * page_size,
+        )
+        pages: int = -(-total // page_size)
+        if total and not hits:
+            page = pages - 1
+            total, hits = await manager.search(
+                bot_id=bot_id,
+                terms=terms,
+                limit=page_size,
+                offset=page * page_size,
+            )
+            pages = -(-total // page_size)
+
+    return SearchPage(
+        query=query,
+        page=page,
+        pages=pages,
+        total=total,
+        hits=hits,
+    )
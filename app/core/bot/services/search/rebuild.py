@@ -0,0 +1,45 @@
+"""
+Модуль перестроения поискового индекса.
+
+Содержит функцию rebuild_search_index: пользователи читаются
+страницами по курсору ID вместе с данными, документы строятся заново
+и записываются только там, где они изменились. Используется для
+заполнения индекса по уже существующим данным, после изменения
+SEARCH_KEYS и для исправления расхождений.
+"""
+
+from loguru import logger
+
+from app.core.database import SearchManager, async_session
+
+from .index import IndexEntry, sync_documents
+
+
+async def rebuild_search_index(
+    batch_size: int = 500,
+) -> int:
+    """
+    Перестраивает поисковые документы по таблицам user и data.
+
+    Args:
+        batch_size (int): Размер страницы пользователей.
+
+    Returns:
+        int: Количество изменённых и удалённых документов.
+    """
+    cursor: int = 0
+    changed: int = 0
+    while True:
+        async with async_session() as session:
+            page: list[IndexEntry] = await SearchManager(session).answers(
+                after_id=cursor,
+                limit=batch_size,
+            )
+            if not page:
+                break
+            changed += await sync_documents(session, page)
+            await session.commit()
+        cursor = page[-1][0]
+
+    logger.info(f"Поисковый индекс перестроен: изменено документов {changed}")
+    return changed
@@ -0,0 +1,97 @@
+"""
+Модуль нормализации текста для поиска участников.
+
+Содержит функции, приводящие ответы пользователя и поисковый запрос к
+одному виду: регистр сворачивается, «ё» заменяется на «е», текст
+делится на слова из букв и цифр. Документ участника хранит
+нормализованные слова выбранных ответов, запрос ищет слова,
+начинающиеся с каждого из слов запроса.
+"""
+
+import re
+from collections.abc import Mapping, Sequence
+
+# Разделители слов: всё, кроме букв и цифр (совпадает с токенизатором
+# unicode61 полнотекстового индекса)
+SEPARATORS: re.Pattern[str] = re.compile(r"[\W_]+")
+
+# Минимальное количество цифр, при котором значение дополнительно
+# индексируется слитно (телефоны, номера документов)
+DIGITS_MIN: int = 5
+
+# Максимальное количество слов запроса
+MAX_TERMS: int = 8
+
+# Разделитель ответов в подписи документа и её максимальная длина
+TITLE_SEPARATOR: str = " · "
+TITLE_LIMIT: int = 255
+
+
+def normalize(
+    text: str,
+) -> list[str]:
+    """
+    Делит текст на нормализованные слова.
+
+    Args:
+        text (str): Исходный текст.
+
+    Returns:
+        list[str]: Слова в нижнем регистре с «е» вместо «ё».
+    """
+    folded: str = text.casefold().replace("ё", "е")
+    return [word for word in SEPARATORS.split(folded) if word]
+
+
+def build_document(
+    data: Mapping[str, str],
+    keys: Sequence[str],
+) -> tuple[str, str] | None:
+    """
+    Строит поисковый документ пользователя по его ответам.
+
+    Args:
+        data (Mapping[str, str]): Данные пользователя (ключ — название
+            шага).
+        keys (Sequence[str]): Ключи данных, по которым ищут
+            участников.
+
+    Returns:
+        tuple[str, str] | None: Подпись для результатов поиска и
+            нормализованный текст документа или None, если ни одного
+            ответа нет.
+    """
+    values: list[str] = [
+        value.strip() for key in keys
+        if (value := str(data.get(key) or "")).strip()
+    ]
+    if not values:
+        return None
+
+    words: dict[str, None] = {}
+    for value in values:
+        words.update(dict.fromkeys(normalize(value)))
+        digits: str = "".join(char for char in value if char.isdigit())
+        if len(digits) >= DIGITS_MIN:
+            words[digits] = None
+
+    title: str = TITLE_SEPARATOR.join(values)
+    if len(title) > TITLE_LIMIT:
+        title = title[:TITLE_LIMIT - 1] + "…"
+    return title, " ".join(words)
+
+
+def match_terms(
+    query: str,
+) -> list[str]:
+    """
+    Переводит поисковый запрос в слова для поиска по префиксу.
+
+    Args:
+        query (str): Запрос администратора.
+
+    Returns:
+        list[str]: Различные нормализованные слова запроса (не больше
+            MAX_TERMS).
+    """
+    return list(dict.fromkeys(normalize(query)))[:MAX_TERMS]
@@ -0,0 +1,16 @@
+"""
+Пакет общей HTTP-сессии Telegram-ботов.
+
+Содержит:
+- get_bot_session — функция для получения общей сессии.
+- create_bot — функция создания бота с общей сессией.
+- close_bot_session — функция закрытия пула соединений.
+"""
+
+from .instance import close_bot_session, create_bot, get_bot_session
+
+__all__: list[str] = [
+    "close_bot_session",
+    "create_bot",
+    "get_bot_session",
+]
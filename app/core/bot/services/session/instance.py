@@ -0,0 +1,73 @@
+"""
+Модуль содержит общую HTTP-сессию Telegram Bot API.
+
+Все боты процесса отправляют запросы через один пул соединений
+aiohttp, размер которого задаётся настройкой BOT_SESSION_LIMIT.
+"""
+
+from typing import Final
+
+from aiogram import Bot
+from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.enums import ParseMode
+
+from app.config import BOT_SESSION_LIMIT
+from app.core.bot.services.metrics import (RequestMetricsMiddleware,
+                                           get_metrics)
+
+# Сессия не привязана к токену: URL запроса содержит токен бота,
+# поэтому один пул соединений обслуживает все боты.
+_session: Final[AiohttpSession] = AiohttpSession(limit=BOT_SESSION_LIMIT)
+_session.middleware(RequestMetricsMiddleware(get_metrics()))
+
+
+def get_bot_session() -> AiohttpSession:
+    """
+    Возвращает общую HTTP-сессию ботов.
+
+    Returns
+    -------
+    AiohttpSession
+        Сессия с общим пулом соединений.
+    """
+    return _session
+
+
+def create_bot(
+    api_token: str,
+) -> Bot:
+    """
+    Создаёт бота, работающего через общую HTTP-сессию.
+
+    Такого бота нельзя использовать как ``async with Bot(...)``:
+    выход из контекста закрыл бы сессию всех ботов. Сессия
+    закрывается через close_bot_session.
+
+    Parameters
+    ----------
+    api_token : str
+        Токен API бота.
+
+    Returns
+    -------
+    Bot
+        Экземпляр бота с HTML-разметкой по умолчанию.
+    """
+    return Bot(
+        token=api_token,
+        session=_session,
+        default=DefaultBotProperties(
+            parse_mode=ParseMode.HTML
+        ),
+    )
+
+
+async def close_bot_session() -> None:
+    """
+    Закрывает пул соединений общей сессии.
+
+    Сессия создаст новый пул при следующем запросе, поэтому боты
+    можно запустить повторно.
+    """
+    await _session.close()
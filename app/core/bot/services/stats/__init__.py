@@ -0,0 +1,26 @@
+"""
+Пакет статистики регистраций.
+
+Содержит имена метрик, расчёт приращений счётчиков при регистрации и
+её отмене и пересчёт счётчиков по существующим данным.
+"""
+
+from .counters import (METRIC_CANCELLED, METRIC_CONFIRMED, METRIC_DAY,
+                       METRIC_HOUR, METRIC_OPTION, METRIC_PENDING,
+                       METRIC_REGISTERED, cancellation_deltas, option_steps,
+                       registration_deltas)
+from .rebuild import rebuild_stats
+
+__all__: list[str] = [
+    "METRIC_CANCELLED",
+    "METRIC_CONFIRMED",
+    "METRIC_DAY",
+    "METRIC_HOUR",
+    "METRIC_OPTION",
+    "METRIC_PENDING",
+    "METRIC_REGISTERED",
+    "cancellation_deltas",
+    "option_steps",
+    "rebuild_stats",
+    "registration_deltas",
+]
@@ -0,0 +1,124 @@
+"""
+Модуль счётчиков регистраций.
+
+Содержит имена метрик и функции, переводящие регистрацию и её
+отмену в приращения счётчиков. Все счётчики, кроме числа отмен,
+отражают текущих зарегистрированных пользователей: отмена вычитает
+то, что прибавила регистрация, поэтому пересчёт по таблицам user и
+data даёт те же значения.
+"""
+
+from collections import Counter
+from collections.abc import Mapping
+from datetime import datetime
+
+from app.core.bot.services.localization import Localization
+from app.core.database import User
+from app.core.database.models.stat import StatKey
+
+# Зарегистрированные пользователи
+METRIC_REGISTERED: str = "registered"
+
+# Зарегистрированные с подтверждённым участием и ожидающие его
+METRIC_CONFIRMED: str = "confirmed"
+METRIC_PENDING: str = "pending"
+
+# Отмены регистрации (накопительно, при пересчёте сохраняются)
+METRIC_CANCELLED: str = "cancelled"
+
+# Регистрации по дням (ключ ГГГГ-ММ-ДД) и часам (ключ ЧЧ)
+METRIC_DAY: str = "day"
+METRIC_HOUR: str = "hour"
+
+# Ответы на шаги выбора: метрика option:<ID шага>, ключ — ответ
+METRIC_OPTION: str = "option:"
+
+# Максимальная длина ключа счётчика
+KEY_LIMIT: int = 255
+
+
+def option_steps(
+    loc: Localization,
+) -> dict[str, str]:
+    """
+    Сопоставляет ключи данных шагов выбора с ID шагов.
+
+    Ответ хранится под названием шага, поэтому ручной ввод варианта
+    (шаг с тем же названием) учитывается вместе с шагом выбора.
+
+    Args:
+        loc (Localization): Локализация пользователя.
+
+    Returns:
+        dict[str, str]: ID шага по названию.
+    """
+    steps: dict[str, str] = {}
+    for step in loc.steps_index.values():
+        if step.type == "select":
+            steps.setdefault(step.text, step.id)
+    return steps
+
+
+def registration_deltas(
+    user: User,
+    data: Mapping[str, str],
+    loc: Localization,
+    sign: int = 1,
+) -> Counter[StatKey]:
+    """
+    Возвращает приращения счётчиков для регистрации пользователя.
+
+    Args:
+        user (User): Зарегистрированный пользователь.
+        data (Mapping[str, str]): Ответы пользователя.
+        loc (Localization): Локализация пользователя.
+        sign (int): 1 — регистрация, -1 — её отмена.
+
+    Returns:
+        Counter[StatKey]: Приращения по ключам счётчиков.
+    """
+    bot_id: int = user.bot_id
+    deltas: Counter[StatKey] = Counter()
+    deltas[(bot_id, METRIC_REGISTERED, "")] += sign
+
+    status: str = (
+        METRIC_CONFIRMED if user.date_confirm is not None
+        else METRIC_PENDING
+    )
+    deltas[(bot_id, status, "")] += sign
+
+    registered: datetime | None = user.date_registration
+    if registered is not None:
+        deltas[(bot_id, METRIC_DAY, registered.strftime("%Y-%m-%d"))] += sign
+        deltas[(bot_id, METRIC_HOUR, registered.strftime("%H"))] += sign
+
+    for title, step_id in option_steps(loc).items():
+        value: str | None = data.get(title)
+        if value:
+            key: StatKey = (bot_id, f"{METRIC_OPTION}{step_id}",
+                            value[:KEY_LIMIT])
+            deltas[key] += sign
+    return deltas
+
+
+def cancellation_deltas(
+    user: User,
+    data: Mapping[str, str],
+    loc: Localization,
+) -> Counter[StatKey]:
+    """
+    Возвращает приращения счётчиков для отмены регистрации.
+
+    Вызывается до очистки ответов и даты регистрации.
+
+    Args:
+        user (User): Пользователь, отменяющий регистрацию.
+        data (Mapping[str, str]): Ответы пользователя.
+        loc (Localization): Локализация пользователя.
+
+    Returns:
+        Counter[StatKey]: Приращения по ключам счётчиков.
+    """
+    deltas: Counter[StatKey] = registration_deltas(user, data, loc, sign=-1)
+    deltas[(user.bot_id, METRIC_CANCELLED, "")] += 1
+    return deltas
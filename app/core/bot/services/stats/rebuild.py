@@ -0,0 +1,73 @@
+"""
+Модуль пересчёта статистики.
+
+Содержит функцию rebuild_stats: профили зарегистрированных
+пользователей читаются страницами по курсору ID, счётчики
+накапливаются в памяти и заменяют сохранённые одной транзакцией.
+Используется для заполнения счётчиков по уже существующим данным и
+для исправления расхождений. Число отмен по таблицам восстановить
+нельзя, поэтому оно сохраняется.
+"""
+
+from collections import Counter
+from typing import Any
+
+from loguru import logger
+
+from app.core.bot.services.localization import Localization, load_localization
+from app.core.bot.services.persistence import get_write_behind
+from app.core.bot.services.profile import get_profile_service
+from app.core.database import (ProfileManager, StatManager, User,
+                               async_session)
+from app.core.database.models.stat import StatKey
+
+from .counters import METRIC_CANCELLED, registration_deltas
+
+
+async def rebuild_stats(
+    batch_size: int = 500,
+) -> int:
+    """
+    Пересчитывает счётчики статистики по таблице профилей.
+
+    Args:
+        batch_size (int): Размер страницы пользователей.
+
+    Returns:
+        int: Количество учтённых зарегистрированных пользователей.
+    """
+    # Отложенные изменения этого процесса должны попасть в пересчёт
+    await get_write_behind().flush()
+
+    profiles = get_profile_service()
+    await profiles.prepare()
+    # Ответы профиля хранятся по названиям шагов на языке схемы
+    loc: Localization = await load_localization(profiles.lang, "user")
+
+    counters: Counter[StatKey] = Counter()
+    cursor: int = 0
+    users: int = 0
+    while True:
+        async with async_session() as session:
+            page: list[tuple[User, dict[str, Any]]] = await ProfileManager(
+                session, profiles.columns
+            ).page(after_id=cursor, limit=batch_size)
+        if not page:
+            break
+        for user, values in page:
+            counters.update(
+                registration_deltas(user, profiles.answers(values), loc)
+            )
+        cursor = page[-1][0].id
+        users += len(page)
+
+    async with async_session() as session:
+        await StatManager(session).replace(
+            counters,
+            keep=(METRIC_CANCELLED,),
+        )
+    logger.info(
+        f"Статистика пересчитана: пользователей {users}, "
+        f"счётчиков {len(counters)}"
+    )
+    return users
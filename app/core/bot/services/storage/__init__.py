@@ -0,0 +1,29 @@
+"""
+Пакет хранилищ FSM.
+
+Содержит:
+- PersistentStorage — хранилище FSM с живым слоем в памяти
+  и пакетной записью в бэкенд.
+- SQLiteBackend, RedisBackend — бэкенды для хранения сессий.
+- get_fsm_storage — функция для получения глобального хранилища.
+"""
+
+from .backend import SQLiteBackend, StorageBackend
+from .codec import decode_record, encode_record
+from .instance import create_storage, get_fsm_storage
+from .resp import RedisBackend, RespClient, RespError
+from .storage import PersistentStorage, build_key
+
+__all__: list[str] = [
+    "PersistentStorage",
+    "RedisBackend",
+    "RespClient",
+    "RespError",
+    "SQLiteBackend",
+    "StorageBackend",
+    "build_key",
+    "create_storage",
+    "decode_record",
+    "encode_record",
+    "get_fsm_storage",
+]
@@ -0,0 +1,196 @@
+"""
+Модуль бэкендов хранилища сессий FSM.
+
+Содержит абстрактный StorageBackend и реализацию SQLiteBackend
+на aiosqlite с пакетной записью и удалением устаревших сессий.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import aiosqlite
+
+
+class StorageBackend(ABC):
+    """Бэкенд, хранящий сериализованные сессии FSM по строковому ключу."""
+
+    @abstractmethod
+    async def load(
+        self,
+        key: str,
+    ) -> str | None:
+        """
+        Загружает сессию по ключу.
+
+        Args:
+            key (str): Ключ сессии.
+
+        Returns:
+            str | None: Сериализованная сессия или None.
+        """
+
+    @abstractmethod
+    async def save_many(
+        self,
+        records: list[tuple[str, str]],
+    ) -> None:
+        """
+        Сохраняет пакет сессий.
+
+        Args:
+            records (list[tuple[str, str]]): Пары (ключ, сессия).
+        """
+
+    @abstractmethod
+    async def delete_many(
+        self,
+        keys: list[str],
+    ) -> None:
+        """
+        Удаляет пакет сессий.
+
+        Args:
+            keys (list[str]): Ключи сессий.
+        """
+
+    @abstractmethod
+    async def touch_many(
+        self,
+        keys: list[str],
+    ) -> None:
+        """
+        Продлевает время жизни пакета сессий без перезаписи.
+
+        Args:
+            keys (list[str]): Ключи сессий.
+        """
+
+    @abstractmethod
+    async def evict(
+        self,
+        ttl: int,
+    ) -> int:
+        """
+        Удаляет сессии, не обновлявшиеся дольше ttl секунд.
+
+        Args:
+            ttl (int): Время жизни неактивной сессии в секундах.
+
+        Returns:
+            int: Количество удалённых сессий.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Закрывает соединение с хранилищем."""
+
+
+class SQLiteBackend(StorageBackend):
+    """Хранилище сессий FSM в отдельном файле SQLite."""
+
+    def __init__(
+        self,
+        path: Path,
+    ) -> None:
+        """
+        Инициализация бэкенда.
+
+        Соединение открывается при первом обращении.
+
+        Args:
+            path (Path): Путь к файлу базы данных.
+        """
+        self.path: Path = path
+        self._conn: aiosqlite.Connection | None = None
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """
+        Возвращает соединение, при необходимости создавая таблицу.
+
+        Returns:
+            aiosqlite.Connection: Открытое соединение.
+        """
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn: aiosqlite.Connection = await aiosqlite.connect(self.path)
+            await conn.execute("PRAGMA journal_mode=WAL")
+            await conn.execute("PRAGMA synchronous=NORMAL")
+            await conn.execute(
+                "CREATE TABLE IF NOT EXISTS fsm ("
+                "key TEXT PRIMARY KEY, "
+                "value TEXT NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+            await conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_fsm_updated_at "
+                "ON fsm (updated_at)"
+            )
+            await conn.commit()
+            self._conn = conn
+        return self._conn
+
+    async def load(
+        self,
+        key: str,
+    ) -> str | None:
+        conn: aiosqlite.Connection = await self._connect()
+        async with conn.execute(
+            "SELECT value FROM fsm WHERE key = ?", (key,)
+        ) as cursor:
+            row: aiosqlite.Row | None = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def save_many(
+        self,
+        records: list[tuple[str, str]],
+    ) -> None:
+        conn: aiosqlite.Connection = await self._connect()
+        now: float = time.time()
+        await conn.executemany(
+            "INSERT INTO fsm (key, value, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET "
+            "value = excluded.value, updated_at = excluded.updated_at",
+            [(key, value, now) for key, value in records],
+        )
+        await conn.commit()
+
+    async def delete_many(
+        self,
+        keys: list[str],
+    ) -> None:
+        conn: aiosqlite.Connection = await self._connect()
+        await conn.executemany(
+            "DELETE FROM fsm WHERE key = ?",
+            [(key,) for key in keys],
+        )
+        await conn.commit()
+
+    async def touch_many(
+        self,
+        keys: list[str],
+    ) -> None:
+        conn: aiosqlite.Connection = await self._connect()
+        now: float = time.time()
+        await conn.executemany(
+            "UPDATE fsm SET updated_at = ? WHERE key = ?",
+            [(now, key) for key in keys],
+        )
+        await conn.commit()
+
+    async def evict(
+        self,
+        ttl: int,
+    ) -> int:
+        conn: aiosqlite.Connection = await self._connect()
+        cursor: aiosqlite.Cursor = await conn.execute(
+            "DELETE FROM fsm WHERE updated_at < ?",
+            (time.time() - ttl,),
+        )
+        await conn.commit()
+        return cursor.rowcount
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
@@ -0,0 +1,105 @@
+"""
+Модуль сериализации сессий FSM.
+
+В хранилище попадают только примитивы: состояние, данные пользователя
+и колонки объекта User. Локализации (ключи ``loc_*``) не сохраняются —
+они загружаются заново при первом обращении к сессии.
+"""
+
+import json
+from datetime import datetime
+from typing import Any
+
+from app.core.bot.services.persistence import snapshot_user
+from app.core.database import User
+
+# Префикс ключей FSM, которые не сохраняются в хранилище
+LOCAL_PREFIX: str = "loc_"
+
+# Служебные ключи сериализованных объектов
+USER_TAG: str = "__user__"
+DATETIME_TAG: str = "__dt__"
+
+
+def encode_record(
+    state: str | None,
+    data: dict[str, Any],
+) -> str:
+    """
+    Сериализует сессию FSM в компактную JSON-строку.
+
+    Args:
+        state (str | None): Состояние FSM.
+        data (dict[str, Any]): Данные FSM.
+
+    Returns:
+        str: Сериализованная сессия.
+    """
+    payload: dict[str, Any] = {
+        key: value
+        for key, value in data.items()
+        if not key.startswith(LOCAL_PREFIX)
+    }
+    return json.dumps(
+        {"state": state, "data": payload},
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=_encode_value,
+    )
+
+
+def decode_record(
+    raw: str | bytes,
+) -> tuple[str | None, dict[str, Any]]:
+    """
+    Восстанавливает сессию FSM из JSON-строки.
+
+    Args:
+        raw (str | bytes): Сериализованная сессия.
+
+    Returns:
+        tuple[str | None, dict[str, Any]]: Состояние и данные FSM.
+    """
+    record: dict[str, Any] = json.loads(raw, object_hook=_decode_value)
+    return record.get("state"), record.get("data") or {}
+
+
+def _encode_value(
+    value: Any,
+) -> Any:
+    """
+    Преобразует объекты, не поддерживаемые JSON, в примитивы.
+
+    Args:
+        value (Any): Значение для сериализации.
+
+    Returns:
+        Any: JSON-совместимое представление значения.
+
+    Raises:
+        TypeError: Тип значения не поддерживается.
+    """
+    if isinstance(value, User):
+        return {USER_TAG: snapshot_user(value)}
+    if isinstance(value, datetime):
+        return {DATETIME_TAG: value.isoformat()}
+    raise TypeError(f"Неподдерживаемый тип данных FSM: {type(value)}")
+
+
+def _decode_value(
+    obj: dict[str, Any],
+) -> Any:
+    """
+    Восстанавливает объекты, сериализованные в _encode_value.
+
+    Args:
+        obj (dict[str, Any]): Декодированный JSON-объект.
+
+    Returns:
+        Any: Исходный объект или сам словарь.
+    """
+    if USER_TAG in obj:
+        return User(**obj[USER_TAG])
+    if DATETIME_TAG in obj:
+        return datetime.fromisoformat(obj[DATETIME_TAG])
+    return obj
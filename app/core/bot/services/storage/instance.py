@@ -0,0 +1,71 @@
+"""
+Модуль содержит глобальный экземпляр хранилища FSM.
+
+Тип хранилища выбирается настройкой FSM_STORAGE: "memory" (без
+сохранения между перезапусками), "sqlite" или "redis".
+"""
+
+from pathlib import Path
+from typing import Final
+
+from aiogram.fsm.storage.base import BaseStorage
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from app.config import (FSM_FLUSH_INTERVAL, FSM_STORAGE, FSM_STORAGE_PATH,
+                        FSM_STORAGE_URL, FSM_TTL)
+
+from .backend import SQLiteBackend, StorageBackend
+from .resp import RedisBackend
+from .storage import PersistentStorage
+
+
+def create_storage(
+    kind: str,
+    url: str = "",
+) -> BaseStorage:
+    """
+    Создаёт хранилище FSM указанного типа.
+
+    Args:
+        kind (str): Тип хранилища: "memory", "sqlite" или "redis".
+        url (str): Путь к файлу SQLite или адрес сервера Redis.
+            Пустая строка означает адрес по умолчанию.
+
+    Returns:
+        BaseStorage: Хранилище FSM.
+
+    Raises:
+        ValueError: Неизвестный тип хранилища.
+    """
+    backend: StorageBackend
+    if kind == "memory":
+        return MemoryStorage()
+    if kind == "sqlite":
+        backend = SQLiteBackend(Path(url) if url else FSM_STORAGE_PATH)
+    elif kind == "redis":
+        backend = RedisBackend(url or "redis://localhost:6379/0", FSM_TTL)
+    else:
+        raise ValueError(f"Неизвестный тип хранилища FSM: {kind}")
+
+    return PersistentStorage(
+        backend=backend,
+        ttl=FSM_TTL,
+        interval=FSM_FLUSH_INTERVAL,
+    )
+
+
+# Одно хранилище на процесс: диспетчеры всех ботов работают
+# с общими сессиями.
+_storage: Final[BaseStorage] = create_storage(FSM_STORAGE, FSM_STORAGE_URL)
+
+
+def get_fsm_storage() -> BaseStorage:
+    """
+    Возвращает глобальный экземпляр хранилища FSM.
+
+    Returns
+    -------
+    BaseStorage
+        Хранилище FSM, используемое диспетчером.
+    """
+    return _storage
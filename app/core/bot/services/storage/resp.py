@@ -0,0 +1,273 @@
+"""
+Модуль бэкенда сессий FSM для серверов с протоколом Redis (RESP).
+
+Содержит минимальный асинхронный клиент RESP без внешних зависимостей
+и RedisBackend, совместимый с Redis и его локальными заменами
+(KeyDB, Dragonfly и др.). Устаревшие сессии удаляет сам сервер
+по EXPIRE.
+"""
+
+import asyncio
+from urllib.parse import urlparse
+
+from .backend import StorageBackend
+
+# Ответ сервера: строка, число, массив ответов или None
+Reply = bytes | int | list["Reply"] | None
+
+
+class RespError(Exception):
+    """Ошибка, возвращённая сервером RESP."""
+
+
+class RespClient:
+    """Минимальный асинхронный клиент протокола RESP с конвейером."""
+
+    def __init__(
+        self,
+        url: str,
+    ) -> None:
+        """
+        Инициализация клиента.
+
+        Соединение открывается при первой команде.
+
+        Args:
+            url (str): Адрес вида redis://[:password@]host:port/db.
+        """
+        parsed = urlparse(url)
+        self.host: str = parsed.hostname or "localhost"
+        self.port: int = parsed.port or 6379
+        self.password: str | None = parsed.password
+        self.db: int = int(parsed.path.lstrip("/") or 0)
+
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def execute(
+        self,
+        *args: str | bytes | int,
+    ) -> Reply:
+        """
+        Выполняет одну команду.
+
+        Args:
+            *args (str | bytes | int): Команда и её аргументы.
+
+        Returns:
+            Reply: Ответ сервера.
+        """
+        return (await self.pipeline([args]))[0]
+
+    async def pipeline(
+        self,
+        commands: list[tuple[str | bytes | int, ...]],
+    ) -> list[Reply]:
+        """
+        Отправляет команды одним пакетом и читает все ответы.
+
+        Args:
+            commands (list[tuple[str | bytes | int, ...]]): Команды.
+
+        Returns:
+            list[Reply]: Ответы сервера в порядке команд.
+
+        Raises:
+            RespError: Сервер вернул ошибку на одну из команд.
+        """
+        async with self._lock:
+            reader, writer = await self._connect()
+            try:
+                writer.write(b"".join(_encode(c) for c in commands))
+                await writer.drain()
+                replies: list[Reply | RespError] = [
+                    await _read_reply(reader) for _ in commands
+                ]
+            except (OSError, asyncio.IncompleteReadError):
+                # Соединение будет открыто заново при следующей команде
+                await self._reset()
+                raise
+
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies  # type: ignore[return-value]
+
+    async def close(self) -> None:
+        """Закрывает соединение с сервером."""
+        async with self._lock:
+            await self._reset()
+
+    async def _connect(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """
+        Открывает соединение, авторизуется и выбирает базу.
+
+        Returns:
+            tuple[asyncio.StreamReader, asyncio.StreamWriter]: Потоки.
+        """
+        if self._reader is None or self._writer is None:
+            reader, writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+            setup: list[tuple[str | bytes | int, ...]] = []
+            if self.password:
+                setup.append(("AUTH", self.password))
+            if self.db:
+                setup.append(("SELECT", self.db))
+            if setup:
+                writer.write(b"".join(_encode(c) for c in setup))
+                await writer.drain()
+                for _ in setup:
+                    reply: Reply | RespError = await _read_reply(reader)
+                    if isinstance(reply, RespError):
+                        writer.close()
+                        raise reply
+            self._reader, self._writer = reader, writer
+        return self._reader, self._writer
+
+    async def _reset(self) -> None:
+        """Закрывает текущее соединение без повторного подключения."""
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._reader = self._writer = None
+
+
+class RedisBackend(StorageBackend):
+    """Хранилище сессий FSM на сервере с протоколом Redis."""
+
+    def __init__(
+        self,
+        url: str,
+        ttl: int,
+        prefix: str = "fsm",
+    ) -> None:
+        """
+        Инициализация бэкенда.
+
+        Args:
+            url (str): Адрес сервера redis://host:port/db.
+            ttl (int): Время жизни неактивной сессии в секундах.
+            prefix (str): Префикс ключей сессий.
+        """
+        self.client: RespClient = RespClient(url)
+        self.ttl: int = ttl
+        self.prefix: str = prefix
+
+    def _key(
+        self,
+        key: str,
+    ) -> str:
+        """Возвращает ключ сессии с префиксом."""
+        return f"{self.prefix}:{key}"
+
+    async def load(
+        self,
+        key: str,
+    ) -> str | None:
+        reply: Reply = await self.client.execute("GET", self._key(key))
+        return reply.decode() if isinstance(reply, bytes) else None
+
+    async def save_many(
+        self,
+        records: list[tuple[str, str]],
+    ) -> None:
+        await self.client.pipeline([
+            ("SET", self._key(key), value, "EX", self.ttl)
+            for key, value in records
+        ])
+
+    async def delete_many(
+        self,
+        keys: list[str],
+    ) -> None:
+        await self.client.execute("DEL", *(self._key(key) for key in keys))
+
+    async def touch_many(
+        self,
+        keys: list[str],
+    ) -> None:
+        await self.client.pipeline([
+            ("EXPIRE", self._key(key), self.ttl) for key in keys
+        ])
+
+    async def evict(
+        self,
+        ttl: int,
+    ) -> int:
+        # Сервер сам удаляет ключи с истёкшим EXPIRE
+        return 0
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+def _encode(
+    command: tuple[str | bytes | int, ...],
+) -> bytes:
+    """
+    Кодирует команду в массив bulk-строк RESP.
+
+    Args:
+        command (tuple[str | bytes | int, ...]): Команда и аргументы.
+
+    Returns:
+        bytes: Закодированная команда.
+    """
+    parts: list[bytes] = [f"*{len(command)}\r\n".encode()]
+    for arg in command:
+        if isinstance(arg, bytes):
+            data: bytes = arg
+        else:
+            data = str(arg).encode()
+        parts.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+    return b"".join(parts)
+
+
+async def _read_reply(
+    reader: asyncio.StreamReader,
+) -> Reply | RespError:
+    """
+    Читает один ответ сервера.
+
+    Ошибки сервера возвращаются, а не выбрасываются, чтобы
+    дочитать ответы остальных команд конвейера.
+
+    Args:
+        reader (asyncio.StreamReader): Поток чтения.
+
+    Returns:
+        Reply | RespError: Ответ сервера или ошибка.
+    """
+    line: bytes = await reader.readuntil(b"\r\n")
+    kind, payload = line[:1], line[1:-2]
+
+    if kind == b"+":
+        return payload
+    if kind == b"-":
+        return RespError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length: int = int(payload)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        count: int = int(payload)
+        if count < 0:
+            return None
+        items: list[Reply] = []
+        for _ in range(count):
+            item: Reply | RespError = await _read_reply(reader)
+            if isinstance(item, RespError):
+                return item
+            items.append(item)
+        return items
+    raise RespError(f"Неизвестный тип ответа RESP: {line!r}")
@@ -0,0 +1,323 @@
+"""
+Модуль персистентного хранилища FSM для aiogram.
+
+Содержит класс PersistentStorage: живые объекты сессий хранятся в
+памяти (как в MemoryStorage, поэтому обработчики могут изменять
+user_db и data_db на месте), а изменённые сессии сериализуются и
+пакетно записываются в бэкенд по таймеру. Изменёнными считаются
+сессии после set_state и set_data (update_data); прочитанные сессии
+при записи сравниваются с сохранённой версией, чтобы не терять
+изменения объектов на месте и не перезаписывать неизменённые.
+После перезапуска сессии восстанавливаются из бэкенда при первом
+обращении.
+"""
+
+import asyncio
+import time
+from asyncio import Task
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiogram.exceptions import DataNotDictLikeError
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+from loguru import logger
+
+from .backend import StorageBackend
+from .codec import decode_record, encode_record
+
+# Период удаления устаревших сессий из бэкенда (секунды)
+EVICT_PERIOD: float = 60.0
+
+# Время после чтения, в течение которого сессия сравнивается с
+# версией в бэкенде: обработчик изменяет её уже после get_data
+# (секунды)
+READ_WINDOW: float = 30.0
+
+
+@dataclass(slots=True)
+class SessionRecord:
+    """Живая сессия FSM в памяти.
+
+    Атрибуты:
+        state (str | None): Состояние FSM.
+        data (dict[str, Any]): Данные FSM.
+        touched (float): Время последнего обращения (monotonic).
+        saved (str | None): Версия сессии в бэкенде.
+        stored (float | None): Время последней записи или продления
+            сессии в бэкенде (monotonic, None — неизвестно).
+    """
+    state: str | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+    touched: float = field(default_factory=time.monotonic)
+    saved: str | None = None
+    stored: float | None = None
+
+
+def build_key(
+    key: StorageKey,
+) -> str:
+    """
+    Строит строковый ключ сессии для бэкенда.
+
+    Args:
+        key (StorageKey): Ключ FSM aiogram.
+
+    Returns:
+        str: Строковый ключ сессии.
+    """
+    return ":".join(
+        str(part) if part is not None else ""
+        for part in (
+            key.bot_id,
+            key.chat_id,
+            key.user_id,
+            key.thread_id,
+            key.business_connection_id,
+            key.destiny,
+        )
+    )
+
+
+class PersistentStorage(BaseStorage):
+    """Хранилище FSM с живым слоем в памяти и пакетной записью."""
+
+    def __init__(
+        self,
+        backend: StorageBackend,
+        ttl: int,
+        interval: float,
+    ) -> None:
+        """
+        Инициализация хранилища.
+
+        Args:
+            backend (StorageBackend): Бэкенд для сохранения сессий.
+            ttl (int): Время жизни неактивной сессии в секундах.
+            interval (float): Период фоновой записи в секундах.
+        """
+        self.backend: StorageBackend = backend
+        self.ttl: int = ttl
+        self.interval: float = interval
+
+        self._records: dict[StorageKey, SessionRecord] = {}
+        self._dirty: set[StorageKey] = set()
+        # Прочитанные сессии, которые могли измениться на месте
+        self._read: set[StorageKey] = set()
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._task: Task[None] | None = None
+        self._closing: bool = False
+        self._last_evict: float = time.monotonic()
+
+    async def set_state(
+        self,
+        key: StorageKey,
+        state: StateType = None,
+    ) -> None:
+        record: SessionRecord = await self._record(key)
+        record.state = state.state if isinstance(state, State) else state
+        self._dirty.add(key)
+
+    async def get_state(
+        self,
+        key: StorageKey,
+    ) -> str | None:
+        return (await self._record(key)).state
+
+    async def set_data(
+        self,
+        key: StorageKey,
+        data: Mapping[str, Any],
+    ) -> None:
+        if not isinstance(data, dict):
+            raise DataNotDictLikeError(
+                f"Data must be a dict or dict-like object, "
+                f"got {type(data).__name__}"
+            )
+        record: SessionRecord = await self._record(key)
+        record.data = data.copy()
+        self._dirty.add(key)
+
+    async def get_data(
+        self,
+        key: StorageKey,
+    ) -> dict[str, Any]:
+        record: SessionRecord = await self._record(key)
+        if record.data:
+            # Обработчики изменяют объекты сессии на месте: при записи
+            # сессия сравнивается с версией в бэкенде
+            self._read.add(key)
+        return record.data.copy()
+
+    async def flush(self) -> int:
+        """
+        Записывает изменённые сессии в бэкенд одним пакетом.
+
+        Пустые сессии (после очистки FSM) удаляются из бэкенда.
+        Прочитанные сессии записываются, только если отличаются от
+        версии в бэкенде; иначе им раз в половину ttl продлевается
+        время жизни. Сессия, которую не удалось сериализовать,
+        пропускается, не мешая записи остальных.
+
+        Returns:
+            int: Количество записанных или удалённых сессий.
+        """
+        async with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            read, self._read = self._read - dirty, set()
+            now: float = time.monotonic()
+
+            saves: list[tuple[str, str]] = []
+            deletes: list[str] = []
+            touches: list[str] = []
+            failed: set[StorageKey] = set()
+            written: list[tuple[SessionRecord, str | None]] = []
+            try:
+                for key in dirty | read:
+                    record: SessionRecord | None = self._records.get(key)
+                    if record is None:
+                        continue
+                    raw: str | None = None
+                    if record.state is None and not record.data:
+                        if key in read:
+                            continue
+                        deletes.append(build_key(key))
+                    else:
+                        try:
+                            raw = encode_record(record.state, record.data)
+                        except Exception as error:
+                            logger.error(
+                                f"Сессия FSM {build_key(key)} не "
+                                f"сохранена: {error}"
+                            )
+                            failed.add(key)
+                            continue
+                        if key in read and raw == record.saved:
+                            if (
+                                record.stored is None
+                                or now - record.stored > self.ttl / 2
+                            ):
+                                touches.append(build_key(key))
+                                written.append((record, raw))
+                            continue
+                        saves.append((build_key(key), raw))
+                    written.append((record, raw))
+
+                if saves:
+                    await self.backend.save_many(saves)
+                if deletes:
+                    await self.backend.delete_many(deletes)
+                if touches:
+                    await self.backend.touch_many(touches)
+            except Exception as error:
+                logger.error(f"Ошибка записи сессий FSM: {error}")
+                self._dirty |= dirty
+                self._read |= read
+                return 0
+
+            for record, raw in written:
+                record.saved = raw
+                record.stored = now
+            # Недавно использованные сессии ещё могут измениться на месте
+            self._read |= {
+                key for key in (dirty | read) - failed
+                if key in self._records
+                and now - self._records[key].touched < READ_WINDOW
+            }
+
+            await self._evict()
+            return len(saves) + len(deletes)
+
+    async def close(self) -> None:
+        """Останавливает фоновую запись и сбрасывает сессии в бэкенд."""
+        self._closing = True
+        self._wakeup.set()
+
+        if self._task and not self._task.done():
+            await self._task
+        self._task = None
+
+        await self.flush()
+        await self.backend.close()
+        self._closing = False
+
+    async def _record(
+        self,
+        key: StorageKey,
+    ) -> SessionRecord:
+        """
+        Возвращает живую сессию, при промахе загружая её из бэкенда.
+
+        Args:
+            key (StorageKey): Ключ FSM aiogram.
+
+        Returns:
+            SessionRecord: Живая сессия.
+        """
+        record: SessionRecord | None = self._records.get(key)
+        if record is None:
+            record = SessionRecord()
+            try:
+                raw: str | None = await self.backend.load(build_key(key))
+                if raw:
+                    record.state, record.data = decode_record(raw)
+                    record.saved = raw
+            except Exception as error:
+                # Без сессии данные будут заново загружены из БД
+                logger.error(f"Ошибка загрузки сессии FSM: {error}")
+            record = self._records.setdefault(key, record)
+
+        record.touched = time.monotonic()
+        self._ensure_worker()
+        return record
+
+    async def _evict(self) -> None:
+        """Удаляет неактивные сессии из памяти и бэкенда."""
+        now: float = time.monotonic()
+        if now - self._last_evict < EVICT_PERIOD:
+            return
+        self._last_evict = now
+
+        expired: list[StorageKey] = [
+            key for key, record in self._records.items()
+            if now - record.touched > self.ttl and key not in self._dirty
+        ]
+        for key in expired:
+            del self._records[key]
+
+        try:
+            removed: int = await self.backend.evict(self.ttl)
+        except Exception as error:
+            logger.error(f"Ошибка удаления устаревших сессий FSM: {error}")
+            return
+        if expired or removed:
+            logger.debug(
+                f"Удалено сессий FSM: {len(expired)} из памяти, "
+                f"{removed} из хранилища"
+            )
+
+    def _ensure_worker(self) -> None:
+        """Запускает фоновую задачу записи, если она не запущена."""
+        if self._closing:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Фоновый цикл периодической записи сессий."""
+        while not self._closing:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=self.interval,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception as error:
+                logger.exception(f"Ошибка фоновой записи сессий FSM: {error}")
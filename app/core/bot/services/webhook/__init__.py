@@ -0,0 +1,20 @@
+"""
+Пакет для приёма обновлений Telegram-ботов через вебхуки.
+
+Содержит:
+- WebhookServer — aiohttp-сервер с очередью обновлений и воркерами.
+- WebhookManager — класс менеджера ботов в режиме вебхуков.
+- get_webhook_manager — функция для получения глобального экземпляра
+  менеджера.
+"""
+
+from .instance import get_webhook_manager
+from .manager import WebhookManager
+from .server import WebhookRoute, WebhookServer
+
+__all__: list[str] = [
+    "get_webhook_manager",
+    "WebhookManager",
+    "WebhookRoute",
+    "WebhookServer",
+]
@@ -0,0 +1,42 @@
+"""
+Модуль содержит глобальный экземпляр менеджера вебхуков.
+
+Все боты в режиме вебхуков обслуживаются одним сервером на порту
+WEBHOOK_PORT.
+"""
+
+import secrets
+from typing import Final
+
+from app.config import (WEBHOOK_BASE_URL, WEBHOOK_HOST, WEBHOOK_PATH,
+                        WEBHOOK_PORT, WEBHOOK_QUEUE_SIZE, WEBHOOK_SECRET,
+                        WEBHOOK_WORKERS)
+
+from .manager import WebhookManager
+from .server import WebhookServer
+
+# Без заданного секрета токены проверки генерируются при каждом
+# запуске: вебхук всё равно переустанавливается при старте бота.
+_webhook_manager: Final[WebhookManager] = WebhookManager(
+    server=WebhookServer(
+        host=WEBHOOK_HOST,
+        port=WEBHOOK_PORT,
+        path=WEBHOOK_PATH,
+        queue_size=WEBHOOK_QUEUE_SIZE,
+        workers=WEBHOOK_WORKERS,
+    ),
+    base_url=WEBHOOK_BASE_URL,
+    secret=WEBHOOK_SECRET or secrets.token_hex(32),
+)
+
+
+def get_webhook_manager() -> WebhookManager:
+    """
+    Возвращает глобальный экземпляр WebhookManager.
+
+    Returns
+    -------
+    WebhookManager
+        Экземпляр менеджера вебхуков, используемый приложением.
+    """
+    return _webhook_manager
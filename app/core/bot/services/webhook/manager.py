@@ -0,0 +1,224 @@
+"""
+Модуль для управления ботами, получающими обновления через вебхуки.
+
+Содержит класс WebhookManager с тем же интерфейсом, что и у
+PollingManager: запуск, остановка и проверка активных ботов.
+"""
+
+import asyncio
+from asyncio import Task
+from typing import Any, Awaitable, Callable
+
+from aiogram import Bot
+from aiogram.dispatcher.dispatcher import Dispatcher
+from aiogram.types import User
+from loguru import logger
+
+from app.core.bot.services.session import create_bot
+
+from .server import WebhookRoute, WebhookServer, bot_key, bot_secret
+
+
+class WebhookManager:
+    """Менеджер для запуска и контроля ботов в режиме вебхуков."""
+
+    def __init__(
+        self,
+        server: WebhookServer,
+        base_url: str,
+        secret: str,
+    ) -> None:
+        """
+        Инициализация менеджера.
+
+        Parameters
+        ----------
+        server : WebhookServer
+            Общий сервер вебхуков.
+        base_url : str
+            Публичный HTTPS-адрес сервера.
+        secret : str
+            Общий секрет для секретных токенов ботов.
+        """
+        self.server: WebhookServer = server
+        self.base_url: str = base_url.rstrip("/")
+        self.secret: str = secret
+
+        self.tasks: dict[str, Task] = {}
+        self.api_to_bot_id: dict[str, int] = {}
+
+    def active_bots_count(self) -> int:
+        """
+        Возвращает количество активных ботов.
+
+        Returns
+        -------
+        int
+            Количество ботов, которые в данный момент запущены.
+        """
+        return len(self.tasks)
+
+    def active_api_tokens(self) -> list[str]:
+        """
+        Возвращает список токенов API активных ботов.
+
+        Returns
+        -------
+        list[str]
+            Список токенов API.
+        """
+        return list(self.tasks.keys())
+
+    def start_bot_webhook(
+        self,
+        dp: Dispatcher,
+        api_token: str,
+        allowed_updates: list[str] | None = None,
+        drop_pending_updates: bool = False,
+        on_bot_startup: Callable[[Bot], Awaitable[Any]] | None = None,
+        on_bot_shutdown: Callable[[Bot], Awaitable[Any]] | None = None,
+    ) -> Task[None]:
+        """
+        Регистрирует вебхук бота в отдельной асинхронной задаче.
+
+        Parameters
+        ----------
+        dp : Dispatcher
+            Диспетчер Aiogram для обработки апдейтов.
+        api_token : str
+            Токен API бота.
+        allowed_updates : list[str], optional
+            Список разрешенных типов апдейтов. По умолчанию
+            определяется по зарегистрированным обработчикам.
+        drop_pending_updates : bool, optional
+            Сбросить накопленные на сервере Telegram апдейты.
+        on_bot_startup : Callable[[Bot], Awaitable[Any]], optional
+            Функция запуска бота.
+        on_bot_shutdown : Callable[[Bot], Awaitable[Any]], optional
+            Функция завершения работы бота.
+
+        Returns
+        -------
+        Task[None]
+            Задача бота; завершается при остановке бота.
+        """
+        if self.is_bot_running(api_token):
+            return self.tasks[api_token]
+
+        task: Task[None] = asyncio.create_task(
+            self._run_webhook(
+                dp=dp,
+                api_token=api_token,
+                allowed_updates=allowed_updates,
+                drop_pending_updates=drop_pending_updates,
+                on_bot_startup=on_bot_startup,
+                on_bot_shutdown=on_bot_shutdown,
+            )
+        )
+        self.tasks[api_token] = task
+        return task
+
+    async def _run_webhook(
+        self,
+        dp: Dispatcher,
+        api_token: str,
+        allowed_updates: list[str] | None,
+        drop_pending_updates: bool,
+        on_bot_startup: Callable[[Bot], Awaitable[Any]] | None = None,
+        on_bot_shutdown: Callable[[Bot], Awaitable[Any]] | None = None,
+    ) -> None:
+        """
+        Регистрирует вебхук и держит бота активным до остановки.
+
+        Parameters
+        ----------
+        dp : Dispatcher
+            Диспетчер Aiogram для апдейтов.
+        api_token : str
+            Токен API бота.
+        allowed_updates : list[str] | None
+            Разрешенные апдейты.
+        drop_pending_updates : bool
+            Сбросить накопленные апдейты.
+        on_bot_startup : Callable[[Bot], Awaitable[Any]] | None
+            Функция запуска.
+        on_bot_shutdown : Callable[[Bot], Awaitable[Any]] | None
+            Функция остановки.
+        """
+        key: str = bot_key(api_token)
+        # Бот использует общую HTTP-сессию, поэтому не закрывается
+        # через async with
+        bot: Bot = create_bot(api_token)
+        try:
+            if not self.base_url:
+                raise RuntimeError("Не задан WEBHOOK_BASE_URL")
+
+            secret: str = bot_secret(self.secret, api_token)
+            await self.server.add_route(
+                key, WebhookRoute(bot=bot, dp=dp, secret=secret)
+            )
+            await bot.set_webhook(
+                url=self.base_url + self.server.route_path(key),
+                secret_token=secret,
+                allowed_updates=(
+                    allowed_updates or dp.resolve_used_update_types()
+                ),
+                drop_pending_updates=drop_pending_updates,
+            )
+
+            user: User = await bot.me()
+            self.api_to_bot_id[api_token] = user.id
+
+            if on_bot_startup:
+                await on_bot_startup(bot)
+
+            # Обновления приходят через сервер до отмены задачи
+            await asyncio.Event().wait()
+
+        except Exception as error:
+            logger.exception(
+                "Unexpected error in webhook task for token "
+                f"{api_token}: {error}"
+            )
+
+        finally:
+            await self.server.remove_route(key)
+            try:
+                await bot.delete_webhook()
+            except Exception as error:
+                logger.warning(f"Не удалось удалить вебхук: {error}")
+
+            if on_bot_shutdown:
+                await on_bot_shutdown(bot)
+            self.tasks.pop(api_token, None)
+            self.api_to_bot_id.pop(api_token, None)
+
+    def stop_bot_webhook(self, api_token: str) -> None:
+        """
+        Останавливает бота по токену API и удаляет его вебхук.
+
+        Parameters
+        ----------
+        api_token : str
+            Токен API бота.
+        """
+        task: Task[Any] | None = self.tasks.get(api_token)
+        if task and not task.done():
+            task.cancel()
+
+    def is_bot_running(self, api_token: str) -> bool:
+        """
+        Проверяет, запущен ли бот.
+
+        Parameters
+        ----------
+        api_token : str
+            Токен API бота.
+
+        Returns
+        -------
+        bool
+            True, если бот запущен, иначе False.
+        """
+        task: Task[Any] | None = self.tasks.get(api_token)
+        return task is not None and not task.done()
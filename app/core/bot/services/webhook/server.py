@@ -0,0 +1,257 @@
+"""
+Модуль HTTP-сервера для приёма вебхуков Telegram.
+
+Содержит класс WebhookServer: один aiohttp-сервер обслуживает
+несколько ботов на одном порту (у каждого свой путь и секретный
+токен), складывает обновления в ограниченную очередь и обрабатывает
+их пулом воркеров.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import secrets
+from asyncio import Task
+from dataclasses import dataclass
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Update
+from aiohttp import web
+from loguru import logger
+
+# Заголовок, в котором Telegram передаёт секретный токен
+SECRET_HEADER: str = "X-Telegram-Bot-Api-Secret-Token"
+
+
+@dataclass(slots=True)
+class WebhookRoute:
+    """Маршрут вебхука одного бота.
+
+    Атрибуты:
+        bot (Bot): Экземпляр бота.
+        dp (Dispatcher): Диспетчер для обработки обновлений.
+        secret (str): Секретный токен для проверки запросов.
+    """
+    bot: Bot
+    dp: Dispatcher
+    secret: str
+
+
+def bot_key(
+    api_token: str,
+) -> str:
+    """
+    Возвращает ключ бота для пути вебхука.
+
+    Токен не попадает в URL: путь строится из его хэша.
+
+    Args:
+        api_token (str): Токен API бота.
+
+    Returns:
+        str: Ключ бота.
+    """
+    return hashlib.sha256(api_token.encode()).hexdigest()[:32]
+
+
+def bot_secret(
+    secret: str,
+    api_token: str,
+) -> str:
+    """
+    Возвращает секретный токен вебхука для бота.
+
+    Args:
+        secret (str): Общий секрет приложения.
+        api_token (str): Токен API бота.
+
+    Returns:
+        str: Секретный токен (допустимые для Telegram символы).
+    """
+    return hmac.new(
+        secret.encode(),
+        api_token.encode(),
+        hashlib.sha256,
+    ).hexdigest()
+
+
+class WebhookServer:
+    """Сервер вебхуков с очередью обновлений и пулом воркеров."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        path: str,
+        queue_size: int,
+        workers: int,
+    ) -> None:
+        """
+        Инициализация сервера.
+
+        Args:
+            host (str): Адрес для прослушивания.
+            port (int): Порт для прослушивания.
+            path (str): Префикс пути вебхуков.
+            queue_size (int): Максимальный размер очереди обновлений.
+            workers (int): Количество воркеров обработки.
+        """
+        self.host: str = host
+        self.port: int = port
+        self.path: str = "/" + path.strip("/")
+        self.workers: int = workers
+
+        self.routes: dict[str, WebhookRoute] = {}
+        self.queue: asyncio.Queue[tuple[WebhookRoute, Update]] = (
+            asyncio.Queue(maxsize=queue_size)
+        )
+
+        self._runner: web.AppRunner | None = None
+        self._tasks: list[Task[None]] = []
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def route_path(
+        self,
+        key: str,
+    ) -> str:
+        """
+        Возвращает путь вебхука бота.
+
+        Args:
+            key (str): Ключ бота.
+
+        Returns:
+            str: Путь вебхука.
+        """
+        return f"{self.path}/{key}"
+
+    async def add_route(
+        self,
+        key: str,
+        route: WebhookRoute,
+    ) -> None:
+        """
+        Регистрирует бота и запускает сервер, если он не запущен.
+
+        Args:
+            key (str): Ключ бота.
+            route (WebhookRoute): Маршрут бота.
+        """
+        async with self._lock:
+            self.routes[key] = route
+            if self._runner is None:
+                await self._start()
+
+    async def remove_route(
+        self,
+        key: str,
+    ) -> None:
+        """
+        Удаляет бота и останавливает сервер, если ботов не осталось.
+
+        Args:
+            key (str): Ключ бота.
+        """
+        async with self._lock:
+            self.routes.pop(key, None)
+            if not self.routes and self._runner is not None:
+                await self._stop()
+
+    async def _start(self) -> None:
+        """Запускает HTTP-сервер и воркеры."""
+        app = web.Application()
+        app.router.add_post(self.route_path("{key}"), self._handle)
+
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, self.host, self.port).start()
+        self._runner = runner
+
+        self._tasks = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.workers)
+        ]
+        logger.debug(
+            f"Сервер вебхуков запущен на {self.host}:{self.port}"
+        )
+
+    async def _stop(
+        self,
+        drain_timeout: float = 10.0,
+    ) -> None:
+        """
+        Останавливает приём запросов и дожидается обработки очереди.
+
+        Args:
+            drain_timeout (float): Максимальное время ожидания
+                обработки оставшихся обновлений в секундах.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Не обработано обновлений вебхуков: {self.queue.qsize()}"
+            )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.debug("Сервер вебхуков остановлен")
+
+    async def _handle(
+        self,
+        request: web.Request,
+    ) -> web.Response:
+        """
+        Принимает обновление и ставит его в очередь.
+
+        Args:
+            request (web.Request): Входящий запрос Telegram.
+
+        Returns:
+            web.Response: 200 при успехе, 503 при переполнении очереди
+                (Telegram повторит доставку позже), иначе код ошибки.
+        """
+        route: WebhookRoute | None = self.routes.get(
+            request.match_info["key"]
+        )
+        if route is None:
+            return web.Response(status=404)
+
+        if not secrets.compare_digest(
+            request.headers.get(SECRET_HEADER, ""),
+            route.secret,
+        ):
+            return web.Response(status=401)
+
+        try:
+            update: Update = Update.model_validate(
+                await request.json(),
+                context={"bot": route.bot},
+            )
+        except ValueError:
+            return web.Response(status=400)
+
+        try:
+            self.queue.put_nowait((route, update))
+        except asyncio.QueueFull:
+            logger.warning("Очередь вебхуков переполнена")
+            return web.Response(status=503)
+
+        return web.Response()
+
+    async def _worker(self) -> None:
+        """Воркер, передающий обновления из очереди в диспетчер."""
+        while True:
+            route, update = await self.queue.get()
+            try:
+                await route.dp.feed_update(route.bot, update)
+            except Exception as error:
+                logger.exception(f"Ошибка обработки вебхука: {error}")
+            finally:
+                self.queue.task_done()
@@ -3,12 +3,15 @@
 """
 
 from .guards import ensure
-from .morphology import cap_words, fix_o, inflect_text, lower_words
+from .morphology import (cap_words, fix_o, inflect_many, inflect_text,
+                         lower_words, prewarm_inflections)
 
 __all__: list[str] = [
     "ensure",
     "cap_words",
     "fix_o",
+    "inflect_many",
     "inflect_text",
     "lower_words",
+    "prewarm_inflections",
 ]
@@ -4,12 +4,14 @@
 """
 
 from .casing import cap_words, lower_words
-from .inflection import inflect_text
+from .inflection import inflect_many, inflect_text, prewarm_inflections
 from .prepositions import fix_o
 
 __all__: list[str] = [
     "cap_words",
     "lower_words",
+    "inflect_many",
     "inflect_text",
+    "prewarm_inflections",
     "fix_o",
 ]
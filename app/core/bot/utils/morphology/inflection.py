@@ -1,9 +1,17 @@
-from typing import Any
+import asyncio
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-import pymorphy3
+if TYPE_CHECKING:
+    import pymorphy3
 
-# Создаем экземпляр морфологического анализатора
-morph: pymorphy3.MorphAnalyzer = pymorphy3.MorphAnalyzer()
+# Морфологический анализатор загружает словарь при создании, поэтому
+# создаётся при первом склонении или фоновом прогреве, а не при импорте
+_morph: "pymorphy3.MorphAnalyzer | None" = None
+_morph_lock: threading.Lock = threading.Lock()
 
 # Сопоставление падежей с кодами pymorphy3
 CASES: dict[str, str] = {
@@ -15,6 +23,43 @@ CASES: dict[str, str] = {
     "предложный": "loct"
 }
 
+# Размер кэшей разборов слов и склонённых фраз. Склоняются названия
+# шагов анкеты, поэтому различных значений немного
+CACHE_SIZE: int = 4096
+
+# Склонённые фразы по паре (текст, код падежа). Заполняются в пуле
+# потоков, а читаются в цикле событий, поэтому защищены блокировкой
+_phrases: OrderedDict[tuple[str, str], str] = OrderedDict()
+_phrases_lock: threading.Lock = threading.Lock()
+
+
+def get_morph() -> "pymorphy3.MorphAnalyzer":
+    """
+    Возвращает морфологический анализатор, при первом вызове создавая
+    его.
+
+    Потокобезопасно: словарь загружается один раз, даже если первые
+    вызовы пришли из нескольких потоков.
+
+    Returns:
+        Общий экземпляр pymorphy3.MorphAnalyzer.
+    """
+    global _morph
+    if _morph is None:
+        with _morph_lock:
+            if _morph is None:
+                import pymorphy3
+                _morph = pymorphy3.MorphAnalyzer()
+    return _morph
+
+
+async def warm_up_morph() -> None:
+    """
+    Загружает словарь анализатора в пуле потоков, не блокируя цикл
+    событий.
+    """
+    await asyncio.to_thread(get_morph)
+
 
 async def inflect_text(
     text: str,
@@ -24,6 +69,9 @@ async def inflect_text(
     Склоняет существительные и согласованные прилагательные
     в предложении в указанный падеж.
 
+    Результат кэшируется по паре (текст, падеж); при промахе кэша
+    фраза склоняется в пуле потоков, не блокируя цикл событий.
+
     Args:
         text: Исходная строка с одним или несколькими словами.
         case: Название падежа на русском языке.
@@ -35,30 +83,174 @@ async def inflect_text(
     case_code: str | None = CASES.get(case)
     if not case_code:
         return f"Неизвестный падеж: {case}"
+    return (await _inflect_all([text], case_code))[0]
+
+
+async def inflect_many(
+    texts: Iterable[str],
+    case: str
+) -> list[str]:
+    """
+    Склоняет несколько фраз в указанный падеж за один проход.
+
+    Фразы, которых нет в кэше, склоняются одной задачей в пуле
+    потоков; повторяющиеся фразы и слова разбираются один раз.
+
+    Args:
+        texts: Исходные фразы.
+        case: Название падежа на русском языке.
+
+    Returns:
+        Склонённые фразы в исходном порядке.
+    """
+    phrases: list[str] = list(texts)
+    case_code: str | None = CASES.get(case)
+    if not case_code:
+        return [f"Неизвестный падеж: {case}" for _ in phrases]
+    return await _inflect_all(phrases, case_code)
+
+
+async def prewarm_inflections(
+    texts: Iterable[str]
+) -> int:
+    """
+    Заранее склоняет фразы во все падежи в пуле потоков и кладёт их
+    в кэш.
+
+    Args:
+        texts: Фразы, например названия шагов анкеты.
+
+    Returns:
+        Количество склонённых фраз в кэше.
+    """
+    phrases: list[str] = list(dict.fromkeys(texts))
+    for case_code in CASES.values():
+        await _inflect_all(phrases, case_code)
+    return len(_phrases)
+
+
+async def _inflect_all(
+    texts: list[str],
+    case_code: str
+) -> list[str]:
+    """
+    Склоняет фразы в падеж, выполняя промахи кэша в пуле потоков.
+
+    Args:
+        texts: Исходные фразы.
+        case_code: Код падежа pymorphy3.
 
-    def choose_best_parse(word: str) -> Any:
-        """
-        Выбирает лучший разбор слова среди возможных.
-        Предпочтение отдаётся существительным и прилагательным
-        в именительном падеже.
-        """
-        parses: list[Any] = morph.parse(word)
-        for p in parses:
-            if "NOUN" in p.tag and "nomn" in p.tag:
-                return p
-            if "ADJF" in p.tag and "nomn" in p.tag:
-                return p
-        return parses[0]
-
-    def preserve_case(original: str, new: str) -> str:
-        """
-        Сохраняет регистр букв исходного слова при склонении.
-        """
-        return "".join(
-            n.upper() if o.isupper() else n.lower()
-            for o, n in zip(original, new)
-        ) + new[len(original):]
+    Returns:
+        Склонённые фразы в исходном порядке.
+    """
+    results: dict[str, str] = {}
+    misses: list[str] = []
+    for text in dict.fromkeys(texts):
+        cached: str | None = _cached(text, case_code)
+        if cached is None:
+            misses.append(text)
+        else:
+            results[text] = cached
+
+    if misses:
+        # Загрузка словаря и разбор слов блокируют поток, поэтому
+        # все промахи склоняются одной задачей вне цикла событий
+        inflected: list[str] = await asyncio.to_thread(
+            _inflect_batch, misses, case_code
+        )
+        results.update(zip(misses, inflected))
+    return [results[text] for text in texts]
+
+
+def _cached(
+    text: str,
+    case_code: str
+) -> str | None:
+    """
+    Возвращает склонённую фразу из кэша.
+
+    Args:
+        text: Исходная фраза.
+        case_code: Код падежа pymorphy3.
+
+    Returns:
+        Склонённая фраза или None, если её нет в кэше.
+    """
+    key: tuple[str, str] = (text, case_code)
+    with _phrases_lock:
+        value: str | None = _phrases.get(key)
+        if value is not None:
+            _phrases.move_to_end(key)
+    return value
+
+
+def _inflect_batch(
+    texts: list[str],
+    case_code: str
+) -> list[str]:
+    """
+    Склоняет фразы в падеж и кладёт результаты в кэш.
+
+    Выполняется в пуле потоков.
+
+    Args:
+        texts: Исходные фразы.
+        case_code: Код падежа pymorphy3.
+
+    Returns:
+        Склонённые фразы в исходном порядке.
+    """
+    inflected: list[str] = [_inflect(text, case_code) for text in texts]
+    with _phrases_lock:
+        for text, value in zip(texts, inflected):
+            _phrases[(text, case_code)] = value
+            _phrases.move_to_end((text, case_code))
+        while len(_phrases) > CACHE_SIZE:
+            _phrases.popitem(last=False)
+    return inflected
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def choose_best_parse(word: str) -> Any:
+    """
+    Выбирает лучший разбор слова среди возможных.
+    Предпочтение отдаётся существительным и прилагательным
+    в именительном падеже.
+    """
+    parses: list[Any] = get_morph().parse(word)
+    for p in parses:
+        if "NOUN" in p.tag and "nomn" in p.tag:
+            return p
+        if "ADJF" in p.tag and "nomn" in p.tag:
+            return p
+    return parses[0]
+
+
+def _preserve_case(original: str, new: str) -> str:
+    """
+    Сохраняет регистр букв исходного слова при склонении.
+    """
+    return "".join(
+        n.upper() if o.isupper() else n.lower()
+        for o, n in zip(original, new)
+    ) + new[len(original):]
 
+
+def _inflect(
+    text: str,
+    case_code: str
+) -> str:
+    """
+    Склоняет фразу в падеж с кодом pymorphy3.
+
+    Args:
+        text: Исходная строка с одним или несколькими словами.
+        case_code: Код падежа pymorphy3.
+
+    Returns:
+        Склонённая строка или исходная, если в ней нет
+        существительного.
+    """
     words: list[str] = text.split()
     parsed: list[Any] = [choose_best_parse(w) for w in words]
 
@@ -103,7 +295,7 @@ async def inflect_text(
 
             inflected: Any | None = parse.inflect(tags)
             new_word: str = inflected.word if inflected else word
-            result.append(preserve_case(word, new_word))
+            result.append(_preserve_case(word, new_word))
         else:
             result.append(word)
 
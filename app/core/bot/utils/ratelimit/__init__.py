@@ -0,0 +1,9 @@
+"""
+Пакет утилит ограничения частоты запросов.
+"""
+
+from .bucket import TokenBucket
+
+__all__: list[str] = [
+    "TokenBucket",
+]
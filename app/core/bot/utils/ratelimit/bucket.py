@@ -0,0 +1,143 @@
+"""
+Модуль ограничителя частоты запросов.
+
+Содержит класс TokenBucket: токены пополняются с постоянной скоростью
+до ёмкости корзины, каждый запрос забирает токен. Пустая корзина
+заставляет запрос подождать, поэтому средняя частота не превышает
+квоты, а короткие всплески укладываются в ёмкость.
+"""
+
+import asyncio
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Асинхронный ограничитель частоты по алгоритму token bucket."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Инициализация ограничителя.
+
+        Args:
+            rate (float): Скорость пополнения (токенов в секунду).
+            capacity (float): Ёмкость корзины (размер всплеска).
+            clock (Callable[[], float]): Источник монотонного времени
+                в секундах.
+
+        Raises:
+            ValueError: Скорость или ёмкость не положительны.
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Скорость и ёмкость должны быть больше 0")
+
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.clock: Callable[[], float] = clock
+
+        self._tokens: float = capacity
+        self._updated: float = clock()
+        # Ожидающие запросы обслуживаются по очереди
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """
+        Количество доступных токенов на текущий момент.
+
+        Returns:
+            float: Количество токенов.
+        """
+        self._refill()
+        return self._tokens
+
+    def try_acquire(
+        self,
+        tokens: float = 1,
+    ) -> bool:
+        """
+        Забирает токены без ожидания.
+
+        Args:
+            tokens (float): Количество токенов.
+
+        Returns:
+            bool: True, если токены получены.
+        """
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    async def acquire(
+        self,
+        tokens: float = 1,
+    ) -> float:
+        """
+        Забирает токены, при необходимости дожидаясь пополнения.
+
+        Args:
+            tokens (float): Количество токенов (не больше ёмкости).
+
+        Returns:
+            float: Время ожидания в секундах.
+        """
+        tokens = min(tokens, self.capacity)
+        waited: float = 0.0
+        async with self._lock:
+            while not self.try_acquire(tokens):
+                delay: float = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+        return waited
+
+    def penalize(
+        self,
+        seconds: float,
+    ) -> None:
+        """
+        Опустошает корзину на заданное время.
+
+        Используется, когда сервер ответил превышением квоты:
+        следующие запросы подождут не меньше seconds.
+
+        Args:
+            seconds (float): Время до появления первого токена.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    def set_rate(
+        self,
+        rate: float,
+    ) -> None:
+        """
+        Меняет скорость пополнения.
+
+        Токены, накопленные по старой скорости, сохраняются.
+
+        Args:
+            rate (float): Новая скорость (токенов в секунду).
+
+        Raises:
+            ValueError: Скорость не положительна.
+        """
+        if rate <= 0:
+            raise ValueError("Скорость должна быть больше 0")
+        self._refill()
+        self.rate = rate
+
+    def _refill(self) -> None:
+        """Пополняет корзину за прошедшее время."""
+        now: float = self.clock()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate,
+        )
+        self._updated = now
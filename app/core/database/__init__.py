@@ -1,26 +1,47 @@
 """
 Пакет базы данных.
 
-Содержит асинхронный движок, фабрику сессий, инициализацию базы данных
-и все модели.
+Содержит асинхронный движок, фабрику сессий, инициализацию базы данных,
+хранилище файлов и все модели.
 """
 
 from .engine import async_session
 from .init_db import init_db
-from .managers import AdminManager, DataManager, FlagManager, UserManager
-from .models import Admin, Data, Flag, User, UserFile
+from .managers import (AdminManager, BroadcastManager, DataManager,
+                       FileManager, FlagManager, MediaManager, OutboxManager,
+                       ProfileManager, SearchManager, SheetRowManager,
+                       StatManager, UserManager)
+from .models import (Admin, Broadcast, Data, Flag, Media, SearchDoc,
+                     SheetOutbox, SheetRow, StatCounter, User, UserFile)
+from .storage import BlobStore, get_blob_store
 
 # Список публичных объектов пакета
 __all__: list[str] = [
     "async_session",
     "init_db",
     "AdminManager",
+    "BroadcastManager",
     "DataManager",
+    "FileManager",
     "FlagManager",
+    "MediaManager",
+    "OutboxManager",
+    "ProfileManager",
+    "SearchManager",
+    "SheetRowManager",
+    "StatManager",
     "UserManager",
     "Admin",
+    "Broadcast",
     "Data",
     "UserFile",
     "Flag",
+    "Media",
+    "SearchDoc",
+    "SheetOutbox",
+    "SheetRow",
+    "StatCounter",
     "User",
+    "BlobStore",
+    "get_blob_store",
 ]
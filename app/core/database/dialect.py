@@ -0,0 +1,36 @@
+"""
+Модуль диалект-зависимых конструкций SQLAlchemy.
+
+Предоставляет конструктор INSERT с поддержкой ON CONFLICT для SQLite и
+PostgreSQL, чтобы менеджеры могли выполнять upsert одним запросом.
+"""
+
+from typing import Any, Callable
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Конструкторы INSERT ... ON CONFLICT для поддерживаемых диалектов
+UPSERT_INSERTS: dict[str, Callable[..., Any]] = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def upsert_insert(
+    session: AsyncSession,
+) -> Callable[..., Any] | None:
+    """
+    Возвращает конструктор INSERT с поддержкой ON CONFLICT.
+
+    Args:
+        session (AsyncSession): Сессия, по движку которой определяется
+            диалект базы данных.
+
+    Returns:
+        Callable[..., Any] | None: Функция insert диалекта или None,
+            если диалект не поддерживает upsert.
+    """
+    if session.bind is None:
+        return None
+    return UPSERT_INSERTS.get(session.bind.dialect.name)
@@ -1,13 +1,15 @@
 """
 Модуль инициализации базы данных.
 
-Создает таблицы при их отсутствии с использованием метаданных моделей.
+Создает таблицы при их отсутствии с использованием метаданных моделей
+и применяет миграции к существующей базе данных.
 """
 
 from loguru import logger
 from sqlalchemy.exc import SQLAlchemyError
 
 from .engine import engine
+from .migrations import apply_migrations
 from .models import Base
 
 
@@ -15,7 +17,8 @@ async def init_db() -> None:
     """Инициализация базы данных.
 
     Создает все таблицы, если их ещё нет, используя метаданные всех
-    моделей, наследующих Base.
+    моделей, наследующих Base, и применяет миграции (например,
+    уникальные индексы) к уже существующим таблицам.
 
     Raises:
         SQLAlchemyError: Ошибка при создании таблиц базы данных.
@@ -24,6 +27,7 @@ async def init_db() -> None:
         async with engine.begin() as conn:
             # Base.metadata содержит информацию обо всех моделях
             await conn.run_sync(Base.metadata.create_all)
+            await apply_migrations(conn)
         logger.debug("База данных инициализирована")
     except SQLAlchemyError as error:
         logger.error(
@@ -3,18 +3,35 @@
 
 Модуль предоставляет единый доступ ко всем менеджерам, обеспечивая
 CRUD и вспомогательные операции для работы с таблицами:
-Admin, Data, Flag и User.
+Admin, Broadcast, Data, Flag, Media, SearchDoc, SheetOutbox, SheetRow,
+StatCounter, User, UserFile и таблицы профилей участников.
 """
 
 from .admin import AdminManager
+from .broadcast import BroadcastManager
 from .data import DataManager
+from .file import FileManager
 from .flag import FlagManager
+from .media import MediaManager
+from .outbox import OutboxManager
+from .profile import ProfileManager
+from .search import SearchManager
+from .sheet_row import SheetRowManager
+from .stat import StatManager
 from .user import UserManager
 
 # Список менеджеров, доступных для импорта через '*'
 __all__: list[str] = [
     "AdminManager",
+    "BroadcastManager",
     "DataManager",
+    "FileManager",
     "FlagManager",
+    "MediaManager",
+    "OutboxManager",
+    "ProfileManager",
+    "SearchManager",
+    "SheetRowManager",
+    "StatManager",
     "UserManager",
 ]
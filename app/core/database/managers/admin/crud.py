@@ -1,8 +1,8 @@
 """
 CRUD-операции для работы с таблицей администраторов.
 
-Содержит методы для создания, получения и удаления администраторов
-в базе данных.
+Содержит методы для создания, получения, перечисления и удаления
+администраторов в базе данных.
 """
 
 from loguru import logger
@@ -43,6 +43,28 @@ class AdminCRUD(AdminManagerBase):
             logger.error(f"Ошибка при получении администратора: {e}")
             return None
 
+    async def all(
+        self,
+        bot_id: int,
+    ) -> list[Admin]:
+        """
+        Получить всех администраторов бота.
+
+        Args:
+            bot_id (int): ID бота.
+
+        Returns:
+            list[Admin]: Администраторы в порядке добавления.
+        """
+        try:
+            result = await self.session.scalars(
+                select(Admin).where(Admin.bot_id == bot_id).order_by(Admin.id)
+            )
+            return list(result)
+        except SQLAlchemyError as e:
+            logger.error(f"Ошибка при получении администраторов: {e}")
+            return []
+
     async def create(
         self,
         tg_id: int,
@@ -52,6 +74,7 @@ class AdminCRUD(AdminManagerBase):
         text: str = "Нет текста",
         entities: str = "None",
         msg_id: int = 0,
+        role: str = "moderator",
     ) -> Admin:
         """
         Создать нового администратора.
@@ -64,6 +87,7 @@ class AdminCRUD(AdminManagerBase):
             text (str): Текст сообщения администратора.
             entities (str): Сущности сообщения.
             msg_id (int): ID сообщения.
+            role (str): Роль администратора.
 
         Returns:
             Admin: Созданный объект администратора.
@@ -76,6 +100,7 @@ class AdminCRUD(AdminManagerBase):
             text=text,
             entities=entities,
             msg_id=msg_id,
+            role=role,
             state="1",
         )
         # Добавляем администратора в сессию и сохраняем изменения
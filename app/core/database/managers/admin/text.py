@@ -17,6 +17,7 @@ class AdminText(AdminCRUD):
         tg_id: int,
         bot_id: int,
         new_text: str,
+        entities: str | None = None,
     ) -> bool:
         """
         Обновить текст администратора.
@@ -25,6 +26,8 @@ class AdminText(AdminCRUD):
             tg_id (int): Telegram ID администратора.
             bot_id (int): ID бота.
             new_text (str): Новый текст администратора.
+            entities (str | None): Сущности текста в JSON (None — не
+                менять).
 
         Returns:
             bool: True, если текст успешно обновлён, иначе False.
@@ -37,6 +40,8 @@ class AdminText(AdminCRUD):
             return False
 
         admin.text = new_text
+        if entities is not None:
+            admin.entities = entities
 
         # Сохраняем изменения в базе данных
         await self.session.commit()
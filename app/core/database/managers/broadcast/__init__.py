@@ -0,0 +1,19 @@
+"""
+Инициализация менеджера рассылок.
+
+Объединяет функциональные возможности для работы с таблицей
+Broadcast: задания рассылок, их прогресс и выборку получателей.
+"""
+
+from .crud import BroadcastCRUD
+
+
+class BroadcastManager(BroadcastCRUD):
+    """
+    Полнофункциональный менеджер для работы с рассылками.
+
+    Наследуемые классы:
+        BroadcastCRUD: Предоставляет CRUD-операции с рассылками.
+    """
+    pass
+
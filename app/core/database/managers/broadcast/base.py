@@ -0,0 +1,26 @@
+"""
+Базовый класс менеджера рассылок.
+
+Содержит общую функциональность для работы с таблицей Broadcast
+через асинхронную сессию SQLAlchemy.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class BroadcastManagerBase:
+    """Базовый менеджер для работы с таблицей Broadcast."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+    ) -> None:
+        """
+        Инициализация менеджера рассылок.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия для работы
+                с базой данных.
+        """
+        # Сохраняем сессию для дальнейшей работы с БД
+        self.session: AsyncSession = session
@@ -0,0 +1,241 @@
+"""
+CRUD-операции для таблицы Broadcast.
+
+Содержит методы для создания заданий рассылки, сохранения их
+прогресса и постраничной выборки получателей по курсору ID.
+"""
+
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import func, select, update
+
+from ...models import Broadcast, User
+from ...models.broadcast import STATUS_DRAFT, STATUS_RUNNING
+from .base import BroadcastManagerBase
+
+
+class BroadcastCRUD(BroadcastManagerBase):
+    """Класс для выполнения CRUD-операций с рассылками."""
+
+    async def create(
+        self,
+        bot_id: int,
+        admin_tg_id: int,
+        text: str,
+        entities: str = "None",
+        lang: str = "ru",
+        progress_msg_id: int | None = None,
+    ) -> Broadcast:
+        """
+        Создать задание рассылки по всем пользователям бота.
+
+        Args:
+            bot_id (int): ID бота.
+            admin_tg_id (int): Telegram ID администратора.
+            text (str): Текст рассылки.
+            entities (str): Разметка текста в JSON.
+            lang (str): Язык администратора.
+            progress_msg_id (int | None): ID сообщения, в котором
+                показывается прогресс.
+
+        Returns:
+            Broadcast: Созданное задание.
+        """
+        total: int = await self.session.scalar(
+            select(func.count(User.id)).where(User.bot_id == bot_id)
+        ) or 0
+        job = Broadcast(
+            bot_id=bot_id,
+            admin_tg_id=admin_tg_id,
+            text=text,
+            entities=entities,
+            lang=lang,
+            status=STATUS_RUNNING,
+            total=total,
+            progress_msg_id=progress_msg_id,
+        )
+        self.session.add(job)
+        await self.session.commit()
+        return job
+
+    async def draft(
+        self,
+        bot_id: int,
+        admin_tg_id: int,
+    ) -> Broadcast | None:
+        """
+        Получить черновик рассылки администратора.
+
+        Args:
+            bot_id (int): ID бота.
+            admin_tg_id (int): Telegram ID администратора.
+
+        Returns:
+            Broadcast | None: Черновик или None, если текст не задан.
+        """
+        return await self.session.scalar(
+            select(Broadcast)
+            .where(
+                Broadcast.bot_id == bot_id,
+                Broadcast.admin_tg_id == admin_tg_id,
+                Broadcast.status == STATUS_DRAFT,
+            )
+            .order_by(Broadcast.id.desc())
+            .limit(1)
+        )
+
+    async def save_draft(
+        self,
+        bot_id: int,
+        admin_tg_id: int,
+        text: str,
+        entities: str = "None",
+    ) -> Broadcast:
+        """
+        Сохранить черновик рассылки администратора.
+
+        Черновики хранятся отдельно от таблицы admin, поэтому
+        сохранение текста не создаёт записей администраторов.
+
+        Args:
+            bot_id (int): ID бота.
+            admin_tg_id (int): Telegram ID администратора.
+            text (str): Текст рассылки.
+            entities (str): Разметка текста в JSON.
+
+        Returns:
+            Broadcast: Сохранённый черновик.
+        """
+        job: Broadcast | None = await self.draft(bot_id, admin_tg_id)
+        if job is None:
+            job = Broadcast(
+                bot_id=bot_id,
+                admin_tg_id=admin_tg_id,
+                status=STATUS_DRAFT,
+            )
+            self.session.add(job)
+        job.text = text
+        job.entities = entities
+        await self.session.commit()
+        return job
+
+    async def get(
+        self,
+        job_id: int,
+    ) -> Broadcast | None:
+        """
+        Получить задание рассылки по ID.
+
+        Args:
+            job_id (int): ID задания.
+
+        Returns:
+            Broadcast | None: Задание или None, если не найдено.
+        """
+        return await self.session.get(Broadcast, job_id)
+
+    async def active(
+        self,
+        bot_id: int | None = None,
+    ) -> list[Broadcast]:
+        """
+        Получить незавершённые рассылки.
+
+        Args:
+            bot_id (int | None): ID бота (None — всех ботов).
+
+        Returns:
+            list[Broadcast]: Задания в порядке создания.
+        """
+        stmt = select(Broadcast).where(Broadcast.status == STATUS_RUNNING)
+        if bot_id is not None:
+            stmt = stmt.where(Broadcast.bot_id == bot_id)
+        result = await self.session.scalars(stmt.order_by(Broadcast.id))
+        return list(result)
+
+    async def recipients(
+        self,
+        bot_id: int,
+        after_id: int,
+        limit: int,
+    ) -> list[tuple[int, int]]:
+        """
+        Получить следующую страницу получателей по курсору.
+
+        Выборка идёт по первичному ключу (WHERE id > after_id), поэтому
+        стоимость страницы не растёт с её номером, а пользователи,
+        зарегистрированные во время рассылки, тоже её получат.
+
+        Args:
+            bot_id (int): ID бота.
+            after_id (int): ID последнего обработанного пользователя.
+            limit (int): Размер страницы.
+
+        Returns:
+            list[tuple[int, int]]: Пары (ID пользователя, Telegram ID)
+                в порядке ID.
+        """
+        result = await self.session.execute(
+            select(User.id, User.tg_id)
+            .where(User.bot_id == bot_id, User.id > after_id)
+            .order_by(User.id)
+            .limit(limit)
+        )
+        return [(row.id, row.tg_id) for row in result]
+
+    async def save_progress(
+        self,
+        job_id: int,
+        last_user_id: int,
+        sent: int,
+        failed: int,
+    ) -> None:
+        """
+        Сохранить курсор и счётчики рассылки.
+
+        Args:
+            job_id (int): ID задания.
+            last_user_id (int): ID последнего обработанного
+                пользователя.
+            sent (int): Количество доставленных сообщений.
+            failed (int): Количество недоставленных сообщений.
+        """
+        await self.session.execute(
+            update(Broadcast)
+            .where(Broadcast.id == job_id)
+            .values(last_user_id=last_user_id, sent=sent, failed=failed)
+        )
+        await self.session.commit()
+
+    async def set_status(
+        self,
+        job_id: int,
+        status: str,
+    ) -> bool:
+        """
+        Завершить выполняемую рассылку с указанным статусом.
+
+        Рассылка, уже завершённая или отменённая, не изменяется,
+        поэтому отмена и завершение не перезаписывают друг друга.
+
+        Args:
+            job_id (int): ID задания.
+            status (str): Новый статус.
+
+        Returns:
+            bool: True, если статус изменён.
+        """
+        result: Any = await self.session.execute(
+            update(Broadcast)
+            .where(
+                Broadcast.id == job_id,
+                Broadcast.status == STATUS_RUNNING,
+            )
+            .values(
+                status=status,
+                finished_at=datetime.now(timezone.utc).replace(tzinfo=None),
+            )
+        )
+        await self.session.commit()
+        return bool(result.rowcount)
@@ -2,11 +2,23 @@
 Базовый класс менеджера данных.
 
 Содержит общую функциональность для работы с таблицей Data
-через асинхронную сессию SQLAlchemy.
+через асинхронную сессию SQLAlchemy, включая разрешение ID
+пользователя через кэш сессии.
 """
 
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...models import User
+from ..identity import cache_user_id, cached_user_id
+
+# Пользователь, переданный напрямую: объект User или его ID
+UserRef = User | int | None
+
 
 class DataManagerBase:
     """Базовый менеджер для работы с таблицей Data."""
@@ -23,3 +35,90 @@ class DataManagerBase:
         """
         # Сохраняем сессию для дальнейшей работы с базой данных
         self.session: AsyncSession = session
+
+    def _known_user_id(
+        self,
+        tg_id: int,
+        bot_id: int,
+        user: UserRef = None,
+    ) -> int | None:
+        """Возвращает ID пользователя без обращения к базе данных.
+
+        Args:
+            tg_id (int): Telegram ID пользователя.
+            bot_id (int): ID бота.
+            user (UserRef): Объект User или его ID, если известны.
+
+        Returns:
+            int | None: ID пользователя или None, если он неизвестен.
+        """
+        if isinstance(user, int):
+            return user
+        if user is not None and user.id is not None:
+            cache_user_id(self.session, tg_id, bot_id, user.id)
+            return user.id
+        return cached_user_id(self.session, tg_id, bot_id)
+
+    async def _user_id(
+        self,
+        tg_id: int,
+        bot_id: int,
+        user: UserRef = None,
+    ) -> int | None:
+        """Получает ID пользователя, при промахе кэша — одним SELECT.
+
+        Args:
+            tg_id (int): Telegram ID пользователя.
+            bot_id (int): ID бота.
+            user (UserRef): Объект User или его ID, если известны.
+
+        Returns:
+            int | None: ID пользователя или None, если пользователь
+                не найден.
+        """
+        user_id: int | None = self._known_user_id(tg_id, bot_id, user)
+        if user_id is not None:
+            return user_id
+
+        try:
+            user_id = await self.session.scalar(
+                select(User.id).where(
+                    User.tg_id == tg_id,
+                    User.bot_id == bot_id
+                )
+            )
+        except SQLAlchemyError as error:
+            logger.error(f"Ошибка при получении пользователя: {error}")
+            return None
+
+        if user_id is not None:
+            cache_user_id(self.session, tg_id, bot_id, user_id)
+        return user_id
+
+    def _user_id_expr(
+        self,
+        tg_id: int,
+        bot_id: int,
+        user: UserRef = None,
+    ) -> Any:
+        """Возвращает ID пользователя для подстановки в запрос.
+
+        Если ID известен, возвращается само значение, иначе —
+        скалярный подзапрос к User, чтобы операция над Data
+        выполнялась одним запросом.
+
+        Args:
+            tg_id (int): Telegram ID пользователя.
+            bot_id (int): ID бота.
+            user (UserRef): Объект User или его ID, если известны.
+
+        Returns:
+            Any: ID пользователя или скалярный подзапрос.
+        """
+        user_id: int | None = self._known_user_id(tg_id, bot_id, user)
+        if user_id is not None:
+            return user_id
+        return select(User.id).where(
+            User.tg_id == tg_id,
+            User.bot_id == bot_id
+        ).scalar_subquery()
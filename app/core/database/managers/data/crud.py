@@ -2,58 +2,34 @@
 Модуль CRUD-операций для работы с таблицей Data.
 
 Содержит класс DataCRUD для создания, получения, обновления и удаления
-записей ключ–значение пользователей по их Telegram ID (tg_id).
+записей ключ–значение пользователей по их Telegram ID (tg_id)
+или по уже известному пользователю.
 """
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Any, Callable
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.engine import Result as SAResult
 from sqlalchemy.exc import SQLAlchemyError
 
-from ...models import Data, User
-from .base import DataManagerBase
+from ...dialect import upsert_insert
+from ...models import Data
+from ...models.profile import VALUE_PARSERS
+from .base import DataManagerBase, UserRef
 
 
 class DataCRUD(DataManagerBase):
     """Менеджер для выполнения CRUD-операций с данными пользователей."""
 
-    async def _get_user(
-        self,
-        tg_id: int,
-        bot_id: int,
-    ) -> User | None:
-        """Получает пользователя по его Telegram ID.
-
-        Args:
-            tg_id (int): Telegram ID пользователя.
-            bot_id (int): ID бота.
-
-        Returns:
-            User | None: Объект User или None, если пользователь
-                не найден.
-        """
-        try:
-            result: SAResult[tuple[User]] = await self.session.execute(
-                select(User).where(
-                    User.tg_id == tg_id,
-                    User.bot_id == bot_id
-                )
-            )
-            return result.scalar_one_or_none()
-        except SQLAlchemyError as error:
-            logger.error(f"Ошибка при получении пользователя: {error}")
-            return None
-
     async def get(
         self,
         tg_id: int,
         bot_id: int,
-        key: str
+        key: str,
+        user: UserRef = None,
     ) -> Data | None:
         """Получает запись данных по ключу для конкретного пользователя.
 
@@ -61,21 +37,15 @@ class DataCRUD(DataManagerBase):
             tg_id (int): Telegram ID пользователя.
             bot_id (int): ID бота.
             key (str): Ключ данных.
+            user (UserRef): Объект User или его ID, если известны.
 
         Returns:
             Data | None: Объект Data, если запись найдена, иначе None.
         """
-        user: User | None = await self._get_user(
-            tg_id=tg_id,
-            bot_id=bot_id,
-        )
-        if not user:
-            return None
-
         try:
             result: SAResult[tuple[Data]] = await self.session.execute(
                 select(Data).where(
-                    Data.user_id == user.id,
+                    Data.user_id == self._user_id_expr(tg_id, bot_id, user),
                     Data.key == key
                 )
             )
@@ -90,7 +60,8 @@ class DataCRUD(DataManagerBase):
         bot_id: int,
         key: str,
         value: str,
-        value_type: str | None = None
+        value_type: str | None = None,
+        user: UserRef = None,
     ) -> Data | None:
         """Создает или обновляет запись данных для пользователя.
 
@@ -101,29 +72,23 @@ class DataCRUD(DataManagerBase):
             value (str): Значение данных в строковом виде.
             value_type (str | None): Тип значения (int, bool, str, dict,
                 date, time). Используется только для проверки формата.
+            user (UserRef): Объект User или его ID, если известны.
 
         Возвращает:
             Data | None: Созданная или обновленная запись Data.
         """
-        # Получаем пользователя один раз
-        user: User | None = await self._get_user(
+        # Получаем ID пользователя один раз, с учётом кэша сессии
+        user_id: int | None = await self._user_id(
             tg_id=tg_id,
             bot_id=bot_id,
+            user=user,
         )
-        if not user:
+        if user_id is None:
             return None
 
         # Проверка формата значения, если указан тип
         if value_type:
-            type_map: dict[str, Callable[[str], Any]] = {
-                "int": int,
-                "bool": lambda v: v.lower() == "true",
-                "date": lambda v: datetime.strptime(v, "%d.%m.%Y"),
-                "time": lambda v: datetime.strptime(v, "%d.%m.%Y %H:%M:%S"),
-                "str": str
-            }
-
-            caster: Callable[[str], Any] | None = type_map.get(
+            caster: Callable[[str], Any] | None = VALUE_PARSERS.get(
                 value_type.lower()
             )
             if not caster:
@@ -137,17 +102,38 @@ class DataCRUD(DataManagerBase):
                 return
 
         try:
-            # Объединяем один блок для уменьшения транзакций
+            insert_: Any = upsert_insert(self.session)
+            if insert_ is not None:
+                # Один запрос INSERT ... ON CONFLICT ... RETURNING
+                stmt: Any = insert_(Data).values(
+                    user_id=user_id,
+                    key=key,
+                    value=value,
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Data.user_id, Data.key],
+                    set_={"value": stmt.excluded.value},
+                ).returning(Data)
+                upserted: Data = (
+                    await self.session.scalars(
+                        stmt,
+                        execution_options={"populate_existing": True},
+                    )
+                ).one()
+                await self.session.commit()
+                return upserted
+
+            # Запасной путь для диалектов без ON CONFLICT
             data: Data | None = await self.session.scalar(
                 select(Data).where(
-                    Data.user_id == user.id,
+                    Data.user_id == user_id,
                     Data.key == key
                 )
             )
             if data:
                 data.value = value
             else:
-                data = Data(user=user, key=key, value=value)
+                data = Data(user_id=user_id, key=key, value=value)
                 self.session.add(data)
 
             await self.session.commit()
@@ -163,7 +149,8 @@ class DataCRUD(DataManagerBase):
         self,
         tg_id: int,
         bot_id: int,
-        key: str
+        key: str,
+        user: UserRef = None,
     ) -> bool:
         """Удаляет запись данных пользователя по ключу.
 
@@ -171,22 +158,20 @@ class DataCRUD(DataManagerBase):
             tg_id (int): Telegram ID пользователя.
             bot_id (int): ID бота.
             key (str): Ключ данных.
+            user (UserRef): Объект User или его ID, если известны.
 
         Returns:
             bool: True, если удаление прошло успешно, иначе False.
         """
-        data: Data | None = await self.get(
-            tg_id=tg_id,
-            bot_id=bot_id,
-            key=key,
-        )
-        if not data:
-            return False
-
         try:
-            await self.session.delete(data)
+            result: Any = await self.session.execute(
+                delete(Data).where(
+                    Data.user_id == self._user_id_expr(tg_id, bot_id, user),
+                    Data.key == key
+                )
+            )
             await self.session.commit()
-            return True
+            return bool(result.rowcount)
         except SQLAlchemyError as error:
             logger.error(f"Ошибка при удалении данных: {error}")
             await self.session.rollback()
@@ -2,7 +2,8 @@
 CRUD-операции для работы с таблицей Data.
 
 Модуль содержит класс DataList для получения всех записей
-ключ–значение конкретного пользователя по его Telegram ID (tg_id).
+ключ–значение конкретного пользователя по его Telegram ID (tg_id)
+или по уже известному пользователю.
 """
 
 from typing import Any
@@ -12,63 +13,38 @@ from sqlalchemy import Update, delete, insert, select, update
 from sqlalchemy.engine import Result as SAResult
 from sqlalchemy.exc import SQLAlchemyError
 
-from ...models import Data, User
-from .base import DataManagerBase
+from ...dialect import upsert_insert
+from ...models import Data
+from .base import DataManagerBase, UserRef
 
 
 class DataList(DataManagerBase):
     """Класс для получения списка пар ключ–значение пользователя."""
 
-    async def _get_user(
-        self,
-        tg_id: int,
-        bot_id: int,
-    ) -> User | None:
-        """Получает объект пользователя по его Telegram ID.
-
-        Args:
-            tg_id (int): Telegram ID пользователя.
-            bot_id (int): ID бота.
-
-        Returns:
-            User | None: Объект User или None, если пользователь не найден.
-        """
-        try:
-            result: SAResult[tuple[User]] = await self.session.execute(
-                select(User).where(
-                    User.tg_id == tg_id,
-                    User.bot_id == bot_id
-                )
-            )
-            return result.scalar_one_or_none()
-        except SQLAlchemyError as error:
-            logger.error(f"Ошибка при получении пользователя: {error}")
-            return None
-
     async def dict_all(
         self,
         tg_id: int,
         bot_id: int,
+        user: UserRef = None,
     ) -> dict[str, Any]:
         """Получает все пары ключ–значение пользователя в виде словаря.
 
+        Выполняется одним запросом: если ID пользователя неизвестен,
+        он подставляется подзапросом к User.
+
         Args:
             tg_id (int): Telegram ID пользователя.
             bot_id (int): ID бота.
+            user (UserRef): Объект User или его ID, если известны.
 
         Returns:
             dict[str, Any]: Словарь ключ–значение для пользователя.
         """
-        user: User | None = await self._get_user(
-            tg_id=tg_id,
-            bot_id=bot_id,
-        )
-        if not user:
-            return {}
-
         try:
             result: SAResult = await self.session.execute(
-                select(Data.key, Data.value).where(Data.user_id == user.id)
+                select(Data.key, Data.value).where(
+                    Data.user_id == self._user_id_expr(tg_id, bot_id, user)
+                )
             )
             return {row.key: row.value for row in result.all()}
         except SQLAlchemyError as error:
@@ -79,30 +55,33 @@ class DataList(DataManagerBase):
         self,
         tg_id: int,
         bot_id: int,
+        commit: bool = True,
+        user: UserRef = None,
     ) -> bool:
         """Удаляет все записи пользователя.
 
         Args:
             tg_id (int): Telegram ID пользователя.
             bot_id (int): ID бота.
+            commit (bool): Фиксировать транзакцию. При False ошибки
+                пробрасываются вызывающему коду.
+            user (UserRef): Объект User или его ID, если известны.
 
         Returns:
             bool: True, если удаление прошло успешно, иначе False.
         """
-        user: User | None = await self._get_user(
-            tg_id=tg_id,
-            bot_id=bot_id,
-        )
-        if not user:
-            return False
-
         try:
             await self.session.execute(
-                delete(Data).where(Data.user_id == user.id)
+                delete(Data).where(
+                    Data.user_id == self._user_id_expr(tg_id, bot_id, user)
+                )
             )
-            await self.session.commit()
+            if commit:
+                await self.session.commit()
             return True
         except SQLAlchemyError as error:
+            if not commit:
+                raise
             logger.error(f"Ошибка при удалении данных пользователя: {error}")
             await self.session.rollback()
             return False
@@ -111,7 +90,8 @@ class DataList(DataManagerBase):
         self,
         tg_id: int,
         bot_id: int,
-        keep_keys: list[str]
+        keep_keys: list[str],
+        user: UserRef = None,
     ) -> bool:
         """
         Удаляет все записи пользователя, кроме ключей из keep_keys.
@@ -120,21 +100,15 @@ class DataList(DataManagerBase):
             tg_id (int): Telegram ID пользователя.
             bot_id (int): ID бота.
             keep_keys (list[str]): Список ключей, которые не удаляются.
+            user (UserRef): Объект User или его ID, если известны.
 
         Returns:
             bool: True, если удаление прошло успешно, иначе False.
         """
-        user: User | None = await self._get_user(
-            tg_id=tg_id,
-            bot_id=bot_id,
-        )
-        if not user:
-            return False
-
         try:
             await self.session.execute(
                 delete(Data).where(
-                    Data.user_id == user.id,
+                    Data.user_id == self._user_id_expr(tg_id, bot_id, user),
                     ~Data.key.in_(keep_keys)
                 )
             )
@@ -151,27 +125,64 @@ class DataList(DataManagerBase):
         self,
         tg_id: int,
         bot_id: int,
-        new_data: dict[str, Any]
+        new_data: dict[str, Any],
+        commit: bool = True,
+        user: UserRef = None,
     ) -> bool:
-        user: User | None = await self._get_user(
+        """Создаёт или обновляет все переданные записи пользователя.
+
+        Args:
+            tg_id (int): Telegram ID пользователя.
+            bot_id (int): ID бота.
+            new_data (dict[str, Any]): Словарь ключ–значение. Пустой
+                словарь удаляет все записи пользователя.
+            commit (bool): Фиксировать транзакцию. При False ошибки
+                пробрасываются вызывающему коду.
+            user (UserRef): Объект User или его ID, если известны.
+
+        Returns:
+            bool: True, если обновление прошло успешно, иначе False.
+        """
+        # Если пришёл пустой словарь, удаляем все записи
+        if not new_data:
+            return await self.clear_all(
+                tg_id=tg_id,
+                bot_id=bot_id,
+                commit=commit,
+                user=user,
+            )
+
+        user_id: int | None = await self._user_id(
             tg_id=tg_id,
             bot_id=bot_id,
+            user=user,
         )
-        if not user:
+        if user_id is None:
             return False
 
         try:
-            # Если пришёл пустой словарь, удаляем все записи
-            if not new_data:
-                return await self.clear_all(
-                    tg_id=tg_id,
-                    bot_id=bot_id,
+
+            insert_: Any = upsert_insert(self.session)
+            if insert_ is not None:
+                # Один запрос INSERT ... ON CONFLICT для всех ключей
+                stmt: Any = insert_(Data).values([
+                    {"user_id": user_id, "key": key, "value": value}
+                    for key, value in new_data.items()
+                ])
+                await self.session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[Data.user_id, Data.key],
+                        set_={"value": stmt.excluded.value},
+                    )
                 )
+                if commit:
+                    await self.session.commit()
+                return True
 
-            # Обновляем или создаём записи
+            # Запасной путь для диалектов без ON CONFLICT
             for key, value in new_data.items():
                 stmt: Update = update(Data).where(
-                    Data.user_id == user.id,
+                    Data.user_id == user_id,
                     Data.key == key
                 ).values(value=value)
                 result: Any = await self.session.execute(stmt)
@@ -179,14 +190,17 @@ class DataList(DataManagerBase):
                     # Создаём новую запись, если обновление не произошло
                     await self.session.execute(
                         insert(Data).values(
-                            user_id=user.id,
+                            user_id=user_id,
                             key=key,
                             value=value
                         )
                     )
-            await self.session.commit()
+            if commit:
+                await self.session.commit()
             return True
         except Exception as e:
+            if not commit:
+                raise
             logger.error(f"Ошибка при обновлении данных пользователя: {e}")
             await self.session.rollback()
             return False
@@ -0,0 +1,21 @@
+"""
+Инициализация менеджера файлов пользователей.
+
+Объединяет функциональные возможности для работы с таблицей UserFile
+и контентно-адресуемым хранилищем содержимого.
+"""
+
+from .crud import FileCRUD
+
+
+class FileManager(FileCRUD):
+    """
+    Полнофункциональный менеджер для работы с файлами пользователей.
+
+    Хранит метаданные файлов в базе данных, а содержимое — в
+    хранилище на диске, и предоставляет потоковые чтение и запись.
+
+    Наследуемые классы:
+        FileCRUD: Предоставляет CRUD-операции с файлами.
+    """
+    pass
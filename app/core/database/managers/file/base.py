@@ -0,0 +1,32 @@
+"""
+Базовый класс менеджера файлов пользователей.
+
+Содержит общую функциональность для работы с таблицей UserFile
+через асинхронную сессию SQLAlchemy и хранилищем содержимого.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...storage import BlobStore, get_blob_store
+
+
+class FileManagerBase:
+    """Базовый менеджер для работы с файлами пользователей."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        store: BlobStore | None = None,
+    ) -> None:
+        """
+        Инициализация менеджера файлов.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия для работы
+                с базой данных.
+            store (BlobStore | None): Хранилище содержимого. Если None,
+                используется глобальное хранилище.
+        """
+        # Сохраняем сессию и хранилище для дальнейшей работы
+        self.session: AsyncSession = session
+        self.store: BlobStore = store or get_blob_store()
@@ -0,0 +1,180 @@
+"""
+CRUD-операции для таблицы UserFile.
+
+Содержит методы для сохранения, получения метаданных, потокового
+чтения и удаления файлов пользователей и сборки неиспользуемого
+содержимого.
+"""
+
+import time
+from typing import AsyncIterable, AsyncIterator, Sequence
+
+from loguru import logger
+from sqlalchemy import Result, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import BLOB_GC_GRACE
+
+from ...models import UserFile
+from ...storage import BlobInfo
+from .base import FileManagerBase
+
+
+class FileCRUD(FileManagerBase):
+    """Класс для CRUD-операций с файлами пользователей."""
+
+    async def add(
+        self,
+        user_id: int,
+        filename: str,
+        chunks: AsyncIterable[bytes] | bytes,
+        content_type: str | None = None,
+    ) -> UserFile | None:
+        """
+        Сохраняет файл пользователя.
+
+        Содержимое потоково записывается в хранилище, в базе данных
+        сохраняются только метаданные.
+
+        Args:
+            user_id (int): ID пользователя в таблице User.
+            filename (str): Имя файла.
+            chunks (AsyncIterable[bytes] | bytes): Поток блоков
+                содержимого или содержимое целиком.
+            content_type (str | None): MIME-тип файла.
+
+        Returns:
+            UserFile | None: Метаданные файла или None при ошибке.
+        """
+        info: BlobInfo = await self.store.write(chunks)
+        user_file = UserFile(
+            user_id=user_id,
+            filename=filename,
+            content_type=content_type,
+            sha256=info.sha256,
+            size=info.size,
+        )
+        try:
+            self.session.add(user_file)
+            await self.session.commit()
+            await self.session.refresh(user_file)
+            return user_file
+        except SQLAlchemyError as error:
+            logger.error(f"Ошибка при сохранении файла: {error}")
+            await self.session.rollback()
+            return None
+
+    async def get(
+        self,
+        file_id: int,
+    ) -> UserFile | None:
+        """
+        Получить метаданные файла по ID.
+
+        Args:
+            file_id (int): ID файла.
+
+        Returns:
+            UserFile | None: Метаданные файла или None.
+        """
+        try:
+            return await self.session.get(UserFile, file_id)
+        except SQLAlchemyError as error:
+            logger.error(f"Ошибка при получении файла: {error}")
+            return None
+
+    async def list_files(
+        self,
+        user_id: int,
+    ) -> Sequence[UserFile]:
+        """
+        Получить метаданные всех файлов пользователя.
+
+        Args:
+            user_id (int): ID пользователя в таблице User.
+
+        Returns:
+            Sequence[UserFile]: Список метаданных файлов.
+        """
+        try:
+            result: Result[tuple[UserFile]] = await self.session.execute(
+                select(UserFile).where(UserFile.user_id == user_id)
+            )
+            return result.scalars().all()
+        except SQLAlchemyError as error:
+            logger.error(f"Ошибка при получении файлов пользователя: {error}")
+            return []
+
+    def open(
+        self,
+        user_file: UserFile,
+    ) -> AsyncIterator[bytes]:
+        """
+        Открывает потоковое чтение содержимого файла.
+
+        Args:
+            user_file (UserFile): Метаданные файла.
+
+        Returns:
+            AsyncIterator[bytes]: Поток блоков содержимого.
+        """
+        return self.store.read(user_file.sha256)
+
+    async def delete(
+        self,
+        file_id: int,
+    ) -> bool:
+        """
+        Удаляет файл пользователя.
+
+        Содержимое остаётся в хранилище: его удаляет collect_garbage,
+        когда на него не ссылается ни один файл. Удаление здесь
+        гонялось бы с одновременным сохранением того же содержимого.
+
+        Args:
+            file_id (int): ID файла.
+
+        Returns:
+            bool: True, если удаление прошло успешно, иначе False.
+        """
+        user_file: UserFile | None = await self.get(file_id)
+        if not user_file:
+            return False
+
+        try:
+            await self.session.delete(user_file)
+            await self.session.commit()
+            return True
+        except SQLAlchemyError as error:
+            logger.error(f"Ошибка при удалении файла: {error}")
+            await self.session.rollback()
+            return False
+
+    async def collect_garbage(
+        self,
+        grace: float = BLOB_GC_GRACE,
+    ) -> int:
+        """
+        Удаляет из хранилища содержимое, на которое не ссылаются файлы.
+
+        Содержимое, сохранённое позже чем за grace секунд до начала
+        сборки, не удаляется: ссылка на него может быть ещё не
+        зафиксирована.
+
+        Args:
+            grace (float): Защитный интервал в секундах.
+
+        Returns:
+            int: Количество удалённых файлов содержимого.
+        """
+        started: float = time.time()
+        result: Result[tuple[str]] = await self.session.execute(
+            select(UserFile.sha256).distinct()
+        )
+        referenced: set[str] = set(result.scalars())
+        removed: int = await self.store.sweep(
+            referenced, before=started - grace
+        )
+        if removed:
+            logger.info(f"Удалено содержимое файлов без ссылок: {removed}")
+        return removed
@@ -1,13 +1,13 @@
 """
 CRUD-операции для таблицы Flag.
 
-Содержит методы для создания, получения, обновления и
-удаления флагов.
+Содержит методы для создания, получения, обновления,
+установки с увеличением версии и удаления флагов.
 """
 
 from loguru import logger
-from sqlalchemy import Result, select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Result, func, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from ...models import Flag
 from .base import FlagManagerBase
@@ -87,6 +87,45 @@ class FlagCRUD(FlagManagerBase):
         await self.session.commit()
         return True
 
+    async def set(
+        self,
+        name: str,
+        value: bool,
+    ) -> int:
+        """
+        Установить значение флага, создав его при необходимости,
+        и присвоить изменению новую версию.
+
+        Версия вычисляется в том же UPDATE, что и значение, поэтому
+        изменения из разных процессов получают разные версии.
+
+        Args:
+            name (str): Имя флага.
+            value (bool): Новое значение флага.
+
+        Returns:
+            int: Версия изменения.
+        """
+        if await self.get(name) is None:
+            try:
+                await self.create(name, value)
+            except IntegrityError:
+                # Флаг одновременно создал другой процесс
+                await self.session.rollback()
+
+        next_version = select(
+            func.coalesce(func.max(Flag.version), 0) + 1
+        ).scalar_subquery()
+        await self.session.execute(
+            update(Flag)
+            .where(Flag.name == name)
+            .values(value=value, version=next_version)
+        )
+        await self.session.commit()
+        return await self.session.scalar(
+            select(Flag.version).where(Flag.name == name)
+        ) or 0
+
     async def delete(
         self,
         name: str,
@@ -1,13 +1,14 @@
 """
 Получение списка всех флагов.
 
-Содержит методы для получения всех записей из таблицы Flag.
+Содержит методы для получения всех записей из таблицы Flag и
+текущей версии набора флагов.
 """
 
 from typing import Sequence
 
 from loguru import logger
-from sqlalchemy import Result, select
+from sqlalchemy import Result, func, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from ...models import Flag
@@ -34,3 +35,18 @@ class FlagList(FlagManagerBase):
             # Выводим сообщение об ошибке при получении списка
             logger.error(f"Ошибка при получении списка флагов: {e}")
             return []
+
+    async def version(self) -> int:
+        """
+        Получить версию набора флагов: номер последнего изменения.
+
+        Returns:
+            int: Версия (0, если флагов нет или запрос не удался).
+        """
+        try:
+            return await self.session.scalar(
+                select(func.max(Flag.version))
+            ) or 0
+        except SQLAlchemyError as e:
+            logger.error(f"Ошибка при получении версии флагов: {e}")
+            return 0
@@ -0,0 +1,67 @@
+"""
+Кэш соответствия (tg_id, bot_id) → user_id в пределах сессии.
+
+Кэш хранится в ``session.info`` и живёт вместе с сессией, поэтому
+менеджеры одной сессии не запрашивают ID пользователя повторно.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Ключ кэша в session.info
+USER_IDS_KEY: str = "user_ids"
+
+
+def cache_user_id(
+    session: AsyncSession,
+    tg_id: int,
+    bot_id: int,
+    user_id: int,
+) -> None:
+    """
+    Запоминает ID пользователя для текущей сессии.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy.
+        tg_id (int): Telegram ID пользователя.
+        bot_id (int): ID бота.
+        user_id (int): ID пользователя в таблице User.
+    """
+    user_ids: dict[tuple[int, int], int] = session.info.setdefault(
+        USER_IDS_KEY, {}
+    )
+    user_ids[(tg_id, bot_id)] = user_id
+
+
+def cached_user_id(
+    session: AsyncSession,
+    tg_id: int,
+    bot_id: int,
+) -> int | None:
+    """
+    Возвращает ID пользователя из кэша сессии.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy.
+        tg_id (int): Telegram ID пользователя.
+        bot_id (int): ID бота.
+
+    Returns:
+        int | None: ID пользователя или None, если его нет в кэше.
+    """
+    return session.info.get(USER_IDS_KEY, {}).get((tg_id, bot_id))
+
+
+def forget_user_id(
+    session: AsyncSession,
+    tg_id: int,
+    bot_id: int,
+) -> None:
+    """
+    Удаляет ID пользователя из кэша сессии.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия SQLAlchemy.
+        tg_id (int): Telegram ID пользователя.
+        bot_id (int): ID бота.
+    """
+    session.info.get(USER_IDS_KEY, {}).pop((tg_id, bot_id), None)
@@ -0,0 +1,18 @@
+"""
+Инициализация менеджера медиафайлов.
+
+Объединяет функциональные возможности для работы с таблицей Media:
+хранение file_id файлов, уже загруженных в Telegram.
+"""
+
+from .crud import MediaCRUD
+
+
+class MediaManager(MediaCRUD):
+    """
+    Полнофункциональный менеджер для работы с медиафайлами.
+
+    Наследуемые классы:
+        MediaCRUD: Предоставляет CRUD-операции с file_id.
+    """
+    pass
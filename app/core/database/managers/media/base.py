@@ -0,0 +1,26 @@
+"""
+Базовый класс менеджера медиафайлов.
+
+Содержит общую функциональность для работы с таблицей Media
+через асинхронную сессию SQLAlchemy.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class MediaManagerBase:
+    """Базовый менеджер для работы с таблицей Media."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+    ) -> None:
+        """
+        Инициализация менеджера медиафайлов.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия для работы
+                с базой данных.
+        """
+        # Сохраняем сессию для дальнейшей работы с БД
+        self.session: AsyncSession = session
@@ -0,0 +1,122 @@
+"""
+CRUD-операции для таблицы Media.
+
+Содержит методы для получения, сохранения и удаления file_id
+загруженных медиафайлов.
+"""
+
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from ...dialect import upsert_insert
+from ...models import Media
+from .base import MediaManagerBase
+
+
+class MediaCRUD(MediaManagerBase):
+    """Класс для выполнения CRUD-операций с медиафайлами."""
+
+    async def get_file_id(
+        self,
+        bot_id: int,
+        key: str,
+    ) -> str | None:
+        """
+        Получить file_id медиафайла.
+
+        Args:
+            bot_id (int): ID бота, загрузившего файл.
+            key (str): Ключ медиафайла.
+
+        Returns:
+            str | None: file_id или None, если файл не загружался.
+        """
+        try:
+            return await self.session.scalar(
+                select(Media.file_id).where(
+                    Media.bot_id == bot_id,
+                    Media.key == key,
+                )
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Ошибка при получении медиафайла: {e}")
+            return None
+
+    async def set_file_id(
+        self,
+        bot_id: int,
+        key: str,
+        file_id: str,
+    ) -> None:
+        """
+        Сохранить file_id медиафайла.
+
+        Args:
+            bot_id (int): ID бота, загрузившего файл.
+            key (str): Ключ медиафайла.
+            file_id (str): Идентификатор файла в Telegram.
+        """
+        try:
+            insert_: Any = upsert_insert(self.session)
+            if insert_ is not None:
+                stmt: Any = insert_(Media).values(
+                    bot_id=bot_id,
+                    key=key,
+                    file_id=file_id,
+                )
+                await self.session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[Media.bot_id, Media.key],
+                        set_={"file_id": stmt.excluded.file_id},
+                    )
+                )
+            else:
+                # Запасной путь для диалектов без ON CONFLICT
+                media: Media | None = await self.session.scalar(
+                    select(Media).where(
+                        Media.bot_id == bot_id,
+                        Media.key == key,
+                    )
+                )
+                if media is None:
+                    self.session.add(
+                        Media(bot_id=bot_id, key=key, file_id=file_id)
+                    )
+                else:
+                    media.file_id = file_id
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(f"Ошибка при сохранении медиафайла: {e}")
+
+    async def delete(
+        self,
+        bot_id: int,
+        key: str,
+    ) -> bool:
+        """
+        Удалить file_id медиафайла.
+
+        Args:
+            bot_id (int): ID бота, загрузившего файл.
+            key (str): Ключ медиафайла.
+
+        Returns:
+            bool: True, если запись была удалена.
+        """
+        try:
+            result: Any = await self.session.execute(
+                delete(Media).where(
+                    Media.bot_id == bot_id,
+                    Media.key == key,
+                )
+            )
+            await self.session.commit()
+            return bool(result.rowcount)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(f"Ошибка при удалении медиафайла: {e}")
+            return False
@@ -0,0 +1,18 @@
+"""
+Инициализация менеджера очереди экспорта.
+
+Объединяет функциональные возможности для работы с таблицей
+SheetOutbox: операции экспорта в Google Sheets до их отправки.
+"""
+
+from .crud import OutboxCRUD
+
+
+class OutboxManager(OutboxCRUD):
+    """
+    Полнофункциональный менеджер для работы с очередью экспорта.
+
+    Наследуемые классы:
+        OutboxCRUD: Предоставляет CRUD-операции с очередью.
+    """
+    pass
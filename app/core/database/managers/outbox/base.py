@@ -0,0 +1,26 @@
+"""
+Базовый класс менеджера очереди экспорта.
+
+Содержит общую функциональность для работы с таблицей SheetOutbox
+через асинхронную сессию SQLAlchemy.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class OutboxManagerBase:
+    """Базовый менеджер для работы с таблицей SheetOutbox."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+    ) -> None:
+        """
+        Инициализация менеджера очереди экспорта.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия для работы
+                с базой данных.
+        """
+        # Сохраняем сессию для дальнейшей работы с БД
+        self.session: AsyncSession = session
@@ -0,0 +1,103 @@
+"""
+CRUD-операции для таблицы SheetOutbox.
+
+Содержит методы для добавления операций экспорта, выборки
+неотправленных операций и их удаления после отправки.
+"""
+
+from collections.abc import Sequence
+
+from sqlalchemy import delete, select, update
+
+from ...models import SheetOutbox
+from .base import OutboxManagerBase
+
+
+class OutboxCRUD(OutboxManagerBase):
+    """Класс для выполнения CRUD-операций с очередью экспорта."""
+
+    async def add(
+        self,
+        items: Sequence[tuple[str, str]],
+        commit: bool = True,
+    ) -> list[int]:
+        """
+        Сохранить операции экспорта одной транзакцией.
+
+        Args:
+            items (Sequence[tuple[str, str]]): Пары (тип операции,
+                данные в JSON).
+            commit (bool): Зафиксировать транзакцию. False — операции
+                фиксирует вызывающий код вместе с другими изменениями.
+
+        Returns:
+            list[int]: ID сохранённых операций в порядке items.
+        """
+        rows: list[SheetOutbox] = [
+            SheetOutbox(kind=kind, payload=payload)
+            for kind, payload in items
+        ]
+        self.session.add_all(rows)
+        if commit:
+            await self.session.commit()
+        else:
+            await self.session.flush()
+        return [row.id for row in rows]
+
+    async def pending(
+        self,
+        limit: int,
+    ) -> list[SheetOutbox]:
+        """
+        Получить неотправленные операции в порядке добавления.
+
+        Args:
+            limit (int): Максимальное количество операций.
+
+        Returns:
+            list[SheetOutbox]: Операции экспорта.
+        """
+        result = await self.session.scalars(
+            select(SheetOutbox).order_by(SheetOutbox.id).limit(limit)
+        )
+        return list(result)
+
+    async def delete(
+        self,
+        ids: Sequence[int],
+    ) -> int:
+        """
+        Удалить отправленные операции.
+
+        Args:
+            ids (Sequence[int]): ID операций.
+
+        Returns:
+            int: Количество удалённых операций.
+        """
+        if not ids:
+            return 0
+        result = await self.session.execute(
+            delete(SheetOutbox).where(SheetOutbox.id.in_(ids))
+        )
+        await self.session.commit()
+        return result.rowcount or 0
+
+    async def mark_failed(
+        self,
+        ids: Sequence[int],
+    ) -> None:
+        """
+        Увеличить счётчик неудачных попыток отправки.
+
+        Args:
+            ids (Sequence[int]): ID операций.
+        """
+        if not ids:
+            return
+        await self.session.execute(
+            update(SheetOutbox)
+            .where(SheetOutbox.id.in_(ids))
+            .values(attempts=SheetOutbox.attempts + 1)
+        )
+        await self.session.commit()
@@ -0,0 +1,19 @@
+"""
+Инициализация менеджера профилей участников.
+
+Объединяет функциональные возможности для работы с таблицей профилей:
+изменение её схемы вслед за шагами анкеты, запись и чтение профилей.
+"""
+
+from .crud import ProfileCRUD
+
+
+class ProfileManager(ProfileCRUD):
+    """
+    Полнофункциональный менеджер для работы с профилями.
+
+    Наследуемые классы:
+        ProfileCRUD: Предоставляет CRUD-операции с профилями и
+            изменение схемы таблицы.
+    """
+    pass
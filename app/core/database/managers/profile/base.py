@@ -0,0 +1,35 @@
+"""
+Базовый класс менеджера профилей участников.
+
+Содержит общую функциональность для работы с таблицей профилей
+через асинхронную сессию SQLAlchemy.
+"""
+
+from collections.abc import Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models.profile import ProfileColumn, profile_table
+
+
+class ProfileManagerBase:
+    """Базовый менеджер для работы с таблицей профилей."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        columns: Sequence[ProfileColumn] = (),
+    ) -> None:
+        """
+        Инициализация менеджера профилей.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия для работы
+                с базой данных.
+            columns (Sequence[ProfileColumn]): Колонки ответов
+                текущей схемы профиля.
+        """
+        # Сохраняем сессию для дальнейшей работы с БД
+        self.session: AsyncSession = session
+        self.table: Table = profile_table(tuple(columns))
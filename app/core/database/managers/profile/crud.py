@@ -0,0 +1,252 @@
+"""
+CRUD-операции для таблицы профилей.
+
+Содержит методы для приведения схемы таблицы к колонкам шагов анкеты,
+записи и удаления профилей, чтения профилей вместе с пользователями
+и постраничной выборки ответов зарегистрированных пользователей для
+заполнения профилей.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import Connection, Table, delete, inspect, select, text
+
+from ...dialect import upsert_insert
+from ...models import Data, User
+from ...models.profile import FIXED_COLUMNS, PROFILE_TABLE
+from .base import ProfileManagerBase
+
+# Результат изменения схемы: таблица создана, дополнена колонками или
+# пересоздана (пустая строка — схема не изменилась)
+SCHEMA_CREATED: str = "created"
+SCHEMA_EXTENDED: str = "extended"
+SCHEMA_RECREATED: str = "recreated"
+
+
+class ProfileCRUD(ProfileManagerBase):
+    """Класс для выполнения CRUD-операций с профилями."""
+
+    async def migrate(
+        self,
+        force: bool = False,
+    ) -> str:
+        """
+        Привести схему таблицы профилей к текущим колонкам.
+
+        Новые колонки добавляются к существующей таблице. Если колонка
+        шага удалена или сменила тип, таблица пересоздаётся: профили
+        — производные данные, и их заполняют заново.
+
+        Args:
+            force (bool): Пересоздать таблицу в любом случае.
+
+        Returns:
+            str: SCHEMA_CREATED, SCHEMA_EXTENDED, SCHEMA_RECREATED или
+                пустая строка, если схема не изменилась.
+        """
+        table: Table = self.table
+
+        def _migrate(conn: Connection) -> str:
+            if not inspect(conn).has_table(PROFILE_TABLE):
+                table.create(conn)
+                return SCHEMA_CREATED
+
+            existing: dict[str, Any] = {
+                column["name"]: column["type"]
+                for column in inspect(conn).get_columns(PROFILE_TABLE)
+            }
+            stale: list[str] = [
+                name for name, type_ in existing.items()
+                if name not in table.c
+                or not isinstance(type_, type(table.c[name].type))
+            ]
+            if force or stale:
+                table.drop(conn)
+                table.create(conn)
+                return SCHEMA_RECREATED
+
+            missing: list[str] = [
+                name for name in table.c.keys() if name not in existing
+            ]
+            preparer: Any = conn.dialect.identifier_preparer
+            for name in missing:
+                column_type: str = table.c[name].type.compile(conn.dialect)
+                conn.execute(text(
+                    f"ALTER TABLE {preparer.quote(PROFILE_TABLE)} "
+                    f"ADD COLUMN {preparer.quote(name)} {column_type}"
+                ))
+            return SCHEMA_EXTENDED if missing else ""
+
+        result: str = await self.session.run_sync(
+            lambda session: _migrate(session.connection())
+        )
+        await self.session.commit()
+        return result
+
+    async def upsert(
+        self,
+        rows: Sequence[dict[str, Any]],
+        commit: bool = True,
+    ) -> None:
+        """
+        Сохранить профили, заменяя существующие.
+
+        Args:
+            rows (Sequence[dict[str, Any]]): Строки профилей со всеми
+                колонками таблицы.
+            commit (bool): Зафиксировать транзакцию. False — изменения
+                фиксирует вызывающий код вместе с другими.
+        """
+        if not rows:
+            return
+
+        table: Table = self.table
+        insert_: Any = upsert_insert(self.session)
+        if insert_ is not None:
+            # Пакетами, чтобы не упереться в лимит параметров запроса
+            size: int = max(1, 900 // len(table.c))
+            for start in range(0, len(rows), size):
+                stmt: Any = insert_(table).values(
+                    list(rows[start:start + size])
+                )
+                await self.session.execute(stmt.on_conflict_do_update(
+                    index_elements=[table.c.user_id],
+                    set_={
+                        name: stmt.excluded[name]
+                        for name in table.c.keys() if name != "user_id"
+                    },
+                ))
+        else:
+            # Запасной путь для диалектов без ON CONFLICT
+            await self.remove([row["user_id"] for row in rows], commit=False)
+            await self.session.execute(table.insert(), list(rows))
+        if commit:
+            await self.session.commit()
+
+    async def remove(
+        self,
+        user_ids: Iterable[int],
+        commit: bool = True,
+    ) -> None:
+        """
+        Удалить профили пользователей.
+
+        Args:
+            user_ids (Iterable[int]): ID пользователей.
+            commit (bool): Зафиксировать транзакцию.
+        """
+        ids: list[int] = list(user_ids)
+        if not ids:
+            return
+        table: Table = self.table
+        await self.session.execute(
+            delete(table).where(table.c.user_id.in_(ids))
+        )
+        if commit:
+            await self.session.commit()
+
+    async def users(
+        self,
+        user_ids: Sequence[int],
+    ) -> list[tuple[User, dict[str, Any]]]:
+        """
+        Получить пользователей вместе с их профилями.
+
+        Args:
+            user_ids (Sequence[int]): ID пользователей.
+
+        Returns:
+            list[tuple[User, dict[str, Any]]]: Пользователи и значения
+                колонок ответов их профилей (пустой словарь, если
+                профиля нет) в порядке ID.
+        """
+        table: Table = self.table
+        found: list[tuple[User, dict[str, Any]]] = []
+        for start in range(0, len(user_ids), 500):
+            chunk: Sequence[int] = user_ids[start:start + 500]
+            result = await self.session.execute(
+                select(User, table)
+                .outerjoin(table, table.c.user_id == User.id)
+                .where(User.id.in_(chunk))
+                .order_by(User.id)
+            )
+            found.extend(
+                (row[0], self._values(row)) for row in result
+            )
+        return found
+
+    async def page(
+        self,
+        after_id: int,
+        limit: int,
+    ) -> list[tuple[User, dict[str, Any]]]:
+        """
+        Получить следующую страницу зарегистрированных пользователей с
+        профилями.
+
+        Args:
+            after_id (int): ID последнего полученного пользователя.
+            limit (int): Размер страницы.
+
+        Returns:
+            list[tuple[User, dict[str, Any]]]: Пользователи и значения
+                колонок ответов их профилей в порядке ID.
+        """
+        table: Table = self.table
+        result = await self.session.execute(
+            select(User, table)
+            .join(table, table.c.user_id == User.id)
+            .where(User.id > after_id, User.date_registration.is_not(None))
+            .order_by(User.id)
+            .limit(limit)
+        )
+        return [(row[0], self._values(row)) for row in result]
+
+    async def registered(
+        self,
+        after_id: int,
+        limit: int,
+    ) -> list[tuple[User, dict[str, str]]]:
+        """
+        Получить следующую страницу зарегистрированных пользователей
+        с их ответами из таблицы data.
+
+        Args:
+            after_id (int): ID последнего полученного пользователя.
+            limit (int): Размер страницы.
+
+        Returns:
+            list[tuple[User, dict[str, str]]]: Пользователи и словари
+                ключ–значение их данных в порядке ID.
+        """
+        users: list[User] = list(await self.session.scalars(
+            select(User)
+            .where(User.id > after_id, User.date_registration.is_not(None))
+            .order_by(User.id)
+            .limit(limit)
+        ))
+        answers: dict[int, dict[str, str]] = {}
+        if users:
+            result = await self.session.execute(
+                select(Data.user_id, Data.key, Data.value).where(
+                    Data.user_id.in_([user.id for user in users])
+                )
+            )
+            for row in result:
+                answers.setdefault(row.user_id, {})[row.key] = row.value
+        return [(user, answers.get(user.id, {})) for user in users]
+
+    def _values(
+        self,
+        row: Any,
+    ) -> dict[str, Any]:
+        """Значения колонок ответов из строки User + профиль."""
+        if row.user_id is None:
+            return {}
+        mapping: Any = row._mapping
+        return {
+            column.name: mapping[column]
+            for column in self.table.c
+            if column.name not in FIXED_COLUMNS
+        }
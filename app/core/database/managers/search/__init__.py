@@ -0,0 +1,18 @@
+"""
+Инициализация менеджера поиска участников.
+
+Объединяет функциональные возможности для работы с таблицей
+SearchDoc: обновление поисковых документов и поиск по ним.
+"""
+
+from .crud import SearchCRUD
+
+
+class SearchManager(SearchCRUD):
+    """
+    Полнофункциональный менеджер для поиска участников.
+
+    Наследуемые классы:
+        SearchCRUD: Предоставляет CRUD-операции с документами и поиск.
+    """
+    pass
@@ -0,0 +1,26 @@
+"""
+Базовый класс менеджера поиска участников.
+
+Содержит общую функциональность для работы с таблицей SearchDoc
+через асинхронную сессию SQLAlchemy.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class SearchManagerBase:
+    """Базовый менеджер для работы с таблицей SearchDoc."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+    ) -> None:
+        """
+        Инициализация менеджера поиска.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия для работы
+                с базой данных.
+        """
+        # Сохраняем сессию для дальнейшей работы с БД
+        self.session: AsyncSession = session
@@ -0,0 +1,225 @@
+"""
+CRUD-операции для таблицы SearchDoc.
+
+Содержит методы для обновления поисковых документов участников,
+постраничной выборки данных пользователей для перестроения индекса и
+ранжированного поиска: в SQLite — по полнотекстовому индексу FTS5 с
+сортировкой по BM25, в остальных СУБД — по префиксам слов документа.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import (column, delete, func, literal_column, or_, select,
+                        table)
+
+from ...dialect import upsert_insert
+from ...models import Data, SearchDoc, User
+from ...models.search import SEARCH_FTS
+from .base import SearchManagerBase
+
+# Найденный участник: ID пользователя, код и подпись документа
+SearchHit = tuple[int, int | None, str]
+
+
+class SearchCRUD(SearchManagerBase):
+    """Класс для выполнения CRUD-операций с поисковыми документами."""
+
+    async def documents(
+        self,
+        user_ids: Iterable[int],
+    ) -> dict[int, tuple[str, str]]:
+        """
+        Получить сохранённые документы пользователей.
+
+        Args:
+            user_ids (Iterable[int]): ID пользователей.
+
+        Returns:
+            dict[int, tuple[str, str]]: Подпись и текст документа по
+                ID пользователя.
+        """
+        ids: list[int] = list(user_ids)
+        if not ids:
+            return {}
+        result = await self.session.execute(
+            select(SearchDoc.user_id, SearchDoc.title, SearchDoc.content)
+            .where(SearchDoc.user_id.in_(ids))
+        )
+        return {row.user_id: (row.title, row.content) for row in result}
+
+    async def index(
+        self,
+        docs: Sequence[dict[str, Any]],
+        commit: bool = True,
+    ) -> None:
+        """
+        Сохранить поисковые документы, заменяя существующие.
+
+        Полнотекстовый индекс SQLite обновляется триггерами таблицы.
+
+        Args:
+            docs (Sequence[dict[str, Any]]): Документы с ключами
+                user_id, bot_id, title и content.
+            commit (bool): Зафиксировать транзакцию. False — изменения
+                фиксирует вызывающий код вместе с другими.
+        """
+        if not docs:
+            return
+
+        insert_: Any = upsert_insert(self.session)
+        if insert_ is not None:
+            # Пакетами, чтобы не упереться в лимит параметров запроса
+            for start in range(0, len(docs), 200):
+                stmt: Any = insert_(SearchDoc).values(
+                    list(docs[start:start + 200])
+                )
+                await self.session.execute(stmt.on_conflict_do_update(
+                    index_elements=[SearchDoc.user_id],
+                    set_={
+                        "bot_id": stmt.excluded.bot_id,
+                        "title": stmt.excluded.title,
+                        "content": stmt.excluded.content,
+                    },
+                ))
+        else:
+            # Запасной путь для диалектов без ON CONFLICT
+            for doc in docs:
+                await self.session.merge(SearchDoc(**doc))
+        if commit:
+            await self.session.commit()
+
+    async def remove(
+        self,
+        user_ids: Iterable[int],
+        commit: bool = True,
+    ) -> int:
+        """
+        Удалить документы пользователей.
+
+        Args:
+            user_ids (Iterable[int]): ID пользователей.
+            commit (bool): Зафиксировать транзакцию.
+
+        Returns:
+            int: Количество удалённых документов.
+        """
+        ids: list[int] = list(user_ids)
+        if not ids:
+            return 0
+        result: Any = await self.session.execute(
+            delete(SearchDoc).where(SearchDoc.user_id.in_(ids))
+        )
+        if commit:
+            await self.session.commit()
+        return result.rowcount or 0
+
+    async def answers(
+        self,
+        after_id: int,
+        limit: int,
+    ) -> list[tuple[int, int, dict[str, str]]]:
+        """
+        Получить следующую страницу пользователей с их данными.
+
+        Args:
+            after_id (int): ID последнего полученного пользователя.
+            limit (int): Размер страницы.
+
+        Returns:
+            list[tuple[int, int, dict[str, str]]]: ID пользователя,
+                ID бота и словарь ключ–значение его данных в порядке
+                ID.
+        """
+        users: list[Any] = list(await self.session.execute(
+            select(User.id, User.bot_id)
+            .where(User.id > after_id)
+            .order_by(User.id)
+            .limit(limit)
+        ))
+        answers: dict[int, dict[str, str]] = {}
+        if users:
+            result = await self.session.execute(
+                select(Data.user_id, Data.key, Data.value).where(
+                    Data.user_id.in_([user.id for user in users])
+                )
+            )
+            for row in result:
+                answers.setdefault(row.user_id, {})[row.key] = row.value
+        return [
+            (user.id, user.bot_id, answers.get(user.id, {}))
+            for user in users
+        ]
+
+    async def search(
+        self,
+        bot_id: int,
+        terms: Sequence[str],
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[int, list[SearchHit]]:
+        """
+        Найти участников бота, в документах которых есть слова,
+        начинающиеся с каждого из terms.
+
+        Args:
+            bot_id (int): ID бота.
+            terms (Sequence[str]): Нормализованные слова запроса.
+            limit (int): Размер страницы результатов.
+            offset (int): Смещение страницы.
+
+        Returns:
+            tuple[int, list[SearchHit]]: Общее количество найденных
+                участников и страница результатов, лучшие первыми.
+        """
+        if not terms:
+            return 0, []
+
+        stmt: Any = (
+            select(SearchDoc.user_id, User.code, SearchDoc.title)
+            .join(User, User.id == SearchDoc.user_id)
+            .where(SearchDoc.bot_id == bot_id)
+        )
+        ranked: Any
+        if self.session.bind.dialect.name == "sqlite":
+            fts: Any = table(SEARCH_FTS, column("rowid"))
+            match: Any = literal_column(SEARCH_FTS).op("MATCH")(
+                " ".join(f'"{term}"*' for term in terms)
+            )
+            # Подсчёт через подзапрос: при соединении с индексом
+            # планировщик перебирает документы бота и для каждого
+            # выполняет MATCH заново
+            stmt = stmt.where(
+                SearchDoc.user_id.in_(select(fts.c.rowid).where(match))
+            )
+            ranked = (
+                stmt.join(fts, fts.c.rowid == SearchDoc.user_id)
+                .where(match)
+                .order_by(func.bm25(literal_column(SEARCH_FTS)))
+            )
+        else:
+            # Без полнотекстового индекса слово ищется в начале
+            # документа или после пробела
+            stmt = stmt.where(*(
+                or_(
+                    SearchDoc.content.startswith(term, autoescape=True),
+                    SearchDoc.content.contains(f" {term}", autoescape=True),
+                )
+                for term in terms
+            ))
+            ranked = stmt
+
+        total: int = await self.session.scalar(
+            select(func.count()).select_from(stmt.subquery())
+        ) or 0
+        if not total:
+            return 0, []
+
+        result = await self.session.execute(
+            ranked.order_by(SearchDoc.title, SearchDoc.user_id)
+            .limit(limit)
+            .offset(offset)
+        )
+        return total, [
+            (row.user_id, row.code, row.title) for row in result
+        ]
@@ -0,0 +1,18 @@
+"""
+Инициализация менеджера снимка строк таблицы.
+
+Объединяет функциональные возможности для работы с таблицей
+SheetRow: номера и хэши строк, выгруженных в Google Sheets.
+"""
+
+from .crud import SheetRowCRUD
+
+
+class SheetRowManager(SheetRowCRUD):
+    """
+    Полнофункциональный менеджер для работы со снимком строк.
+
+    Наследуемые классы:
+        SheetRowCRUD: Предоставляет CRUD-операции со снимком.
+    """
+    pass
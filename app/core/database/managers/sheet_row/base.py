@@ -0,0 +1,26 @@
+"""
+Базовый класс менеджера снимка строк таблицы.
+
+Содержит общую функциональность для работы с таблицей SheetRow
+через асинхронную сессию SQLAlchemy.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class SheetRowManagerBase:
+    """Базовый менеджер для работы с таблицей SheetRow."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+    ) -> None:
+        """
+        Инициализация менеджера снимка строк.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия для работы
+                с базой данных.
+        """
+        # Сохраняем сессию для дальнейшей работы с БД
+        self.session: AsyncSession = session
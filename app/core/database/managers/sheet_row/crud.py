@@ -0,0 +1,69 @@
+"""
+CRUD-операции для таблицы SheetRow.
+
+Содержит методы для чтения снимка выгруженных строк, времени
+изменения зарегистрированных пользователей и замены снимка после
+синхронизации.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import delete, select
+
+from ...models import SheetRow, User
+from .base import SheetRowManagerBase
+
+
+class SheetRowCRUD(SheetRowManagerBase):
+    """Класс для выполнения CRUD-операций со снимком строк."""
+
+    async def all(self) -> dict[int, SheetRow]:
+        """
+        Получить снимок всех выгруженных строк.
+
+        Returns:
+            dict[int, SheetRow]: Строки по ID пользователя.
+        """
+        result = await self.session.scalars(select(SheetRow))
+        return {row.user_id: row for row in result}
+
+    async def stamps(self) -> dict[int, datetime | None]:
+        """
+        Получить время изменения всех зарегистрированных пользователей.
+
+        Returns:
+            dict[int, datetime | None]: Время изменения по ID
+                пользователя.
+        """
+        result = await self.session.execute(
+            select(User.id, User.updated_at).where(
+                User.date_registration.is_not(None)
+            )
+        )
+        return {row.id: row.updated_at for row in result}
+
+    async def replace(
+        self,
+        rows: Sequence[SheetRow],
+        removed: Sequence[int] = (),
+    ) -> None:
+        """
+        Заменить строки снимка одной транзакцией.
+
+        Args:
+            rows (Sequence[SheetRow]): Новые строки снимка.
+            removed (Sequence[int]): ID пользователей, строки которых
+                удаляются из снимка.
+        """
+        user_ids: list[int] = [row.user_id for row in rows]
+        user_ids.extend(removed)
+        # Пакетами, чтобы не упереться в лимит параметров запроса
+        for start in range(0, len(user_ids), 500):
+            await self.session.execute(
+                delete(SheetRow).where(
+                    SheetRow.user_id.in_(user_ids[start:start + 500])
+                )
+            )
+        self.session.add_all(rows)
+        await self.session.commit()
@@ -0,0 +1,18 @@
+"""
+Инициализация менеджера статистики.
+
+Объединяет функциональные возможности для работы с таблицей
+StatCounter: приращения счётчиков, их чтение и пересчёт.
+"""
+
+from .crud import StatCRUD
+
+
+class StatManager(StatCRUD):
+    """
+    Полнофункциональный менеджер для работы со статистикой.
+
+    Наследуемые классы:
+        StatCRUD: Предоставляет CRUD-операции со счётчиками.
+    """
+    pass
@@ -0,0 +1,26 @@
+"""
+Базовый класс менеджера статистики.
+
+Содержит общую функциональность для работы с таблицей StatCounter
+через асинхронную сессию SQLAlchemy.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class StatManagerBase:
+    """Базовый менеджер для работы с таблицей StatCounter."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+    ) -> None:
+        """
+        Инициализация менеджера статистики.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия для работы
+                с базой данных.
+        """
+        # Сохраняем сессию для дальнейшей работы с БД
+        self.session: AsyncSession = session
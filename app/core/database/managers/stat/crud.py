@@ -0,0 +1,159 @@
+"""
+CRUD-операции для таблицы StatCounter.
+
+Содержит методы для приращения счётчиков одним запросом, чтения
+метрик по индексу и замены счётчиков при пересчёте.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import delete, select
+
+from ...dialect import upsert_insert
+from ...models import StatCounter
+from ...models.stat import StatKey
+from .base import StatManagerBase
+
+
+class StatCRUD(StatManagerBase):
+    """Класс для выполнения CRUD-операций со счётчиками статистики."""
+
+    async def add(
+        self,
+        deltas: Mapping[StatKey, int],
+        commit: bool = True,
+    ) -> None:
+        """
+        Прибавить приращения к счётчикам.
+
+        Для SQLite и PostgreSQL все счётчики изменяются одним
+        INSERT ... ON CONFLICT DO UPDATE SET value = value + приращение,
+        поэтому одновременные изменения из разных процессов не
+        теряются.
+
+        Args:
+            deltas (Mapping[StatKey, int]): Приращения по ключам
+                (ID бота, метрика, ключ).
+            commit (bool): Зафиксировать транзакцию. False — изменения
+                фиксирует вызывающий код вместе с другими.
+        """
+        rows: list[dict[str, Any]] = [
+            {"bot_id": bot_id, "metric": metric, "key": key, "value": value}
+            for (bot_id, metric, key), value in deltas.items() if value
+        ]
+        if not rows:
+            return
+
+        insert_: Any = upsert_insert(self.session)
+        if insert_ is not None:
+            # Пакетами, чтобы не упереться в лимит параметров запроса
+            for start in range(0, len(rows), 200):
+                stmt: Any = insert_(StatCounter).values(
+                    rows[start:start + 200]
+                )
+                await self.session.execute(stmt.on_conflict_do_update(
+                    index_elements=[
+                        StatCounter.bot_id,
+                        StatCounter.metric,
+                        StatCounter.key,
+                    ],
+                    set_={"value": StatCounter.value + stmt.excluded.value},
+                ))
+        else:
+            # Запасной путь для диалектов без ON CONFLICT
+            for row in rows:
+                counter: StatCounter | None = await self.session.scalar(
+                    select(StatCounter).where(
+                        StatCounter.bot_id == row["bot_id"],
+                        StatCounter.metric == row["metric"],
+                        StatCounter.key == row["key"],
+                    )
+                )
+                if counter is None:
+                    self.session.add(StatCounter(**row))
+                else:
+                    counter.value += row["value"]
+        if commit:
+            await self.session.commit()
+
+    async def get(
+        self,
+        bot_id: int,
+        metrics: Iterable[str],
+    ) -> dict[str, dict[str, int]]:
+        """
+        Получить значения метрик бота.
+
+        Args:
+            bot_id (int): ID бота.
+            metrics (Iterable[str]): Имена метрик.
+
+        Returns:
+            dict[str, dict[str, int]]: Значения по ключам для каждой
+                запрошенной метрики (пустой словарь, если счётчиков
+                нет).
+        """
+        names: list[str] = list(metrics)
+        found: dict[str, dict[str, int]] = {name: {} for name in names}
+        result = await self.session.execute(
+            select(StatCounter.metric, StatCounter.key, StatCounter.value)
+            .where(
+                StatCounter.bot_id == bot_id,
+                StatCounter.metric.in_(names),
+            )
+        )
+        for row in result:
+            found[row.metric][row.key] = row.value
+        return found
+
+    async def prefixed(
+        self,
+        bot_id: int,
+        prefix: str,
+    ) -> dict[str, dict[str, int]]:
+        """
+        Получить все метрики бота с именем, начинающимся с prefix.
+
+        Args:
+            bot_id (int): ID бота.
+            prefix (str): Префикс имени метрики.
+
+        Returns:
+            dict[str, dict[str, int]]: Значения по ключам для каждой
+                найденной метрики.
+        """
+        found: dict[str, dict[str, int]] = {}
+        result = await self.session.execute(
+            select(StatCounter.metric, StatCounter.key, StatCounter.value)
+            .where(
+                StatCounter.bot_id == bot_id,
+                StatCounter.metric.startswith(prefix, autoescape=True),
+            )
+        )
+        for row in result:
+            found.setdefault(row.metric, {})[row.key] = row.value
+        return found
+
+    async def replace(
+        self,
+        counters: Mapping[StatKey, int],
+        keep: Sequence[str] = (),
+    ) -> None:
+        """
+        Заменить все счётчики одной транзакцией.
+
+        Args:
+            counters (Mapping[StatKey, int]): Новые значения счётчиков.
+            keep (Sequence[str]): Метрики, которые не пересчитываются
+                и сохраняются.
+        """
+        await self.session.execute(
+            delete(StatCounter).where(StatCounter.metric.not_in(keep))
+        )
+        self.session.add_all(
+            StatCounter(bot_id=bot_id, metric=metric, key=key, value=value)
+            for (bot_id, metric, key), value in counters.items()
+            if value and metric not in keep
+        )
+        await self.session.commit()
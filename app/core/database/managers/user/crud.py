@@ -4,13 +4,15 @@ CRUD-операции для таблицы User.
 Содержит методы для создания, получения, обновления и удаления пользователей.
 """
 
-from typing import Any
+from typing import Any, Callable
 
 from loguru import logger
-from sqlalchemy import Result, select
+from sqlalchemy import Result, select, update
 from sqlalchemy.exc import SQLAlchemyError
 
+from ...dialect import upsert_insert
 from ...models import User
+from ..identity import cache_user_id, forget_user_id
 from .base import UserManagerBase
 
 
@@ -27,6 +29,10 @@ class UserCRUD(UserManagerBase):
         """
         Получить пользователя или создать нового, если его нет.
 
+        Для SQLite и PostgreSQL выполняется одним запросом
+        INSERT ... ON CONFLICT ... RETURNING, что исключает гонку между
+        чтением и вставкой.
+
         Args:
             tg_id (int): Telegram ID пользователя.
             bot_id (int): ID бота.
@@ -36,6 +42,33 @@ class UserCRUD(UserManagerBase):
         Returns:
             User: Существующий или созданный объект пользователя.
         """
+        insert_: Any = upsert_insert(self.session)
+        if insert_ is not None:
+            stmt: Any = insert_(User).values(
+                tg_id=tg_id,
+                bot_id=bot_id,
+                lang=lang,
+                msg_id=msg_id,
+                _state="1",
+            )
+            # Пустое обновление нужно, чтобы RETURNING вернул
+            # существующую строку при конфликте
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[User.tg_id, User.bot_id],
+                set_={"tg_id": stmt.excluded.tg_id},
+            ).returning(User)
+
+            created: User = (
+                await self.session.scalars(
+                    stmt,
+                    execution_options={"populate_existing": True},
+                )
+            ).one()
+            await self.session.commit()
+            cache_user_id(self.session, tg_id, bot_id, created.id)
+            return created
+
+        # Запасной путь для диалектов без ON CONFLICT
         user: User | None = await self.get(
             tg_id=tg_id,
             bot_id=bot_id,)
@@ -71,12 +104,98 @@ class UserCRUD(UserManagerBase):
                     User.bot_id == bot_id,
                 )
             )
-            return result.scalar_one_or_none()
+            user: User | None = result.scalar_one_or_none()
+            if user is not None:
+                # Запоминаем ID для менеджеров данных этой сессии
+                cache_user_id(self.session, tg_id, bot_id, user.id)
+            return user
         except SQLAlchemyError as e:
             # Логируем ошибку при получении пользователя
             logger.error(f"Ошибка при получении пользователя: {e}")
             return None
 
+    async def get_by_code(
+        self,
+        code: int,
+        bot_id: int,
+    ) -> User | None:
+        """
+        Получить участника по коду через уникальный индекс.
+
+        Args:
+            code (int): Код участника.
+            bot_id (int): ID бота.
+
+        Returns:
+            User | None: Объект User или None, если участника с таким
+                кодом в этом боте нет.
+        """
+        try:
+            return await self.session.scalar(
+                select(User).where(
+                    User.code == code,
+                    User.bot_id == bot_id,
+                )
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Ошибка при поиске участника по коду: {e}")
+            return None
+
+    async def get_by_id(
+        self,
+        user_id: int,
+        bot_id: int,
+    ) -> User | None:
+        """
+        Получить пользователя бота по ID записи.
+
+        Args:
+            user_id (int): ID пользователя в базе данных.
+            bot_id (int): ID бота.
+
+        Returns:
+            User | None: Объект User или None, если пользователя с
+                таким ID в этом боте нет.
+        """
+        try:
+            user: User | None = await self.session.get(User, user_id)
+        except SQLAlchemyError as e:
+            logger.error(f"Ошибка при получении пользователя по ID: {e}")
+            return None
+        if user is None or user.bot_id != bot_id:
+            return None
+        return user
+
+    async def assign_codes(
+        self,
+        encode: Callable[[int], int],
+    ) -> int:
+        """
+        Заполняет коды зарегистрированных участников, у которых кода
+        ещё нет.
+
+        Args:
+            encode (Callable[[int], int]): Функция ID → код.
+
+        Returns:
+            int: Количество заполненных кодов.
+        """
+        user_ids: list[int] = list(await self.session.scalars(
+            select(User.id).where(
+                User.code.is_(None),
+                User.date_registration.is_not(None),
+            )
+        ))
+        if not user_ids:
+            return 0
+
+        await self.session.execute(
+            update(User),
+            [{"id": user_id, "code": encode(user_id)} for user_id in user_ids],
+        )
+        await self.session.commit()
+        return len(user_ids)
+
     async def create(
         self,
         tg_id: int,
@@ -107,6 +226,7 @@ class UserCRUD(UserManagerBase):
         self.session.add(user)
         await self.session.commit()
         await self.session.refresh(user)
+        cache_user_id(self.session, tg_id, bot_id, user.id)
         return user
 
     async def delete(
@@ -134,6 +254,7 @@ class UserCRUD(UserManagerBase):
         # Удаляем пользователя и фиксируем изменения
         await self.session.delete(user)
         await self.session.commit()
+        forget_user_id(self.session, tg_id, bot_id)
         return True
 
     async def update(
@@ -0,0 +1,400 @@
+"""
+Модуль миграций существующей базы данных.
+
+Применяет изменения схемы, которые create_all не выполняет для уже
+созданных таблиц: добавляет новые колонки, удаляет дубликаты, создаёт
+уникальные индексы и полнотекстовый индекс поиска и переносит
+содержимое файлов из базы данных в хранилище на диске.
+"""
+
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import (Column, Connection, Index, Table, and_, case,
+                        delete, func, inspect, select, text, update)
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from .models import Base, UserFile
+from .models.search import SEARCH_FTS, SEARCH_FTS_DDL
+from .storage import BlobInfo, get_blob_store
+
+# Колонки, добавленные в модели после создания таблиц, и выражение
+# для заполнения существующих строк (None — оставить NULL). Тип
+# колонки берётся из модели и компилируется для диалекта базы
+NEW_COLUMNS: dict[str, dict[str, str | None]] = {
+    "admin": {
+        "role": "'moderator'",
+    },
+    "flag": {
+        "version": "0",
+    },
+    "user": {
+        "code": None,
+        "updated_at": "CURRENT_TIMESTAMP",
+    },
+}
+
+# Таблицы, в которых при удалении дубликатов сохраняется последняя
+# запись (с наибольшим id). В остальных сохраняется первая. То же
+# правило выбирает строку дочерней таблицы при переносе дубликата
+KEEP_LATEST: set[str] = {"data"}
+
+# Количество файлов, содержимое которых переносится на диск за один
+# запрос: тела файлов не загружаются в память все сразу
+BLOB_MOVE_BATCH: int = 100
+
+
+async def apply_migrations(
+    conn: AsyncConnection,
+) -> None:
+    """
+    Применяет миграции к существующей базе данных.
+
+    Args:
+        conn (AsyncConnection): Асинхронное соединение в транзакции.
+    """
+    await conn.run_sync(_add_columns)
+    await conn.run_sync(_create_unique_indexes)
+    await conn.run_sync(_create_search_index)
+    await conn.run_sync(_move_file_blobs)
+
+
+def _add_columns(
+    conn: Connection,
+) -> None:
+    """
+    Добавляет в существующие таблицы колонки из NEW_COLUMNS.
+
+    Коды зарегистрированных пользователей заполняются при запуске
+    бота: алгоритм кодов относится к боту, а не к базе данных.
+
+    Args:
+        conn (Connection): Синхронное соединение SQLAlchemy.
+    """
+    tables: set[str] = set(inspect(conn).get_table_names())
+    for table, new_columns in NEW_COLUMNS.items():
+        if table not in tables:
+            continue
+        columns: set[str] = {
+            column["name"] for column in inspect(conn).get_columns(table)
+        }
+        for name, fill in new_columns.items():
+            if name in columns:
+                continue
+            kind: str = Base.metadata.tables[table].c[name].type.compile(
+                dialect=conn.dialect
+            )
+            conn.execute(
+                text(f'ALTER TABLE "{table}" ADD COLUMN {name} {kind}')
+            )
+            if fill is not None:
+                conn.execute(text(f'UPDATE "{table}" SET {name} = {fill}'))
+            logger.info(f"Добавлена колонка {table}.{name}")
+
+
+def _create_unique_indexes(
+    conn: Connection,
+) -> None:
+    """
+    Создаёт отсутствующие уникальные индексы моделей.
+
+    Перед созданием индекса удаляет дублирующиеся строки и записи
+    дочерних таблиц, ссылающиеся на удалённые строки.
+
+    Args:
+        conn (Connection): Синхронное соединение SQLAlchemy.
+    """
+    for table in Base.metadata.sorted_tables:
+        existing: set[str | None] = {
+            index["name"] for index in inspect(conn).get_indexes(table.name)
+        }
+        for index in table.indexes:
+            if not index.unique or index.name in existing:
+                continue
+
+            removed: int = _drop_duplicates(conn, table, index)
+            index.create(conn, checkfirst=True)
+            logger.info(
+                f"Создан индекс {index.name} (удалено дубликатов: {removed})"
+            )
+
+
+def _create_search_index(
+    conn: Connection,
+) -> None:
+    """
+    Создаёт полнотекстовый индекс поиска участников (только SQLite).
+
+    Индекс, созданный для уже заполненной таблицы документов,
+    перестраивается по её содержимому.
+
+    Args:
+        conn (Connection): Синхронное соединение SQLAlchemy.
+    """
+    if conn.dialect.name != "sqlite":
+        return
+    if SEARCH_FTS in inspect(conn).get_table_names():
+        return
+
+    for statement in SEARCH_FTS_DDL:
+        conn.execute(text(statement))
+    conn.execute(
+        text(f"INSERT INTO {SEARCH_FTS}({SEARCH_FTS}) VALUES ('rebuild')")
+    )
+    logger.info(f"Создан полнотекстовый индекс {SEARCH_FTS}")
+
+
+def _drop_duplicates(
+    conn: Connection,
+    table: Table,
+    index: Index,
+) -> int:
+    """
+    Удаляет строки, нарушающие уникальность индекса.
+
+    Строки дочерних таблиц, ссылающиеся на удаляемые дубликаты,
+    переносятся на сохраняемую строку группы.
+
+    Args:
+        conn (Connection): Синхронное соединение SQLAlchemy.
+        table (Table): Таблица с индексом.
+        index (Index): Уникальный индекс.
+
+    Returns:
+        int: Количество удалённых строк.
+    """
+    aggregate = func.max if table.name in KEEP_LATEST else func.min
+    # Строки с NULL в колонках индекса не конфликтуют между собой
+    filled = and_(*(column.is_not(None) for column in index.columns))
+    groups = (
+        select(*index.columns, aggregate(table.c.id).label("keep_id"))
+        .where(filled)
+        .group_by(*index.columns)
+        .having(func.count() > 1)
+        .subquery()
+    )
+    # ID дубликата → ID сохраняемой строки его группы
+    moved: dict[int, int] = {
+        row_id: keep_id
+        for row_id, keep_id in conn.execute(
+            select(table.c.id, groups.c.keep_id)
+            .join(groups, and_(*(
+                column == groups.c[column.name]
+                for column in index.columns
+            )))
+            .where(table.c.id != groups.c.keep_id)
+        )
+    }
+    if not moved:
+        return 0
+
+    _merge_children(conn, table, moved)
+    result = conn.execute(delete(table).where(table.c.id.in_(moved)))
+    _drop_orphans(conn, table)
+    return result.rowcount or 0
+
+
+def _merge_children(
+    conn: Connection,
+    parent: Table,
+    moved: dict[int, int],
+) -> None:
+    """
+    Переносит строки дочерних таблиц с дубликатов на сохраняемые строки.
+
+    Если после переноса нарушится уникальный индекс дочерней таблицы
+    (например, ответ с тем же ключом есть у обоих пользователей),
+    остаётся одна строка: последняя для таблиц из KEEP_LATEST, первая
+    для остальных, а в таблицах без id — строка сохраняемой записи.
+
+    Args:
+        conn (Connection): Синхронное соединение SQLAlchemy.
+        parent (Table): Таблица с дубликатами.
+        moved (dict[int, int]): ID дубликата → ID сохраняемой строки.
+    """
+    for table in Base.metadata.sorted_tables:
+        for fk in table.foreign_keys:
+            if fk.column.table is not parent:
+                continue
+            column: Column[Any] = fk.parent
+            for key in _unique_keys(table, column):
+                _drop_conflicts(conn, table, column, key, moved)
+            conn.execute(
+                update(table)
+                .where(column.in_(moved))
+                .values({column: case(moved, value=column)})
+            )
+
+
+def _unique_keys(
+    table: Table,
+    column: Column[Any],
+) -> list[list[Column[Any]]]:
+    """
+    Возвращает уникальные ключи таблицы, включающие колонку.
+
+    Args:
+        table (Table): Дочерняя таблица.
+        column (Column[Any]): Колонка внешнего ключа.
+
+    Returns:
+        list[list[Column[Any]]]: Колонки уникальных индексов и
+            первичного ключа.
+    """
+    keys: list[list[Column[Any]]] = [
+        list(index.columns) for index in table.indexes
+        if index.unique and any(c is column for c in index.columns)
+    ]
+    if column.primary_key:
+        keys.append(list(table.primary_key.columns))
+    return keys
+
+
+def _drop_conflicts(
+    conn: Connection,
+    table: Table,
+    column: Column[Any],
+    key: list[Column[Any]],
+    moved: dict[int, int],
+) -> None:
+    """
+    Удаляет дочерние строки, которые совпадут по уникальному ключу
+    после переноса на сохраняемую запись.
+
+    Args:
+        conn (Connection): Синхронное соединение SQLAlchemy.
+        table (Table): Дочерняя таблица.
+        column (Column[Any]): Колонка внешнего ключа.
+        key (list[Column[Any]]): Колонки уникального ключа.
+        moved (dict[int, int]): ID дубликата → ID сохраняемой строки.
+    """
+    primary: list[Column[Any]] = list(table.primary_key.columns)
+    parents: set[int] = set(moved) | set(moved.values())
+    rows: Any = conn.execute(
+        select(*dict.fromkeys([*primary, *key])).where(column.in_(parents))
+    ).mappings()
+
+    winners: dict[tuple[Any, ...], Any] = {}
+    losers: list[Any] = []
+    for row in rows:
+        target: int = moved.get(row[column.name], row[column.name])
+        group: tuple[Any, ...] = tuple(
+            target if c is column else row[c.name] for c in key
+        )
+        current: Any = winners.get(group)
+        if current is None:
+            winners[group] = row
+            continue
+        if _prefer(table, column, row, current, moved):
+            winners[group] = row
+            losers.append(current)
+        else:
+            losers.append(row)
+
+    for row in losers:
+        conn.execute(
+            delete(table).where(and_(*(c == row[c.name] for c in primary)))
+        )
+
+
+def _prefer(
+    table: Table,
+    column: Column[Any],
+    row: Any,
+    current: Any,
+    moved: dict[int, int],
+) -> bool:
+    """
+    Проверяет, сохранить ли строку вместо ранее выбранной.
+
+    Args:
+        table (Table): Дочерняя таблица.
+        column (Column[Any]): Колонка внешнего ключа.
+        row (Any): Проверяемая строка.
+        current (Any): Ранее выбранная строка группы.
+        moved (dict[int, int]): ID дубликата → ID сохраняемой строки.
+
+    Returns:
+        bool: True, если строка row важнее current.
+    """
+    if "id" in table.c:
+        if table.name in KEEP_LATEST:
+            return row["id"] > current["id"]
+        return row["id"] < current["id"]
+    return row[column.name] not in moved
+
+
+def _drop_orphans(
+    conn: Connection,
+    parent: Table,
+) -> None:
+    """
+    Удаляет строки дочерних таблиц без родительской записи.
+
+    Args:
+        conn (Connection): Синхронное соединение SQLAlchemy.
+        parent (Table): Таблица, из которой были удалены строки.
+    """
+    for table in Base.metadata.sorted_tables:
+        for fk in table.foreign_keys:
+            if fk.column.table is not parent:
+                continue
+            conn.execute(
+                delete(table).where(
+                    fk.parent.not_in(select(fk.column))
+                )
+            )
+
+
+def _move_file_blobs(
+    conn: Connection,
+) -> None:
+    """
+    Переносит содержимое файлов из колонки user_file.data на диск.
+
+    Для старых баз добавляет колонки sha256 и size, сохраняет
+    содержимое в хранилище и удаляет колонку data.
+
+    Args:
+        conn (Connection): Синхронное соединение SQLAlchemy.
+    """
+    table: str = UserFile.__tablename__
+    columns: set[str] = {
+        column["name"] for column in inspect(conn).get_columns(table)
+    }
+    if "data" not in columns:
+        return
+
+    if "sha256" not in columns:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN sha256 VARCHAR(64)"))
+    if "size" not in columns:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN size BIGINT"))
+
+    store = get_blob_store()
+    moved: int = 0
+    last_id: int = 0
+    while True:
+        # Постраничное чтение по id: в памяти не больше одной страницы
+        rows: Any = conn.execute(
+            text(f"SELECT id, data FROM {table} WHERE id > :last_id "
+                 "ORDER BY id LIMIT :limit"),
+            {"last_id": last_id, "limit": BLOB_MOVE_BATCH},
+        ).all()
+        if not rows:
+            break
+        for row_id, content in rows:
+            info: BlobInfo = store.write_sync(bytes(content or b""))
+            conn.execute(
+                text(f"UPDATE {table} SET sha256 = :sha256, size = :size "
+                     "WHERE id = :id"),
+                {"sha256": info.sha256, "size": info.size, "id": row_id},
+            )
+            moved += 1
+        last_id = rows[-1][0]
+
+    conn.execute(text(f"ALTER TABLE {table} DROP COLUMN data"))
+    conn.execute(
+        text(f"CREATE INDEX IF NOT EXISTS ix_{table}_sha256 "
+             f"ON {table} (sha256)")
+    )
+    logger.info(f"Содержимое файлов перенесено в хранилище: {moved}")
@@ -7,17 +7,29 @@
 
 from .admin import Admin
 from .base import Base
+from .broadcast import Broadcast
 from .data import Data
 from .file import UserFile
 from .flag import Flag
+from .media import Media
+from .outbox import SheetOutbox
+from .search import SearchDoc
+from .sheet_row import SheetRow
+from .stat import StatCounter
 from .user import User
 
 # Список публичных объектов модуля
 __all__: list[str] = [
     "Admin",
     "Base",
+    "Broadcast",
     "Data",
     "UserFile",
     "Flag",
+    "Media",
+    "SearchDoc",
+    "SheetOutbox",
+    "SheetRow",
+    "StatCounter",
     "User",
 ]
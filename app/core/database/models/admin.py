@@ -2,12 +2,12 @@
 Модуль модели администратора.
 
 Содержит ORM-модель администратора Telegram с полями для
-идентификации, состояния, языка и текста сообщений.
+идентификации, роли, состояния, языка и текста сообщений.
 """
 
 from typing import Any
 
-from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy import BigInteger, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -17,6 +17,15 @@ class Admin(Base):
     """ORM-модель администратора Telegram."""
 
     __tablename__: Any = "admin"
+    __table_args__: Any = (
+        # Уникальный составной индекс для поиска и upsert
+        Index(
+            "ix_admin_tg_id_bot_id",
+            "tg_id",
+            "bot_id",
+            unique=True,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -59,6 +68,11 @@ class Admin(Base):
         Integer,
         nullable=False
     )
+    role: Mapped[str] = mapped_column(
+        String(16),
+        default="moderator",
+        nullable=False
+    )
 
     @property
     def state(self) -> list[str]:
@@ -0,0 +1,113 @@
+"""
+Модуль модели рассылки.
+
+Содержит ORM-модель задания массовой рассылки: текст с разметкой,
+статус, курсор по ID пользователей и счётчики. Курсор сохраняется
+после каждого пакета получателей, поэтому после перезапуска бота
+рассылка продолжается с места остановки.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+# Статусы рассылки
+STATUS_RUNNING: str = "running"
+STATUS_DONE: str = "done"
+STATUS_CANCELLED: str = "cancelled"
+# Черновик: сохранённый текст рассылки администратора, ещё не запущенной
+STATUS_DRAFT: str = "draft"
+
+
+class Broadcast(Base):
+    """ORM-модель задания рассылки."""
+
+    __tablename__: Any = "broadcast"
+    __table_args__: Any = (
+        # Поиск незавершённых рассылок бота при запуске
+        Index(
+            "ix_broadcast_bot_id_status",
+            "bot_id",
+            "status",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True
+    )
+    bot_id: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False
+    )
+    admin_tg_id: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False
+    )
+    # Язык администратора для отчёта о прогрессе
+    lang: Mapped[str] = mapped_column(
+        String(8),
+        nullable=False,
+        default="ru"
+    )
+    text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False
+    )
+    entities: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        default="None"
+    )
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default=STATUS_RUNNING
+    )
+    # ID последнего обработанного пользователя (keyset-курсор)
+    last_user_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
+    total: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
+    sent: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
+    failed: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
+    # Сообщение администратора, в котором обновляется прогресс
+    progress_msg_id: Mapped[int | None] = mapped_column(
+        Integer
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        server_default=func.current_timestamp()
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime
+    )
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление объекта Broadcast.
+
+        Returns:
+            str: Строка с ID и статусом рассылки.
+        """
+        return f"<Broadcast id={self.id} status={self.status}>"
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -21,6 +21,15 @@ class Data(Base):
     """ORM-модель хранения ключ–значение для пользователя."""
 
     __tablename__: Any = "data"
+    __table_args__: Any = (
+        # Уникальный составной индекс для поиска и upsert
+        Index(
+            "ix_data_user_id_key",
+            "user_id",
+            "key",
+            unique=True,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(
@@ -1,14 +1,16 @@
 """
 Модуль модели данных файлов пользователя.
 
-Содержит ORM-модель хранения самих файлов для конкретного пользователя.
+Содержит ORM-модель метаданных файлов пользователя. Содержимое файлов
+хранится в контентно-адресуемом хранилище на диске, в базе остаются
+только хэш, размер и MIME-тип.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ForeignKey, Integer, LargeBinary, String
+from sqlalchemy import BigInteger, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -18,7 +20,7 @@ if TYPE_CHECKING:
 
 
 class UserFile(Base):
-    """ORM-модель хранения файлов для пользователя."""
+    """ORM-модель метаданных файла пользователя."""
 
     __tablename__: Any = "user_file"
 
@@ -28,8 +30,9 @@ class UserFile(Base):
         nullable=False
     )
     filename: Mapped[str] = mapped_column(String(255), nullable=False)  # имя файла
-    content_type: Mapped[str] = mapped_column(String(50), nullable=True)  # MIME-тип файла
-    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # сам файл в бинарном виде
+    content_type: Mapped[str] = mapped_column(String(127), nullable=True)  # MIME-тип файла
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False, index=True)  # хэш содержимого
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)  # размер в байтах
 
     # Связь с пользователем
     user: Mapped["User"] = relationship(
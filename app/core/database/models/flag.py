@@ -1,7 +1,8 @@
 """
 Модуль модели флагов.
 
-Содержит ORM-модель для хранения флагов в формате имя:значение.
+Содержит ORM-модель для хранения флагов в формате имя:значение
+с номером версии последнего изменения.
 """
 
 from __future__ import annotations
@@ -33,6 +34,13 @@ class Flag(Base):
         nullable=False,
         default=False
     )
+    # Номер изменения: каждое изменение получает номер больше всех
+    # существующих, поэтому максимум — версия всего набора флагов
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
 
     def __repr__(self) -> str:
         """Возвращает строковое представление объекта Flag.
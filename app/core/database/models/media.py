@@ -0,0 +1,56 @@
+"""
+Модуль модели загруженных медиафайлов.
+
+Содержит ORM-модель для хранения file_id, которые Telegram выдаёт
+после загрузки файла. file_id действителен только для бота, который
+загрузил файл, поэтому ключ записи — пара (бот, ключ медиа).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import BigInteger, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class Media(Base):
+    """ORM-модель file_id загруженного медиафайла."""
+
+    __tablename__: Any = "media"
+    __table_args__: Any = (
+        # Уникальный составной индекс для поиска и upsert
+        Index(
+            "ix_media_bot_id_key",
+            "bot_id",
+            "key",
+            unique=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True
+    )
+    bot_id: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False
+    )
+    key: Mapped[str] = mapped_column(
+        String(128),
+        nullable=False
+    )
+    file_id: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление объекта Media.
+
+        Returns:
+            str: Строка с ID бота и ключом медиа.
+        """
+        return f"<Media bot_id={self.bot_id} key={self.key}>"
@@ -0,0 +1,54 @@
+"""
+Модуль модели очереди экспорта в Google Sheets.
+
+Содержит ORM-модель записи outbox: операция экспорта сохраняется в
+базе до отправки и удаляется после успешной записи в таблицу, поэтому
+при перезапуске бота неотправленные операции не теряются.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class SheetOutbox(Base):
+    """ORM-модель операции экспорта, ожидающей отправки."""
+
+    __tablename__: Any = "sheet_outbox"
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True
+    )
+    kind: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False
+    )
+    payload: Mapped[str] = mapped_column(
+        Text,
+        nullable=False
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        server_default=func.current_timestamp()
+    )
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление объекта SheetOutbox.
+
+        Returns:
+            str: Строка с ID и типом операции.
+        """
+        return f"<SheetOutbox id={self.id} kind={self.kind}>"
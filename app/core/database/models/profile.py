@@ -0,0 +1,104 @@
+"""
+Модуль таблицы профилей участников.
+
+Профиль — типизированная копия ответов зарегистрированного
+пользователя: одна строка на пользователя и одна колонка на шаг
+анкеты. Набор колонок задаётся шагами локализации, поэтому таблица
+описывается не ORM-моделью, а функцией profile_table, строящей
+таблицу по списку колонок. Модуль также содержит разбор строковых
+значений ответов по типу шага, общий для проверки ввода, записи
+данных и заполнения профилей.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import (BigInteger, Boolean, Column, Date, DateTime, Index,
+                        Integer, MetaData, String, Table)
+from sqlalchemy.types import TypeEngine
+
+# Имя таблицы профилей
+PROFILE_TABLE: str = "profile"
+
+# Служебные колонки профиля
+FIXED_COLUMNS: tuple[str, ...] = ("user_id", "bot_id", "updated_at")
+
+# Колонка профиля: (имя колонки, тип значения шага)
+ProfileColumn = tuple[str, str]
+
+
+def _parse_bool(
+    value: str,
+) -> bool:
+    """Разбирает логическое значение ("true" — истина)."""
+    return value.lower() == "true"
+
+
+def _parse_date(
+    value: str,
+) -> date:
+    """Разбирает дату в формате ДД.ММ.ГГГГ."""
+    return datetime.strptime(value, "%d.%m.%Y").date()
+
+
+def _parse_time(
+    value: str,
+) -> datetime:
+    """Разбирает дату и время в формате ДД.ММ.ГГГГ ЧЧ:ММ:СС."""
+    return datetime.strptime(value, "%d.%m.%Y %H:%M:%S")
+
+
+# Разбор строкового значения по типу шага. Ошибка разбора означает,
+# что значение не соответствует типу
+VALUE_PARSERS: dict[str, Callable[[str], Any]] = {
+    "int": int,
+    "bool": _parse_bool,
+    "date": _parse_date,
+    "time": _parse_time,
+    "str": str,
+}
+
+# Тип колонки профиля по типу значения шага
+COLUMN_TYPES: dict[str, Callable[[], TypeEngine[Any]]] = {
+    "int": Integer,
+    "bool": Boolean,
+    "date": Date,
+    "time": DateTime,
+    "str": String,
+}
+
+
+@lru_cache(maxsize=16)
+def profile_table(
+    columns: tuple[ProfileColumn, ...],
+) -> Table:
+    """
+    Описывает таблицу профилей с заданными колонками ответов.
+
+    Таблица не входит в метаданные моделей: её создаёт и изменяет
+    менеджер профилей, когда меняются шаги анкеты.
+
+    Args:
+        columns (tuple[ProfileColumn, ...]): Колонки ответов в порядке
+            шагов.
+
+    Returns:
+        Table: Описание таблицы.
+    """
+    return Table(
+        PROFILE_TABLE,
+        MetaData(),
+        # ID пользователя; строка удаляется при отмене регистрации
+        Column("user_id", Integer, primary_key=True, autoincrement=False),
+        Column("bot_id", BigInteger, nullable=False),
+        Column("updated_at", DateTime, nullable=True),
+        *(
+            Column(name, COLUMN_TYPES.get(value_type, String)())
+            for name, value_type in columns
+        ),
+        Index("ix_profile_bot_id", "bot_id"),
+    )
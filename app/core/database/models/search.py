@@ -0,0 +1,80 @@
+"""
+Модуль модели поискового документа участника.
+
+Содержит ORM-модель документа: нормализованный текст выбранных
+ответов пользователя и подпись для результатов поиска. В SQLite по
+таблице строится полнотекстовый индекс FTS5 (внешнее содержимое,
+rowid — ID пользователя), который поддерживается триггерами;
+в остальных СУБД поиск идёт по самой таблице.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import (BigInteger, ForeignKey, Index, Integer, String,
+                        Text)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+# Полнотекстовый индекс SQLite по таблице search_doc
+SEARCH_FTS: str = "search_fts"
+
+# Создание индекса и триггеров, синхронизирующих его с таблицей
+SEARCH_FTS_DDL: tuple[str, ...] = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_FTS} USING fts5("
+    "content, content='search_doc', content_rowid='user_id', "
+    "tokenize='unicode61 remove_diacritics 0')",
+    "CREATE TRIGGER IF NOT EXISTS search_doc_ai AFTER INSERT ON search_doc "
+    f"BEGIN INSERT INTO {SEARCH_FTS}(rowid, content) "
+    "VALUES (new.user_id, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS search_doc_ad AFTER DELETE ON search_doc "
+    f"BEGIN INSERT INTO {SEARCH_FTS}({SEARCH_FTS}, rowid, content) "
+    "VALUES ('delete', old.user_id, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS search_doc_au AFTER UPDATE ON search_doc "
+    f"BEGIN INSERT INTO {SEARCH_FTS}({SEARCH_FTS}, rowid, content) "
+    "VALUES ('delete', old.user_id, old.content); "
+    f"INSERT INTO {SEARCH_FTS}(rowid, content) "
+    "VALUES (new.user_id, new.content); END",
+)
+
+
+class SearchDoc(Base):
+    """ORM-модель поискового документа участника."""
+
+    __tablename__: Any = "search_doc"
+    __table_args__: Any = (
+        Index(
+            "ix_search_doc_bot_id",
+            "bot_id",
+        ),
+    )
+
+    # ID пользователя (rowid полнотекстового индекса)
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("user.id", ondelete="CASCADE"),
+        primary_key=True,
+        autoincrement=False
+    )
+    bot_id: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False
+    )
+    title: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False
+    )
+    content: Mapped[str] = mapped_column(
+        Text,
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление объекта SearchDoc.
+
+        Returns:
+            str: Строка с ID пользователя и подписью.
+        """
+        return f"<SearchDoc user_id={self.user_id} title={self.title}>"
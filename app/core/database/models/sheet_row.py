@@ -0,0 +1,61 @@
+"""
+Модуль модели снимка экспортированных строк таблицы.
+
+Содержит ORM-модель строки Google Sheets, уже выгруженной для
+пользователя: номер строки, хэш значений и время синхронизации.
+По снимку синхронизация находит изменившиеся строки, не читая
+таблицу. Заголовок хранится как строка с user_id = 0.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class SheetRow(Base):
+    """ORM-модель снимка строки таблицы."""
+
+    __tablename__: Any = "sheet_row"
+    __table_args__: Any = (
+        # Одна строка таблицы на пользователя
+        Index(
+            "ix_sheet_row_user_id",
+            "user_id",
+            unique=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True
+    )
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False
+    )
+    row: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False
+    )
+    digest: Mapped[str] = mapped_column(
+        String(40),
+        nullable=False
+    )
+    synced_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление объекта SheetRow.
+
+        Returns:
+            str: Строка с ID пользователя и номером строки.
+        """
+        return f"<SheetRow user_id={self.user_id} row={self.row}>"
@@ -0,0 +1,72 @@
+"""
+Модуль модели счётчиков статистики.
+
+Содержит ORM-модель счётчика регистраций: метрика (например, число
+регистраций за день или выбравших вариант ответа), ключ внутри
+метрики и значение. Счётчики изменяются приращениями при регистрации
+и её отмене, поэтому статистика читается без обхода таблиц user и
+data.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import BigInteger, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+# Ключ счётчика: (ID бота, метрика, ключ внутри метрики)
+StatKey = tuple[int, str, str]
+
+
+class StatCounter(Base):
+    """ORM-модель счётчика статистики."""
+
+    __tablename__: Any = "stat_counter"
+    __table_args__: Any = (
+        # Один счётчик на метрику и ключ бота; по префиксу индекса
+        # читаются все ключи метрики
+        Index(
+            "ix_stat_counter_bot_id_metric_key",
+            "bot_id",
+            "metric",
+            "key",
+            unique=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True
+    )
+    bot_id: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False
+    )
+    metric: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False
+    )
+    key: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        default=""
+    )
+    value: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление объекта StatCounter.
+
+        Returns:
+            str: Строка с метрикой, ключом и значением.
+        """
+        return (
+            f"<StatCounter metric={self.metric} key={self.key} "
+            f"value={self.value}>"
+        )
@@ -10,8 +10,9 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import BigInteger, DateTime, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, func
+from sqlalchemy.orm import (Mapped, WriteOnlyMapped, mapped_column,
+                            relationship)
 
 from .base import Base
 
@@ -24,6 +25,21 @@ class User(Base):
     """ORM-модель пользователя Telegram."""
 
     __tablename__: Any = "user"
+    __table_args__: Any = (
+        # Уникальный составной индекс для поиска и upsert
+        Index(
+            "ix_user_tg_id_bot_id",
+            "tg_id",
+            "bot_id",
+            unique=True,
+        ),
+        # Уникальный индекс для поиска участника по коду
+        Index(
+            "ix_user_code",
+            "code",
+            unique=True,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -62,6 +78,14 @@ class User(Base):
     date_confirm: Mapped[datetime | None] = mapped_column(
         DateTime
     )
+    code: Mapped[int | None] = mapped_column(
+        Integer
+    )
+    # Время последнего изменения (UTC) для инкрементальной выгрузки
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime,
+        server_default=func.current_timestamp()
+    )
 
     data: Mapped[list[Data]] = relationship(
         "Data",
@@ -69,10 +93,12 @@ class User(Base):
         cascade="all, delete-orphan"
     )
 
-    files: Mapped[list["UserFile"]] = relationship(
+    # Файлы не загружаются вместе с пользователем: метаданные
+    # запрашиваются явно через FileManager
+    files: WriteOnlyMapped["UserFile"] = relationship(
         "UserFile",
         back_populates="user",
-        lazy="selectin"
+        passive_deletes=True
     )
 
     # ------------------------------------------------------------------
@@ -0,0 +1,32 @@
+"""
+Пакет файлового хранилища.
+
+Содержит контентно-адресуемое хранилище содержимого файлов
+пользователей и функцию доступа к его глобальному экземпляру.
+"""
+
+from typing import Final
+
+from app.config import BLOBS_DIR
+
+from .blob import BlobInfo, BlobStore
+
+# Единое хранилище содержимого файлов для всего приложения
+_blob_store: Final[BlobStore] = BlobStore(root=BLOBS_DIR)
+
+
+def get_blob_store() -> BlobStore:
+    """
+    Возвращает глобальный экземпляр BlobStore.
+
+    Returns:
+        BlobStore: Хранилище содержимого файлов.
+    """
+    return _blob_store
+
+
+__all__: list[str] = [
+    "BlobInfo",
+    "BlobStore",
+    "get_blob_store",
+]
@@ -0,0 +1,300 @@
+"""
+Модуль контентно-адресуемого хранилища файлов.
+
+Содержит класс BlobStore, который хранит содержимое файлов на диске
+по SHA-256 хэшу и предоставляет потоковые API чтения и записи.
+Содержимое без ссылок удаляется сборщиком (sweep), а не при удалении
+файла: одновременная запись того же содержимого не потеряет данные.
+"""
+
+import asyncio
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator
+
+import aiofiles
+import aiofiles.os
+
+# Размер блока потокового чтения (64 КиБ)
+CHUNK_SIZE: int = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class BlobInfo:
+    """Сведения о сохранённом содержимом.
+
+    Атрибуты:
+        sha256 (str): Хэш содержимого в шестнадцатеричном виде.
+        size (int): Размер содержимого в байтах.
+    """
+    sha256: str
+    size: int
+
+
+class BlobStore:
+    """Контентно-адресуемое хранилище файлов на диске.
+
+    Файл с хэшем ``abcdef...`` хранится по пути ``ab/cd/abcdef...``.
+    Одинаковое содержимое хранится один раз.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+    ) -> None:
+        """
+        Инициализация хранилища.
+
+        Args:
+            root (Path): Корневая директория хранилища.
+        """
+        self.root: Path = root
+        self.tmp_dir: Path = root / "tmp"
+
+    def path(
+        self,
+        sha256: str,
+    ) -> Path:
+        """
+        Возвращает путь к содержимому по хэшу.
+
+        Args:
+            sha256 (str): Хэш содержимого.
+
+        Returns:
+            Path: Путь к файлу содержимого.
+        """
+        return self.root / sha256[:2] / sha256[2:4] / sha256
+
+    def exists(
+        self,
+        sha256: str,
+    ) -> bool:
+        """
+        Проверяет наличие содержимого в хранилище.
+
+        Args:
+            sha256 (str): Хэш содержимого.
+
+        Returns:
+            bool: True, если содержимое сохранено.
+        """
+        return self.path(sha256).is_file()
+
+    async def write(
+        self,
+        chunks: AsyncIterable[bytes] | bytes,
+    ) -> BlobInfo:
+        """
+        Потоково сохраняет содержимое и возвращает его хэш и размер.
+
+        Данные пишутся во временный файл с одновременным вычислением
+        хэша, затем файл атомарно переносится на своё место.
+
+        Args:
+            chunks (AsyncIterable[bytes] | bytes): Поток блоков данных
+                или содержимое целиком.
+
+        Returns:
+            BlobInfo: Хэш и размер сохранённого содержимого.
+        """
+        await aiofiles.os.makedirs(self.tmp_dir, exist_ok=True)
+        tmp_path: Path = self.tmp_dir / uuid.uuid4().hex
+
+        digest = hashlib.sha256()
+        size: int = 0
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in _iterate(chunks):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    await f.write(chunk)
+
+            info = BlobInfo(sha256=digest.hexdigest(), size=size)
+            target: Path = self.path(info.sha256)
+            if _touch(target):
+                # Такое содержимое уже сохранено
+                await aiofiles.os.remove(tmp_path)
+            else:
+                await aiofiles.os.makedirs(target.parent, exist_ok=True)
+                await aiofiles.os.replace(tmp_path, target)
+            return info
+
+        except BaseException:
+            if tmp_path.exists():
+                os.remove(tmp_path)
+            raise
+
+    def write_sync(
+        self,
+        content: bytes,
+    ) -> BlobInfo:
+        """
+        Синхронно сохраняет содержимое (для миграций).
+
+        Args:
+            content (bytes): Содержимое файла.
+
+        Returns:
+            BlobInfo: Хэш и размер сохранённого содержимого.
+        """
+        info = BlobInfo(
+            sha256=hashlib.sha256(content).hexdigest(),
+            size=len(content),
+        )
+        target: Path = self.path(info.sha256)
+        if not _touch(target):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path: Path = target.with_suffix(".tmp")
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, target)
+        return info
+
+    async def read(
+        self,
+        sha256: str,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Потоково читает содержимое по хэшу.
+
+        Args:
+            sha256 (str): Хэш содержимого.
+            chunk_size (int): Размер блока чтения в байтах.
+
+        Yields:
+            bytes: Очередной блок содержимого.
+
+        Raises:
+            FileNotFoundError: Содержимое отсутствует в хранилище.
+        """
+        async with aiofiles.open(self.path(sha256), "rb") as f:
+            while chunk := await f.read(chunk_size):
+                yield chunk
+
+    async def delete(
+        self,
+        sha256: str,
+    ) -> bool:
+        """
+        Удаляет содержимое из хранилища.
+
+        Args:
+            sha256 (str): Хэш содержимого.
+
+        Returns:
+            bool: True, если содержимое было удалено.
+        """
+        try:
+            await aiofiles.os.remove(self.path(sha256))
+            return True
+        except FileNotFoundError:
+            return False
+
+    async def sweep(
+        self,
+        referenced: set[str],
+        before: float,
+    ) -> int:
+        """
+        Удаляет содержимое, на которое нет ссылок.
+
+        Args:
+            referenced (set[str]): Хэши содержимого, на которое
+                ссылаются файлы.
+            before (float): Время (Unix), раньше которого должно быть
+                последнее сохранение удаляемого содержимого.
+
+        Returns:
+            int: Количество удалённых файлов содержимого.
+        """
+        return await asyncio.to_thread(self._sweep_sync, referenced, before)
+
+    def _sweep_sync(
+        self,
+        referenced: set[str],
+        before: float,
+    ) -> int:
+        """
+        Синхронная часть sweep, выполняется в пуле потоков.
+
+        Args:
+            referenced (set[str]): Хэши содержимого со ссылками.
+            before (float): Граница времени последнего сохранения.
+
+        Returns:
+            int: Количество удалённых файлов содержимого.
+        """
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        removed: int = 0
+        for path in self.root.glob("??/??/*"):
+            if path.name in referenced:
+                continue
+            trash: Path = self.tmp_dir / f"sweep-{path.name}"
+            try:
+                if path.stat().st_mtime >= before:
+                    continue
+                # Перенос атомарен: запись, которая обновит время
+                # после него, не найдёт файл и сохранит его заново
+                os.replace(path, trash)
+            except FileNotFoundError:
+                continue
+            if trash.stat().st_mtime >= before:
+                # Запись обновила время между проверкой и переносом
+                os.replace(trash, path)
+                continue
+            trash.unlink()
+            removed += 1
+
+        # Временные файлы прерванных записей
+        for path in self.tmp_dir.iterdir():
+            try:
+                if path.stat().st_mtime < before:
+                    path.unlink()
+            except FileNotFoundError:
+                continue
+        return removed
+
+
+def _touch(
+    path: Path,
+) -> bool:
+    """
+    Обновляет время изменения сохранённого содержимого.
+
+    Сборщик не удаляет недавно сохранённое содержимое, поэтому ссылка
+    на него успеет попасть в базу данных.
+
+    Args:
+        path (Path): Путь к файлу содержимого.
+
+    Returns:
+        bool: True, если файл существует.
+    """
+    try:
+        os.utime(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+async def _iterate(
+    chunks: AsyncIterable[bytes] | bytes,
+) -> AsyncIterator[bytes]:
+    """
+    Приводит содержимое к асинхронному потоку блоков.
+
+    Args:
+        chunks (AsyncIterable[bytes] | bytes): Поток или байты.
+
+    Yields:
+        bytes: Очередной блок данных.
+    """
+    if isinstance(chunks, bytes):
+        yield chunks
+        return
+    async for chunk in chunks:
+        yield chunk
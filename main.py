@@ -5,11 +5,19 @@
 """
 
 import asyncio
+import sys
 
 from loguru import logger
 
-from app.config.settings import BOT_TOKEN
+from app.config.settings import BOT_TOKEN, IMAGE_PREBUILD_WORKERS
 from app.core import init_db, run_bot
+from app.core.database import FileManager, async_session
+from app.core.bot.services.generator.prebuild import prebuild_code_images
+from app.core.bot.services.google_sheets import (get_sheet_exporter,
+                                                 get_sheet_sync)
+from app.core.bot.services.profile import get_profile_service
+from app.core.bot.services.search import rebuild_search_index
+from app.core.bot.services.stats import rebuild_stats
 
 
 async def main() -> None:
@@ -27,6 +35,9 @@ async def main() -> None:
         # Инициализация базы данных перед запуском бота.
         await init_db()
 
+        # Приведение таблицы профилей к текущим шагам анкеты.
+        await get_profile_service().prepare()
+
         # Запуск Telegram-бота.
         await run_bot(api_tokens=BOT_TOKEN)
 
@@ -42,5 +53,56 @@ async def main() -> None:
         logger.debug("Приложение завершило работу корректно")
 
 
+async def sheet_sync(dry_run: bool) -> None:
+    """
+    Синхронизирует таблицу с базой без запуска бота.
+
+    Args:
+        dry_run (bool): Только вывести изменения, не записывая их.
+    """
+    await init_db()
+    await get_sheet_sync().sync(dry_run=dry_run)
+    await get_sheet_exporter().close()
+
+
+async def stats_rebuild() -> None:
+    """Пересчитывает счётчики статистики по существующим данным."""
+    await init_db()
+    await rebuild_stats()
+
+
+async def profile_rebuild() -> None:
+    """Пересоздаёт таблицу профилей и заполняет её по таблице data."""
+    await init_db()
+    await get_profile_service().prepare(force=True)
+
+
+async def search_rebuild() -> None:
+    """Перестраивает поисковый индекс участников по существующим данным."""
+    await init_db()
+    await rebuild_search_index()
+
+
+async def blob_gc() -> None:
+    """Удаляет из хранилища содержимое файлов, на которое нет ссылок."""
+    await init_db()
+    async with async_session() as session:
+        await FileManager(session).collect_garbage()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    if sys.argv[1:] == ["prebuild"]:
+        # Рендеринг изображений всех кодов без запуска бота
+        asyncio.run(prebuild_code_images(IMAGE_PREBUILD_WORKERS))
+    elif sys.argv[1:2] == ["sheet-sync"]:
+        asyncio.run(sheet_sync(dry_run="--dry-run" in sys.argv[2:]))
+    elif sys.argv[1:] == ["stats-rebuild"]:
+        asyncio.run(stats_rebuild())
+    elif sys.argv[1:] == ["profile-rebuild"]:
+        asyncio.run(profile_rebuild())
+    elif sys.argv[1:] == ["search-rebuild"]:
+        asyncio.run(search_rebuild())
+    elif sys.argv[1:] == ["blob-gc"]:
+        asyncio.run(blob_gc())
+    else:
+        asyncio.run(main())
@@ -0,0 +1,35 @@
+"""
+Общие фикстуры тестов.
+
+Тесты работают с временной базой SQLite: DB_URL подменяется до импорта
+app, поэтому значение из окружения или .env не используется и
+таблицы рабочей базы не очищаются.
+"""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+import pytest_asyncio
+
+TEST_DB_DIR: str = tempfile.mkdtemp(prefix="bot-tests-")
+TEST_DB_PATH: str = os.path.join(TEST_DB_DIR, "test.db")
+
+# Должно выполниться до импорта app.config: load_dotenv не
+# перезаписывает уже заданные переменные окружения
+os.environ["DB_URL"] = f"sqlite+aiosqlite:///{TEST_DB_PATH}"
+
+from app.core.database import init_db  # noqa: E402
+from app.core.database.engine import engine  # noqa: E402
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    shutil.rmtree(TEST_DB_DIR, ignore_errors=True)
+
+
+@pytest_asyncio.fixture
+async def database() -> None:
+    """Создаёт таблицы во временной базе тестов."""
+    assert engine.url.database == TEST_DB_PATH
+    await init_db()
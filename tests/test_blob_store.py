@@ -0,0 +1,95 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+
+from app.core.database import (BlobStore, FileManager, User, UserFile,
+                               async_session)
+
+BOT_ID: int = 82
+
+
+@pytest_asyncio.fixture
+async def user_id(database: None) -> int:
+    async with async_session() as session:
+        users = select(User.id).where(User.bot_id == BOT_ID)
+        await session.execute(
+            delete(UserFile).where(UserFile.user_id.in_(users))
+        )
+        await session.execute(delete(User).where(User.bot_id == BOT_ID))
+        user = User(tg_id=1, bot_id=BOT_ID, msg_id=0)
+        session.add(user)
+        await session.commit()
+        return user.id
+
+
+def age(path: Path, seconds: float) -> None:
+    """Сдвигает время изменения файла в прошлое."""
+    old: float = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+@pytest.mark.asyncio
+async def test_same_content_stored_once(
+    user_id: int,
+    tmp_path: Path,
+) -> None:
+    store = BlobStore(root=tmp_path)
+    async with async_session() as session:
+        files = FileManager(session, store=store)
+        first = await files.add(user_id, "a.txt", b"hello")
+        second = await files.add(user_id, "b.txt", b"hello")
+        assert first and second
+        assert first.sha256 == second.sha256 and first.size == 5
+        assert list(tmp_path.glob("??/??/*")) == [store.path(first.sha256)]
+
+        content: bytes = b"".join([chunk async for chunk in files.open(first)])
+        assert content == b"hello"
+
+
+@pytest.mark.asyncio
+async def test_garbage_collected_after_last_reference(
+    user_id: int,
+    tmp_path: Path,
+) -> None:
+    store = BlobStore(root=tmp_path)
+    async with async_session() as session:
+        files = FileManager(session, store=store)
+        first = await files.add(user_id, "a.txt", b"hello")
+        second = await files.add(user_id, "b.txt", b"hello")
+        assert first and second
+        sha256: str = first.sha256
+        age(store.path(sha256), 60)
+
+        # Содержимое удаляет только сборщик и только без ссылок
+        assert await files.delete(first.id)
+        assert await files.collect_garbage(grace=10) == 0
+        assert await files.delete(second.id)
+        assert store.exists(sha256)
+        assert await files.collect_garbage(grace=10) == 1
+        assert not store.exists(sha256)
+
+
+@pytest.mark.asyncio
+async def test_recent_content_survives_collection(
+    database: None,
+    tmp_path: Path,
+) -> None:
+    store = BlobStore(root=tmp_path)
+    # Содержимое записано, а ссылка на него ещё не сохранена
+    info = await store.write(b"pending")
+    async with async_session() as session:
+        files = FileManager(session, store=store)
+        assert await files.collect_garbage(grace=10) == 0
+        assert store.exists(info.sha256)
+
+        # Повторная запись того же содержимого продлевает его жизнь
+        age(store.path(info.sha256), 60)
+        await store.write(b"pending")
+        assert await files.collect_garbage(grace=10) == 0
+
+        age(store.path(info.sha256), 60)
+        assert await files.collect_garbage(grace=10) == 1
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+from aiogram.methods import SendMessage
+from sqlalchemy import delete
+
+from app.core.bot.services.broadcast import BroadcastEngine, BroadcastPacer
+from app.core.bot.services.metrics import MetricsRegistry
+from app.core.database import (Broadcast, BroadcastManager, User,
+                               UserManager, async_session)
+
+BOT_ID: int = 42
+
+
+class FakeBot:
+    """Бот, отклоняющий часть сообщений."""
+
+    id: int = BOT_ID
+
+    def __init__(self) -> None:
+        self.sent: list[int] = []
+        self.flooded: bool = False
+
+    async def send_message(self, chat_id: int, text: str, **kwargs) -> None:
+        method = SendMessage(chat_id=chat_id, text=text)
+        if chat_id == 505 and not self.flooded:
+            self.flooded = True
+            raise TelegramRetryAfter(method, "flood", 0)
+        if chat_id % 10 == 0:
+            raise TelegramForbiddenError(method, "blocked")
+        self.sent.append(chat_id)
+
+
+@pytest_asyncio.fixture
+async def users(database: None) -> None:
+    async with async_session() as session:
+        await session.execute(
+            delete(Broadcast).where(Broadcast.bot_id == BOT_ID)
+        )
+        await session.execute(delete(User).where(User.bot_id == BOT_ID))
+        await session.commit()
+        manager = UserManager(session)
+        for tg_id in range(500, 560):
+            await manager.get_or_create(tg_id=tg_id, bot_id=BOT_ID)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_resumes_from_cursor(users: None) -> None:
+    engine = BroadcastEngine(
+        metrics=MetricsRegistry(),
+        rate=1000,
+        burst=1000,
+        min_rate=1,
+        chat_interval=0,
+        concurrency=5,
+        batch_size=10,
+        retries=2,
+        report_interval=60,
+    )
+    bot = FakeBot()
+    job = await engine.start(bot, admin_tg_id=1, text="hi",
+                             entities="None", lang="ru")
+    assert job is not None
+    assert await engine.start(bot, 1, "again", "None", "ru") is None
+
+    # Остановка бота посреди рассылки, затем перезапуск
+    while not bot.sent:
+        await asyncio.sleep(0)
+    await engine.stop(BOT_ID)
+    assert await engine.resume(bot) == 1
+    for _ in range(500):
+        async with async_session() as session:
+            done = await BroadcastManager(session).get(job.id)
+        if done is not None and done.status == "done":
+            break
+        await asyncio.sleep(0.01)
+
+    assert done is not None and done.status == "done"
+    assert (done.sent, done.failed, done.total) == (54, 6, 60)
+    assert set(bot.sent) == {i for i in range(500, 560) if i % 10}
+
+
+def test_pacer_backs_off_and_recovers() -> None:
+    now = [0.0]
+    pacer = BroadcastPacer(rate=20, burst=5, min_rate=1,
+                           chat_interval=1, clock=lambda: now[0])
+    pacer.retry_after(chat_id=1, seconds=2)
+    assert pacer.rate == 10
+    assert pacer.bucket.tokens == pytest.approx(-20)
+
+    for _ in range(10):
+        pacer.success()
+    assert pacer.rate == 11
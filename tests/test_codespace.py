@@ -0,0 +1,44 @@
+import pytest
+
+from app.core.bot.services.generator.generator_code import CodeSpace
+
+# Небольшое пространство: коды прежней схемы и два следующих разряда
+BASE_DIGITS: int = 2
+MAX_USER_ID: int = 10 ** (BASE_DIGITS + 2)
+
+
+@pytest.mark.parametrize("seed", [701, 3, 9999])
+def test_encode_is_bijection(seed: int) -> None:
+    space = CodeSpace(BASE_DIGITS, seed=seed)
+    codes: list[int] = [
+        space.encode(user_id) for user_id in range(1, MAX_USER_ID + 1)
+    ]
+    assert len(set(codes)) == len(codes)
+
+
+@pytest.mark.parametrize("seed", [701, 3, 9999])
+def test_decode_restores_user_id(seed: int) -> None:
+    space = CodeSpace(BASE_DIGITS, seed=seed)
+    for user_id in range(1, MAX_USER_ID + 1):
+        assert space.decode(space.encode(user_id)) == user_id
+
+
+def test_codes_stay_in_range() -> None:
+    space = CodeSpace(BASE_DIGITS)
+    for user_id in range(1, MAX_USER_ID + 1):
+        code: int = space.encode(user_id)
+        digits: int = space.digits(user_id)
+        if user_id <= space.base_size:
+            # Коды прежней схемы не меняются
+            assert code == user_id * space.seed % space.base_size
+            assert 0 <= code < space.base_size
+        else:
+            assert 10 ** (digits - 1) <= code < 10 ** digits
+
+
+def test_rejects_invalid_input() -> None:
+    with pytest.raises(ValueError):
+        CodeSpace(BASE_DIGITS, seed=5)
+    with pytest.raises(ValueError):
+        CodeSpace(BASE_DIGITS).encode(0)
+    assert CodeSpace(BASE_DIGITS).decode(-1) is None
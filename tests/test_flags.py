@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+
+from app.core.bot.services.flags import FLAG_BOT, FLAG_REG, FlagService
+from app.core.database import Flag, async_session
+
+
+@pytest_asyncio.fixture
+async def flags(database: None) -> None:
+    async with async_session() as session:
+        # Таблица флагов общая для всех ботов, поэтому очищаются только
+        # флаги теста и только во временной базе (фикстура database)
+        await session.execute(
+            delete(Flag).where(Flag.name.in_((FLAG_BOT, FLAG_REG)))
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_workers_converge_through_version(flags: None) -> None:
+    first = FlagService(interval=0.02)
+    second = FlagService(interval=0.02)
+    await first.load()
+    await second.load()
+
+    changes: list[tuple[str, bool]] = []
+    second.subscribe(lambda name, value: changes.append((name, value)))
+
+    await first.set(FLAG_BOT, True)
+    await first.set(FLAG_REG, True)
+    assert first.get(FLAG_BOT) and first.get(FLAG_REG)
+    assert not second.get(FLAG_BOT)
+
+    # Опрос запускается после проверки: иначе он может успеть
+    # подхватить изменения раньше неё
+    second.start()
+    for _ in range(50):
+        if second.version == first.version:
+            break
+        await asyncio.sleep(0.02)
+    await second.close()
+
+    assert second.snapshot() == {FLAG_BOT: True, FLAG_REG: True}
+    assert sorted(changes) == [(FLAG_BOT, True), (FLAG_REG, True)]
@@ -0,0 +1,107 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from aiogram.fsm.storage.base import StorageKey
+
+from app.core.bot.services.storage import PersistentStorage
+from app.core.bot.services.storage.backend import SQLiteBackend
+from app.core.bot.services.storage.codec import decode_record, encode_record
+from app.core.database import User
+
+
+class RecordingBackend(SQLiteBackend):
+    """Бэкенд SQLite, запоминающий вызовы записи."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.saved: list[str] = []
+        self.touched: list[str] = []
+
+    async def save_many(self, records: list[tuple[str, str]]) -> None:
+        self.saved.extend(key for key, _ in records)
+        await super().save_many(records)
+
+    async def touch_many(self, keys: list[str]) -> None:
+        self.touched.extend(keys)
+        await super().touch_many(keys)
+
+
+def make_key(user_id: int) -> StorageKey:
+    return StorageKey(bot_id=1, chat_id=user_id, user_id=user_id)
+
+
+def test_codec_round_trip() -> None:
+    user = User(id=5, tg_id=100, bot_id=1, msg_id=7, lang="ru", code=42)
+    registered = datetime(2025, 1, 2, 3, 4, 5)
+    raw: str = encode_record("Form:step", {
+        "user_db": user,
+        "data_db": {"ФИО": "Иванов Иван"},
+        "registered": registered,
+        "loc_user": object(),
+    })
+
+    state, data = decode_record(raw)
+    assert state == "Form:step"
+    assert "loc_user" not in data
+    assert data["data_db"] == {"ФИО": "Иванов Иван"}
+    assert data["registered"] == registered
+    assert isinstance(data["user_db"], User)
+    assert (data["user_db"].id, data["user_db"].code) == (5, 42)
+    assert encode_record(state, data) == raw
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_only_changed_sessions(tmp_path: Path) -> None:
+    backend = RecordingBackend(tmp_path / "fsm.sqlite3")
+    storage = PersistentStorage(backend, ttl=3600, interval=60)
+
+    await storage.update_data(make_key(1), {"answers": {"a": 1}})
+    assert await storage.flush() == 1
+
+    # Чтение без изменений не перезаписывает сессию
+    data: dict = await storage.get_data(make_key(1))
+    assert await storage.flush() == 0
+
+    # Изменение на месте после чтения сохраняется
+    data["answers"]["a"] = 2
+    assert await storage.flush() == 1
+    assert backend.saved == ["1:1:1:::default"] * 2
+    await storage.close()
+
+    restored = PersistentStorage(
+        SQLiteBackend(tmp_path / "fsm.sqlite3"), ttl=3600, interval=60
+    )
+    assert await restored.get_data(make_key(1)) == {"answers": {"a": 2}}
+    await restored.close()
+
+
+@pytest.mark.asyncio
+async def test_bad_session_does_not_block_others(tmp_path: Path) -> None:
+    backend = RecordingBackend(tmp_path / "fsm.sqlite3")
+    storage = PersistentStorage(backend, ttl=3600, interval=60)
+
+    await storage.set_data(make_key(1), {"bad": object()})
+    await storage.set_data(make_key(2), {"ok": 1})
+    assert await storage.flush() == 1
+    assert backend.saved == ["1:2:2:::default"]
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_read_sessions_refresh_backend_ttl(tmp_path: Path) -> None:
+    backend = RecordingBackend(tmp_path / "fsm.sqlite3")
+    await backend.save_many(
+        [("1:1:1:::default", encode_record(None, {"a": 1}))]
+    )
+
+    storage = PersistentStorage(backend, ttl=3600, interval=60)
+    assert await storage.get_data(make_key(1)) == {"a": 1}
+    await storage.flush()
+    assert backend.touched == ["1:1:1:::default"]
+
+    # Повторное продление — не раньше чем через половину ttl
+    await storage.get_data(make_key(1))
+    await storage.flush()
+    assert backend.touched == ["1:1:1:::default"]
+    await storage.close()
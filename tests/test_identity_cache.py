@@ -0,0 +1,96 @@
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, event, select
+
+from app.core.database import (Data, DataManager, User, UserManager,
+                               async_session)
+from app.core.database.engine import engine
+from app.core.database.managers.identity import cached_user_id
+
+BOT_ID: int = 84
+
+
+async def drop_users() -> None:
+    async with async_session() as session:
+        ids = select(User.id).where(User.bot_id == BOT_ID)
+        await session.execute(delete(Data).where(Data.user_id.in_(ids)))
+        await session.execute(delete(User).where(User.bot_id == BOT_ID))
+        await session.commit()
+
+
+@pytest_asyncio.fixture
+async def clean(database: None) -> AsyncIterator[None]:
+    # Данные пишутся в обход поискового индекса, поэтому удаляются и
+    # после теста: иначе пересчёт индекса в других тестах их найдёт
+    await drop_users()
+    yield
+    await drop_users()
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    """Записывает SQL-запросы, выполненные движком."""
+    executed: list[str] = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        executed.append(" ".join(statement.split()))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+def user_lookups(executed: list[str]) -> list[str]:
+    """Запросы, ищущие пользователя по (tg_id, bot_id)."""
+    return [sql for sql in executed if "user.tg_id = ?" in sql]
+
+
+@pytest.mark.asyncio
+async def test_user_manager_fills_cache(
+    clean: None,
+    statements: list[str],
+) -> None:
+    async with async_session() as session:
+        user: User = await UserManager(session).get_or_create(1, BOT_ID)
+        assert cached_user_id(session, 1, BOT_ID) == user.id
+
+        # Менеджер данных берёт ID из кэша сессии
+        statements.clear()
+        data = DataManager(session)
+        await data.create_or_update(1, BOT_ID, "ФИО", "Иванов")
+        assert await data.dict_all(1, BOT_ID) == {"ФИО": "Иванов"}
+        assert user_lookups(statements) == []
+
+        assert await UserManager(session).delete(1, BOT_ID)
+        assert cached_user_id(session, 1, BOT_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_user_resolved_in_one_statement(
+    clean: None,
+    statements: list[str],
+) -> None:
+    async with async_session() as session:
+        user: User = await UserManager(session).get_or_create(2, BOT_ID)
+        await DataManager(session).create_or_update(
+            2, BOT_ID, "ВУЗ", "МИФИ", user=user
+        )
+
+    # Новая сессия: ID неизвестен, чтение подставляет его подзапросом
+    async with async_session() as session:
+        statements.clear()
+        data = DataManager(session)
+        assert await data.dict_all(2, BOT_ID) == {"ВУЗ": "МИФИ"}
+        assert len(statements) == 1
+        assert "data.user_id = (SELECT user.id" in statements[0]
+        assert cached_user_id(session, 2, BOT_ID) is None
+
+        # Запись выполняет один поиск пользователя и запоминает его
+        statements.clear()
+        await data.create_or_update(2, BOT_ID, "ВУЗ", "МГУ")
+        await data.create_or_update(2, BOT_ID, "Курс", "3")
+        assert len(user_lookups(statements)) == 1
+        assert cached_user_id(session, 2, BOT_ID) == user.id
@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+
+from app.config.paths import BASE_DIR
+
+# Бюджет времени импорта app.core в секундах. Основную часть занимает
+# импорт aiogram; словарь морфологии при импорте загружаться не должен
+IMPORT_BUDGET: float = float(os.getenv("IMPORT_BUDGET", "10"))
+
+IMPORT_SCRIPT: str = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import app.core
+elapsed = time.perf_counter() - start
+
+from app.core.bot.utils.morphology import inflection
+print(json.dumps({
+    "elapsed": elapsed,
+    "pymorphy3": "pymorphy3" in sys.modules,
+    "analyzer": inflection._morph is not None,
+}))
+"""
+
+
+def test_import_app_core_within_budget() -> None:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    report: dict = json.loads(result.stdout.strip().splitlines()[-1])
+    assert not report["pymorphy3"]
+    assert not report["analyzer"]
+    assert report["elapsed"] < IMPORT_BUDGET, (
+        f"import app.core: {report['elapsed']:.2f} с "
+        f"(бюджет {IMPORT_BUDGET:.2f} с)"
+    )
@@ -0,0 +1,67 @@
+from typing import Any
+
+import pytest
+from aiogram import types
+
+from app.core.bot.services.keyboards import kb_start
+from app.core.bot.services.keyboards.cache import KeyboardCache
+from app.core.bot.services.keyboards.make import build_keyboard
+from app.core.bot.services.localization import (LocNode,
+                                                get_localization_registry)
+
+
+class Counter:
+    """Построитель клавиатуры, считающий вызовы."""
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+
+    def __call__(self, text: Any) -> types.InlineKeyboardMarkup:
+        self.calls += 1
+        return build_keyboard([[(str(text), "data")]])
+
+
+def test_cache_dropped_on_version_bump() -> None:
+    version: list[int] = [1]
+    cache = KeyboardCache(version=lambda: version[0])
+    build = Counter()
+
+    first = cache.get(build, ("Да",), {})
+    assert cache.get(build, ("Да",), {}) is first
+    assert cache.get(build, ("Нет",), {}) is not first
+    assert build.calls == 2
+
+    # Подмена локализации: клавиатуры собираются заново
+    version[0] += 1
+    assert cache.get(build, ("Да",), {}) is not first
+    assert build.calls == 3
+
+
+def test_cache_limits() -> None:
+    cache = KeyboardCache(version=lambda: 0, maxsize=2)
+    build = Counter()
+    first = cache.get(build, ("a",), {})
+    cache.get(build, ("b",), {})
+    cache.get(build, ("c",), {})
+    assert cache.get(build, ("a",), {}) is not first
+
+    # Нехэшируемые аргументы не кэшируются
+    calls: int = build.calls
+    cache.get(build, (["x"],), {})
+    cache.get(build, (["x"],), {})
+    assert build.calls == calls + 2
+
+
+def test_user_keyboards_follow_registry_version(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    buttons = LocNode({"consent": "Даю согласие"})
+    first = kb_start(buttons)
+    assert kb_start(buttons) is first
+    assert first.inline_keyboard[0][0].text == "Даю согласие"
+
+    registry = get_localization_registry()
+    monkeypatch.setattr(registry, "version", registry.version + 1)
+    second = kb_start(buttons)
+    assert second is not first
+    assert second == first
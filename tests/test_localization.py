@@ -0,0 +1,229 @@
+import asyncio
+import json
+import os
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from loguru import logger
+
+from app.config import LOCALIZATIONS_DIR
+from app.core.bot.services.localization.compiler import (CALLBACK_DATA_LIMIT,
+                                                         compile_localization,
+                                                         option_callback)
+from app.core.bot.services.localization.model import LocalizationError
+from app.core.bot.services.localization.registry import LocalizationRegistry
+
+
+@pytest.fixture
+def locales(tmp_path: Path) -> Path:
+    """Копия файлов локализации, которую тесты могут править."""
+    base_dir: Path = tmp_path / "locales"
+    shutil.copytree(LOCALIZATIONS_DIR, base_dir)
+    return base_dir
+
+
+def edit(
+    file_path: Path,
+    text: str,
+) -> None:
+    """Перезаписывает файл и сдвигает время его изменения вперёд."""
+    stamp: int = file_path.stat().st_mtime_ns + 1_000_000_000
+    file_path.write_text(text, encoding="utf-8")
+    os.utime(file_path, ns=(stamp, stamp))
+
+
+def with_help(
+    file_path: Path,
+    value: str,
+) -> str:
+    """Возвращает содержимое файла с новым текстом messages.help."""
+    data: dict[str, Any] = json.loads(file_path.read_text(encoding="utf-8"))
+    data["messages"]["help"] = value
+    return json.dumps(data, ensure_ascii=False)
+
+
+@pytest.mark.asyncio
+async def test_reload_replaces_changed_localization(locales: Path) -> None:
+    registry = LocalizationRegistry(base_dir=locales, interval=0)
+    first = await registry.get("ru", "user")
+    admin = await registry.get("ru", "admin")
+    assert await registry.get("ru", "user") is first
+    assert await registry.reload() == 0
+    version: int = registry.version
+
+    user_file: Path = locales / "user" / "ru.json"
+    edit(user_file, with_help(user_file, "Новая справка"))
+    assert await registry.reload() == 1
+    assert registry.version == version + 1
+
+    # Пользователи получают новый объект, прежний не изменился
+    second = await registry.get("ru", "user")
+    assert second is not first
+    assert second.messages.help == "Новая справка"
+    assert first.messages.help != "Новая справка"
+    assert await registry.get("ru", "admin") is admin
+
+
+@pytest.mark.asyncio
+async def test_broken_file_keeps_previous_version(locales: Path) -> None:
+    registry = LocalizationRegistry(base_dir=locales, interval=0)
+    first = await registry.get("ru", "user")
+    version: int = registry.version
+
+    user_file: Path = locales / "user" / "ru.json"
+    valid: str = with_help(user_file, "Исправлено")
+    edit(user_file, "{")
+    assert await registry.reload() == 0
+    assert await registry.get("ru", "user") is first
+    assert registry.version == version
+
+    # Ошибка не повторяется до следующей правки файла
+    assert await registry.reload() == 0
+
+    edit(user_file, valid)
+    assert await registry.reload() == 1
+    assert (await registry.get("ru", "user")).messages.help == "Исправлено"
+
+
+@pytest.mark.asyncio
+async def test_watcher_picks_up_changes(locales: Path) -> None:
+    registry = LocalizationRegistry(base_dir=locales, interval=0.01)
+    await registry.get("ru", "user")
+    version: int = registry.version
+
+    user_file: Path = locales / "user" / "ru.json"
+    edit(user_file, with_help(user_file, "Из фона"))
+    try:
+        async with asyncio.timeout(5):
+            while registry.version == version:
+                await asyncio.sleep(0.01)
+    finally:
+        await registry.close()
+    assert (await registry.get("ru", "user")).messages.help == "Из фона"
+
+
+def user_data() -> dict[str, Any]:
+    """Объединённые данные пользовательской локализации."""
+    data: dict[str, Any] = {}
+    for part in ("default", "user"):
+        file_path: Path = LOCALIZATIONS_DIR / part / "ru.json"
+        data.update(json.loads(file_path.read_text(encoding="utf-8")))
+    return data
+
+
+def test_compiled_localization_is_immutable() -> None:
+    loc = compile_localization(user_data(), "user")
+    assert loc.lookup("buttons.yes") == loc.buttons.yes == "Да"
+    assert loc.step("2") and loc.step("2").data.regex.match("Иванов Иван")
+    assert isinstance(loc.messages.template.start, tuple)
+
+    with pytest.raises(AttributeError):
+        loc.buttons.yes = "Нет"
+    with pytest.raises(AttributeError):
+        loc.missing
+
+
+@pytest.mark.parametrize(
+    ("change", "path"),
+    [
+        (lambda data: data["buttons"].pop("yes"), "buttons.yes"),
+        (
+            lambda data: data["messages"]["template"].update(start=["x"]),
+            "messages.template.start",
+        ),
+        (
+            lambda data: data["steps"]["3"].update(type="upload"),
+            "steps.3",
+        ),
+        (lambda data: data["steps"]["3"].pop("next"), "steps.3.next"),
+        (
+            lambda data: data["steps"]["2"]["data"].update(pattern="("),
+            "steps.2.data.pattern",
+        ),
+        (
+            lambda data: data["steps"]["4"].update(options=[]),
+            "steps.4.options",
+        ),
+    ],
+)
+def test_invalid_structure_names_path(
+    change: Callable[[dict[str, Any]], object],
+    path: str,
+) -> None:
+    data: dict[str, Any] = user_data()
+    change(data)
+    with pytest.raises(LocalizationError) as error:
+        compile_localization(data, "user")
+    assert error.value.path == path
+
+
+@pytest.mark.parametrize(
+    ("change", "path", "message"),
+    [
+        (
+            lambda steps: steps["5"].update(next="7"),
+            "steps.5",
+            "несуществующий шаг '7'",
+        ),
+        (lambda steps: steps.pop("2"), "steps.2", "первый шаг"),
+        (
+            lambda steps: steps.update({"99": {
+                "id": "99", "type": "text", "text": "Оплата", "next": "100"
+            }}),
+            "steps.99",
+            "служебным шагом",
+        ),
+        (
+            lambda steps: steps["6"].update(next="6"),
+            "steps",
+            "['6']",
+        ),
+    ],
+)
+def test_invalid_graph_rejected(
+    change: Callable[[dict[str, Any]], object],
+    path: str,
+    message: str,
+) -> None:
+    data: dict[str, Any] = user_data()
+    change(data["steps"])
+    with pytest.raises(LocalizationError) as error:
+        compile_localization(data, "user")
+    assert error.value.path == path
+    assert message in str(error.value)
+
+
+def test_callback_data_limit() -> None:
+    data: dict[str, Any] = user_data()
+    option: dict[str, Any] = data["steps"]["4"]["options"][0]
+    option["text"] = ""
+    loc = compile_localization(data, "user")
+    step = loc.step("4")
+    assert step and step.options[0].save
+    size: int = len(option_callback(step, step.options[0]).encode())
+
+    # Ровно 64 байта допустимы, на байт больше — ошибка загрузки
+    option["text"] = "x" * (CALLBACK_DATA_LIMIT - size)
+    compile_localization(data, "user")
+    option["text"] += "x"
+    with pytest.raises(LocalizationError) as error:
+        compile_localization(data, "user")
+    assert error.value.path == "steps.4.options.0"
+
+
+def test_unreachable_step_only_warned() -> None:
+    data: dict[str, Any] = user_data()
+    data["steps"]["7"] = {
+        "id": "7", "type": "text", "text": "Забытый шаг", "next": "98"
+    }
+    warnings: list[str] = []
+    handler: int = logger.add(warnings.append, level="WARNING")
+    try:
+        loc = compile_localization(data, "user")
+    finally:
+        logger.remove(handler)
+    assert loc.step("7")
+    assert len(warnings) == 1 and "['7']" in warnings[0]
@@ -0,0 +1,55 @@
+from app.core.bot.services.metrics import (Histogram, MetricsRegistry,
+                                           render_prometheus)
+
+
+def test_quantiles_within_relative_error() -> None:
+    histogram = Histogram(precision=5)
+    for value in range(1, 10001):
+        histogram.record(value)
+
+    # Оценка сверху с погрешностью не больше 2**(1 - precision)
+    for q in (0.5, 0.9, 0.99):
+        exact: float = q * 10000
+        assert exact <= histogram.quantile(q) <= exact * (1 + 2 ** -4)
+    assert histogram.quantile(1.0) == histogram.max == 10000
+    assert histogram.count == 10000
+
+
+def test_small_values_exact() -> None:
+    histogram = Histogram(precision=5)
+    for value in (3, 3, 7, 31):
+        histogram.record(value)
+    histogram.record(-1)
+
+    assert histogram.quantile(0.2) == 0
+    assert histogram.quantile(0.5) == 3
+    assert histogram.quantile(0.8) == 7
+    assert histogram.quantile(0.99) == 31
+    assert Histogram().quantile(0.5) == 0
+
+
+def test_prometheus_output() -> None:
+    registry = MetricsRegistry()
+    registry.observe("update", 0.002, type="message")
+    registry.inc("errors", 2, kind='bad "value"')
+
+    assert render_prometheus(registry).splitlines() == [
+        "# TYPE bot_update_seconds summary",
+        'bot_update_seconds{type="message",quantile="0.5"} 0.002',
+        'bot_update_seconds{type="message",quantile="0.9"} 0.002',
+        'bot_update_seconds{type="message",quantile="0.99"} 0.002',
+        'bot_update_seconds_sum{type="message"} 0.002',
+        'bot_update_seconds_count{type="message"} 1',
+        "# TYPE bot_errors_total counter",
+        'bot_errors_total{kind="bad \\"value\\""} 2',
+    ]
+
+
+def test_disabled_registry_records_nothing() -> None:
+    registry = MetricsRegistry(enabled=False)
+    with registry.span("update"):
+        pass
+    registry.inc("errors")
+
+    assert not registry.histograms and not registry.counters
+    assert render_prometheus(registry) == "\n"
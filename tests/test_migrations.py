@@ -0,0 +1,138 @@
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import (BlobStore, Data, DataManager, SearchDoc, User,
+                               UserFile, UserManager, async_session,
+                               migrations)
+from app.core.database.migrations import apply_migrations
+from app.core.database.models import Base
+
+BOT_ID: int = 81
+
+
+@pytest_asyncio.fixture
+async def users(database: None) -> None:
+    async with async_session() as session:
+        users = select(User.id).where(User.bot_id == BOT_ID)
+        await session.execute(delete(Data).where(Data.user_id.in_(users)))
+        await session.execute(delete(User).where(User.bot_id == BOT_ID))
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_upserts_keep_one_row(users: None) -> None:
+    async with async_session() as session:
+        manager = UserManager(session)
+        first: User = await manager.get_or_create(tg_id=1, bot_id=BOT_ID)
+        second: User = await manager.get_or_create(tg_id=1, bot_id=BOT_ID)
+        assert first.id == second.id
+
+        data = DataManager(session)
+        await data.create_or_update(1, BOT_ID, "city", "Москва")
+        await data.create_or_update(1, BOT_ID, "city", "Казань")
+        assert await data.update_all(1, BOT_ID, {"city": "Омск", "age": 30})
+
+        rows = (await session.scalars(
+            select(Data).where(Data.user_id == first.id).order_by(Data.key)
+        )).all()
+        assert [(row.key, row.value) for row in rows] == [
+            ("age", "30"), ("city", "Омск")
+        ]
+
+
+@pytest.mark.asyncio
+async def test_dedup_moves_answers_to_kept_user(tmp_path: Path) -> None:
+    # База до появления уникальных индексов: пользователь записан дважды
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/old.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text("DROP INDEX ix_user_tg_id_bot_id"))
+        await conn.execute(text("DROP INDEX ix_data_user_id_key"))
+        await conn.execute(User.__table__.insert(), [
+            {"id": 1, "tg_id": 10, "bot_id": BOT_ID, "msg_id": 0},
+            {"id": 2, "tg_id": 10, "bot_id": BOT_ID, "msg_id": 0},
+            {"id": 3, "tg_id": 11, "bot_id": BOT_ID, "msg_id": 0},
+        ])
+        await conn.execute(Data.__table__.insert(), [
+            {"user_id": 1, "key": "city", "value": "Москва"},
+            {"user_id": 2, "key": "city", "value": "Казань"},
+            {"user_id": 2, "key": "age", "value": "30"},
+            {"user_id": 3, "key": "city", "value": "Омск"},
+        ])
+        await conn.execute(UserFile.__table__.insert(), [
+            {"user_id": 2, "filename": "scan.pdf", "sha256": "0" * 64,
+             "size": 1},
+        ])
+        await conn.execute(SearchDoc.__table__.insert(), [
+            {"user_id": user_id, "bot_id": BOT_ID, "title": "", "content": ""}
+            for user_id in (1, 2)
+        ])
+
+    async with engine.begin() as conn:
+        await apply_migrations(conn)
+
+    async with engine.connect() as conn:
+        user_ids = (await conn.scalars(
+            select(User.id).order_by(User.id)
+        )).all()
+        data = (await conn.execute(
+            select(Data.user_id, Data.key, Data.value)
+            .order_by(Data.user_id, Data.key)
+        )).all()
+        files = (await conn.scalars(select(UserFile.user_id))).all()
+        docs = (await conn.scalars(select(SearchDoc.user_id))).all()
+    await engine.dispose()
+
+    assert user_ids == [1, 3]
+    # Ответ только дубликата перенесён, при совпадении ключа
+    # сохраняется последнее значение
+    assert [tuple(row) for row in data] == [
+        (1, "age", "30"), (1, "city", "Казань"), (3, "city", "Омск")
+    ]
+    assert files == [1]
+    assert docs == [1]
+
+
+@pytest.mark.asyncio
+async def test_file_bodies_move_to_store_in_pages(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = BlobStore(root=tmp_path / "blobs")
+    monkeypatch.setattr(migrations, "get_blob_store", lambda: store)
+    monkeypatch.setattr(migrations, "BLOB_MOVE_BATCH", 2)
+
+    # Старая схема: содержимое файлов хранится в колонке data
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/old.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text("DROP TABLE user_file"))
+        await conn.execute(text(
+            "CREATE TABLE user_file (id INTEGER PRIMARY KEY, "
+            "user_id INTEGER NOT NULL, filename VARCHAR(255) NOT NULL, "
+            "content_type VARCHAR(127), data BLOB)"
+        ))
+        for i in range(5):
+            await conn.execute(
+                text("INSERT INTO user_file (user_id, filename, data) "
+                     "VALUES (1, :name, :data)"),
+                {"name": f"{i}.txt", "data": f"body {i % 3}".encode()},
+            )
+
+    async with engine.begin() as conn:
+        await apply_migrations(conn)
+
+    async with engine.connect() as conn:
+        files = (await conn.execute(
+            select(UserFile.sha256, UserFile.size).order_by(UserFile.id)
+        )).all()
+    await engine.dispose()
+
+    assert len(files) == 5
+    assert all(store.exists(sha256) and size == 6 for sha256, size in files)
+    assert files[0] == files[3]
+    assert len({sha256 for sha256, _ in files}) == 3
@@ -1,12 +1,16 @@
 import difflib
 import os
 import sys
+import threading
+from collections import OrderedDict
 from typing import Iterator
 
 import pytest
 
 from app.config.paths import BASE_DIR
-from app.core.bot.utils.morphology.inflection import inflect_text
+from app.core.bot.utils.morphology import inflection
+from app.core.bot.utils.morphology.inflection import (inflect_many,
+                                                      inflect_text)
 from tests.test_cases import test_cases
 
 # Настройка пути к корню проекта
@@ -39,3 +43,37 @@ async def test_inflect_text(
         f'────────────────────────────\n'
         f'  Разница:\n{get_diff(expected, result)}'
     )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('case', ['винительный', 'творительный'])
+async def test_inflect_many_matches_inflect_text(case: str) -> None:
+    texts: list[str] = [text for text, _, _ in test_cases]
+    expected: list[str] = [await inflect_text(text, case) for text in texts]
+    assert await inflect_many(texts, case) == expected
+
+
+@pytest.mark.asyncio
+async def test_cache_misses_run_off_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    threads: list[int] = []
+    original = inflection._inflect
+
+    def recording(text: str, case_code: str) -> str:
+        threads.append(threading.get_ident())
+        return original(text, case_code)
+
+    monkeypatch.setattr(inflection, "_inflect", recording)
+    monkeypatch.setattr(inflection, "_phrases", OrderedDict())
+    texts: list[str] = ["Синяя папка", "Новый город", "Синяя папка"]
+
+    first: list[str] = await inflect_many(texts, "дательный")
+    assert first == ["Синей папке", "Новому городу", "Синей папке"]
+    # Повторы разобраны один раз и не в потоке цикла событий
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+
+    # Повторный вызов берёт фразы из кэша
+    assert await inflect_many(texts, "дательный") == first
+    assert len(threads) == 2
@@ -0,0 +1,101 @@
+from datetime import date, datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+
+from app.core.bot.services.localization import load_localization
+from app.core.bot.services.persistence import WriteBehindBuffer
+from app.core.bot.services.profile import (column_name, get_profile_service,
+                                           profile_fields)
+from app.core.database import (ProfileManager, User, UserManager,
+                               async_session)
+
+BOT_ID: int = 79
+
+
+@pytest_asyncio.fixture
+async def users(database: None) -> dict[int, User]:
+    async with async_session() as session:
+        await session.execute(delete(User).where(User.bot_id == BOT_ID))
+        await session.commit()
+
+    found: dict[int, User] = {}
+    async with async_session() as session:
+        for tg_id in (1, 2):
+            found[tg_id] = await UserManager(session).get_or_create(
+                tg_id=tg_id, bot_id=BOT_ID
+            )
+    return found
+
+
+@pytest.mark.asyncio
+async def test_schema_follows_steps() -> None:
+    fields = profile_fields(await load_localization("ru", "user"))
+    assert [(f.column, f.type, f.steps) for f in fields] == [
+        ("fio", "str", ("2",)),
+        ("data_rozhdeniya", "date", ("3",)),
+        ("vuz", "str", ("4", "6")),
+        ("gruppa", "str", ("5",)),
+    ]
+    assert column_name("Группа", {"gruppa"}) == "gruppa_2"
+    assert column_name("User ID") == "user_id_2"
+    assert column_name("2 курс") == "f_2_kurs"
+
+
+@pytest.mark.asyncio
+async def test_profiles_follow_registrations(users: dict[int, User]) -> None:
+    profiles = get_profile_service()
+    buffer = WriteBehindBuffer(interval=60, max_batch=1000)
+    answers: dict[int, dict[str, str]] = {
+        1: {"ФИО": "Иванов Иван", "Дата рождения": "09.09.2003",
+            "ВУЗ": "МИФИ"},
+        2: {"ФИО": "Петров Пётр", "Дата рождения": "31.02.2003"},
+    }
+    for tg_id, data in answers.items():
+        users[tg_id].date_registration = datetime(2026, 10, 17, 12, 30)
+        buffer.mark_dirty(tg_id, BOT_ID, users[tg_id], data)
+    await buffer.flush()
+
+    ids: list[int] = [users[1].id, users[2].id]
+    async with async_session() as session:
+        rows = await ProfileManager(session, profiles.columns).users(ids)
+    values = {user.tg_id: profile for user, profile in rows}
+    assert values[1] == {
+        "fio": "Иванов Иван",
+        "data_rozhdeniya": date(2003, 9, 9),
+        "vuz": "МИФИ",
+        "gruppa": None,
+    }
+    # Значение, не подходящее к типу колонки, остаётся пустым
+    assert values[2]["data_rozhdeniya"] is None
+    assert profiles.answers(values[1])["Дата рождения"] == "09.09.2003"
+
+    # Новый шаг добавляет колонку, профили сохраняются
+    async with async_session() as session:
+        extended = ProfileManager(
+            session, (*profiles.columns, ("kurs", "int"))
+        )
+        assert await extended.migrate() == "extended"
+        rows = await extended.users(ids)
+    assert rows[0][1]["kurs"] is None
+    assert rows[0][1]["fio"] == "Иванов Иван"
+
+    # Смена типа пересоздаёт таблицу, профили заполняются по data
+    async with async_session() as session:
+        retyped = ProfileManager(
+            session, (("fio", "int"), *profiles.columns[1:])
+        )
+        assert await retyped.migrate() == "recreated"
+    assert await profiles.prepare(force=True) == "recreated"
+    async with async_session() as session:
+        rows = await ProfileManager(session, profiles.columns).users(ids)
+    assert rows[0][1]["data_rozhdeniya"] == date(2003, 9, 9)
+
+    # Отмена регистрации удаляет профиль
+    users[1].date_registration = None
+    buffer.mark_dirty(1, BOT_ID, users[1], {})
+    await buffer.close()
+    async with async_session() as session:
+        rows = await ProfileManager(session, profiles.columns).users(ids)
+    assert [profile for _, profile in rows] == [{}, values[2]]
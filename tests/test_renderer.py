@@ -0,0 +1,107 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.config import BACKGROUND_PATH, FONT_PATH
+from app.core.bot.services.generator import prebuild
+from app.core.bot.services.generator.renderer import CodeImageRenderer
+
+PNG_SIGNATURE: bytes = b"\x89PNG\r\n\x1a\n"
+
+
+class CountingRenderer(CodeImageRenderer):
+    """Рендерер, считающий обращения к диску и рендерингу."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        super().__init__(
+            background_path=BACKGROUND_PATH,
+            font_path=FONT_PATH,
+            workers=2,
+            cache_size=8,
+            cache_dir=cache_dir,
+        )
+        self.loads: list[str] = []
+
+    def load_or_render(self, text: str) -> bytes:
+        self.loads.append(text)
+        return super().load_or_render(text)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_renders_share_one_job() -> None:
+    renderer = CountingRenderer()
+    images: list[bytes] = await asyncio.gather(
+        *(renderer.render("123") for _ in range(5))
+    )
+    assert renderer.loads == ["123"]
+    assert len(set(images)) == 1
+    assert images[0].startswith(PNG_SIGNATURE)
+
+    # Повторный запрос берётся из кэша в памяти
+    await renderer.render("123")
+    assert renderer.loads == ["123"]
+    renderer.close()
+
+
+@pytest.mark.asyncio
+async def test_render_after_close() -> None:
+    renderer = CountingRenderer()
+    await renderer.render("1")
+    renderer.close()
+
+    # Перезапуск бота: пул пересоздаётся при следующем рендеринге
+    content: bytes = await renderer.render("2")
+    assert content.startswith(PNG_SIGNATURE)
+    renderer.close()
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_survives_restart(tmp_path: Path) -> None:
+    renderer = CountingRenderer(cache_dir=tmp_path)
+    content: bytes = await renderer.render("7")
+    renderer.close()
+
+    assert renderer.version_dir == tmp_path / renderer.version
+    assert (renderer.version_dir / "7.png").read_bytes() == content
+    assert not list(renderer.version_dir.glob(".*.tmp"))
+
+    # Новый экземпляр читает файл, а не рендерит заново
+    restarted = CountingRenderer(cache_dir=tmp_path)
+    assert restarted.load_or_render("7") == content
+    (renderer.version_dir / "7.png").write_bytes(b"cached")
+    assert restarted.load_or_render("7") == b"cached"
+    restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_prebuild_renders_missing_codes_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(prebuild, "all_codes", lambda: ["1", "2", "3"])
+    stale: Path = tmp_path / "stale-version"
+    stale.mkdir()
+    (stale / "1.png").write_bytes(b"old")
+
+    renderer = CountingRenderer(cache_dir=tmp_path)
+    version_dir: Path | None = renderer.version_dir
+    assert version_dir
+    renderer.load_or_render("2")
+
+    # Уже лежащий на диске код не рендерится повторно
+    assert await prebuild.prebuild_code_images(
+        workers=1, renderer=renderer
+    ) == 2
+    assert not stale.exists()
+    assert (version_dir / prebuild.COMPLETE_MARKER).exists()
+    assert all(
+        (version_dir / f"{text}.png").read_bytes().startswith(PNG_SIGNATURE)
+        for text in ("1", "2", "3")
+    )
+
+    # Собранная версия не перепроверяется
+    assert await prebuild.prebuild_code_images(
+        workers=1, renderer=renderer
+    ) == 0
+    renderer.close()
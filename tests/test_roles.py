@@ -0,0 +1,106 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+
+from app.core.bot.services.metrics import MetricsRegistry
+from app.core.bot.services.roles import (ROLE_MAIN, ROLE_MODERATOR,
+                                         RoleResolver)
+from app.core.database import (Admin, AdminManager, Broadcast,
+                               BroadcastManager, async_session)
+
+BOT_ID: int = 1
+
+
+@pytest_asyncio.fixture
+async def admins(database: None) -> None:
+    async with async_session() as session:
+        await session.execute(delete(Admin).where(Admin.bot_id == BOT_ID))
+        await session.execute(
+            delete(Broadcast).where(Broadcast.bot_id == BOT_ID)
+        )
+        await session.commit()
+        await AdminManager(session).create(tg_id=10, bot_id=BOT_ID)
+
+
+def lookups(metrics: MetricsRegistry) -> dict[tuple[str, str], int]:
+    return {
+        (dict(labels)["role"], dict(labels)["source"]): value
+        for (name, labels), value in metrics.counters.items()
+        if name == "admin_role_lookups"
+    }
+
+
+@pytest.mark.asyncio
+async def test_resolver_caches_roles_and_misses(admins: None) -> None:
+    now: list[float] = [0.0]
+    metrics = MetricsRegistry()
+    resolver = RoleResolver(
+        main_admins=[1],
+        metrics=metrics,
+        ttl=60,
+        negative_ttl=5,
+        max_size=100,
+        clock=lambda: now[0],
+    )
+
+    assert await resolver.resolve(1, BOT_ID) == ROLE_MAIN
+    for _ in range(3):
+        assert await resolver.resolve(10, BOT_ID) == ROLE_MODERATOR
+        assert await resolver.resolve(20, BOT_ID) is None
+
+    assert lookups(metrics) == {
+        ("main", "config"): 1,
+        ("moderator", "db"): 1,
+        ("moderator", "cache"): 2,
+        ("none", "db"): 1,
+        ("none", "cache"): 2,
+    }
+
+    # Новый администратор виден после истечения отрицательного кэша
+    async with async_session() as session:
+        await AdminManager(session).create(tg_id=20, bot_id=BOT_ID)
+    assert await resolver.resolve(20, BOT_ID) is None
+    now[0] += 6
+    assert await resolver.resolve(20, BOT_ID) == ROLE_MODERATOR
+
+    # Удаление через панель сбрасывает кэш сразу
+    async with async_session() as session:
+        await AdminManager(session).delete(tg_id=10, bot_id=BOT_ID)
+    resolver.invalidate(10, BOT_ID)
+    assert await resolver.resolve(10, BOT_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_broadcast_draft_does_not_grant_roles(admins: None) -> None:
+    resolver = RoleResolver(
+        main_admins=[],
+        metrics=MetricsRegistry(),
+        ttl=60,
+        negative_ttl=5,
+        max_size=100,
+    )
+
+    # Черновик главного администратора из настроек не создаёт записи
+    # в таблице admin и не сохраняет роль после удаления из настроек
+    async with async_session() as session:
+        await BroadcastManager(session).save_draft(
+            bot_id=BOT_ID, admin_tg_id=30, text="Привет"
+        )
+        await BroadcastManager(session).save_draft(
+            bot_id=BOT_ID, admin_tg_id=30, text="Привет всем"
+        )
+        assert await AdminManager(session).get(
+            tg_id=30, bot_id=BOT_ID
+        ) is None
+        draft: Broadcast | None = await BroadcastManager(session).draft(
+            BOT_ID, 30
+        )
+    assert draft is not None and draft.text == "Привет всем"
+    assert await resolver.resolve(30, BOT_ID) is None
+
+    # Роль main из таблицы не даёт прав главного администратора
+    async with async_session() as session:
+        await AdminManager(session).create(
+            tg_id=31, bot_id=BOT_ID, role=ROLE_MAIN
+        )
+    assert await resolver.resolve(31, BOT_ID) == ROLE_MODERATOR
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from app.core.bot import runner
+
+
+@pytest.fixture
+def services(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Подменяет запуск и остановку общих служб записью вызовов."""
+    calls: list[str] = []
+
+    async def start() -> None:
+        calls.append("start")
+        await asyncio.sleep(0.01)
+
+    async def stop() -> None:
+        calls.append("stop")
+
+    monkeypatch.setattr(runner, "_start_services", start)
+    monkeypatch.setattr(runner, "_stop_services", stop)
+    monkeypatch.setattr(runner, "_active_runs", 0)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_services_shared_by_concurrent_runs(
+    services: list[str],
+) -> None:
+    await asyncio.gather(*(runner._acquire_services() for _ in range(3)))
+    assert services == ["start"]
+    assert runner._active_runs == 3
+
+    await runner._release_services()
+    await runner._release_services()
+    assert services == ["start"]
+
+    await runner._release_services()
+    assert services == ["start", "stop"]
+
+    # Следующий запуск снова поднимает службы
+    await runner._acquire_services()
+    await runner._release_services()
+    assert services == ["start", "stop", "start", "stop"]
+
+
+@pytest.mark.asyncio
+async def test_failed_start_stops_services(
+    services: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def broken_start() -> None:
+        services.append("start")
+        raise RuntimeError("broken locale")
+
+    monkeypatch.setattr(runner, "_start_services", broken_start)
+    with pytest.raises(RuntimeError):
+        await runner._acquire_services()
+    assert services == ["start", "stop"]
+    assert runner._active_runs == 0
@@ -0,0 +1,82 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+
+from app.core.bot.services.persistence import WriteBehindBuffer
+from app.core.bot.services.search import (build_document,
+                                          rebuild_search_index, search_users)
+from app.core.database import SearchDoc, User, UserManager, async_session
+
+BOT_ID: int = 78
+
+
+@pytest_asyncio.fixture
+async def users(database: None) -> dict[int, User]:
+    async with async_session() as session:
+        await session.execute(
+            delete(SearchDoc).where(SearchDoc.bot_id == BOT_ID)
+        )
+        await session.execute(delete(User).where(User.bot_id == BOT_ID))
+        await session.commit()
+
+    found: dict[int, User] = {}
+    async with async_session() as session:
+        for tg_id in range(1, 5):
+            found[tg_id] = await UserManager(session).get_or_create(
+                tg_id=tg_id, bot_id=BOT_ID
+            )
+    return found
+
+
+def test_document_normalizes_values() -> None:
+    title, content = build_document(
+        {"ФИО": "Алёна Ёлкина", "Группа": "ИУ5-31Б", "Телефон": "1"},
+        ["ФИО", "Группа"],
+    )
+    assert title == "Алёна Ёлкина · ИУ5-31Б"
+    assert content.split() == ["алена", "елкина", "иу5", "31б"]
+    assert build_document({"ФИО": " "}, ["ФИО"]) is None
+
+
+@pytest.mark.asyncio
+async def test_search_follows_buffer_writes(users: dict[int, User]) -> None:
+    buffer = WriteBehindBuffer(interval=60, max_batch=1000)
+    answers: dict[int, dict[str, str]] = {
+        1: {"ФИО": "Иванов Иван", "ВУЗ": "МГТУ им. Н.Э. Баумана"},
+        2: {"ФИО": "Петров Пётр", "ВУЗ": "МИФИ"},
+        3: {"ФИО": "Иванова Мария", "ВУЗ": "МИФИ", "Группа": "Б21-503"},
+        4: {"Дата рождения": "01.01.2000"},
+    }
+    for tg_id, data in answers.items():
+        buffer.mark_dirty(tg_id, BOT_ID, users[tg_id], data)
+    await buffer.flush()
+
+    async def codes(query: str, page: int = 0, size: int = 10) -> list[int]:
+        result = await search_users(BOT_ID, query, page, size)
+        return [user_id for user_id, _, _ in result.hits]
+
+    # Префиксы слов, регистр и «ё» не важны, слова запроса сужают поиск
+    assert sorted(await codes("иван")) == [users[1].id, users[3].id]
+    assert await codes("ПЁТР") == [users[2].id]
+    assert await codes("иван мифи") == [users[3].id]
+    assert await codes("б21") == [users[3].id]
+    assert await codes("баумана петров") == []
+    assert await codes("!!!") == []
+
+    # Номер страницы за пределами результатов заменяется последней
+    last = await search_users(BOT_ID, "иван", 5, 1)
+    assert (last.total, last.pages, last.page) == (2, 2, 1)
+    assert len(last.hits) == 1
+
+    # Изменение и удаление ответов обновляют документы
+    answers[1]["ФИО"] = "Смирнов Иван"
+    answers[3].clear()
+    for tg_id in (1, 3):
+        buffer.mark_dirty(tg_id, BOT_ID, users[tg_id], answers[tg_id])
+    await buffer.close()
+    assert await codes("смир") == [users[1].id]
+    assert await codes("мария") == []
+
+    # Документы совпадают с данными, пересчёт ничего не меняет
+    assert await rebuild_search_index() == 0
+    assert await codes("мифи") == [users[2].id]
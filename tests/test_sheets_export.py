@@ -0,0 +1,312 @@
+import asyncio
+import json
+from datetime import datetime
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from gspread.exceptions import APIError
+from sqlalchemy import delete, select
+
+from app.core.bot.services.google_sheets import (SheetExporter, SheetSync,
+                                                 SyncDiff)
+from app.core.bot.services.persistence import WriteBehindBuffer
+from app.core.bot.utils.ratelimit import TokenBucket
+from app.core.database import (OutboxManager, SheetOutbox, SheetRow, User,
+                               async_session)
+
+BOT_ID: int = 80
+
+# Значение, которое лист отклоняет с ответом 400
+BAD: str = "#BAD"
+
+
+class FakeResponse:
+    """Ответ API с кодом ошибки для APIError."""
+
+    def __init__(self, code: int) -> None:
+        self.code: int = code
+        self.text: str = ""
+
+    def json(self) -> dict[str, Any]:
+        return {"error": {"code": self.code, "message": "fake"}}
+
+
+class FakeWorksheet:
+    """Локальный лист с интерфейсом gspread.Worksheet."""
+
+    def __init__(self, failures: list[Exception] | None = None) -> None:
+        self.rows: list[list[Any]] = []
+        self.cells: dict[str, Any] = {}
+        self.ranges: dict[str, list[list[Any]]] = {}
+        self.calls: list[str] = []
+        self.failures: list[Exception] = failures or []
+
+    def _maybe_fail(self) -> None:
+        if self.failures:
+            raise self.failures.pop(0)
+
+    @staticmethod
+    def _reject(values: list[list[Any]]) -> None:
+        # Таблица отклоняет весь запрос, если в нём есть значение BAD
+        if any(BAD in row for row in values):
+            raise APIError(FakeResponse(400))  # type: ignore[arg-type]
+
+    def append_rows(self, values: list[list[Any]], **kwargs: Any) -> None:
+        self.calls.append("append_rows")
+        self._maybe_fail()
+        self._reject(values)
+        self.rows.extend(values)
+
+    def batch_update(self, data: list[dict[str, Any]], **kwargs: Any) -> None:
+        self.calls.append("batch_update")
+        self._maybe_fail()
+        self._reject([row for item in data for row in item["values"]])
+        for item in data:
+            self.cells[item["range"]] = item["values"][0][0]
+            self.ranges[item["range"]] = item["values"]
+
+
+def make_exporter(wks: FakeWorksheet | None, **kwargs: Any) -> SheetExporter:
+    options: dict[str, Any] = {
+        "bucket": TokenBucket(rate=1000, capacity=1000),
+        "queue_size": 100,
+        "batch_size": 50,
+        "flush_interval": 0.01,
+        "retries": 2,
+        "backoff": 0.001,
+        "max_backoff": 0.01,
+    }
+    options.update(kwargs)
+    return SheetExporter(worksheet=lambda: wks, **options)
+
+
+@pytest_asyncio.fixture
+async def outbox(database: None) -> None:
+    async with async_session() as session:
+        await session.execute(delete(SheetOutbox))
+        await session.commit()
+
+
+async def pending() -> list[SheetOutbox]:
+    async with async_session() as session:
+        return await OutboxManager(session).pending(1000)
+
+
+@pytest.mark.asyncio
+async def test_coalesces_operations_into_batch_calls(outbox: None) -> None:
+    wks = FakeWorksheet()
+    exporter = make_exporter(wks)
+
+    for i in range(10):
+        await exporter.append_row([i, f"user{i}"])
+    await exporter.update_cell(2, 3, "old")
+    await exporter.update_cell(2, 3, "new")
+    await exporter.update_cell(5, 1, 42)
+    await exporter.close()
+
+    assert wks.calls == ["append_rows", "batch_update"]
+    assert wks.rows == [[i, f"user{i}"] for i in range(10)]
+    assert wks.cells == {"C2": "new", "A5": 42}
+    assert await pending() == []
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors(outbox: None) -> None:
+    wks = FakeWorksheet(failures=[
+        APIError(FakeResponse(429)),  # type: ignore[arg-type]
+        ConnectionError("reset"),
+    ])
+    exporter = make_exporter(wks)
+
+    await exporter.append_row(["a"])
+    assert await exporter.flush()
+
+    assert wks.calls == ["append_rows"] * 3
+    assert wks.rows == [["a"]]
+    assert await pending() == []
+
+
+@pytest.mark.asyncio
+async def test_failed_operations_survive_restart(outbox: None) -> None:
+    broken = FakeWorksheet(failures=[ValueError("bad request")])
+    exporter = make_exporter(broken)
+
+    await exporter.append_row(["kept"])
+    await exporter.update_cell(1, 1, "cell")
+    assert not await exporter.flush()
+
+    # Добавление строки не прошло, изменение ячейки ещё не отправлялось
+    records: list[SheetOutbox] = await pending()
+    assert [record.kind for record in records] == ["append", "update"]
+    assert records[0].attempts == 1
+
+    wks = FakeWorksheet()
+    restarted = make_exporter(wks)
+    assert await restarted.flush()
+
+    assert wks.rows == [["kept"]]
+    assert wks.cells == {"A1": "cell"}
+    assert await pending() == []
+
+
+@pytest.mark.asyncio
+async def test_rejected_operation_does_not_block_batch(outbox: None) -> None:
+    wks = FakeWorksheet()
+    exporter = make_exporter(wks)
+
+    for value in ["a", "b", BAD, "c"]:
+        await exporter.append_row([value])
+    await exporter.update_cell(1, 1, BAD)
+    await exporter.update_cell(2, 1, "ok")
+    assert await exporter.flush()
+
+    # Отклонённые операции удалены, остальные отправлены по порядку
+    assert wks.rows == [["a"], ["b"], ["c"]]
+    assert wks.cells == {"A2": "ok"}
+    assert await pending() == []
+
+
+@pytest.mark.asyncio
+async def test_stale_batch_does_not_stop_delivery(outbox: None) -> None:
+    async with async_session() as session:
+        manager = OutboxManager(session)
+        payload: str = json.dumps({"values": ["old"], "row": 0, "col": 0})
+        await manager.add([("append", payload)] * 2)
+        stale: list[SheetOutbox] = await manager.pending(10)
+        await manager.mark_failed([record.id for record in stale])
+
+    wks = FakeWorksheet()
+    exporter = make_exporter(wks, batch_size=2, max_attempts=1)
+    await exporter.append_row(["new"])
+    assert await exporter.flush()
+
+    # Первый пакет целиком устарел, но следующий всё равно отправлен
+    assert wks.rows == [["new"]]
+    assert await pending() == []
+
+
+@pytest.mark.asyncio
+async def test_background_worker_drains_queue(outbox: None) -> None:
+    wks = FakeWorksheet()
+    exporter = make_exporter(wks, batch_size=3)
+
+    for i in range(7):
+        await exporter.append_row([i])
+    for _ in range(100):
+        if len(wks.rows) == 7:
+            break
+        await asyncio.sleep(0.02)
+    await exporter.close()
+
+    assert wks.rows == [[i] for i in range(7)]
+    assert wks.calls == ["append_rows"] * 3
+    assert await pending() == []
+
+
+@pytest.mark.asyncio
+async def test_sync_sends_only_changed_rows(outbox: None) -> None:
+    async with async_session() as session:
+        users = select(User.id).where(User.bot_id == BOT_ID)
+        await session.execute(
+            delete(SheetRow).where(SheetRow.user_id.in_(users))
+        )
+        await session.execute(delete(User).where(User.bot_id == BOT_ID))
+        await session.commit()
+
+    wks = FakeWorksheet()
+    exporter = make_exporter(wks)
+    sync = SheetSync(exporter)
+
+    # Строки пользователей других тестов выгружаются заранее
+    await sync.sync()
+    await exporter.flush()
+    wks.ranges.clear()
+    wks.calls.clear()
+
+    async with async_session() as session:
+        session.add_all(
+            User(
+                tg_id=100 + i,
+                bot_id=BOT_ID,
+                msg_id=1,
+                code=i,
+                date_registration=datetime(2025, 1, i),
+            )
+            for i in range(1, 4)
+        )
+        await session.commit()
+
+    preview: SyncDiff = await sync.sync(dry_run=True)
+    rows: list[int] = [change.row for change in preview.changes]
+    assert len(rows) == 3
+    assert rows == list(range(rows[0], rows[0] + 3))
+    assert wks.calls == []
+
+    await sync.sync()
+    await exporter.flush()
+    assert list(wks.ranges) == [f"A{rows[0]}"]
+    assert len(wks.ranges[f"A{rows[0]}"]) == 3
+
+    assert (await sync.sync()).changes == []
+
+    # Ответ проходит через буфер записи, который обновляет профиль
+    async with async_session() as session:
+        user: User = await session.scalar(
+            select(User).where(User.tg_id == 102, User.bot_id == BOT_ID)
+        )
+    buffer = WriteBehindBuffer(interval=60, max_batch=1000)
+    buffer.mark_dirty(102, BOT_ID, user, {"ФИО": "Иванов Иван"})
+    await buffer.close()
+
+    wks.ranges.clear()
+    diff: SyncDiff = await sync.sync()
+    await exporter.close()
+    assert [change.row for change in diff.changes] == [rows[1]]
+    assert list(wks.ranges) == [f"A{rows[1]}"]
+    assert "Иванов Иван" in wks.ranges[f"A{rows[1]}"][0]
+
+
+@pytest.mark.asyncio
+async def test_sync_stores_ranges_with_snapshot(outbox: None) -> None:
+    async with async_session() as session:
+        session.add(User(
+            tg_id=200,
+            bot_id=BOT_ID,
+            msg_id=1,
+            date_registration=datetime(2025, 2, 1),
+        ))
+        await session.commit()
+
+    # Таблица недоступна: строки остаются в outbox, а не в памяти
+    exporter = make_exporter(None)
+    diff: SyncDiff = await SheetSync(exporter).sync()
+    await exporter.close()
+
+    covered: set[int] = set()
+    for record in await pending():
+        payload: dict[str, Any] = json.loads(record.payload)
+        start: int = payload["row"]
+        covered.update(range(start, start + len(payload["values"])))
+    assert diff.changes
+    assert {change.row for change in diff.changes} <= covered
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate() -> None:
+    now: list[float] = [0.0]
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0])
+
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    now[0] += 0.5
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    bucket.penalize(1.0)
+    now[0] += 0.5
+    assert not bucket.try_acquire()
+    now[0] += 1.0
+    assert bucket.try_acquire()
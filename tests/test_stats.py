@@ -0,0 +1,77 @@
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+
+from app.core.bot.services.localization import load_localization
+from app.core.bot.services.persistence import WriteBehindBuffer
+from app.core.bot.services.stats import (METRIC_CANCELLED, METRIC_DAY,
+                                         METRIC_OPTION, METRIC_PENDING,
+                                         METRIC_REGISTERED,
+                                         cancellation_deltas, rebuild_stats,
+                                         registration_deltas)
+from app.core.database import (StatCounter, StatManager, User, UserManager,
+                               async_session)
+
+BOT_ID: int = 77
+
+
+@pytest_asyncio.fixture
+async def stats(database: None) -> None:
+    async with async_session() as session:
+        await session.execute(
+            delete(StatCounter).where(StatCounter.bot_id == BOT_ID)
+        )
+        await session.execute(delete(User).where(User.bot_id == BOT_ID))
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_registrations(stats: None) -> None:
+    loc = await load_localization("ru", "user")
+    buffer = WriteBehindBuffer(interval=60, max_batch=1000)
+    answers: dict[int, dict[str, str]] = {
+        1: {"ФИО": "Иванов Иван", "ВУЗ": "МГТУ им. Н.Э. Баумана"},
+        2: {"ФИО": "Петров Пётр", "ВУЗ": "МИФИ"},
+        3: {"ФИО": "Сидоров Сидор", "ВУЗ": "МИФИ"},
+    }
+    users: dict[int, User] = {}
+    async with async_session() as session:
+        for tg_id in answers:
+            users[tg_id] = await UserManager(session).get_or_create(
+                tg_id=tg_id, bot_id=BOT_ID
+            )
+
+    for tg_id, data in answers.items():
+        user = users[tg_id]
+        user.date_registration = datetime(2026, 10, 17, 12, 30)
+        buffer.record(tg_id, BOT_ID, registration_deltas(user, data, loc))
+        buffer.mark_dirty(tg_id, BOT_ID, user, data)
+    await buffer.flush()
+
+    # Отмена регистрации вычитает ответы пользователя
+    user = users[3]
+    buffer.record(3, BOT_ID, cancellation_deltas(user, answers[3], loc))
+    user.date_registration = None
+    answers[3].clear()
+    buffer.mark_dirty(3, BOT_ID, user, answers[3])
+    await buffer.close()
+
+    metrics = [METRIC_REGISTERED, METRIC_PENDING, METRIC_CANCELLED,
+               METRIC_DAY, f"{METRIC_OPTION}4"]
+    async with async_session() as session:
+        counted = await StatManager(session).get(BOT_ID, metrics)
+    assert counted[METRIC_REGISTERED] == {"": 2}
+    assert counted[METRIC_PENDING] == {"": 2}
+    assert counted[METRIC_CANCELLED] == {"": 1}
+    assert counted[METRIC_DAY] == {"2026-10-17": 2}
+    assert counted[f"{METRIC_OPTION}4"] == {
+        "МГТУ им. Н.Э. Баумана": 1, "МИФИ": 1,
+    }
+
+    # Пересчёт по таблицам даёт те же значения и сохраняет отмены
+    assert await rebuild_stats() >= 2
+    async with async_session() as session:
+        rebuilt = await StatManager(session).get(BOT_ID, metrics)
+    assert rebuilt == counted
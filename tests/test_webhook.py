@@ -0,0 +1,77 @@
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from aiogram import Bot, Dispatcher
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from app.core.bot.services.webhook.server import (SECRET_HEADER,
+                                                  WebhookRoute, WebhookServer,
+                                                  bot_key, bot_secret)
+
+TOKEN: str = "42:TEST"
+SECRET: str = bot_secret("app-secret", TOKEN)
+
+
+@pytest_asyncio.fixture
+async def client() -> AsyncIterator[tuple[TestClient, WebhookServer]]:
+    """Клиент сервера вебхуков с очередью на одно обновление."""
+    server = WebhookServer(
+        host="127.0.0.1", port=0, path="/webhook", queue_size=1, workers=1
+    )
+    bot = Bot(token=TOKEN)
+    server.routes[bot_key(TOKEN)] = WebhookRoute(
+        bot=bot, dp=Dispatcher(), secret=SECRET
+    )
+    # Приложение без воркеров: обновления остаются в очереди
+    app = web.Application()
+    app.router.add_post(server.route_path("{key}"), server._handle)
+    async with TestClient(TestServer(app)) as test_client:
+        yield test_client, server
+    await bot.session.close()
+
+
+async def post(
+    client: TestClient,
+    server: WebhookServer,
+    secret: str = SECRET,
+    key: str = bot_key(TOKEN),
+    update_id: int = 1,
+) -> int:
+    response = await client.post(
+        server.route_path(key),
+        json={"update_id": update_id},
+        headers={SECRET_HEADER: secret},
+    )
+    return response.status
+
+
+@pytest.mark.asyncio
+async def test_rejects_wrong_secret_and_unknown_bot(
+    client: tuple[TestClient, WebhookServer],
+) -> None:
+    test_client, server = client
+    assert await post(test_client, server, secret="") == 401
+    assert await post(test_client, server, secret=SECRET[:-1] + "0") == 401
+    assert await post(test_client, server, key="unknown") == 404
+
+    response = await test_client.post(
+        server.route_path(bot_key(TOKEN)),
+        data=b"{",
+        headers={SECRET_HEADER: SECRET},
+    )
+    assert response.status == 400
+    assert server.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_returns_503(
+    client: tuple[TestClient, WebhookServer],
+) -> None:
+    test_client, server = client
+    assert await post(test_client, server, update_id=1) == 200
+    # Telegram повторит доставку после 503
+    assert await post(test_client, server, update_id=2) == 503
+    _, update = server.queue.get_nowait()
+    assert update.update_id == 1
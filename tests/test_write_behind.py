@@ -0,0 +1,99 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+
+from app.core.bot.middleware import utils
+from app.core.bot.services.persistence import WriteBehindBuffer
+from app.core.bot.services.stats import METRIC_REGISTERED
+from app.core.database import (Data, StatCounter, User, UserManager,
+                               async_session)
+
+BOT_ID: int = 83
+
+
+@pytest_asyncio.fixture
+async def users(database: None) -> dict[int, User]:
+    async with async_session() as session:
+        ids = select(User.id).where(User.bot_id == BOT_ID)
+        await session.execute(delete(Data).where(Data.user_id.in_(ids)))
+        await session.execute(delete(User).where(User.bot_id == BOT_ID))
+        await session.execute(
+            delete(StatCounter).where(StatCounter.bot_id == BOT_ID)
+        )
+        await session.commit()
+        return {
+            tg_id: await UserManager(session).get_or_create(
+                tg_id=tg_id, bot_id=BOT_ID
+            )
+            for tg_id in (1, 2)
+        }
+
+
+async def stored(user: User) -> dict[str, str]:
+    async with async_session() as session:
+        rows = await session.execute(
+            select(Data.key, Data.value).where(Data.user_id == user.id)
+        )
+        return dict(rows.all())
+
+
+@pytest.mark.asyncio
+async def test_changes_coalesce_per_user(users: dict[int, User]) -> None:
+    buffer = WriteBehindBuffer(interval=60, max_batch=1000)
+    buffer.mark_dirty(1, BOT_ID, users[1], {"ФИО": "Иванов"})
+    buffer.mark_dirty(1, BOT_ID, users[1], {"ФИО": "Петров"})
+    assert buffer.pending_count() == 1
+
+    # В базу попадает только последнее состояние пользователя
+    assert await buffer.flush() == 1
+    assert await stored(users[1]) == {"ФИО": "Петров"}
+    assert await buffer.flush() == 0
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_terminal_state_flushes_one_user(
+    users: dict[int, User],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    buffer = WriteBehindBuffer(interval=60, max_batch=1000)
+    monkeypatch.setattr(utils, "get_write_behind", lambda: buffer)
+
+    await utils.update_db(2, BOT_ID, users[2], {"ВУЗ": "МИФИ"})
+    await utils.update_db(1, BOT_ID, users[1], {"ВУЗ": "МГУ"}, flush=True)
+
+    # Пользователь в терминальном состоянии записан сразу, остальные
+    # ждут фоновой записи
+    assert await stored(users[1]) == {"ВУЗ": "МГУ"}
+    assert buffer.has_pending(2, BOT_ID)
+    assert not buffer.has_pending(1, BOT_ID)
+
+    await buffer.close()
+    assert await stored(users[2]) == {"ВУЗ": "МИФИ"}
+
+
+@pytest.mark.asyncio
+async def test_failed_write_requeues_batch(
+    users: dict[int, User],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    buffer = WriteBehindBuffer(interval=60, max_batch=1000)
+    buffer.mark_dirty(1, BOT_ID, users[1], {"ФИО": "Иванов"})
+    buffer.record(1, BOT_ID, {(BOT_ID, METRIC_REGISTERED, ""): 1})
+
+    async def broken(*args: object, **kwargs: object) -> None:
+        raise RuntimeError("database is locked")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(WriteBehindBuffer, "_write", staticmethod(broken))
+        assert await buffer.flush() == 0
+
+    # Изменения и приращения вернулись в буфер
+    assert buffer.has_pending(1, BOT_ID)
+    assert buffer._stats[(1, BOT_ID)] == {(BOT_ID, METRIC_REGISTERED, ""): 1}
+
+    # Новое изменение, пришедшее после ошибки, не затирается старым
+    buffer.mark_dirty(1, BOT_ID, users[1], {"ФИО": "Петров"})
+    assert await buffer.flush() == 1
+    assert await stored(users[1]) == {"ФИО": "Петров"}
+    await buffer.close()